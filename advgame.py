@@ -1,82 +1,191 @@
 #!/usr/bin/python3
 
-from iniconfig import IniConfig
-
-from advgame.data import ini_file_texts
-from advgame.elements.characters import GameState
-from advgame.elements.characters import ItemsState
-from advgame.elements.containers import ContainersState, CreaturesState
-from advgame.elements.doors import DoorsState
-from advgame.elements.rooms import RoomsState
+import sys
+
+from random import randrange
+
+from advgame.host import PreforkHost
+from advgame.loadgen import LoadGenerator, LoadReport
+from advgame.memreport import item_catalog_memory_report, message_churn_report
+from advgame.output import OutputWriter
 from advgame.process import CommandProcessor
+from advgame.replay import Replayer, TranscriptWriter
+from advgame.savefile import SaveFile
+from advgame.solver import SeededDice
 from advgame.statemsgs.be_atkd import CharacterDeathGSM
 from advgame.statemsgs.leave import WonTheGameGSM
 from advgame.statemsgs.quit import HaveQuitTheGameGSM
-from advgame.utils import textwrapper
+from advgame.utils import set_dice_roller
+from advgame.validation import validate_world
+from advgame.world import WorldTemplate, build_game_state, load_world_sections
 
 
 # Stage 1: establishing the game data object environment
 
-items_ini_config = IniConfig(
-    ini_file_texts.get_ini_tmpfile_name(ini_file_texts.ITEMS_INI)
-)
-doors_ini_config = IniConfig(
-    ini_file_texts.get_ini_tmpfile_name(ini_file_texts.DOORS_INI)
-)
-containers_ini_config = IniConfig(
-    ini_file_texts.get_ini_tmpfile_name(ini_file_texts.CONTAINERS_INI)
-)
-creatures_ini_config = IniConfig(
-    ini_file_texts.get_ini_tmpfile_name(ini_file_texts.CREATURES_INI)
-)
-rooms_ini_config = IniConfig(
-    ini_file_texts.get_ini_tmpfile_name(ini_file_texts.ROOMS_INI)
-)
-
-for ini_const in (
-    ini_file_texts.ITEMS_INI,
-    ini_file_texts.DOORS_INI,
-    ini_file_texts.CONTAINERS_INI,
-    ini_file_texts.CREATURES_INI,
-    ini_file_texts.ROOMS_INI,
-):
-    ini_file_texts.remove_tempfile(ini_const)
+world_sections = load_world_sections()
+
+
+# Server mode: with --serve [PORT] [--structured] [--save-dir DIR], the
+# world is built once in this process and served to many sessions by
+# forked workers, instead of running a single game on the terminal.
+
+if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+    serve_args = sys.argv[2:]
+    structured = "--structured" in serve_args
+    if structured:
+        serve_args.remove("--structured")
+    save_dir = None
+    if "--save-dir" in serve_args:
+        option_index = serve_args.index("--save-dir")
+        save_dir = serve_args[option_index + 1]
+        del serve_args[option_index : option_index + 2]
+    port = int(serve_args[0]) if serve_args else 7070
+    host = PreforkHost(
+        WorldTemplate(world_sections),
+        host="0.0.0.0",
+        port=port,
+        structured=structured,
+        save_dir=save_dir,
+    )
+    host.start()
+    print(f"Serving on port {host.address[1]}.")
+    try:
+        host.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        host.stop()
+    exit(0)
+
+
+# Replay mode: with --replay DIR [--processes N], every transcript in the
+# directory is replayed against the current code and any that no longer
+# play as recorded are reported. The exit status is 1 if any diverged.
+
+if len(sys.argv) > 1 and sys.argv[1] == "--replay":
+    processes = 1
+    if "--processes" in sys.argv:
+        processes = int(sys.argv[sys.argv.index("--processes") + 1])
+    report = Replayer(WorldTemplate(world_sections), processes).run_directory(
+        sys.argv[2]
+    )
+    for divergence in report.divergences:
+        print(divergence.describe())
+    print(report.summary())
+    exit(0 if report.passed else 1)
+
+
+# Load-test mode: with --load-test PLAYERS [--commands N] [--connect
+# HOST:PORT], that many simulated players each play N commands, against a
+# running server or in this process, and the latency, throughput, errors
+# and memory growth are reported. --report PATH saves the report as JSON;
+# --baseline PATH compares it with a saved one, and the exit status is 1
+# if anything regressed.
+
+if len(sys.argv) > 1 and sys.argv[1] == "--load-test":
+    commands_per_player = 50
+    if "--commands" in sys.argv:
+        commands_per_player = int(sys.argv[sys.argv.index("--commands") + 1])
+    address = None
+    if "--connect" in sys.argv:
+        address_host, _, address_port = sys.argv[
+            sys.argv.index("--connect") + 1
+        ].rpartition(":")
+        address = (address_host or "127.0.0.1", int(address_port))
+    report = LoadGenerator(
+        WorldTemplate(world_sections),
+        players=int(sys.argv[2]),
+        commands_per_player=commands_per_player,
+        address=address,
+    ).run()
+    print(report.summary())
+    if "--report" in sys.argv:
+        report.dump(sys.argv[sys.argv.index("--report") + 1])
+    regressions = list()
+    if "--baseline" in sys.argv:
+        regressions = report.compare(
+            LoadReport.load(sys.argv[sys.argv.index("--baseline") + 1])
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}")
+    exit(1 if regressions else 0)
+
+
+# Memory-report mode: with --memory-report [ITEMS], an item catalog of that
+# many items (10,000 by default) is generated and the memory it takes in
+# the compact item layout is compared with the flat layout it replaced.
+
+if len(sys.argv) > 1 and sys.argv[1] == "--memory-report":
+    item_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    report = item_catalog_memory_report(item_count, list_count=item_count // 5)
+    print(report.summary())
+    exit(0)
+
+
+# Message-report mode: with --message-report [TRANSCRIPTS], that many
+# transcripts of generated commands (20 by default) are played with the
+# game state messages' flyweight instances shared and without, and the
+# message objects allocated and bytes retained per command are compared.
+
+if len(sys.argv) > 1 and sys.argv[1] == "--message-report":
+    transcript_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    report = message_churn_report(world_sections, transcript_count)
+    print(report.summary())
+    exit(0)
 
 
 # Stage 2: instancing the state objects.
 #
 # Each state class can initialize itself from a **dict-of-dicts
 # argument, so I initialize the state objects from the parsed .ini
-# data files. Some state objects require other ones as arguments to
-# initialize properly, so this proceeds in order from simple to complex.
+# data files. build_game_state() instantiates them in order from simple
+# to complex, since some require other ones as arguments.
 
-items_state = ItemsState(**items_ini_config.sections)
+game_state = build_game_state(world_sections)
 
-doors_state = DoorsState(**doors_ini_config.sections)
+# The dungeon's structure is checked once before play begins, so a
+# mismatched door or an unwinnable layout fails here instead of partway
+# through a game.
 
-containers_state = ContainersState(items_state, **containers_ini_config.sections)
-
-creatures_state = CreaturesState(items_state, **creatures_ini_config.sections)
-
-rooms_state = RoomsState(
-    creatures_state,
-    containers_state,
-    doors_state,
-    items_state,
-    **rooms_ini_config.sections
-)
-
-game_state = GameState(
-    rooms_state, creatures_state, containers_state, doors_state, items_state
-)
+validate_world(
+    game_state.rooms_state,
+    game_state.doors_state,
+    game_state.containers_state,
+    game_state.creatures_state,
+).raise_for_errors()
 
 
 # Stage 3: instancing the CommandProcessor object.
 #
 # The state objects are summarized by a GameState object, which is the
-# sole argument to CommandProcessor.__init__. Its methods will consult
+# main argument to CommandProcessor.__init__. Its methods will consult
 # the game_state object to interact with the game's object environment.
-command_processor = CommandProcessor(game_state)
+#
+# The SAVE and LOAD commands use the file given with --save-file, or
+# advgame.sav in the current directory.
+save_path = "advgame.sav"
+if "--save-file" in sys.argv:
+    save_path = sys.argv[sys.argv.index("--save-file") + 1]
+command_processor = CommandProcessor(game_state, save_file=SaveFile(save_path))
+
+# With --seed N, dice are rolled from that seed instead of at random. With
+# --record PATH, the session is recorded to a transcript file that
+# advgame.py --replay can check later; it's played from a seed, chosen at
+# random if none was given, so that it can be replayed.
+transcript_writer = None
+if "--seed" in sys.argv or "--record" in sys.argv:
+    seed = randrange(2**32)
+    if "--seed" in sys.argv:
+        seed = int(sys.argv[sys.argv.index("--seed") + 1])
+    set_dice_roller(SeededDice(seed))
+    if "--record" in sys.argv:
+        transcript_writer = TranscriptWriter(
+            sys.argv[sys.argv.index("--record") + 1], seed
+        )
+
+# A command's response is assembled by an OutputWriter and written to the
+# terminal all at once.
+output_writer = OutputWriter(sys.stdout)
 
 
 ### Game data object environment established ###
@@ -115,11 +224,11 @@ that, enter BEGIN GAME and enter the dungeon!
 """
 )
 
-# input() builtin, and CommandProcessor.process() is used to interpret &
-# execute them.
+# input() builtin, and CommandProcessor.process_iter() is used to
+# interpret & execute them.
 #
-# process() returns a tuple of GameStateMessage subclass
-# objects; they always have a message property which returns a natural
+# process_iter() yields GameStateMessage subclass objects one at a
+# time; they always have a message property which returns a natural
 # language response to the command. It is either an error message or it
 # describes the results of a successful command.
 while True:
@@ -133,21 +242,27 @@ while True:
     if len(command) == 0:
         continue
 
-    result = command_processor.process(command)
-
     # GameStateMessage subclass objects' message properties return one
-    # or more long lines of text, so textwrapper is used
-    # to wrap the messages to 80 columns.
-    for game_state_message in result:
-        print(textwrapper(game_state_message.message))
+    # or more long lines of text, so the output writer wraps the
+    # messages to 80 columns. Each message is written as soon as it's
+    # yielded, so the result of the player's attack shows before the
+    # foe's counterattack is worked out.
+    results = list()
+    for game_state_message in command_processor.process_iter(command):
+        output_writer.add(game_state_message.message)
+        output_writer.flush()
+        results.append(game_state_message)
+    if transcript_writer is not None:
+        transcript_writer.write(command, results)
 
     # Any one of these three GameStateMessage subclass objects signifies
-    # the end of the game. If one of them occurs at the end of a list of
-    # state messages, the game exits.
+    # the end of the game. If one of them is the last state message
+    # yielded, the game exits.
     if isinstance(
-        result[-1],
+        game_state_message,
         (HaveQuitTheGameGSM, CharacterDeathGSM, WonTheGameGSM),
     ):
         exit(0)
 
-    print()
+    output_writer.add("")
+    output_writer.flush()
@@ -21,6 +21,54 @@ character themself.
 * advgame.process comprises a higher-level layer that handles processing
 commands entered by the player and returning semantic return values.
 
+* advgame.validation comprises a load-time structural check of the
+dungeon: matching doors, reachability of the exit and of the keys
+needed to get there.
+
+* advgame.world comprises the steps that build a GameState from the .ini
+texts, a template that hands out fresh copies of a world built once, and a
+factory whose copies share nothing and reset to the pristine world in
+place.
+
+* advgame.host comprises a pre-forking server that runs many sessions
+across worker processes sharing one copy of the world.
+
+* advgame.events comprises a per-room publish/subscribe bus that delivers
+the results of other players' actions to the players in the same room.
+
+* advgame.scheduler comprises a tick-based scheduler for creature actions
+such as regenerating, wandering and patrolling.
+
+* advgame.multiplayer comprises a shared world in which many players, each
+with their own character and cursor, explore the same rooms at once.
+
+* advgame.output comprises a buffered writer that wraps a command's
+response to a terminal's or connection's width and writes it at once.
+
+* advgame.savefile comprises the save file the SAVE and LOAD commands use,
+which appends only what changed since the last save and checksums what
+it writes.
+
+* advgame.solver comprises a breadth-first search of a world's game tree
+for the shortest sequence of commands that wins the game.
+
+* advgame.fuzzer comprises a harness that plays random commands against a
+world across worker processes and reports, minimized, the ones that raise
+exceptions.
+
+* advgame.replay comprises the recording of game sessions as transcripts,
+and a replayer that checks across worker processes that they still play
+as recorded.
+
+* advgame.loadgen comprises a load generator that plays many simulated
+players against a host or in process, and reports latency percentiles,
+throughput, errors and memory growth over time.
+
+* advgame.memreport comprises a report of the memory a large generated item
+catalog takes, in the compact per-type item layout and in the flat one it
+replaced, and a report of the game state message objects processing
+commands allocates, with flyweight instances shared and without.
+
 * advgame.statemsgs comprises the return values used in advgame.process;
 an abstract base class and a large collection of subclasses each
 of which implements a specific result case of one or more specific
@@ -37,9 +85,12 @@ from advgame.commands import (
     STARTER_GEAR,
     VALID_NAME_RE,
     attack_command,
+    attack_command_iter,
     _be_attacked_by_command,
     begin_game_command,
+    begin_game_command_iter,
     cast_spell_command,
+    cast_spell_command_iter,
     close_command,
     drink_command,
     drop_command,
@@ -47,14 +98,17 @@ from advgame.commands import (
     help_command,
     inventory_command,
     leave_command,
+    load_command,
     lock_command,
     look_at_command,
+    map_command,
     open_command,
     pick_up_command,
     pick_lock_command,
     put_command,
     quit_command,
     reroll_command,
+    save_command,
     set_class_command,
     set_name_command,
     status_command,
@@ -66,15 +120,20 @@ from advgame.data import ini_file_texts
 from advgame.elements import (
     AbilityScores,
     Armor,
+    AutoMap,
     Character,
+    CharacterBase,
     Chest,
     Coin,
     Container,
     ContainersState,
     Corpse,
     Creature,
+    CreatureBase,
+    CreatureTable,
     CreaturesState,
     Door,
+    DoorState,
     DoorsState,
     Doorway,
     Equipment,
@@ -91,12 +150,23 @@ from advgame.elements import (
     Potion,
     Room,
     RoomsState,
+    SQLiteContainersState,
+    SQLiteCreaturesState,
+    SQLiteDoorsState,
+    SQLiteRoomsState,
+    SQLiteWorldStore,
+    TabledCreature,
+    PackedDoorsState,
+    PackedItemsState,
+    PackedRoomsState,
+    WorldPack,
+    write_world_pack,
     Shield,
     Wand,
     Weapon,
     WoodenDoor,
 )
-from advgame.errors import BadCommandError, InternalError
+from advgame.errors import BadCommandError, InternalError, SaveFileError
 from advgame.process import CommandProcessor, Context
 from advgame.statemsgs import (
     AmbiguousDoorSpecifierGSM,
@@ -118,6 +188,7 @@ from advgame.statemsgs import (
     ContainerNotFoundGSM,
     DisplayHelpForCommandGSM,
     DisplayInventoryGSM,
+    DisplayMapGSM,
     DoorIsLockedGSM,
     DisplayRolledStatsGSM,
     DoorNotPresentGSM,
@@ -150,6 +221,8 @@ from advgame.statemsgs import (
     FoundItemOrItemsHereGSM,
     FoundNothingGSM,
     GameBeginsGSM,
+    GameLoadedGSM,
+    GameSavedGSM,
     HaveQuitTheGameGSM,
     NameOrClassNotSetGSM,
     ClassSetGSM,
@@ -158,6 +231,7 @@ from advgame.statemsgs import (
     InvalidPartGSM,
     ItemEquippedGSM,
     ItemNotDrinkableGSM,
+    ItemNotEquippableGSM,
     ItemNotEquippedGSM,
     DontPossessCorrectKeyGSM,
     ItemNotFoundGSM,
@@ -174,6 +248,7 @@ from advgame.statemsgs import (
     StatusOutputGSM,
     AmountToTakeUnclearGSM,
     NoCreatureToTargetGSM,
+    NoSavedGameGSM,
     NoSuchItemInInventoryGSM,
     GameStateMessage,
     DisplayCommandsGSM,
@@ -182,6 +257,8 @@ from advgame.statemsgs import (
     NotRecognizedGSM,
     OpponentNotFoundGSM,
     PutAmountOfItemGSM,
+    SavedGameCorruptGSM,
+    SavingUnavailableGSM,
     TargetHasBeenUnlockedGSM,
     TargetNotFoundGSM,
     TargetNotLockedGSM,
@@ -195,14 +272,71 @@ from advgame.statemsgs import (
     WonTheGameGSM,
     DontPossessCorrectKeyGSM,
     YouHaveNoWeaponOrWandEquippedGSM,
+    message_catalog,
+    results_to_json,
 )
 from advgame.utils import (
     join_strs_w_comma_conj,
     lexical_number_to_digits,
     roll_dice,
+    set_dice_roller,
     textwrapper,
     usage_verb,
 )
+from advgame.validation import WorldProblem, WorldValidationReport, validate_world
+from advgame.world import (
+    WorldFactory,
+    WorldSections,
+    WorldTemplate,
+    build_game_state,
+    load_world_sections,
+)
+from advgame.host import HashRing, PreforkHost
+from advgame.events import PUBLISHED_COMMANDS, RoomEvent, RoomEventBus, Subscription
+from advgame.scheduler import (
+    CreatureAction,
+    CreatureScheduler,
+    Patrol,
+    Regenerate,
+    RegenerateAll,
+    Wander,
+)
+from advgame.multiplayer import SharedWorld
+from advgame.output import OutputWriter
+from advgame.savefile import SaveFile
+from advgame.solver import (
+    ExpectedDice,
+    SeededDice,
+    Solution,
+    Solver,
+    legal_commands,
+    state_key,
+)
+from advgame.fuzzer import (
+    CommandGenerator,
+    FuzzFailure,
+    FuzzReport,
+    Fuzzer,
+    minimize_transcript,
+    play_transcript,
+)
+from advgame.replay import (
+    Divergence,
+    ReplayReport,
+    Replayer,
+    Transcript,
+    TranscriptWriter,
+    replay_transcript,
+)
+from advgame.loadgen import LoadGenerator, LoadReport, LoadWindow, SimulatedPlayer
+from advgame.memreport import (
+    MemoryReport,
+    MessageChurnReport,
+    generate_item_lists,
+    generate_item_sections,
+    item_catalog_memory_report,
+    message_churn_report,
+)
 
 
 __all__ = (
@@ -217,8 +351,11 @@ __all__ = (
     "VALID_NAME_RE",
     "_be_attacked_by_command",
     "attack_command",
+    "attack_command_iter",
     "begin_game_command",
+    "begin_game_command_iter",
     "cast_spell_command",
+    "cast_spell_command_iter",
     "close_command",
     "drink_command",
     "drop_command",
@@ -226,14 +363,17 @@ __all__ = (
     "help_command",
     "inventory_command",
     "leave_command",
+    "load_command",
     "lock_command",
     "look_at_command",
+    "map_command",
     "open_command",
     "pick_lock_command",
     "pick_up_command",
     "put_command",
     "quit_command",
     "reroll_command",
+    "save_command",
     "set_class_command",
     "set_name_command",
     "status_command",
@@ -246,6 +386,7 @@ __all__ = (
     "State",
     "AbilityScores",
     "Character",
+    "CharacterBase",
     "Equipment",
     "GameState",
     "ItemsMultiState",
@@ -255,8 +396,12 @@ __all__ = (
     "ContainersState",
     "Corpse",
     "Creature",
+    "CreatureBase",
+    "CreatureTable",
     "CreaturesState",
+    "TabledCreature",
     "Door",
+    "DoorState",
     "DoorsState",
     "Doorway",
     "IronDoor",
@@ -273,9 +418,21 @@ __all__ = (
     "Weapon",
     "Room",
     "RoomsState",
+    "AutoMap",
+    "SQLiteContainersState",
+    "SQLiteCreaturesState",
+    "SQLiteDoorsState",
+    "SQLiteRoomsState",
+    "SQLiteWorldStore",
+    "PackedDoorsState",
+    "PackedItemsState",
+    "PackedRoomsState",
+    "WorldPack",
+    "write_world_pack",
     # from advgame.errors
     "BadCommandError",
     "InternalError",
+    "SaveFileError",
     # from advgame.process
     "CommandProcessor",
     # from advgame.statemsgs.*
@@ -302,6 +459,7 @@ __all__ = (
     "DisplayCommandsGSM",
     "DisplayHelpForCommandGSM",
     "DisplayInventoryGSM",
+    "DisplayMapGSM",
     "DisplayRolledStatsGSM",
     "DontPossessCorrectKeyGSM",
     "DontPossessCorrectKeyGSM",
@@ -336,6 +494,8 @@ __all__ = (
     "FoundItemOrItemsHereGSM",
     "FoundNothingGSM",
     "GameBeginsGSM",
+    "GameLoadedGSM",
+    "GameSavedGSM",
     "GameStateMessage",
     "HaveQuitTheGameGSM",
     "InsufficientManaGSM",
@@ -343,6 +503,7 @@ __all__ = (
     "InvalidPartGSM",
     "ItemEquippedGSM",
     "ItemNotDrinkableGSM",
+    "ItemNotEquippableGSM",
     "ItemNotEquippedGSM",
     "ItemNotFoundGSM",
     "ItemNotFoundInContainerGSM",
@@ -356,12 +517,15 @@ __all__ = (
     "NameOrClassNotSetGSM",
     "NameSetGSM",
     "NoCreatureToTargetGSM",
+    "NoSavedGameGSM",
     "NoSuchItemInInventoryGSM",
     "NotAllowedNowGSM",
     "NotRecognizedGSM",
     "NotRecognizedGSM",
     "OpponentNotFoundGSM",
     "PutAmountOfItemGSM",
+    "SavedGameCorruptGSM",
+    "SavingUnavailableGSM",
     "StatusOutputGSM",
     "TargetHasBeenUnlockedGSM",
     "TargetNotFoundGSM",
@@ -375,10 +539,77 @@ __all__ = (
     "UnderwentHealingEffectGSM",
     "WonTheGameGSM",
     "YouHaveNoWeaponOrWandEquippedGSM",
+    "message_catalog",
+    "results_to_json",
     # from advgame.utils
     "join_strs_w_comma_conj",
     "lexical_number_to_digits",
     "roll_dice",
+    "set_dice_roller",
     "textwrapper",
     "usage_verb",
+    # from advgame.validation
+    "WorldProblem",
+    "WorldValidationReport",
+    "validate_world",
+    # from advgame.world
+    "WorldFactory",
+    "WorldSections",
+    "WorldTemplate",
+    "build_game_state",
+    "load_world_sections",
+    # from advgame.host
+    "HashRing",
+    "PreforkHost",
+    # from advgame.events
+    "PUBLISHED_COMMANDS",
+    "RoomEvent",
+    "RoomEventBus",
+    "Subscription",
+    # from advgame.scheduler
+    "CreatureAction",
+    "CreatureScheduler",
+    "Patrol",
+    "Regenerate",
+    "RegenerateAll",
+    "Wander",
+    # from advgame.multiplayer
+    "SharedWorld",
+    # from advgame.output
+    "OutputWriter",
+    # from advgame.savefile
+    "SaveFile",
+    # from advgame.solver
+    "ExpectedDice",
+    "SeededDice",
+    "Solution",
+    "Solver",
+    "legal_commands",
+    "state_key",
+    # from advgame.fuzzer
+    "CommandGenerator",
+    "FuzzFailure",
+    "FuzzReport",
+    "Fuzzer",
+    "minimize_transcript",
+    "play_transcript",
+    # from advgame.replay
+    "Divergence",
+    "ReplayReport",
+    "Replayer",
+    "Transcript",
+    "TranscriptWriter",
+    "replay_transcript",
+    # from advgame.loadgen
+    "LoadGenerator",
+    "LoadReport",
+    "LoadWindow",
+    "SimulatedPlayer",
+    # from advgame.memreport
+    "MemoryReport",
+    "MessageChurnReport",
+    "generate_item_lists",
+    "generate_item_sections",
+    "item_catalog_memory_report",
+    "message_churn_report",
 )
@@ -1,9 +1,12 @@
 #!/usr/bin/python3
 
-from advgame.commands.attack import attack_command
-from advgame.commands.be_atkd import _be_attacked_by_command
-from advgame.commands.begin import begin_game_command
-from advgame.commands.castspl import cast_spell_command
+from advgame.commands.attack import attack_command, attack_command_iter
+from advgame.commands.be_atkd import (
+    _be_attacked_by_command,
+    _be_attacked_by_command_iter,
+)
+from advgame.commands.begin import begin_game_command, begin_game_command_iter
+from advgame.commands.castspl import cast_spell_command, cast_spell_command_iter
 from advgame.commands.close import close_command
 from advgame.commands.constants import (
     COMMANDS_HELP,
@@ -21,14 +24,17 @@ from advgame.commands.equip import equip_command
 from advgame.commands.help_ import help_command
 from advgame.commands.inven import inventory_command
 from advgame.commands.leave import leave_command
+from advgame.commands.load import load_command
 from advgame.commands.lock import lock_command
 from advgame.commands.lookat import look_at_command
+from advgame.commands.map_ import map_command
 from advgame.commands.open_ import open_command
 from advgame.commands.pickup import pick_up_command
 from advgame.commands.pklock import pick_lock_command
 from advgame.commands.put import put_command
 from advgame.commands.quit import quit_command
 from advgame.commands.reroll import reroll_command
+from advgame.commands.save import save_command
 from advgame.commands.setcls import set_class_command
 from advgame.commands.setname import set_name_command
 from advgame.commands.status import status_command
@@ -47,9 +53,13 @@ __all__ = (
     "STARTER_GEAR",
     "VALID_NAME_RE",
     "attack_command",
+    "attack_command_iter",
     "_be_attacked_by_command",
+    "_be_attacked_by_command_iter",
     "begin_game_command",
+    "begin_game_command_iter",
     "cast_spell_command",
+    "cast_spell_command_iter",
     "close_command",
     "drink_command",
     "drop_command",
@@ -57,14 +67,17 @@ __all__ = (
     "help_command",
     "inventory_command",
     "leave_command",
+    "load_command",
     "lock_command",
     "look_at_command",
+    "map_command",
     "open_command",
     "pick_lock_command",
     "pick_up_command",
     "put_command",
     "quit_command",
     "reroll_command",
+    "save_command",
     "set_class_command",
     "set_name_command",
     "status_command",
@@ -1,6 +1,6 @@
 #!/usr/bin/python3
 
-from advgame.commands.be_atkd import _be_attacked_by_command
+from advgame.commands.be_atkd import _be_attacked_by_command_iter
 from advgame.commands.constants import COMMANDS_SYNTAX
 from advgame.statemsgs.attack import (
     AttackHitGSM,
@@ -13,7 +13,7 @@ from advgame.statemsgs.various import FoeDeathGSM
 from advgame.utils import roll_dice
 
 
-__all__ = ("attack_command",)
+__all__ = ("attack_command", "attack_command_iter")
 
 
 def attack_command(context, tokens):
@@ -41,17 +41,30 @@ def attack_command(context, tokens):
     * If the attack hits and kills the foe, a AttackHitGSM object and a
     FoeDeathGSM object are returned.
     """
+    return tuple(attack_command_iter(context, tokens))
+
+
+def attack_command_iter(context, tokens):
+    """
+    Execute the ATTACK command, yielding each GameStateMessage object as
+    soon as it's determined, so the result of the player's attack can be
+    delivered before the creature's counterattack is figured. The objects
+    yielded are the same ones attack_command() returns. The generator must
+    be run to completion for the command to take full effect.
+    """
     game_state = context.game_state
     # If the player character has no weapon or wand equipped, an error
     # is returned right away.
     if not game_state.character.weapon_equipped and (
         game_state.character_class != "Mage" or not game_state.character.wand_equipped
     ):
-        return (YouHaveNoWeaponOrWandEquippedGSM(game_state.character_class),)
+        yield YouHaveNoWeaponOrWandEquippedGSM(game_state.character_class)
+        return
 
     # Using this command with no argument is a syntax error.
     elif not tokens:
-        return (BadSyntaxGSM("ATTACK", COMMANDS_SYNTAX["ATTACK"]),)
+        yield BadSyntaxGSM("ATTACK", COMMANDS_SYNTAX["ATTACK"])
+        return
 
     # This var is used by some return values.
     weapon_type = "wand" if game_state.character.wand_equipped else "weapon"
@@ -59,15 +72,15 @@ def attack_command(context, tokens):
 
     # If there's no creature in the current room, an error is returned.
     if not game_state.rooms_state.cursor.creature_here:
-        return (OpponentNotFoundGSM(creature_title),)
+        yield OpponentNotFoundGSM(creature_title)
+        return
     # If the arguments don't match the title of the creature in the
     # current room, an error is returned.
     elif game_state.rooms_state.cursor.creature_here.title.lower() != creature_title:
-        return (
-            OpponentNotFoundGSM(
-                creature_title, game_state.rooms_state.cursor.creature_here.title
-            ),
+        yield OpponentNotFoundGSM(
+            creature_title, game_state.rooms_state.cursor.creature_here.title
         )
+        return
 
     # All possible errors have been handles, so the actual attack is
     # figured on the creature here.
@@ -79,18 +92,16 @@ def attack_command(context, tokens):
     # The attack doesn't meet or exceed the creature's armor class.
     if attack_result < creature.armor_class:
 
-        # So a attack-missed return value is prepared.
-        attack_missed_result = AttackMissedGSM(creature.title, weapon_type)
+        # So a attack-missed value is yielded.
+        yield AttackMissedGSM(creature.title, weapon_type)
 
         # The _be_attacked_by_command() pseudo-command is triggered by
-        # any attack command that doesn't kill the creature. Its tuple
-        # of return values is appended to the attack-missed return value
-        # and the combined tuple is returned.
+        # any attack command that doesn't kill the creature. Its values
+        # follow the attack-missed value.
         #
         # Please note that it's possible for _be_attacked_by_command()
         # to end in CharacterDeathGSM; the game might end right here.
-        be_attacked_by_result = _be_attacked_by_command(context, creature)
-        return (attack_missed_result,) + be_attacked_by_result
+        yield from _be_attacked_by_command_iter(context, creature)
     else:
         # attack_result >= creature.armor_class
 
@@ -110,23 +121,16 @@ def attack_command(context, tokens):
             game_state.rooms_state.cursor.container_here = corpse
             game_state.rooms_state.cursor.creature_here = None
 
-            # The return tuple is comprised of an attack-hit value and a
-            # foe-death value.
-            return (
-                AttackHitGSM(creature.title, damage_result, True, weapon_type),
-                FoeDeathGSM(creature.title),
-            )
+            # The values are an attack-hit value and a foe-death value.
+            yield AttackHitGSM(creature.title, damage_result, True, weapon_type)
+            yield FoeDeathGSM(creature.title)
         else:
             # creature.is_alive == True
 
-            # The attack hit but didn't kill, so the return tuple
-            # begins with an attack-hit value. The creature lived, so
-            # _be_attacked_by_command() is called and its return tuple
-            # is appended and the entire sequence is returned. Again,
-            # the counterattack might kill the player character, so the
-            # game might end right here.
-            attack_hit_result = AttackHitGSM(
-                creature.title, damage_result, False, weapon_type
-            )
-            be_attacked_by_result = _be_attacked_by_command(context, creature)
-            return (attack_hit_result,) + be_attacked_by_result
+            # The attack hit but didn't kill, so an attack-hit value is
+            # yielded first. The creature lived, so the values from
+            # _be_attacked_by_command() follow. Again, the counterattack
+            # might kill the player character, so the game might end
+            # right here.
+            yield AttackHitGSM(creature.title, damage_result, False, weapon_type)
+            yield from _be_attacked_by_command_iter(context, creature)
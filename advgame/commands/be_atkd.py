@@ -8,7 +8,7 @@ from advgame.statemsgs.be_atkd import (
 )
 
 
-__all__ = ("_be_attacked_by_command",)
+__all__ = ("_be_attacked_by_command", "_be_attacked_by_command_iter")
 
 
 def _be_attacked_by_command(context, creature):
@@ -20,6 +20,12 @@ def _be_attacked_by_command(context, creature):
     # True, the game ends.
     #
     # :creature: The foe creature that was targeted by attack_command().
+    return tuple(_be_attacked_by_command_iter(context, creature))
+
+
+def _be_attacked_by_command_iter(context, creature):
+    # The generator form of _be_attacked_by_command(), used by
+    # attack_command_iter() and cast_spell_command_iter().
     game_state = context.game_state
 
     # The attack is calculated.
@@ -28,9 +34,9 @@ def _be_attacked_by_command(context, creature):
     attack_result = roll_dice(attack_roll_dice_expr)
 
     # If the attack roll didn't meet or exceed the player character's
-    # armor class, an attacked-and-not-hit value is returned.
+    # armor class, an attacked-and-not-hit value is yielded.
     if attack_result < game_state.character.armor_class:
-        return (AttackedAndNotHitGSM(creature.title),)
+        yield AttackedAndNotHitGSM(creature.title)
     else:
         # attack_result >= game_state.character.armor_class
 
@@ -40,27 +46,24 @@ def _be_attacked_by_command(context, creature):
         if game_state.character.is_dead:
             # The attack killed the player character, so an
             # attacked-and-hit value and a character-death value are
-            # returned. Game over, it's that easy. Combat comes with
+            # yielded. Game over, it's that easy. Combat comes with
             # risk.
-            return_tuple = (
-                AttackedAndHitGSM(creature.title, damage_done, 0),
-                CharacterDeathGSM(),
-            )
-
+            #
             # The game_has_ended boolean is set True, and the
-            # game-ending return value is saved so that process() can
-            # return it if the frontend accidentally tries to submit
-            # another command.
+            # game-ending value is saved so that process() can return
+            # it if the frontend accidentally tries to submit another
+            # command. That's done before anything is yielded, so the
+            # game has ended whether or not the caller reads on.
+            character_death = CharacterDeathGSM()
             game_state.game_has_ended = True
-            context.game_ending_state_msg = return_tuple[-1]
-            return return_tuple
+            context.game_ending_state_msg = character_death
+            yield AttackedAndHitGSM(creature.title, damage_done, 0)
+            yield character_death
         else:
             # game_state.character.is_alive == True
 
             # The player character survived, so just an attacked-and-hit
-            # value is returned.
-            return (
-                AttackedAndHitGSM(
-                    creature.title, damage_done, game_state.character.hit_points
-                ),
+            # value is yielded.
+            yield AttackedAndHitGSM(
+                creature.title, damage_done, game_state.character.hit_points
             )
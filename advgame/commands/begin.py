@@ -8,7 +8,7 @@ from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.various import EnteredRoomGSM, ItemEquippedGSM
 
 
-__all__ = ("begin_game_command",)
+__all__ = ("begin_game_command", "begin_game_command_iter")
 
 
 def begin_game_command(game_state, tokens):
@@ -25,13 +25,24 @@ def begin_game_command(game_state, tokens):
     * Otherwise, returns a GameBeginsGSM object, one or more ItemEquippedGSM
     objects, and a EnteredRoomGSM object.
     """
+    return tuple(begin_game_command_iter(game_state, tokens))
+
+
+def begin_game_command_iter(game_state, tokens):
+    """
+    Execute the BEGIN GAME command, yielding each GameStateMessage object as
+    soon as it's determined. The objects yielded are the same ones
+    begin_game_command() returns. The generator must be run to completion
+    for the command to take full effect.
+    """
     # This command begins the game. Most of the work done is devoted to
     # creating the character's starting gear and equipping all of it.
 
     # This command takes no argument; if any were used, a syntax error
     # is returned.
     if len(tokens):
-        return (BadSyntaxGSM("BEGIN GAME", COMMANDS_SYNTAX["BEGIN GAME"]),)
+        yield BadSyntaxGSM("BEGIN GAME", COMMANDS_SYNTAX["BEGIN GAME"])
+        return
 
     # The game can't begin if the player hasn't used both SET
     # NAME and SET CLASS yet, so I check for that. If not, a
@@ -39,13 +50,13 @@ def begin_game_command(game_state, tokens):
     character_name = getattr(game_state, "character_name", None)
     character_class = getattr(game_state, "character_class", None)
     if not character_name or not character_class:
-        return (NameOrClassNotSetGSM(character_name, character_class),)
+        yield NameOrClassNotSetGSM(character_name, character_class)
+        return
 
     # The error checking is done, so GameState.game_has_begun is set
-    # to True, and a game-begins value is used to initialiZe the
-    # return_values tuple.
+    # to True, and a game-begins value is yielded.
     game_state.game_has_begun = True
-    return_values = (GameBeginsGSM(),)
+    yield GameBeginsGSM()
 
     # A player character receives starting equipment appropriate to
     # their class, as laid out in the STARTER_GEAR dict. The value there
@@ -67,47 +78,37 @@ def begin_game_command(game_state, tokens):
 
         # An appropriate item-equipped return value, complete with
         # either the updated armor_class value or the updated
-        # attack_bonus and damage values, is appended to the
-        # return_values tuple.
+        # attack_bonus and damage values, is yielded.
         if item.item_type == "armor":
-            return_values += (
-                ItemEquippedGSM(
-                    item.title,
-                    "armor",
-                    armor_class=game_state.character.armor_class,
-                ),
+            yield ItemEquippedGSM(
+                item.title,
+                "armor",
+                armor_class=game_state.character.armor_class,
             )
         elif item.item_type == "shield":
-            return_values += (
-                ItemEquippedGSM(
-                    item.title,
-                    "shield",
-                    armor_class=game_state.character.armor_class,
-                ),
+            yield ItemEquippedGSM(
+                item.title,
+                "shield",
+                armor_class=game_state.character.armor_class,
             )
         elif item.item_type == "wand":
-            return_values += (
-                ItemEquippedGSM(
-                    item.title,
-                    "wand",
-                    attack_bonus=game_state.character.attack_bonus,
-                    damage=game_state.character.damage_roll,
-                ),
+            yield ItemEquippedGSM(
+                item.title,
+                "wand",
+                attack_bonus=game_state.character.attack_bonus,
+                damage=game_state.character.damage_roll,
             )
         else:
-            return_values += (
-                ItemEquippedGSM(
-                    item.title,
-                    "weapon",
-                    attack_bonus=game_state.character.attack_bonus,
-                    damage=game_state.character.damage_roll,
-                ),
+            yield ItemEquippedGSM(
+                item.title,
+                "weapon",
+                attack_bonus=game_state.character.attack_bonus,
+                damage=game_state.character.damage_roll,
             )
 
-    # Lastly, an entered-room return value is appended to the
-    # return_values tuple, so a description of the first room will
-    # print.
-    return_values += (EnteredRoomGSM(game_state.rooms_state.cursor),)
+    # Lastly, an entered-room value is yielded, so a description of the
+    # first room will print.
+    yield EnteredRoomGSM(game_state.rooms_state.cursor)
 
     # From the player's perspective, the frontend printing out this
     # entire sequence of return values can look like:
@@ -119,5 +120,3 @@ def begin_game_command(game_state, tokens):
     # You're now wielding a mace. Your attack bonus is now +1 and your
     # weapon damage is now 1d6+1.
     # Antechamber of dungeon. There is a doorway to the north.
-
-    return return_values
@@ -2,7 +2,7 @@
 
 from advgame.utils import roll_dice
 
-from advgame.commands.be_atkd import _be_attacked_by_command
+from advgame.commands.be_atkd import _be_attacked_by_command_iter
 from advgame.commands.constants import COMMANDS_SYNTAX, SPELL_DAMAGE, SPELL_MANA_COST
 from advgame.statemsgs.castspl import (
     CastDamagingSpellGSM,
@@ -14,7 +14,7 @@ from advgame.statemsgs.command import BadSyntaxGSM, ClassRestrictedGSM
 from advgame.statemsgs.various import FoeDeathGSM, UnderwentHealingEffectGSM
 
 
-__all__ = ("cast_spell_command",)
+__all__ = ("cast_spell_command", "cast_spell_command_iter")
 
 
 def cast_spell_command(context, tokens):
@@ -44,28 +44,37 @@ def cast_spell_command(context, tokens):
     * If the character is a Priest, returns a CastHealingSpellGSM object and
     a UnderwentHealingEffectGSM object.
     """
+    return tuple(cast_spell_command_iter(context, tokens))
+
+
+def cast_spell_command_iter(context, tokens):
+    """
+    Execute the CAST SPELL command, yielding each GameStateMessage object as
+    soon as it's determined, so the result of the spell can be delivered
+    before the creature's counterattack is figured. The objects yielded are
+    the same ones cast_spell_command() returns. The generator must be run to
+    completion for the command to take full effect.
+    """
     game_state = context.game_state
 
     # The first error check detects if the player has used this command
     # while playing a Warrior or Thief. Those classes can't cast spells,
     # so a command-class-restricted error is returned.
     if game_state.character_class not in ("Mage", "Priest"):
-        return (ClassRestrictedGSM("CAST SPELL", "mage", "priest"),)
+        yield ClassRestrictedGSM("CAST SPELL", "mage", "priest")
 
     # This command takes no arguments, so if any were used a syntax
     # error is returned.
     elif len(tokens):
-        return (BadSyntaxGSM("CAST SPELL", COMMANDS_SYNTAX["CAST SPELL"]),)
+        yield BadSyntaxGSM("CAST SPELL", COMMANDS_SYNTAX["CAST SPELL"])
 
     # If the player character's mana is less than SPELL_MANA_COST, an
     # insufficient-mana error is returned.
     elif game_state.character.mana_points < SPELL_MANA_COST:
-        return (
-            InsufficientManaGSM(
-                game_state.character.mana_points,
-                game_state.character.mana_point_total,
-                SPELL_MANA_COST,
-            ),
+        yield InsufficientManaGSM(
+            game_state.character.mana_points,
+            game_state.character.mana_point_total,
+            SPELL_MANA_COST,
         )
 
     # The initial error handling is concluded, so now the execution
@@ -75,7 +84,7 @@ def cast_spell_command(context, tokens):
         # If the current room has no creature in it, a
         # no-creature-to-target error is returned.
         if game_state.rooms_state.cursor.creature_here is None:
-            return (NoCreatureToTargetGSM(),)
+            yield NoCreatureToTargetGSM()
         else:
             # Otherwise, spell damage is rolled and inflicted on
             # creature_here. The spell always hits (it's styled after
@@ -87,43 +96,36 @@ def cast_spell_command(context, tokens):
             game_state.character.spend_mana(SPELL_MANA_COST)
 
             # If the creature died, a cast-damaging-spell value and a
-            # foe-death value are returned.
+            # foe-death value are yielded.
             if creature.is_dead:
                 corpse = creature.convert_to_corpse()
                 game_state.rooms_state.cursor.container_here = corpse
                 game_state.rooms_state.cursor.creature_here = None
-                return (
-                    CastDamagingSpellGSM(
-                        creature.title, damage_dealt, creature_slain=True
-                    ),
-                    FoeDeathGSM(creature.title),
+                yield CastDamagingSpellGSM(
+                    creature.title, damage_dealt, creature_slain=True
                 )
+                yield FoeDeathGSM(creature.title)
             else:
                 # Otherwise, like ATTACK, using this command and
                 # not killing your foe means they counterattack.
-                # cast-damaging-spell is conjoined with the outcome
-                # of _be_attacked_by_command() and the total tuple is
-                # returned.
-                be_attacked_by_result = _be_attacked_by_command(context, creature)
-                return (
-                    CastDamagingSpellGSM(
-                        creature.title, damage_dealt, creature_slain=False
-                    ),
-                ) + be_attacked_by_result
+                # cast-damaging-spell is followed by the outcome of
+                # _be_attacked_by_command().
+                yield CastDamagingSpellGSM(
+                    creature.title, damage_dealt, creature_slain=False
+                )
+                yield from _be_attacked_by_command_iter(context, creature)
     else:
         # The Mage's spell is a damaging spell, but the Priest's spell
         # is a self-heal. The same SPELL_DAMAGE dice are used. The
         # healing is rolled and applied to the Character object. A
         # cast-healing-spell value and a underwent-healing-effect value
-        # are returned.
+        # are yielded.
         damage_rolled = roll_dice(SPELL_DAMAGE)
         healed_amt = game_state.character.heal_damage(damage_rolled)
         game_state.character.spend_mana(SPELL_MANA_COST)
-        return (
-            CastHealingSpellGSM(),
-            UnderwentHealingEffectGSM(
-                healed_amt,
-                game_state.character.hit_points,
-                game_state.character.hit_point_total,
-            ),
+        yield CastHealingSpellGSM()
+        yield UnderwentHealingEffectGSM(
+            healed_amt,
+            game_state.character.hit_points,
+            game_state.character.hit_point_total,
         )
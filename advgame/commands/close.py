@@ -1,10 +1,6 @@
 #!/usr/bin/python3
 
-from advgame.commands.utils import (
-    _preprocessing_for_lock_unlock_open_or_close,
-    _matching_door,
-)
-from advgame.elements import Door
+from advgame.commands.utils import _preprocessing_for_lock_unlock_open_or_close
 from advgame.statemsgs import GameStateMessage
 from advgame.statemsgs.close import ElementHasBeenClosedGSM, ElementIsAlreadyClosedGSM
 
@@ -52,17 +48,10 @@ def close_command(game_state, tokens):
     # If the element to close is already closed, a
     if element_to_close.is_closed:
         return (ElementIsAlreadyClosedGSM(element_to_close.title),)
-    elif isinstance(element_to_close, Door):
-        # This is a door object, and it only represents _this side_ of
-        # the door game element; I use _matching_door() to fetch the
-        # door object representing the opposite side so that the door
-        # game element will be closed from the perspective of either
-        # room.
-        opposite_door = _matching_door(game_state, element_to_close)
-        if opposite_door is not None:
-            opposite_door.is_closed = True
 
     # I set the element's is_closed attribute to True, and return an
-    # element-has-been-closed value.
+    # element-has-been-closed value. A door object shares its state with
+    # the door object in the room on the other side, so the door is
+    # closed from the perspective of either room.
     element_to_close.is_closed = True
     return (ElementHasBeenClosedGSM(element_to_close.title),)
@@ -58,6 +58,7 @@ COMMANDS_SYNTAX = {
         "[USING\xa0or\xa0VIA]\xa0<door\xa0name>",
         "[USING\xa0or\xa0VIA]\xa0<compass\xa0direction>\xa0<door\xa0name>",
     ),
+    "LOAD": ("",),
     "LOCK": ("<door\xa0name>", "<chest\xa0name>"),
     "LOOK AT": (
         "<item\xa0name>",
@@ -67,6 +68,7 @@ COMMANDS_SYNTAX = {
         "<compass\xa0direction>\xa0DOOR",
         "<compass\xa0direction>\xa0DOORWAY",
     ),
+    "MAP": ("",),
     "OPEN": ("<door\xa0name>", "<chest\xa0name>"),
     "PICK LOCK": ("ON\xa0[THE]\xa0<chest\xa0name>", "ON\xa0[THE]\xa0<door\xa0name>"),
     "PICK UP": ("<item\xa0name>", "<number>\xa0<item\xa0name>"),
@@ -78,6 +80,7 @@ COMMANDS_SYNTAX = {
     ),
     "QUIT": ("",),
     "REROLL": ("",),
+    "SAVE": ("",),
     "SET CLASS": ("[TO]\xa0<Warrior,\xa0Thief,\xa0Mage\xa0or\xa0Priest>",),
     "SET NAME": ("[TO]\xa0<character\xa0name>",),
     "STATUS": ("",),
@@ -131,12 +134,17 @@ COMMANDS_HELP = {
     "LEAVE": "The LEAVE command is used to exit the room you're in using the "
     + "door you specify. If the door is locked you will be unable to "
     + "leave using it until you can unlock it.",
+    "LOAD": "The LOAD command restores the game you last saved with the "
+    + "SAVE command, replacing the one in progress. It can be used "
+    + "before game start to resume a saved game.",
     "LOCK": "The LOCK command is used to lock doors and chests. You need a "
     + "door key to lock doors and a chest key to lock chests. These "
     + "keys can be found somewhere in the dungeon.",
     "LOOK AT": "The LOOK at command can be used to get more information about "
     + "doors, items on the floor or in a chest or on a corpse, "
     + "chests, creatures and corpses.",
+    "MAP": "The MAP command displays a map of the rooms you have visited so "
+    + "far, centered on the room you're in.",
     "OPEN": "The OPEN command is used to open doors and chests.",
     "PICK LOCK": "Only Thieves can use the pick lock command. The pick lock "
     + "command enables you to unlock a door or chest without "
@@ -153,6 +161,8 @@ COMMANDS_HELP = {
     "REROLL": "The REROLL command is used before game start to get a fresh "
     + "selection of randomly generated ability scores. You can "
     + "reroll your ability scores as many times as you want.",
+    "SAVE": "The SAVE command saves the game in progress, so you can resume "
+    + "it later with the LOAD command.",
     "SET CLASS": "The SET CLASS command is used before game start to pick a "
     + "class for your character. Your options are Warrior, "
     + "Thief, Mage or Priest.",
@@ -176,28 +186,35 @@ COMMANDS_HELP = {
 
 VALID_NAME_RE = re.compile("^[A-Z][a-z]+$")
 
-PREGAME_COMMANDS = {"set_name", "set_class", "help", "reroll", "begin_game", "quit"}
-
-INGAME_COMMANDS = {
-    "attack",
-    "cast_spell",
-    "close",
-    "help",
-    "drink",
-    "drop",
-    "equip",
-    "leave",
-    "inventory",
-    "look_at",
-    "lock",
-    "open",
-    "pick_lock",
-    "pick_up",
-    "quit",
-    "put",
-    "quit",
-    "status",
-    "take",
-    "unequip",
-    "unlock",
-}
+PREGAME_COMMANDS = frozenset(
+    {"set_name", "set_class", "help", "reroll", "begin_game", "load", "quit"}
+)
+
+INGAME_COMMANDS = frozenset(
+    {
+        "attack",
+        "cast_spell",
+        "close",
+        "help",
+        "drink",
+        "drop",
+        "equip",
+        "leave",
+        "inventory",
+        "load",
+        "look_at",
+        "lock",
+        "map",
+        "open",
+        "pick_lock",
+        "pick_up",
+        "quit",
+        "put",
+        "quit",
+        "save",
+        "status",
+        "take",
+        "unequip",
+        "unlock",
+    }
+)
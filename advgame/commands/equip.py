@@ -2,7 +2,11 @@
 
 from advgame.commands.constants import COMMANDS_SYNTAX
 from advgame.statemsgs.command import BadSyntaxGSM
-from advgame.statemsgs.equip import ClassCantUseItemGSM, NoSuchItemInInventoryGSM
+from advgame.statemsgs.equip import (
+    ClassCantUseItemGSM,
+    ItemNotEquippableGSM,
+    NoSuchItemInInventoryGSM,
+)
 from advgame.statemsgs.various import ItemEquippedGSM, ItemUnequippedGSM
 
 
@@ -24,6 +28,9 @@ def equip_command(game_state, tokens):
     * If the item isn't in inventory, returns a NoSuchItemInInventoryGSM
     object.
 
+    * If the item isn't armor, a shield, a wand or a weapon, returns a
+    ItemNotEquippableGSM object.
+
     * If the item can't be used by the character due to their class, returns
     a ClassCantUseItemGSM object.
 
@@ -61,6 +68,11 @@ def equip_command(game_state, tokens):
     # The Item subclass object was found and is saved.
     (item,) = matching_item_tuple[0:1]
 
+    # Only armor, shields, wands and weapons can be equipped; anything
+    # else gets an item-not-equippable error.
+    if item.item_type not in ("armor", "shield", "wand", "weapon"):
+        return (ItemNotEquippableGSM(item_title, item.item_type),)
+
     # I check that the item has a {class}_can_use = True attribute. f
     # Inot, a class-can't-use-item error is returned.
     can_use_attr = game_state.character_class.lower() + "_can_use"
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+
+from advgame.commands.constants import COMMANDS_SYNTAX
+from advgame.errors import SaveFileError
+from advgame.statemsgs.command import BadSyntaxGSM
+from advgame.statemsgs.load import GameLoadedGSM, NoSavedGameGSM, SavedGameCorruptGSM
+from advgame.statemsgs.save import SavingUnavailableGSM
+from advgame.statemsgs.various import EnteredRoomGSM
+
+
+__all__ = ("load_command",)
+
+
+def load_command(context, tokens):
+    """
+    Execute the LOAD command. The return value is always in a tuple even
+    when it's of length 1. The LOAD command takes no arguments.
+
+    * If the command is used with any arguments, returns a BadSyntaxGSM
+    object.
+
+    * If there's no save file to load from, returns a SavingUnavailableGSM
+    object.
+
+    * If no game has been saved, returns a NoSavedGameGSM object.
+
+    * If the save file is damaged, returns a SavedGameCorruptGSM object.
+
+    * Otherwise, the saved game replaces the one in progress, and a
+    GameLoadedGSM object and an EnteredRoomGSM object are returned.
+    """
+    # This command takes no arguments, so if any were supplied, I return
+    # a syntax error.
+    if len(tokens):
+        return (BadSyntaxGSM("LOAD", COMMANDS_SYNTAX["LOAD"]),)
+
+    if context.save_file is None:
+        return (SavingUnavailableGSM(),)
+    elif not context.save_file.exists():
+        return (NoSavedGameGSM(),)
+
+    # The save file is read and checked in full before any of the game
+    # state is touched, so a damaged file leaves the game as it was.
+    try:
+        context.save_file.load(context.game_state)
+    except SaveFileError:
+        return (SavedGameCorruptGSM(),)
+
+    # The game may have been loaded from the pregame, so I return the
+    # same room description BEGIN GAME ends with.
+    return (
+        GameLoadedGSM(context.game_state.character_name),
+        EnteredRoomGSM(context.game_state.rooms_state.cursor),
+    )
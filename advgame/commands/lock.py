@@ -1,10 +1,7 @@
 #!/usr/bin/python3
 
 from advgame.commands.constants import COMMANDS_SYNTAX
-from advgame.commands.utils import (
-    _matching_door,
-    _preprocessing_for_lock_unlock_open_or_close,
-)
+from advgame.commands.utils import _preprocessing_for_lock_unlock_open_or_close
 from advgame.elements import Door
 from advgame.statemsgs import GameStateMessage
 from advgame.statemsgs.command import BadSyntaxGSM
@@ -85,17 +82,10 @@ def lock_command(game_state, tokens):
     # element-is-already-locked error is returned.
     elif element_to_lock.is_locked:
         return (ElementIsAlreadyLockedGSM(element_to_lock.title),)
-    elif isinstance(element_to_lock, Door):
-        # This is a door object, and it only represents _this side_ of
-        # the door game element; I use _matching_door() to fetch the
-        # door object representing the opposite side so that the door
-        # game element will be locked from the perspective of either
-        # room.
-        opposite_door = _matching_door(game_state, element_to_lock)
-        if opposite_door is not None:
-            opposite_door.is_locked = True
-
-    # The element_to_lock's is_locked attribute is set to rue, and a
-    # Telement-has-been-locked value is returned.
+
+    # The element_to_lock's is_locked attribute is set to True, and an
+    # element-has-been-locked value is returned. A door object shares
+    # its state with the door object in the room on the other side, so
+    # the door is locked from the perspective of either room.
     element_to_lock.is_locked = True
     return (ElementHasBeenLockedGSM(element_to_lock.title),)
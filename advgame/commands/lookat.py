@@ -253,11 +253,15 @@ def look_at_command(game_state, tokens):
 
         # The target isn't a creature, or a container, or in a
         # container, or in the character's inventory, so I check the
-        # floor. Again I iterate through items looking for a match.
+        # floor. Again I iterate through items looking for a match. A room
+        # with nothing on the floor has no items_here object.
+        items_here = game_state.rooms_state.cursor.items_here
+        if items_here is None:
+            return (FoundNothingGSM(target_title, "floor"),)
         for item_name, (
             item_qty,
             item,
-        ) in game_state.rooms_state.cursor.items_here.items():
+        ) in items_here.items():
             if item.title != target_title:
                 continue
             # If I find a match, I return a found-item-here value.
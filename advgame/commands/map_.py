@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+
+from advgame.commands.constants import COMMANDS_SYNTAX
+from advgame.statemsgs.command import BadSyntaxGSM
+from advgame.statemsgs.map_ import DisplayMapGSM
+
+
+__all__ = ("map_command",)
+
+
+def map_command(game_state, tokens):
+    """
+    Execute the MAP command. The return value is always in a tuple even
+    when it's of length 1. The MAP command takes no arguments.
+
+    * If the command is used with any arguments, returns a BadSyntaxGSM
+    object.
+
+    * Otherwise, returns a DisplayMapGSM object.
+    """
+    # This command takes no arguments; if any are specified, a syntax
+    # error is returned.
+    if len(tokens):
+        return (BadSyntaxGSM("MAP", COMMANDS_SYNTAX["MAP"]),)
+
+    # The RoomsState object's AutoMap has been tracking the rooms
+    # visited all along, so rendering the map is all that's left to do.
+    automap = game_state.rooms_state.automap
+    return (DisplayMapGSM(automap.render(game_state.rooms_state), automap.LEGEND),)
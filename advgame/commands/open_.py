@@ -1,10 +1,6 @@
 #!/usr/bin/python3
 
-from advgame.commands.utils import (
-    _matching_door,
-    _preprocessing_for_lock_unlock_open_or_close,
-)
-from advgame.elements import Door
+from advgame.commands.utils import _preprocessing_for_lock_unlock_open_or_close
 from advgame.statemsgs import GameStateMessage
 from advgame.statemsgs.open_ import (
     ElementHasBeenOpenedGSM,
@@ -65,16 +61,10 @@ def open_command(game_state, tokens):
         # Otherwise if it's alreadty open, an element-is-already-open
         # error is returned.
         return (ElementIsAlreadyOpenGSM(element_to_open.title),)
-    elif isinstance(element_to_open, Door):
-        # This is a door object, and it only represents _this side_ of
-        # the door game element; I use _matching_door() to fetch the
-        # door object representing the opposite side so that the door
-        # game element will be open from the perspective of either room.
-        opposite_door = _matching_door(game_state, element_to_open)
-        if opposite_door is not None:
-            opposite_door.is_closed = False
 
     # The element has is_closed set to False and an
-    # element-has-been-opened value is returned.
+    # element-has-been-opened value is returned. If it's a door, the
+    # door object in the room on the other side shares its state, so the
+    # door is open from the perspective of either room.
     element_to_open.is_closed = False
     return (ElementHasBeenOpenedGSM(element_to_open.title),)
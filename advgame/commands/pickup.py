@@ -49,7 +49,7 @@ def pick_up_command(game_state, tokens):
 
     # If the contents of tokens is a door specifier, _door_selector() is
     # used.
-    if tokens[-1] in ("door", "doorway"):
+    if tokens and tokens[-1] in ("door", "doorway"):
         result = _door_selector(game_state, tokens)
         # If an error value was returned, it's returned.
         if isinstance(result[0], GameStateMessage):
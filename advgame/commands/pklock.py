@@ -3,7 +3,7 @@
 from itertools import chain
 
 from advgame.commands.constants import COMMANDS_SYNTAX
-from advgame.commands.utils import _door_selector, _matching_door
+from advgame.commands.utils import _door_selector
 from advgame.elements import (
     Corpse,
     Doorway,
@@ -112,17 +112,11 @@ def pick_lock_command(game_state, tokens):
             # error value is returned.
             return (TargetNotLockedGSM(target_title),)
         else:
-            # This is a door object, and it only represents _this side_
-            # of the door game element; I use _matching_door() to fetch
-            # the door object representing the opposite side so that the
-            # door game element will be unlocked from the perspective of
-            # either room.
-            opposite_door = _matching_door(game_state, door)
-            if opposite_door is not None:
-                opposite_door.is_locked = False
-
             # The door's is_locked attribute is set to False, and a
-            # target-has-been-unlocked value is returned.
+            # target-has-been-unlocked value is returned. The door
+            # object shares its state with the door object in the room
+            # on the other side, so the door is unlocked from the
+            # perspective of either room.
             door.is_locked = False
             return (TargetHasBeenUnlockedGSM(target_title),)
     # The target isn't a door. If there is a container here and its
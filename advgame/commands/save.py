@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+
+from advgame.commands.constants import COMMANDS_SYNTAX
+from advgame.statemsgs.command import BadSyntaxGSM
+from advgame.statemsgs.save import GameSavedGSM, SavingUnavailableGSM
+
+
+__all__ = ("save_command",)
+
+
+def save_command(context, tokens):
+    """
+    Execute the SAVE command. The return value is always in a tuple even
+    when it's of length 1. The SAVE command takes no arguments.
+
+    * If the command is used with any arguments, returns a BadSyntaxGSM
+    object.
+
+    * If there's no save file to save to, returns a SavingUnavailableGSM
+    object.
+
+    * Otherwise, the game is saved, and a GameSavedGSM object is returned.
+    """
+    # This command takes no arguments, so if any were supplied, I return
+    # a syntax error.
+    if len(tokens):
+        return (BadSyntaxGSM("SAVE", COMMANDS_SYNTAX["SAVE"]),)
+
+    # The frontend decides where games are saved; if it didn't supply a
+    # save file, saving isn't possible.
+    if context.save_file is None:
+        return (SavingUnavailableGSM(),)
+
+    # The SaveFile object works out whether to append the changes since
+    # the last save or rewrite the file, so all that's left is to call it.
+    context.save_file.save(context.game_state)
+    return (GameSavedGSM(),)
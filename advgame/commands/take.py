@@ -75,7 +75,9 @@ def take_command(game_state, tokens):
             ),
         )
 
-    ((item_internal_name, (item_quantity, item)),) = matching_item
+    # Two different items can share a title; if so, the first one found
+    # is taken.
+    ((item_internal_name, (item_quantity, item)),) = matching_item[0:1]
 
     # The private workhorse method couldn't determine a quantity and
     # returned the signal value NaN, so I assume the entire amount
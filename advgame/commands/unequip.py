@@ -183,3 +183,7 @@ def unequip_command(game_state, tokens):
                     return (
                         ItemUnequippedGSM(item_title, "weapon", now_cant_attack=True),
                     )
+    else:
+        # The item isn't something that can be equipped, so it can't be
+        # equipped now; I return a generic item-not-equipped error.
+        return (ItemNotEquippedGSM(item_title),)
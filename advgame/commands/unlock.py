@@ -1,10 +1,7 @@
 #!/usr/bin/python3
 
 from advgame.commands.constants import COMMANDS_SYNTAX
-from advgame.commands.utils import (
-    _preprocessing_for_lock_unlock_open_or_close,
-    _matching_door,
-)
+from advgame.commands.utils import _preprocessing_for_lock_unlock_open_or_close
 from advgame.elements import Door
 from advgame.statemsgs import GameStateMessage
 from advgame.statemsgs.command import BadSyntaxGSM
@@ -82,17 +79,10 @@ def unlock_command(game_state, tokens):
         # Otherwise, if the item is already unlocked, I return an
         # element-is-already-unlocked error.
         return (ElementIsAlreadyUnlockedGSM(element_to_unlock.title),)
-    elif isinstance(element_to_unlock, Door):
-        # This is a door object, and it only represents _this side_ of
-        # the door game element; I use _matching_door() to fetch the
-        # door object representing the opposite side so that the door
-        # game element will be unlocked from the perspective of either
-        # room.
-        opposite_door = _matching_door(game_state, element_to_unlock)
-        if opposite_door is not None:
-            opposite_door.is_locked = False
 
     # I unlock the element, and return an element-has-been-unlocked
-    # value.
+    # value. A door object shares its state with the door object in the
+    # room on the other side, so the door is unlocked from the
+    # perspective of either room.
     element_to_unlock.is_locked = False
     return (ElementHasBeenUnlockedGSM(element_to_unlock.title),)
@@ -39,7 +39,6 @@ from advgame.utils import (
 __all__ = (
     "_door_selector",
     "_look_at_item_detail",
-    "_matching_door",
     "_pick_up_or_drop_preproc",
     "_preprocessing_for_lock_unlock_open_or_close",
     "_put_or_take_preproc",
@@ -86,26 +85,14 @@ def _door_selector(game_state, tokens):
     ):
         door_type = " ".join(tokens).replace(" ", "_")
 
-    # The tuple of doors in the current room is assigned to a local
-    # variable, and I iterate across it trying to match compass_dir,
-    # door_type, or both. As a fallback, 'door' vs. 'doorway' in the
-    # title is tested. Matches are saved to matching_doors.
-    doors = game_state.rooms_state.cursor.doors
-    matching_doors = list()
-    for door in doors:
-        if compass_dir is not None and door_type is not None:
-            if not (door.title.startswith(compass_dir) and door.door_type == door_type):
-                continue
-        elif compass_dir is not None:
-            if not door.title.startswith(compass_dir):
-                continue
-        elif door_type is not None:
-            if door.door_type != door_type:
-                continue
-        else:
-            if not door.title.endswith(tokens[-1]):
-                continue
-        matching_doors.append(door)
+    # The current room's door index is looked up by compass_dir,
+    # door_type, or both. As a fallback, 'door' vs. 'doorway' is looked
+    # up. Matches are saved to matching_doors, keyed by compass
+    # direction.
+    index_keys = tuple(key for key in (compass_dir, door_type) if key is not None)
+    matching_doors = game_state.rooms_state.cursor.find_doors(
+        *(index_keys or (tokens[-1],))
+    )
 
     # If no doors matched, a door-not-present error is returned.
     if len(matching_doors) == 0:
@@ -115,18 +102,15 @@ def _door_selector(game_state, tokens):
         # ambiguous-door-specifier error is returned. If possible, it's
         # constructed with a door_type value to give a more useful error
         # message.
-        compass_dirs = tuple(door.title.split(" ")[0] for door in matching_doors)
+        compass_dirs = tuple(matching_doors)
         # Checks that all door_types are the same.
-        door_type = (
-            matching_doors[0].door_type
-            if len(set(door.door_type for door in matching_doors)) == 1
-            else None
-        )
+        door_types = set(door.door_type for door in matching_doors.values())
+        door_type = door_types.pop() if len(door_types) == 1 else None
         return (AmbiguousDoorSpecifierGSM(compass_dirs, tokens[-1], door_type),)
     else:
         # Otherwise matching_doors is length 1; I have a match, so I
         # return it.
-        return matching_doors
+        return list(matching_doors.values())
 
 
 def _look_at_item_detail(element):
@@ -168,10 +152,14 @@ def _look_at_item_detail(element):
                 )
         # The first class name is titlecased because it's the start of
         # a sentence, and the list of classes is formed into a sentence
-        # appended to the working string.
-        can_use_list[0] = can_use_list[0].title()
-        descr_append_str += join_strs_w_comma_conj(can_use_list, "and")
-        descr_append_str += " can use this."
+        # appended to the working string. Some items, like a creature's
+        # armor, can't be used by any class.
+        if can_use_list:
+            can_use_list[0] = can_use_list[0].title()
+            descr_append_str += join_strs_w_comma_conj(can_use_list, "and")
+            descr_append_str += " can use this."
+        else:
+            descr_append_str += "No one can use this."
     elif isinstance(element, Potion):
         # If it's a potion, the points recovered are mentioned.
         if element.title == "mana potion":
@@ -192,65 +180,6 @@ def _look_at_item_detail(element):
     return element.description + descr_append_str
 
 
-def _matching_door(game_state, target_door):
-    # Fetches the corresponding door object in the room linked to by a
-    # door object, so an operation can be performed on both door objects
-    # representing the two sides of the same door element. Returns None
-    # if the door being tested is the exit door of the dungeon.
-    #
-    # :target_door: A door object. return: A door object, or None.
-
-    # There's a limitation in the implementations of close_command(),
-    # lock_command(), open_command(), pick_lock_command(), and
-    # unlock_command(): when targetting a door, the door object that's
-    # retrieved to unlock is the one that represents that exit from the
-    # current room object; but the other room linked by that door uses a
-    # different door object to represent the opposite side of the same
-    # notional door game element. In order to operate on the same door
-    # in two rooms, both door objects must have their state changed.
-
-    # This dict is used to match opposing door attributes so that the
-    # opposite door can be retrieved from the opposite room.
-    opposite_compass_door_attrs = {
-        "north_door": "south_door",
-        "east_door": "west_door",
-        "south_door": "north_door",
-        "west_door": "east_door",
-    }
-
-    # First I iterate across the four possible doors in the current room
-    # object to find which door_attr attribute name the door object is
-    # stored under.
-    door_found_at_attr = None
-    for door_attr in ("north_door", "south_door", "east_door", "west_door"):
-        found_door = getattr(game_state.rooms_state.cursor, door_attr, None)
-        if found_door is target_door:
-            door_found_at_attr = door_attr
-            break
-
-    # I use the handy method Door.other_room_internal_name(), which
-    # returns the internal_name of the linked room when given the
-    # internal_name of the room the player is in.
-    other_room_internal_name = target_door.other_room_internal_name(
-        game_state.rooms_state.cursor.internal_name
-    )
-
-    # If the door is the exit to the dungeon, it will have 'Exit' as its
-    # other_room_internal_name. There is no far room or far door object,
-    # so I return None.
-    if other_room_internal_name == "Exit":
-        return None
-
-    # Otherwise, I fetch the opposite room, and use the
-    # opposite_door_attr to fetch the other door object that represents
-    # the other side of the game element door from the door object that
-    # I've got, and return it.
-    opposite_room = game_state.rooms_state.get(other_room_internal_name)
-    opposite_door_attr = opposite_compass_door_attrs[door_found_at_attr]
-    opposite_door = getattr(opposite_room, opposite_door_attr)
-    return opposite_door
-
-
 # Both PUT and TAKE have the same preprocessing challenges, so I
 # refactored their logic into a shared private preprocessing method.
 
@@ -271,6 +200,10 @@ def _pick_up_or_drop_preproc(command, tokens):
     # object or a AmountToPickUpUnclearGSM object is returned depending
     # on the value in command.
 
+    # Without any arguments, a syntax error is returned.
+    if not tokens:
+        return (BadSyntaxGSM(command.upper(), COMMANDS_SYNTAX[command.upper()]),)
+
     # This long boolean checks whether the first token in tokens can
     # indicate quantity.
     if (
@@ -300,8 +233,13 @@ def _pick_up_or_drop_preproc(command, tokens):
             item_quantity = 1
         elif tokens[0].isdigit():
 
-            # Otherwise if it parses as an int, I save that quantity.
+            # Otherwise if it parses as an int, I save that quantity. A
+            # quantity of zero is a syntax error.
             item_quantity = int(tokens[0])
+            if item_quantity == 0:
+                return (
+                    BadSyntaxGSM(command.upper(), COMMANDS_SYNTAX[command.upper()]),
+                )
 
         # If it's a direct article...
         elif tokens[0] == "the":
@@ -598,9 +536,11 @@ def _put_or_take_preproc(game_state, command, tokens):
     container_tokens = tokens[joinword_index + 1 :]
 
     # The first token is a digital number, so I cast it to int and set
-    # quantity.
+    # quantity. A quantity of zero is a syntax error.
     if item_tokens[0].isdigit():
         quantity = int(item_tokens[0])
+        if quantity == 0:
+            return (BadSyntaxGSM(command.upper(), COMMANDS_SYNTAX[command.upper()]),)
         item_tokens = item_tokens[1:]
 
     # The first token is a lexical number, so I convert it and set
@@ -627,6 +567,11 @@ def _put_or_take_preproc(game_state, command, tokens):
         # this with the total amount available when it's known.
         quantity = NaN
 
+    # If a quantity was all there was before the joinword, there's no
+    # item title, so a syntax error is returned.
+    if not item_tokens:
+        return (BadSyntaxGSM(command.upper(), COMMANDS_SYNTAX[command.upper()]),)
+
     if item_tokens[-1].endswith("s"):
         if quantity == 1:
             # quantity is 1 but the item title is plural, so I return a
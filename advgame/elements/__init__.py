@@ -1,11 +1,13 @@
 #!/usr/bin/python3
 
+from advgame.elements.automap import AutoMap
 from advgame.elements.basics import IniEntry, State
 from advgame.elements.characters import (
     ItemsState,
     Equipment,
     ItemsMultiState,
     AbilityScores,
+    CharacterBase,
     Character,
     GameState,
 )
@@ -14,10 +16,20 @@ from advgame.elements.containers import (
     ContainersState,
     Chest,
     Corpse,
+    CreatureBase,
     Creature,
     CreaturesState,
+    TabledCreature,
+)
+from advgame.elements.creaturetable import CreatureTable
+from advgame.elements.doors import (
+    Door,
+    DoorState,
+    IronDoor,
+    WoodenDoor,
+    DoorsState,
+    Doorway,
 )
-from advgame.elements.doors import Door, IronDoor, WoodenDoor, DoorsState, Doorway
 from advgame.elements.items import (
     Item,
     EquippableItem,
@@ -31,20 +43,39 @@ from advgame.elements.items import (
     Armor,
 )
 from advgame.elements.rooms import Room, RoomsState
+from advgame.elements.sqlstore import (
+    SQLiteContainersState,
+    SQLiteCreaturesState,
+    SQLiteDoorsState,
+    SQLiteRoomsState,
+    SQLiteWorldStore,
+)
+from advgame.elements.worldpack import (
+    PackedDoorsState,
+    PackedItemsState,
+    PackedRoomsState,
+    WorldPack,
+    write_world_pack,
+)
 
 
 __all__ = (
     "AbilityScores",
     "Armor",
+    "AutoMap",
     "Character",
+    "CharacterBase",
     "Chest",
     "Coin",
     "Container",
     "ContainersState",
     "Corpse",
     "Creature",
+    "CreatureBase",
+    "CreatureTable",
     "CreaturesState",
     "Door",
+    "DoorState",
     "DoorsState",
     "Doorway",
     "Equipment",
@@ -57,12 +88,23 @@ __all__ = (
     "ItemsState",
     "Key",
     "Oddment",
+    "PackedDoorsState",
+    "PackedItemsState",
+    "PackedRoomsState",
     "Potion",
     "Room",
     "RoomsState",
+    "SQLiteContainersState",
+    "SQLiteCreaturesState",
+    "SQLiteDoorsState",
+    "SQLiteRoomsState",
+    "SQLiteWorldStore",
     "Shield",
     "State",
+    "TabledCreature",
     "Wand",
     "Weapon",
     "WoodenDoor",
+    "WorldPack",
+    "write_world_pack",
 )
@@ -0,0 +1,364 @@
+#!/usr/bin/python3
+
+from advgame.elements.doors import Doorway, DoorState, IronDoor, WoodenDoor
+
+
+__all__ = ("AutoMap",)
+
+
+class AutoMap:
+    """
+    This class tracks which rooms the player has visited and renders an
+    ASCII map of them. It's owned by a RoomsState object, which calls
+    visit() each time the cursor moves.
+
+    Visited rooms are recorded in a bitset indexed by room ordinal, and each
+    room is given grid coordinates relative to the entrance the first time
+    it's entered, by stepping from the room the player came from. Rendering
+    only ever looks at the rooms within the viewport around the player.
+    Each room's tile is cached until the room is marked dirty, by the player
+    entering or leaving it or by one of its doors changing state, and the
+    rendered rows of tiles are kept, so a MAP command only redraws the
+    tiles and joins the rows that changed since the last one.
+    """
+
+    __slots__ = (
+        "_ordinals",
+        "_visited",
+        "_coords",
+        "_cells",
+        "_extent",
+        "_current",
+        "_tile_cache",
+        "_dirty",
+        "_rows",
+        "_dirty_rows",
+    )
+
+    # The map is drawn in tiles TILE_WIDTH columns wide and TILE_HEIGHT
+    # rows high. The default viewport of 15x7 tiles is 75 columns wide, so
+    # it fits an 80-column terminal.
+
+    TILE_WIDTH = 5
+    TILE_HEIGHT = 3
+
+    VIEWPORT_WIDTH = 15
+    VIEWPORT_HEIGHT = 7
+
+    # A nonbreaking space is used for blank map cells, so textwrapper()
+    # neither strips the leading blanks from a map line nor breaks a map
+    # line across a newline.
+
+    BLANK = "\u00A0"
+
+    _blank_tile = (BLANK * TILE_WIDTH,) * TILE_HEIGHT
+
+    _walls = (("north", "-"), ("east", "|"), ("south", "-"), ("west", "|"))
+
+    _compass_steps = {
+        "north": (0, 1),
+        "east": (1, 0),
+        "south": (0, -1),
+        "west": (-1, 0),
+    }
+
+    # Door glyphs for the closed, locked and open states of each type of
+    # door. A doorway is drawn as a gap in the wall.
+
+    _door_glyphs = {
+        IronDoor: ("i", "I", "/"),
+        WoodenDoor: ("w", "W", "/"),
+    }
+
+    _generic_door_glyphs = ("d", "D", "/")
+
+    LEGEND = (
+        "@ = you, / = open door, w = closed wooden door, W = locked wooden "
+        + "door, i = closed iron door, I = locked iron door, d = closed door, "
+        + "D = locked door; a gap in a wall is a doorway."
+    )
+
+    def __init__(self, room_ordinals):
+        """
+        This __init__ method accepts the dict mapping room internal names to
+        ordinals that the owning RoomsState object maintains. The dict is
+        shared, not copied, so rooms added later are seen here too.
+
+        :room_ordinals: A dict of room internal name strings to ints.
+        """
+        self._ordinals = room_ordinals
+        self._visited = bytearray((len(room_ordinals) + 7) // 8)
+        self._coords = dict()
+        self._cells = dict()
+        self._extent = (0, 0)
+        self._current = None
+
+        # _tile_cache maps each room drawn to the door change count its
+        # door states were last checked at, those door states, and its
+        # tile. _rows maps each grid row rendered to its lines, or None if
+        # it has no rooms in it.
+
+        self._tile_cache = dict()
+        self._dirty = set()
+        self._rows = dict()
+        self._dirty_rows = set()
+
+    def visit(self, room_internal_name, from_room_internal_name=None, compass_dir=None):
+        """
+        This method records that the player has entered the given room. If
+        the room is entered for the first time and the room the player came
+        from is known, the new room is placed on the map grid one step from
+        that room in the given compass direction. A room with no known origin
+        is placed at the grid origin.
+
+        :room_internal_name: The internal name of the room entered.
+        :from_room_internal_name: The internal name of the room left, or
+        None.
+        :compass_dir: The direction of travel, one of 'north', 'east',
+        'south' or 'west', or None.
+        :return: None.
+        """
+        ordinal = self._ordinals[room_internal_name]
+        byte_index, bit_mask = ordinal >> 3, 1 << (ordinal & 7)
+        if byte_index >= len(self._visited):
+            self._visited.extend(bytes(byte_index - len(self._visited) + 1))
+        self._visited[byte_index] |= bit_mask
+
+        # The rooms entered and left are dirty, since the player's glyph
+        # has moved from one to the other.
+
+        self._dirty.add(room_internal_name)
+        if from_room_internal_name is not None:
+            self._dirty.add(from_room_internal_name)
+        if room_internal_name in self._coords:
+            return
+        if from_room_internal_name in self._coords and compass_dir is not None:
+            from_x, from_y = self._coords[from_room_internal_name]
+            step_x, step_y = self._compass_steps[compass_dir]
+            coords = (from_x + step_x, from_y + step_y)
+        else:
+            coords = (0, 0)
+        self._coords[room_internal_name] = coords
+
+        # If the dungeon isn't laid out on a grid, two rooms can land on
+        # the same coordinates; the first one to be visited keeps the cell.
+
+        self._place(coords, room_internal_name)
+
+    def _place(self, coords, room_internal_name):
+        # Gives a room the cell at the given coordinates, if it's free, and
+        # marks its row to be joined again. If the cell is beyond the width
+        # of the rendered rows, they're all joined again.
+        if self._cells.setdefault(coords, room_internal_name) != room_internal_name:
+            return
+        coord_x, coord_y = coords
+        min_x, max_x = self._extent
+        if not min_x <= coord_x <= max_x:
+            self._extent = (min(min_x, coord_x), max(max_x, coord_x))
+            self._rows.clear()
+        self._dirty_rows.add(coord_y)
+
+    def is_visited(self, room_internal_name):
+        """
+        This method returns True if the given room has been visited, False
+        otherwise.
+
+        :room_internal_name: The internal name of a room.
+        :return: A boolean.
+        """
+        ordinal = self._ordinals[room_internal_name]
+        byte_index = ordinal >> 3
+        if byte_index >= len(self._visited):
+            return False
+        return bool(self._visited[byte_index] & (1 << (ordinal & 7)))
+
+    def visited_count(self):
+        """
+        This method returns the number of rooms that have been visited.
+
+        :return: An int.
+        """
+        return sum(bin(byte).count("1") for byte in self._visited)
+
+    def snapshot(self):
+        """
+        This method returns the rooms visited and their map coordinates, in
+        the order they were first visited, as a list suitable for
+        serializing.
+
+        :return: A list of 3-lists of a string and two ints.
+        """
+        return [
+            [room_internal_name, coord_x, coord_y]
+            for room_internal_name, (coord_x, coord_y) in self._coords.items()
+        ]
+
+    def restore(self, snapshot):
+        """
+        This method replaces the record of visited rooms with the one in a
+        list as returned by snapshot().
+
+        :snapshot: A list of 3-lists of a string and two ints.
+        :return: None.
+        """
+        self._visited = bytearray(len(self._visited))
+        self._coords.clear()
+        self._cells.clear()
+        self._extent = (0, 0)
+        self._current = None
+        self._tile_cache.clear()
+        self._dirty.clear()
+        self._rows.clear()
+        self._dirty_rows.clear()
+        for room_internal_name, coord_x, coord_y in snapshot:
+            self._coords[room_internal_name] = (coord_x, coord_y)
+            self.visit(room_internal_name)
+            self._place((coord_x, coord_y), room_internal_name)
+
+    def render(self, rooms_state):
+        """
+        This method renders the visited rooms in the viewport centered on
+        the room the player is in as a multi-line string.
+
+        :rooms_state: The RoomsState object that owns this AutoMap.
+        :return: A string.
+        """
+        cursor_name = rooms_state.cursor.internal_name
+        if cursor_name != self._current:
+            self._dirty.update((self._current, cursor_name))
+            self._current = cursor_name
+        center_x, center_y = self._coords.get(cursor_name, (0, 0))
+        left = center_x - self.VIEWPORT_WIDTH // 2
+        top = center_y + self.VIEWPORT_HEIGHT // 2
+        grid_ys = range(top, top - self.VIEWPORT_HEIGHT, -1)
+
+        # Only the tiles of dirty rooms are redrawn. If a door has changed
+        # state anywhere since a visible tile was drawn, the door states
+        # of its room are compared with the ones it was drawn with; that's
+        # four reads, not the work of drawing it.
+
+        door_changes = DoorState.changes
+        for grid_y in grid_ys:
+            for grid_x in range(left, left + self.VIEWPORT_WIDTH):
+                room_name = self._cells.get((grid_x, grid_y))
+                if room_name is None:
+                    continue
+                cached = self._tile_cache.get(room_name)
+                if cached is not None and room_name not in self._dirty:
+                    if cached[0] == door_changes:
+                        continue
+                    door_states = self._door_states(rooms_state.get(room_name))
+                    if door_states == cached[1]:
+                        self._tile_cache[room_name] = (door_changes,) + cached[1:]
+                        continue
+                self._draw_tile(rooms_state.get(room_name), door_changes)
+
+        # The rendered rows span every column the map has a room in, so
+        # scrolling the viewport only slices them differently. Only the
+        # rows with a redrawn tile in them are joined again.
+
+        min_x, max_x = self._extent
+        slice_start = (left - min_x) * self.TILE_WIDTH
+        slice_end = slice_start + self.VIEWPORT_WIDTH * self.TILE_WIDTH
+        pad_left = self.BLANK * max(0, -slice_start)
+        map_lines = list()
+        for grid_y in grid_ys:
+            if grid_y not in self._rows or grid_y in self._dirty_rows:
+                self._rows[grid_y] = self._join_row(rooms_state, grid_y)
+                self._dirty_rows.discard(grid_y)
+            row_lines = self._rows[grid_y]
+            if row_lines is None:
+                continue
+            viewport_lines = [
+                pad_left + line[max(0, slice_start) : max(0, slice_end)]
+                for line in row_lines
+            ]
+
+            # Rows of the viewport with no visited rooms in them are left
+            # out entirely.
+
+            if viewport_lines[0].strip(self.BLANK):
+                map_lines.extend(viewport_lines)
+
+        # Blank columns on either side of the visited area are trimmed,
+        # so a small map isn't padded out to the full viewport width.
+
+        if not map_lines:
+            return ""
+        leading = min(len(line) - len(line.lstrip(self.BLANK)) for line in map_lines)
+        map_lines = [line[leading:].rstrip(self.BLANK) for line in map_lines]
+        return "\n".join(map_lines)
+
+    def _join_row(self, rooms_state, grid_y):
+        # Returns the TILE_HEIGHT lines of a row of tiles across the whole
+        # width of the map, or None if no room has been visited in it.
+        # Rooms in the row that haven't been drawn yet are drawn now.
+        min_x, max_x = self._extent
+        row_tiles = list()
+        any_room = False
+        for grid_x in range(min_x, max_x + 1):
+            room_name = self._cells.get((grid_x, grid_y))
+            if room_name is None:
+                row_tiles.append(self._blank_tile)
+                continue
+            any_room = True
+            if room_name not in self._tile_cache:
+                self._draw_tile(rooms_state.get(room_name), DoorState.changes)
+            row_tiles.append(self._tile_cache[room_name][2])
+        if not any_room:
+            return None
+        return tuple(
+            "".join(tile[line_index] for tile in row_tiles)
+            for line_index in range(self.TILE_HEIGHT)
+        )
+
+    def _draw_tile(self, room, door_changes):
+        # Draws the tile for a room as a tuple of TILE_HEIGHT strings and
+        # caches it with the door states it was drawn from and the door
+        # change count they were read at. The room's row is marked to be
+        # joined again.
+        north, east, south, west = (
+            self._door_glyph(getattr(room, f"{compass_dir}_door", None), wall_glyph)
+            for compass_dir, wall_glyph in self._walls
+        )
+        center = "@" if room.internal_name == self._current else self.BLANK
+        tile = (
+            f"+-{north}-+",
+            f"{west}{self.BLANK}{center}{self.BLANK}{east}",
+            f"+-{south}-+",
+        )
+        self._tile_cache[room.internal_name] = (
+            door_changes,
+            self._door_states(room),
+            tile,
+        )
+        self._dirty.discard(room.internal_name)
+        self._dirty_rows.add(self._coords[room.internal_name][1])
+
+    def _door_states(self, room):
+        # Returns the locked and closed states of a room's four doors.
+        return tuple(
+            (door.is_locked, door.is_closed) if door else None
+            for door in (
+                getattr(room, f"{compass_dir}_door", None)
+                for compass_dir, _ in self._walls
+            )
+        )
+
+    def _door_glyph(self, door, wall_glyph):
+        # Returns the single character used to draw a door in a tile's
+        # wall: the wall itself if there's no door, a gap if it's a
+        # doorway, and otherwise a glyph for the door type and state.
+        if not door:
+            return wall_glyph
+        elif isinstance(door, Doorway):
+            return self.BLANK
+        closed_glyph, locked_glyph, open_glyph = self._door_glyphs.get(
+            type(door), self._generic_door_glyphs
+        )
+        if door.is_locked:
+            return locked_glyph
+        elif door.is_closed:
+            return closed_glyph
+        else:
+            return open_glyph
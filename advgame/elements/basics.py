@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 import re
+import sys
 
 from abc import ABC
 
@@ -14,6 +15,8 @@ class IniEntry:
     from .ini file entries.
     """
 
+    __slots__ = ()
+
     # This regular expression is used to parse the contents= attributes
     # used by rooms.ini and containers.ini to encode initializing data
     # for an ItemsMultiState object into a single line of text. Used in
@@ -86,11 +89,13 @@ class IniEntry:
         \[\d+x[A-Z][A-Za-z_]+(,\d+[A-Z][A-Za-z_]+)*\].
         :return: A tuple of pairs of quantity ints and Item subclass objects.
         """
+        # The internal names are interned, so they're the same string
+        # objects as the ItemsState keys and Item.internal_name.
         value_match = self.inventory_list_value_re.match(inventory_value)
         inner_capture = value_match.groups(1)[0]
         capture_split = inner_capture.split(",")
         qty_strval_pairs = [
-            (int(item_qty), item_name)
+            (int(item_qty), sys.intern(item_name))
             for item_qty, item_name in (
                 name_x_qty_str.split("x", maxsplit=1)
                 for name_x_qty_str in capture_split
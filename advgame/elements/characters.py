@@ -1,11 +1,11 @@
 #!/usr/bin/python3
 
 from math import floor
-from random import randint
 
 from advgame.elements.basics import State
 from advgame.elements.items import Armor, Shield, Weapon, Wand, Item
 from advgame.errors import InternalError
+from advgame.utils import roll_dice
 
 
 __all__ = (
@@ -13,6 +13,7 @@ __all__ = (
     "Equipment",
     "ItemsMultiState",
     "AbilityScores",
+    "CharacterBase",
     "Character",
     "GameState",
 )
@@ -40,7 +41,7 @@ class ItemsState(State):
             item = Item.subclassing_factory(
                 internal_name=item_internal_name, **item_dict
             )
-            self._contents[item_internal_name] = item
+            self._contents[item.internal_name] = item
 
 
 class Equipment:
@@ -372,6 +373,45 @@ class ItemsMultiState(ItemsState):
                 self._contents[item_internal_name][1],
             )
 
+    def snapshot(self):
+        """
+        This method returns the contents of this object as a list of pairs of
+        quantity ints and Item internal names, suitable for serializing.
+
+        :return: A list of 2-lists of an int and a string.
+        """
+        return [
+            [item_qty, item_internal_name]
+            for item_internal_name, (item_qty, _) in self._contents.items()
+        ]
+
+    def restore(self, qty_name_pairs, items_state):
+        """
+        This method replaces the contents of this object with the items
+        described by a list of quantity-internal name pairs as returned by
+        snapshot(), looking up each Item subclass object in items_state.
+
+        :qty_name_pairs: A list of 2-lists of an int and a string.
+        :items_state: An ItemsState object.
+        :return: None.
+        """
+        self._contents.clear()
+        for item_qty, item_internal_name in qty_name_pairs:
+            item = items_state.get(item_internal_name)
+            self.set(item.internal_name, item_qty, item)
+
+
+# The order ability scores are recorded in by Character.snapshot().
+
+_ABILITY_SCORE_NAMES = (
+    "strength",
+    "dexterity",
+    "constitution",
+    "intelligence",
+    "wisdom",
+    "charisma",
+)
+
 
 class AbilityScores:
     """
@@ -536,7 +576,7 @@ class AbilityScores:
         """
         results_list = list()
         for _ in range(0, 6):
-            four_rolls = sorted([randint(1, 6) for _ in range(0, 4)])
+            four_rolls = sorted([roll_dice("1d6") for _ in range(0, 4)])
             three_rolls = four_rolls[1:4]
             results_list.append(sum(three_rolls))
         results_list.sort()
@@ -547,22 +587,21 @@ class AbilityScores:
             )
 
 
-class Character:
+class CharacterBase:
     """
-    This class represents a character. The player's interaction with the
-    game rules environment during play is mediated by an instance of this
-    class, which tracks their ability scores, equipment, hit points, mana
-    points if a spellcaster, and inventory.
+    This class holds the game rules logic shared by characters and creatures,
+    which tracks their ability scores, equipment, hit points, mana points if
+    a spellcaster, and inventory. It doesn't store the hit points and mana
+    points itself: a subclass provides the _hit_point_maximum,
+    _current_hit_points, _mana_point_maximum and _current_mana_points
+    attributes, either as slots or as properties that read and write them
+    somewhere else.
     """
 
     __slots__ = (
         "character_name",
         "character_class",
         "magic_key_stat",
-        "_hit_point_maximum",
-        "_current_hit_points",
-        "_mana_point_maximum",
-        "_current_mana_points",
         "ability_scores",
         "inventory",
         "_equipment",
@@ -720,7 +759,7 @@ class Character:
 
         # When the Character is instanced by a GameState object, none of
         # these values are supplied to __init__. But the Creature object
-        # that subclasses Character draws its values from an .ini entry,
+        # that subclasses CharacterBase draws its values from an .ini entry,
         # and it does have all these values supplied to __init__.
         #
         # Base hit points are taken either from an argument to __init__
@@ -772,6 +811,58 @@ class Character:
         else:
             self._mana_point_maximum = self._current_mana_points = 0
 
+    def snapshot(self):
+        """
+        This method returns the parts of the character's state that can change
+        during a game, and the name and class it was instantiated with, as a
+        dict suitable for serializing. Items are recorded by internal name.
+
+        :return: A dict.
+        """
+        equipment = dict()
+        for equipment_slot in ("armor", "shield", "weapon", "wand"):
+            item = getattr(self._equipment, equipment_slot)
+            equipment[equipment_slot] = item.internal_name if item else None
+        return {
+            "character_name": self.character_name,
+            "character_class": self.character_class,
+            "ability_scores": [
+                getattr(self.ability_scores, ability_score)
+                for ability_score in _ABILITY_SCORE_NAMES
+            ],
+            "hit_point_maximum": self._hit_point_maximum,
+            "hit_points": self._current_hit_points,
+            "mana_point_maximum": self._mana_point_maximum,
+            "mana_points": self._current_mana_points,
+            "inventory": self.inventory.snapshot(),
+            "equipment": equipment,
+        }
+
+    def restore(self, snapshot, items_state):
+        """
+        This method restores the character's state from a dict as returned by
+        snapshot(), looking up each Item subclass object in items_state.
+
+        :snapshot: A dict.
+        :items_state: An ItemsState object.
+        :return: None.
+        """
+        for ability_score, value in zip(
+            _ABILITY_SCORE_NAMES, snapshot["ability_scores"]
+        ):
+            setattr(self.ability_scores, ability_score, value)
+        self._hit_point_maximum = snapshot["hit_point_maximum"]
+        self._current_hit_points = snapshot["hit_points"]
+        self._mana_point_maximum = snapshot["mana_point_maximum"]
+        self._current_mana_points = snapshot["mana_points"]
+        self.inventory.restore(snapshot["inventory"], items_state)
+        for equipment_slot, item_internal_name in snapshot["equipment"].items():
+            setattr(
+                self._equipment,
+                equipment_slot,
+                items_state.get(item_internal_name) if item_internal_name else None,
+            )
+
     def _attack_or_damage_stat_dependency(self):
         """
         This private method is used by attack_roll(), attack_bonus() and
@@ -1482,6 +1573,23 @@ class Character:
         )
 
 
+class Character(CharacterBase):
+    """
+    This class represents a character. The player's interaction with the
+    game rules environment during play is mediated by an instance of this
+    class, which tracks their ability scores, equipment, hit points, mana
+    points if a spellcaster, and inventory. It stores its hit points and
+    mana points in its own attributes.
+    """
+
+    __slots__ = (
+        "_hit_point_maximum",
+        "_current_hit_points",
+        "_mana_point_maximum",
+        "_current_mana_points",
+    )
+
+
 class GameState:
     """
     This class represents the entire GameState needed to run a session
@@ -1594,3 +1702,100 @@ class GameState:
             and getattr(self, "character_class", None)
         ):
             self.character = Character(self.character_name, self.character_class)
+
+    def snapshot(self, elements=True):
+        """
+        This method returns the session's mutable state as a flat dict
+        suitable for serializing: the game's progress, the character, the
+        cursor and the automap, and the state of every instantiated room and
+        of the doors, chest and creature in it. Each room, door, chest and
+        creature is its own entry, keyed by its kind and internal name, so
+        two snapshots can be compared entry by entry. Rooms that were never
+        instantiated haven't changed, and aren't included.
+
+        :elements: A boolean; if False, the rooms, doors, chests and
+        creatures are left out, for a store that saves them itself.
+        :return: A dict.
+        """
+        entries = {
+            "game": {
+                "character_name": self._character_name,
+                "character_class": self._character_class,
+                "game_has_begun": self.game_has_begun,
+                "game_has_ended": self.game_has_ended,
+            },
+            "character": self.character.snapshot() if self.character else None,
+            "cursor": self.rooms_state.cursor.internal_name,
+            "automap": self.rooms_state.automap.snapshot(),
+        }
+        if not elements:
+            return entries
+        for room_internal_name in tuple(self.rooms_state.keys()):
+            if not self.rooms_state.is_materialized(room_internal_name):
+                continue
+            room = self.rooms_state.get(room_internal_name)
+            entries[f"room:{room_internal_name}"] = room.snapshot()
+            for door in room.doors:
+                entries[f"door:{door.internal_name}"] = door.snapshot()
+            container = room.container_here
+            if container is not None and container.container_type == "chest":
+                entries[f"chest:{container.internal_name}"] = container.snapshot()
+            if room.creature_here is not None:
+                creature = room.creature_here
+                entries[f"creature:{creature.internal_name}"] = creature.snapshot()
+        return entries
+
+    def restore(self, entries):
+        """
+        This method restores the session's state from a dict as returned by
+        snapshot(). In lazy mode, rooms instantiated since the snapshot was
+        taken are reset first. Doors, chests and creatures are restored before
+        the rooms that refer to them, and the character is reinstantiated from
+        its saved name and class and then its saved state. The name and class in
+        the game entry can differ from those, since they can be set again
+        after the character is instantiated.
+
+        :entries: A dict.
+        :return: None.
+        """
+        game = entries["game"]
+        self._character_name = game["character_name"]
+        self._character_class = game["character_class"]
+        self.game_has_begun = game["game_has_begun"]
+        self.game_has_ended = game["game_has_ended"]
+        self.character = None
+        if entries["character"] is not None:
+            self.character = Character(
+                entries["character"]["character_name"],
+                entries["character"]["character_class"],
+            )
+            self.character.restore(entries["character"], self.items_state)
+
+        # The entries are grouped by kind so they can be restored in
+        # dependency order.
+
+        entries_by_kind = {"door": [], "chest": [], "creature": [], "room": []}
+        for key, snapshot in entries.items():
+            kind, _, internal_name = key.partition(":")
+            if internal_name:
+                entries_by_kind[kind].append((internal_name, snapshot))
+
+        # The snapshot only included the rooms that had been instantiated,
+        # so in lazy mode any other room that has been since is returned to
+        # the way it was, along with its doors, chest and creature. Entries
+        # without rooms are from a store that saves them itself.
+
+        if entries_by_kind["room"]:
+            self.rooms_state.reset_rooms(
+                {internal_name for internal_name, _ in entries_by_kind["room"]}
+            )
+        for internal_name, snapshot in entries_by_kind["door"]:
+            self.doors_state.get(*internal_name.split("_x_")).restore(snapshot)
+        for internal_name, snapshot in entries_by_kind["chest"]:
+            self.containers_state.get(internal_name).restore(snapshot, self.items_state)
+        for internal_name, snapshot in entries_by_kind["creature"]:
+            self.creatures_state.get(internal_name).restore(snapshot)
+        for internal_name, snapshot in entries_by_kind["room"]:
+            self.rooms_state.get(internal_name).restore(snapshot)
+        self.rooms_state.place_cursor(entries["cursor"])
+        self.rooms_state.automap.restore(entries["automap"])
@@ -1,7 +1,8 @@
 #!/usr/bin/python3
 
 from advgame.elements.basics import IniEntry, State
-from advgame.elements.characters import Character, ItemsState, ItemsMultiState
+from advgame.elements.characters import CharacterBase, ItemsState, ItemsMultiState
+from advgame.elements.creaturetable import CreatureTable
 from advgame.errors import InternalError
 
 
@@ -10,8 +11,10 @@ __all__ = (
     "ContainersState",
     "Chest",
     "Corpse",
+    "CreatureBase",
     "Creature",
     "CreaturesState",
+    "TabledCreature",
 )
 
 
@@ -101,6 +104,32 @@ class Container(IniEntry, ItemsMultiState):
             container = Corpse(items_state, **container_dict)
         return container
 
+    def snapshot(self):
+        """
+        This method returns the parts of the object's state that can change
+        during a game, as a dict suitable for serializing.
+
+        :return: A dict.
+        """
+        return {
+            "is_locked": self.is_locked,
+            "is_closed": self.is_closed,
+            "contents": ItemsMultiState.snapshot(self),
+        }
+
+    def restore(self, snapshot, items_state):
+        """
+        This method restores the object's state from a dict as returned by
+        snapshot().
+
+        :snapshot: A dict.
+        :items_state: An ItemsState object.
+        :return: None.
+        """
+        self.is_locked = snapshot["is_locked"]
+        self.is_closed = snapshot["is_closed"]
+        ItemsMultiState.restore(self, snapshot["contents"], items_state)
+
 
 class ContainersState(ItemsState):
     """
@@ -149,41 +178,31 @@ class Corpse(Container):
     pass
 
 
-class Creature(IniEntry, Character):
+class CreatureBase(IniEntry, CharacterBase):
     """
     This class uses multiple inheritance to subclass both IniEntry and
-    Character. It is instantiated from an .ini file entry, but draws on all
-    the game rules entity logic in Character to have access to the same
-    mechanics as a character.
+    CharacterBase. It is instantiated from an .ini file entry, but draws on
+    all the game rules entity logic in CharacterBase to have access to the
+    same mechanics as a character. Like CharacterBase, it leaves the storage
+    of its hit points and mana points to a subclass: Creature keeps them in
+    its own attributes, and TabledCreature in a CreatureTable.
     """
 
     __slots__ = (
         "internal_name",
-        "character_name",
         "description",
-        "character_class",
         "species",
         "description_dead",
         "title",
-        "_strength",
-        "_dexterity",
-        "_constitution",
-        "_intelligence",
-        "_wisdom",
-        "_charisma",
         "_items_state",
-        "_base_hit_points",
-        "_weapon_equipped",
-        "_armor_equipped",
-        "_shield_equipped",
     )
 
     def __init__(self, items_state, internal_name, **argd):
         """
         This __init__ method initializes the object using super() to call
-        __init__ methods from both IniEntry and Character. It sets the ability
-        scores, populates its inventory, and sets up its equipment from its ini
-        file data.
+        __init__ methods from both IniEntry and CharacterBase. It sets the
+        ability scores, populates its inventory, and sets up its equipment from
+        its ini file data.
 
         :items_state: An ItemsState object.
         :internal_name: A string, the internal name of the creature.
@@ -193,7 +212,7 @@ class Creature(IniEntry, Character):
 
         # _separate_argd_into_different_arg_sets() is a utility function
         # that separates all the .ini key-value pairs into args for
-        # Character.__init__, args for IniEntry.__init__, attributes
+        # CharacterBase.__init__, args for IniEntry.__init__, attributes
         # that can be used to initialize an Equipment object, and
         # quantity/internal_name pairs that can be used to initialize an
         # Inventory object.
@@ -205,10 +224,10 @@ class Creature(IniEntry, Character):
             invent_qty_pairs,
         ) = self._seprt_argd_into_diff_arg_sets(items_state, internal_name, **argd)
         IniEntry.__init__(self, internal_name=internal_name, **ini_entry_init_argd)
-        self._post_init_slots_set_none(self.__slots__)
-        Character.__init__(self, **char_init_argd)
+        self._post_init_slots_set_none(CreatureBase.__slots__)
+        CharacterBase.__init__(self, **char_init_argd)
 
-        # The IniEntry.__init__ and Character.__init__ steps are
+        # The IniEntry.__init__ and CharacterBase.__init__ steps are
         # complete. _init_invent_and_equip handles the other
         # initializations with invent_qty_pairs and equip_argd as
         # arguments.
@@ -217,8 +236,8 @@ class Creature(IniEntry, Character):
         self._items_state = items_state
 
     # Divides the argd passed to __init__ into arguments for
-    # Character.__init__, arguments for IniEntry.__init__, arguments to
-    # Character.equip_*, and arguments to Character.pick_up_item.
+    # CharacterBase.__init__, arguments for IniEntry.__init__, arguments to
+    # CharacterBase.equip_*, and arguments to CharacterBase.pick_up_item.
     #
     # argd is accepted as a ** argument, so it's passed by copy rather
     # than by reference.
@@ -226,8 +245,9 @@ class Creature(IniEntry, Character):
     def _seprt_argd_into_diff_arg_sets(self, items_state, intrn_name, **argd):
         """
         This private method takes the argd supplied to __init__ and separates
-        it into Character.__init__() arguments, IniEntry.__init__() arguments,
-        inventory quantity-internal name pairs, and an equipment dict.
+        it into CharacterBase.__init__() arguments, IniEntry.__init__()
+        arguments, inventory quantity-internal name pairs, and an equipment
+        dict.
 
         :items_state: An ItemsState object.
         :intrn_name: A string, the creature's internal name.
@@ -235,7 +255,7 @@ class Creature(IniEntry, Character):
         arguments.
         """
 
-        # Character's __init__ args are formed first. dict.pop is used
+        # CharacterBase's __init__ args are formed first. dict.pop is used
         # so this step removes those values from argd as they're added
         # to char_init_argd.
 
@@ -368,14 +388,211 @@ class Creature(IniEntry, Character):
             corpse.set(item_internal_name, item_qty, item)
         return corpse
 
+    def snapshot(self):
+        """
+        This method returns the parts of the object's state that can change
+        during a game, as a dict suitable for serializing.
+
+        :return: A dict.
+        """
+        return {
+            "hit_points": self._current_hit_points,
+            "mana_points": self._current_mana_points,
+            "inventory": self.inventory.snapshot(),
+        }
+
+    def restore(self, snapshot):
+        """
+        This method restores the object's state from a dict as returned by
+        snapshot().
+
+        :snapshot: A dict.
+        :return: None.
+        """
+        self._current_hit_points = snapshot["hit_points"]
+        self._current_mana_points = snapshot["mana_points"]
+        self.inventory.restore(snapshot["inventory"], self._items_state)
+
+
+class Creature(CreatureBase):
+    """
+    This CreatureBase subclass represents a creature that stores its hit
+    points and mana points in its own attributes.
+    """
+
+    __slots__ = (
+        "_hit_point_maximum",
+        "_current_hit_points",
+        "_mana_point_maximum",
+        "_current_mana_points",
+    )
+
+
+class TabledCreature(CreatureBase):
+    """
+    This CreatureBase subclass keeps its current and total hit points and mana
+    points, armor class and attack bonus in its row of a CreatureTable, so
+    bulk operations on the table apply to it directly. Its armor class and
+    attack bonus are computed from its equipment and ability scores, and
+    written to its row again whenever its equipment changes, so the row is
+    never out of date.
+
+    It doesn't inherit the attributes a Creature stores its hit points and
+    mana points in; besides what it has in common with a Creature it only
+    holds its table and row ordinal, so it's two attributes smaller than a
+    Creature. Its row's columns take up about as much again.
+    """
+
+    __slots__ = "_table", "_row"
+
+    # CharacterBase reads and writes these four attributes for every hit
+    # point and mana point change; here they're properties that redirect to
+    # the table's columns.
+
+    @property
+    def _current_hit_points(self):
+        return self._table.hit_points[self._row]
+
+    @_current_hit_points.setter
+    def _current_hit_points(self, value):
+        self._table.hit_points[self._row] = value
+
+    @property
+    def _hit_point_maximum(self):
+        return self._table.hit_point_total[self._row]
+
+    @_hit_point_maximum.setter
+    def _hit_point_maximum(self, value):
+        self._table.hit_point_total[self._row] = value
+
+    @property
+    def _current_mana_points(self):
+        return self._table.mana_points[self._row]
+
+    @_current_mana_points.setter
+    def _current_mana_points(self, value):
+        self._table.mana_points[self._row] = value
+
+    @property
+    def _mana_point_maximum(self):
+        return self._table.mana_point_total[self._row]
+
+    @_mana_point_maximum.setter
+    def _mana_point_maximum(self, value):
+        self._table.mana_point_total[self._row] = value
+
+    def __init__(self, table, items_state, internal_name, **argd):
+        """
+        This __init__ method adds a row to the table for the creature before
+        initializing it as a CreatureBase, and writes its armor class and
+        attack bonus to the row afterward.
+
+        :table: A CreatureTable object.
+        :items_state: An ItemsState object.
+        :internal_name: A string, the internal name of the creature.
+        :**argd: A dict, the key-value pairs to instantiate the Creature object
+        from.
+        """
+        self._table = table
+        self._row = table.add(internal_name)
+        super().__init__(items_state, internal_name, **argd)
+        self._update_row()
+
+    def _has_attack(self):
+        # CharacterBase.attack_bonus raises for a creature with nothing to
+        # attack with; this is the same test.
+        return self._equipment.weapon_equipped or (
+            self.character_class == "Mage" and self._equipment.wand_equipped
+        )
+
+    def _update_row(self):
+        # Writes the armor class and attack bonus CharacterBase computes into
+        # the creature's row. A creature with nothing to attack with has 0
+        # in the attack bonus column.
+        self._table.armor_class[self._row] = super().armor_class
+        self._table.attack_bonus[self._row] = (
+            super().attack_bonus if self._has_attack() else 0
+        )
+
+    @property
+    def armor_class(self):
+        """
+        This property returns the creature's armor class from its table row.
+
+        :return: An int.
+        """
+        return self._table.armor_class[self._row]
+
+    @property
+    def attack_bonus(self):
+        """
+        This property returns the creature's attack bonus from its table row.
+        It raises an InternalError, as CharacterBase's does, if the creature
+        has nothing to attack with.
+
+        :return: An int.
+        """
+        if not self._has_attack():
+            return super().attack_bonus
+        return self._table.attack_bonus[self._row]
+
+    # Each of these calls the CharacterBase method, and then updates the
+    # creature's row for its new equipment.
+
+    def equip_armor(self, item):
+        result = super().equip_armor(item)
+        self._update_row()
+        return result
+
+    def equip_shield(self, item):
+        result = super().equip_shield(item)
+        self._update_row()
+        return result
+
+    def equip_weapon(self, item):
+        result = super().equip_weapon(item)
+        self._update_row()
+        return result
+
+    def equip_wand(self, item):
+        result = super().equip_wand(item)
+        self._update_row()
+        return result
+
+    def unequip_armor(self):
+        result = super().unequip_armor()
+        self._update_row()
+        return result
+
+    def unequip_shield(self):
+        result = super().unequip_shield()
+        self._update_row()
+        return result
+
+    def unequip_weapon(self):
+        result = super().unequip_weapon()
+        self._update_row()
+        return result
+
+    def unequip_wand(self):
+        result = super().unequip_wand()
+        self._update_row()
+        return result
+
 
 class CreaturesState(State):
     """
     This State subclass is instantiated from the sections attribute of an
     IniConfig object instantiated from creatures.ini.
+
+    In tabular mode, the creatures are TabledCreature objects whose hit
+    points are kept in the CreatureTable stored in the table attribute;
+    otherwise the table attribute is None.
     """
 
-    def __init__(self, items_state, **dict_of_dicts):
+    table = None
+
+    def __init__(self, items_state, tabular=False, **dict_of_dicts):
         """
         This __init__ method accepts an items_state object and a **dict-of-dicts
         as offered by an IniConfig object's sections attribute. It instantiates
@@ -385,13 +602,25 @@ class CreaturesState(State):
         types of creature.
 
         :items_state: An ItemsState object.
+        :tabular: A boolean, True if the creatures' hit points should be kept
+        in a CreatureTable.
         :**dict_of_dicts: A structure of internal name keys corresponding to
         dict values which are key-value pairs to initialize an individual
         Creature object with.
         """
         self._contents = dict()
+        if tabular:
+            self.table = CreatureTable()
         for creature_internal_name, creature_dict in dict_of_dicts.items():
-            creature = Creature(
-                items_state, internal_name=creature_internal_name, **creature_dict
-            )
+            if tabular:
+                creature = TabledCreature(
+                    self.table,
+                    items_state,
+                    internal_name=creature_internal_name,
+                    **creature_dict,
+                )
+            else:
+                creature = Creature(
+                    items_state, internal_name=creature_internal_name, **creature_dict
+                )
             self.set(creature.internal_name, creature)
@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+
+"""
+The CreatureTable class, a struct-of-arrays store for the numeric fields of
+every creature in a world that world-wide passes read or write: current and
+total hit points, current and total mana points, armor class, attack bonus
+and the ordinal of the room the creature is in. Each field is one array.array column indexed by creature
+ordinal, so a pass over every creature is a pass over a few flat arrays of
+machine ints rather than over Creature objects one attribute at a time.
+The armor class and attack bonus columns are written by each
+TabledCreature whenever its equipment changes.
+"""
+
+from array import array
+from math import ceil
+
+from advgame.errors import InternalError
+
+
+__all__ = ("CreatureTable",)
+
+
+# The room index column holds this value for a creature that isn't in any
+# instantiated room.
+
+NO_ROOM = -1
+
+
+class CreatureTable:
+    """
+    A struct-of-arrays table of creature fields, one row per creature.
+    """
+
+    __slots__ = (
+        "hit_points",
+        "hit_point_total",
+        "mana_points",
+        "mana_point_total",
+        "armor_class",
+        "attack_bonus",
+        "room_index",
+        "_ordinals",
+    )
+
+    NO_ROOM = NO_ROOM
+
+    def __init__(self):
+        """
+        This __init__ method creates an empty table.
+        """
+        self.hit_points = array("l")
+        self.hit_point_total = array("l")
+        self.mana_points = array("l")
+        self.mana_point_total = array("l")
+        self.armor_class = array("l")
+        self.attack_bonus = array("l")
+        self.room_index = array("l")
+        self._ordinals = dict()
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def add(self, internal_name):
+        """
+        This method adds a zeroed row for a creature and returns its ordinal.
+
+        :internal_name: A string, the internal name of the creature.
+        :return: An int.
+        """
+        if internal_name in self._ordinals:
+            raise InternalError(f"creature {internal_name} already has a table row")
+        row = self._ordinals[internal_name] = len(self._ordinals)
+        for column in (
+            self.hit_points,
+            self.hit_point_total,
+            self.mana_points,
+            self.mana_point_total,
+            self.armor_class,
+            self.attack_bonus,
+        ):
+            column.append(0)
+        self.room_index.append(NO_ROOM)
+        return row
+
+    def ordinal(self, internal_name):
+        """
+        This method returns the row ordinal of the creature with the given
+        internal name.
+
+        :internal_name: A string.
+        :return: An int.
+        """
+        return self._ordinals[internal_name]
+
+    def place(self, internal_name, room_index):
+        """
+        This method records the ordinal of the room a creature is in.
+
+        :internal_name: A string, the internal name of the creature.
+        :room_index: An int, the room's ordinal, or CreatureTable.NO_ROOM.
+        :return: None.
+        """
+        self.room_index[self._ordinals[internal_name]] = room_index
+
+    def heal_all(self, amount):
+        """
+        This method restores the given number of hit points to every living
+        creature, up to each one's total. Dead creatures stay dead.
+
+        :amount: An int.
+        :return: None.
+        """
+        self.hit_points[:] = array(
+            "l",
+            [
+                min(hit_points + amount, total) if hit_points else 0
+                for hit_points, total in zip(self.hit_points, self.hit_point_total)
+            ],
+        )
+
+    def scale_hit_points(self, factor):
+        """
+        This method scales every creature's hit point total by the given
+        factor, rounding up, and scales their current hit points in the same
+        proportion. It's meant for adjusting a world's difficulty.
+
+        :factor: A float greater than 0.
+        :return: None.
+        """
+        if factor <= 0:
+            raise InternalError("the hit point scaling factor must be greater than 0")
+        self.hit_point_total[:] = array(
+            "l", [ceil(total * factor) for total in self.hit_point_total]
+        )
+        self.hit_points[:] = array(
+            "l", [ceil(hit_points * factor) for hit_points in self.hit_points]
+        )
+
+    def living_rows(self):
+        """
+        This method returns the ordinals of the creatures with more than 0 hit
+        points.
+
+        :return: A list of ints.
+        """
+        return [row for row, hit_points in enumerate(self.hit_points) if hit_points]
+
+    def rows_in_room(self, room_index):
+        """
+        This method returns the ordinals of the creatures in the given room.
+
+        :room_index: An int, a room ordinal.
+        :return: A list of ints.
+        """
+        return [row for row, index in enumerate(self.room_index) if index == room_index]
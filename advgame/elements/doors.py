@@ -1,6 +1,7 @@
 #!/usr/bin/python3
 
 from collections import defaultdict
+from collections.abc import Collection
 
 from advgame.elements.basics import IniEntry
 from advgame.errors import InternalError
@@ -8,6 +9,7 @@ from advgame.errors import InternalError
 
 __all__ = (
     "Door",
+    "DoorState",
     "IronDoor",
     "WoodenDoor",
     "DoorsState",
@@ -15,6 +17,44 @@ __all__ = (
 )
 
 
+class DoorState:
+    """
+    The mutable state of a single door game element: whether it's locked and
+    whether it's closed. A door joins two rooms, and the Door objects that
+    represent it in each of them share one DoorState object, so a change made
+    from either room is seen from both.
+    """
+
+    __slots__ = "is_locked", "is_closed"
+
+    # The number of times the state of any door has been changed through a
+    # Door object. An AutoMap compares it with the count it last checked
+    # its tiles at to tell whether any door might look different.
+
+    changes = 0
+
+    def __init__(self, is_locked=None, is_closed=None):
+        """
+        This __init__ method sets the two state attributes.
+
+        :is_locked: A boolean, or None.
+        :is_closed: A boolean, or None.
+        """
+        self.is_locked = is_locked
+        self.is_closed = is_closed
+
+    def __eq__(self, other):
+        if not isinstance(other, DoorState):
+            return NotImplemented
+        return (self.is_locked, self.is_closed) == (other.is_locked, other.is_closed)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(is_locked={self.is_locked!r}, "
+            f"is_closed={self.is_closed!r})"
+        )
+
+
 class Door(IniEntry):
     """
     The Item subclass of IniEntry represents a single door. It is
@@ -27,11 +67,10 @@ class Door(IniEntry):
         "title",
         "description",
         "door_type",
-        "is_locked",
-        "is_closed",
         "closeable",
         "_linked_rooms_internal_names",
         "is_exit",
+        "_state",
     )
 
     def __init__(self, **argd):
@@ -45,10 +84,33 @@ class Door(IniEntry):
 
         :**argd: The key-value pairs to initialize the Door object with.
         """
+        self._state = DoorState()
         super().__init__(**argd)
         self._post_init_slots_set_none(self.__slots__)
         self._linked_rooms_internal_names = set(self.internal_name.split("_x_"))
 
+    # The is_locked and is_closed attributes are stored in the DoorState
+    # object, which may be shared with the Door object representing the
+    # other side of the same door; see view().
+
+    @property
+    def is_locked(self):
+        return self._state.is_locked
+
+    @is_locked.setter
+    def is_locked(self, value):
+        self._state.is_locked = value
+        DoorState.changes += 1
+
+    @property
+    def is_closed(self):
+        return self._state.is_closed
+
+    @is_closed.setter
+    def is_closed(self, value):
+        self._state.is_closed = value
+        DoorState.changes += 1
+
     @classmethod
     def subclassing_factory(cls, **door_dict):
         """
@@ -96,14 +158,58 @@ class Door(IniEntry):
 
     def copy(self):
         """
-        This method returns a shallow copy of the object.
+        This method returns a shallow copy of the object. The copy has its own
+        DoorState object, so changing its state doesn't change this one's.
 
         :return: A Door object.
         """
         return self.__class__(
-            **{attr: getattr(self, attr, None) for attr in self.__slots__}
+            is_locked=self.is_locked,
+            is_closed=self.is_closed,
+            **{
+                attr: getattr(self, attr, None)
+                for attr in self.__slots__
+                if attr != "_state"
+            },
         )
 
+    def view(self, title):
+        """
+        This method returns a Door object of the same class that shares this
+        one's DoorState object but has its own title. Each room that a door
+        joins holds a view of it titled for the compass direction it lies in
+        from that room, so opening, closing, locking or unlocking the door
+        from one room is a single write that's seen from the other.
+
+        :title: A string, the title of the view, such as 'north door'.
+        :return: A Door object.
+        """
+        door_view = object.__new__(self.__class__)
+        for attr in self.__slots__:
+            setattr(door_view, attr, getattr(self, attr))
+        door_view.title = title
+        return door_view
+
+    def snapshot(self):
+        """
+        This method returns the parts of the object's state that can change
+        during a game, as a dict suitable for serializing.
+
+        :return: A dict.
+        """
+        return {"is_locked": self.is_locked, "is_closed": self.is_closed}
+
+    def restore(self, snapshot):
+        """
+        This method restores the object's state from a dict as returned by
+        snapshot().
+
+        :snapshot: A dict.
+        :return: None.
+        """
+        self.is_locked = snapshot["is_locked"]
+        self.is_closed = snapshot["is_closed"]
+
 
 class IronDoor(Door):
     """
@@ -125,6 +231,36 @@ class WoodenDoor(Door):
     pass
 
 
+class _DoorsStateView(Collection):
+    # A live view of the keys, values or items of a DoorsState object, as
+    # returned by its keys(), values() and items() methods. It draws on
+    # the DoorsState object each time it's iterated rather than holding a
+    # list of its own, and its length is the DoorsState object's count.
+
+    __slots__ = "_doors_state", "_iterator"
+
+    def __init__(self, doors_state, iterator):
+        self._doors_state = doors_state
+        self._iterator = iterator
+
+    def __iter__(self):
+        return self._iterator()
+
+    def __len__(self):
+        return self._doors_state.size()
+
+    def __contains__(self, value):
+        return any(value == element for element in self)
+
+    def __eq__(self, other):
+        if isinstance(other, (_DoorsStateView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
 class DoorsState:
     """
     This class replicates the functionality of the State object for a
@@ -135,16 +271,21 @@ class DoorsState:
     def __init__(self, **dict_of_dicts):
         """
         The internal storage dictionary of this object is two-dimensional,
-        indexed by the internal names of the two rooms connected by the door.
-        For consistency, the two internal names are sorted and the internal name
-        that is earlier in the sort order is the outer dict's key, and the one
-        that's later in the sort order is the inner dict's key.
+        indexed by the internal names of the two rooms connected by the door,
+        in the order they appear in the door's internal name. Alongside it the
+        object keeps a count of its doors and an adjacency index, which maps
+        each room's internal name to a dict of the rooms it has a door to,
+        each paired with the key the door is stored under. The index lets a
+        door be looked up with its two room internal names in either order,
+        and lets the doors of one room be found without a scan.
 
         :**dict_of_dicts: A structure of internal name keys corresponding to
         dict values which are key-value pairs to initialize an individual Door
         object with.
         """
         self._contents = defaultdict(dict)
+        self._adjacency = defaultdict(dict)
+        self._size = 0
 
         # The entries in doors.ini have internal_names that consist of
         # the internal names for the two rooms they connect, connected
@@ -154,16 +295,49 @@ class DoorsState:
 
         for door_internal_name, door_argd in dict_of_dicts.items():
             room_1_intrn_name, room_2_intrn_name = door_internal_name.split("_x_")
-            self._contents[room_1_intrn_name][
-                room_2_intrn_name
-            ] = Door.subclassing_factory(internal_name=door_internal_name, **door_argd)
-            pass
+            self.set(
+                room_1_intrn_name,
+                room_2_intrn_name,
+                Door.subclassing_factory(internal_name=door_internal_name, **door_argd),
+            )
+
+    def _link(self, room_1_intrn_name, room_2_intrn_name):
+        # Records a door key in the adjacency index under both rooms.
+        door_key = (room_1_intrn_name, room_2_intrn_name)
+        self._adjacency[room_1_intrn_name][room_2_intrn_name] = door_key
+        self._adjacency[room_2_intrn_name][room_1_intrn_name] = door_key
+
+    def _unlink(self, room_1_intrn_name, room_2_intrn_name):
+        # Removes a door key from the adjacency index.
+        for room_intrn_name, other_intrn_name in (
+            (room_1_intrn_name, room_2_intrn_name),
+            (room_2_intrn_name, room_1_intrn_name),
+        ):
+            del self._adjacency[room_intrn_name][other_intrn_name]
+            if not self._adjacency[room_intrn_name]:
+                del self._adjacency[room_intrn_name]
+
+    def key(self, room_1_intrn_name, room_2_intrn_name):
+        """
+        This method returns the pair of Room subclass object internal names
+        that the door between two rooms is stored under, given the two names
+        in either order, or raises a KeyError if no door joins them.
+
+        :room_1_intern_name: The internal name of one of the two linked Room
+        objects.
+        :room_2_intern_name: The internal name of the other of the two linked
+        Room objects.
+        :return: A 2-tuple of strings.
+        """
+        if room_1_intrn_name not in self._adjacency:
+            raise KeyError(room_1_intrn_name)
+        return self._adjacency[room_1_intrn_name][room_2_intrn_name]
 
     def contains(self, room_1_intrn_name, room_2_intrn_name):
         """
-        This method tests whether a Door subclass object indexed by the given
-        two Room subclass object's internal names is present in the internal
-        **dict-of-dicts.
+        This method tests whether a Door subclass object joining the two
+        Room subclass objects with the given internal names is present, with
+        the two names in either order.
 
         :room_1_intern_name: The internal name of one of the two linked Room
         objects.
@@ -172,15 +346,15 @@ class DoorsState:
         :return: A boolean.
         """
         return (
-            room_1_intrn_name in self._contents
-            and room_2_intrn_name in self._contents[room_1_intrn_name]
+            room_1_intrn_name in self._adjacency
+            and room_2_intrn_name in self._adjacency[room_1_intrn_name]
         )
 
     def get(self, room_1_intrn_name, room_2_intrn_name):
         """
-        This method returns the Door subclass object indexed by the two given
-        Room subclass object internal names, or raises a KeyError if it's not
-        present.
+        This method returns the Door subclass object joining the two Room
+        subclass objects with the given internal names, in either order, or
+        raises a KeyError if it's not present.
 
         :room_1_intern_name: The internal name of one of the two linked Room
         objects.
@@ -188,14 +362,16 @@ class DoorsState:
         Room objects.
         :return: A Door object.
         """
+        room_1_intrn_name, room_2_intrn_name = self.key(
+            room_1_intrn_name, room_2_intrn_name
+        )
         return self._contents[room_1_intrn_name][room_2_intrn_name]
 
     def set(self, room_1_intrn_name, room_2_intrn_name, door):
         """
-        This method stores the given Door subclass object in the internal
-        **dict-of-dicts using the first Room subclass object internal name as
-        the key to the outer dictionary and the second Room subclass object
-        internal name as the key to the inner dictionary.
+        This method stores the given Door subclass object under the two given
+        Room subclass object internal names. If a door already joins those
+        two rooms it's replaced, and stays under its existing key.
 
         :room_1_intern_name: The internal name of one of the two linked Room
         objects.
@@ -204,73 +380,110 @@ class DoorsState:
         :door: A Door object.
         :return: None.
         """
+        if self.contains(room_1_intrn_name, room_2_intrn_name):
+            room_1_intrn_name, room_2_intrn_name = self.key(
+                room_1_intrn_name, room_2_intrn_name
+            )
+        else:
+            self._link(room_1_intrn_name, room_2_intrn_name)
+            self._size += 1
         self._contents[room_1_intrn_name][room_2_intrn_name] = door
 
     def delete(self, room_1_intrn_name, room_2_intrn_name):
         """
-        This method deletes the Door subclass object found in the internal
-        **dict-of-dicts under the given two Room subclass object internal name
-        keys.
+        This method deletes the Door subclass object joining the two Room
+        subclass objects with the given internal names, in either order.
 
         :room_1_intern_name: The internal name of one of the two linked Room
         objects.
         :room_2_intern_name: The internal name of the other of the two linked
         Room objects.
-        :door: A Door object.
         :return: None.
         """
+        room_1_intrn_name, room_2_intrn_name = self.key(
+            room_1_intrn_name, room_2_intrn_name
+        )
         del self._contents[room_1_intrn_name][room_2_intrn_name]
+        if not self._contents[room_1_intrn_name]:
+            del self._contents[room_1_intrn_name]
+        self._unlink(room_1_intrn_name, room_2_intrn_name)
+        self._size -= 1
+
+    def neighbors(self, room_intrn_name):
+        """
+        This method yields the internal name of each room that the given room
+        has a door to, paired with that door. It only visits the given room's
+        own doors.
+
+        :room_intrn_name: The internal name of a Room object.
+        :return: An iterator of 2-tuples of a string and a Door object.
+        """
+        for other_intrn_name, door_key in tuple(
+            self._adjacency.get(room_intrn_name, {}).items()
+        ):
+            yield other_intrn_name, self.get(*door_key)
+
+    def degree(self, room_intrn_name):
+        """
+        This method returns the number of doors the given room has.
+
+        :room_intrn_name: The internal name of a Room object.
+        :return: An int.
+        """
+        return len(self._adjacency.get(room_intrn_name, ()))
+
+    def _iter_keys(self):
+        for room_1_name, inner_dict in self._contents.items():
+            for room_2_name in inner_dict:
+                yield room_1_name, room_2_name
+
+    def _iter_values(self):
+        for room_1_name, room_2_name in self._iter_keys():
+            yield self.get(room_1_name, room_2_name)
+
+    def _iter_items(self):
+        for room_1_name, room_2_name in self._iter_keys():
+            yield room_1_name, room_2_name, self.get(room_1_name, room_2_name)
 
     def keys(self):
         """
-        This method returns a list of 2-tuples comprising each valid Room
-        subclass internal name pairs that can be used as arguments to .get() to
-        retrieve a Door subclass object.
+        This method returns a view of the pairs of Room subclass internal
+        names that can be used as arguments to .get() to retrieve a Door
+        subclass object. The view reflects later changes to this object.
 
-        :return: A list of 2-tuples comprising pairs of Room internal name
+        :return: A view of 2-tuples comprising pairs of Room internal name
         strings.
         """
-        keys_list = list()
-        for room_1_name in self._contents.keys():
-            for second_room_name in self._contents[room_1_name].keys():
-                keys_list.append((room_1_name, second_room_name))
-        return keys_list
+        return _DoorsStateView(self, self._iter_keys)
 
     def values(self):
         """
-        This method returns a list comprising all the Door subclass objects
-        stored in the internal **dict-of-dicts.
+        This method returns a view of all the Door subclass objects stored in
+        this object.
 
-        :return: A list of Door objects.
+        :return: A view of Door objects.
         """
-        values_list = list()
-        for room_1_name in self._contents.keys():
-            values_list.extend(self._contents[room_1_name].values())
-        return values_list
+        return _DoorsStateView(self, self._iter_values)
 
     def items(self):
         """
-        This method returns a list of 3-tuples, each comprising a pair of Room
-        subclass object internal names that are a key to the container, coupled
-        with the Door subclass object that is the value to that key.
+        This method returns a view of 3-tuples, each comprising a pair of Room
+        subclass object internal names that are a key to the container,
+        coupled with the Door subclass object that is the value to that key.
 
-        :return: A list of 3-tuples, comprised of a string (the internal name),
-        an int (the quantity) and an Item subclass object.
+        :return: A view of 3-tuples, comprised of two strings (the Room
+        internal names) and a Door subclass object.
         """
-        items_list = list()
-        for room_1_name in self._contents.keys():
-            for second_room_name, door in self._contents[room_1_name].items():
-                items_list.append((room_1_name, second_room_name, door))
-        return items_list
+        return _DoorsStateView(self, self._iter_items)
 
     def size(self):
         """
         This method returns the number of Door subclass objects that is stored
         in this container.
 
-        :return: An int, the number of Item subclass objects stored.
+        :return: An int, the number of Door subclass objects stored.
         """
-        return len(self.keys())
+        return self._size
 
 
 class Doorway(Door):
@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 
+import sys
+
 from advgame.elements.basics import IniEntry
 from advgame.errors import InternalError
 
@@ -21,28 +23,53 @@ __all__ = (
 class Item(IniEntry):
     """A single item, taken from .ini format."""
 
+    # Each subclass declares only the attributes its item type uses, so a
+    # coin doesn't carry a damage slot. The attributes every item has are
+    # declared here; _layout is the full list of slots for a class, built
+    # when the class is defined.
+
     __slots__ = (
         "internal_name",
         "title",
         "description",
         "weight",
         "value",
-        "damage",
-        "attack_bonus",
-        "armor_bonus",
         "item_type",
-        "warrior_can_use",
-        "thief_can_use",
-        "priest_can_use",
-        "mage_can_use",
-        "hit_points_recovered",
-        "mana_points_recovered",
     )
 
+    _layout = __slots__
+
+    def __init_subclass__(cls, **argd):
+        super().__init_subclass__(**argd)
+        cls._layout = cls.__base__._layout + cls.__dict__.get("__slots__", ())
+
     def __init__(self, **argd):
-        """Instance the item for arbitrary key-value pairs."""
-        super().__init__(**argd)
-        self._post_init_slots_set_none(self.__slots__)
+        """
+        Instance the item for arbitrary key-value pairs. Keys its item type
+        doesn't use, like *_can_use on a potion, are ignored. The internal name
+        and title are interned, so every item, container and inventory that
+        names an item shares one string object.
+        """
+        super().__init__(
+            **{key: value for key, value in argd.items() if key in self._layout}
+        )
+        self._post_init_slots_set_none(self._layout)
+        if self.internal_name is not None:
+            self.internal_name = sys.intern(self.internal_name)
+        if isinstance(self.title, str):
+            self.title = sys.intern(self.title)
+
+    def __eq__(self, other):
+        """
+        Test two Item subclass objects for equality, over every attribute in
+        their layout.
+        """
+        if not isinstance(other, type(self)):
+            return False
+        else:
+            return all(
+                getattr(self, attr) == getattr(other, attr) for attr in self._layout
+            )
 
     @classmethod
     def subclassing_factory(cls, **item_dict):
@@ -79,6 +106,13 @@ class Item(IniEntry):
 
 
 class EquippableItem(Item):
+    __slots__ = (
+        "warrior_can_use",
+        "thief_can_use",
+        "priest_can_use",
+        "mage_can_use",
+    )
+
     def usable_by(self, character_class):
         """
         An item equippable by some classes and not by others, based on the
@@ -90,7 +124,7 @@ class EquippableItem(Item):
         """
         if character_class not in ("Warrior", "Thief", "Mage", "Priest"):
             raise InternalError(f"character class {character_class} not recognized")
-        return bool(getattr(self, character_class.lower() + "_can_use", None))
+        return bool(getattr(self, character_class.lower() + "_can_use"))
 
 
 # The subclasses don't have much differing functionality but accurately
@@ -102,46 +136,46 @@ class EquippableItem(Item):
 class Oddment(Item):
     """A miscellaneous good with no in-game purpose."""
 
-    pass
+    __slots__ = ()
 
 
 class Key(Item):
     """A key, which can be used to unlock doors."""
 
-    pass
+    __slots__ = ()
 
 
 class Potion(Item):
     """A potion, which is drinkable."""
 
-    pass
+    __slots__ = "hit_points_recovered", "mana_points_recovered"
 
 
 class Coin(Item):
     """A coin, i.e. a unit of value."""
 
-    pass
+    __slots__ = ()
 
 
 class Wand(EquippableItem):
     """A wand, which can be equipped and used by mages to do damage"""
 
-    pass
+    __slots__ = "damage", "attack_bonus"
 
 
 class Weapon(EquippableItem):
     """A weapon, which can be equipped, and wielded to do damage."""
 
-    pass
+    __slots__ = "damage", "attack_bonus"
 
 
 class Shield(EquippableItem):
     """A shield, which can be equipped, to raise armor class."""
 
-    pass
+    __slots__ = ("armor_bonus",)
 
 
 class Armor(EquippableItem):
     """A suit of armor, which can be equipped, to raise armor class."""
 
-    pass
+    __slots__ = ("armor_bonus",)
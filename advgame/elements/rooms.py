@@ -1,7 +1,9 @@
 #!/usr/bin/python3
 
+from advgame.elements.automap import AutoMap
 from advgame.elements.basics import IniEntry
 from advgame.elements.characters import ItemsMultiState
+from advgame.elements.containers import Container, Corpse
 from advgame.errors import InternalError, BadCommandError
 
 
@@ -34,6 +36,8 @@ class Room(IniEntry):
         "creature_here",
         "container_here",
         "items_here",
+        "_doors",
+        "_door_index",
     )
 
     @property
@@ -142,24 +146,41 @@ class Room(IniEntry):
             door_attr = f"{compass_dir}_door"
             if not getattr(self, door_attr, False):
                 continue
-            sorted_pair = tuple(sorted((self.internal_name, getattr(self, door_attr))))
-            if sorted_pair[0].lower() == "exit":
-                sorted_pair = tuple(reversed(sorted_pair))
 
             # The Door objects stored in each Room object are not
             # identical with the Door objects in self._doors_state
             # because each Door gets a new title based on its compass
             # direction; the same Door can be titled "north door" in the
             # southern of the two rooms it connects and "south door" in
-            # the northern one.
+            # the northern one. They're views that share the door's
+            # DoorState object, so both sides always agree.
 
-            door = self._doors_state.get(*sorted_pair).copy()
-            door.title = (
+            door = self._doors_state.get(self.internal_name, getattr(self, door_attr))
+            door = door.view(
                 f"{compass_dir} doorway"
                 if door.title == "doorway"
                 else f"{compass_dir} door"
             )
             setattr(self, door_attr, door)
+        self._index_doors()
+
+    def _index_doors(self):
+        # The room's doors and its door index are built once, when the
+        # room is instantiated. The index maps each word a door can be
+        # specified by-- its compass direction, its door type (such as
+        # 'iron_door'), and its generic noun ('door' or 'doorway')-- to a
+        # dict of the doors it matches, keyed by compass direction in
+        # north, east, south, west order.
+        self._doors = tuple(
+            getattr(self, f"{compass_dir}_door")
+            for compass_dir in ("north", "east", "south", "west")
+            if getattr(self, f"has_{compass_dir}_door")
+        )
+        self._door_index = dict()
+        for door in self._doors:
+            compass_dir, noun = door.title.split(" ")
+            for key in (compass_dir, door.door_type, noun):
+                self._door_index.setdefault(key, dict())[compass_dir] = door
 
     @property
     def doors(self):
@@ -169,23 +190,94 @@ class Room(IniEntry):
 
         :return: A tuple of Door objects.
         """
-        doors_tuple = ()
+        return self._doors
 
-        # This method is just a shorthand for accessing the
-        # has_(north|south|east|west)_door attributes.
+    def find_doors(self, *keys):
+        """
+        This method returns the doors in this room that match every one of the
+        given keys, using the room's door index. A key is a compass direction
+        such as 'north', a door type such as 'iron_door', or a generic noun,
+        'door' or 'doorway'.
+
+        :*keys: One or more strings.
+        :return: A dict of Door objects keyed by compass direction, in north,
+        east, south, west order.
+        """
+        first_key, *other_keys = keys
+        matching_doors = self._door_index.get(first_key, {})
+        for key in other_keys:
+            other_doors = self._door_index.get(key, {})
+            matching_doors = {
+                compass_dir: door
+                for compass_dir, door in matching_doors.items()
+                if compass_dir in other_doors
+            }
+        return matching_doors
+
+    def snapshot(self):
+        """
+        This method returns the parts of the room's state that can change
+        during a game, as a dict suitable for serializing. The creature and
+        container are recorded by internal name, since their own state is
+        stored separately, except for a corpse, which only exists in the room
+        and so is recorded in full. The doors aren't recorded at all; their
+        state is shared with the room on the other side of each, and it's
+        stored with the doors.
+
+        :return: A dict.
+        """
+        container = self.container_here
+        return {
+            "items_here": self.items_here.snapshot() if self.items_here else [],
+            "creature_here": (
+                self.creature_here.internal_name if self.creature_here else None
+            ),
+            "container_here": container.internal_name if container else None,
+            "corpse": (container.snapshot() if isinstance(container, Corpse) else None),
+        }
+
+    def restore(self, snapshot):
+        """
+        This method restores the room's state from a dict as returned by
+        snapshot(), drawing on the state objects the room was instantiated
+        with.
 
-        for compass_dir in ("north", "east", "south", "west"):
-            has_door_property = f"has_{compass_dir}_door"
-            if not getattr(self, has_door_property):
-                continue
-            doors_tuple += (getattr(self, f"{compass_dir}_door"),)
-        return doors_tuple
+        :snapshot: A dict.
+        :return: None.
+        """
+        items_here = ItemsMultiState()
+        items_here.restore(snapshot["items_here"], self._items_state)
+        self.items_here = items_here if items_here.size() else None
+        creature_name = snapshot["creature_here"]
+        self.creature_here = (
+            self._creatures_state.get(creature_name) if creature_name else None
+        )
+        container_name = snapshot["container_here"]
+        if snapshot["corpse"] is not None:
+            # A corpse is rebuilt from the creature it was, the same way
+            # attack_command() makes it, and then given its saved contents.
+
+            corpse = self._creatures_state.get(container_name).convert_to_corpse()
+            corpse.restore(snapshot["corpse"], self._items_state)
+            self.container_here = corpse
+        elif container_name:
+            self.container_here = self._containers_state.get(container_name)
+        else:
+            self.container_here = None
 
 
 class RoomsState:
     """
     This class implements a state object that tracks the entire dungeon's
     layout.
+
+    In lazy mode, the rooms.ini sections are kept as raw dicts, and a Room
+    object is only instantiated (along with its doors, creature, container
+    and items) the first time it's retrieved, whether because the player
+    entered it or because a command needed to look at a neighboring room.
+    The state of its doors, creature and container at that point is
+    recorded with its section, so reset_rooms() can return the room to the
+    way it was before it was instantiated.
     """
 
     __slots__ = (
@@ -194,7 +286,11 @@ class RoomsState:
         "_items_state",
         "_doors_state",
         "_rooms_objs",
+        "_room_dicts",
         "_room_cursor",
+        "_room_ordinals",
+        "_pristine",
+        "automap",
     )
 
     @property
@@ -205,7 +301,7 @@ class RoomsState:
 
         :return: A Room object.
         """
-        return self._rooms_objs[self._room_cursor]
+        return self.get(self._room_cursor)
 
     def __init__(
         self,
@@ -213,6 +309,7 @@ class RoomsState:
         containers_state,
         doors_state,
         items_state,
+        lazy=False,
         **dict_of_dicts,
     ):
         """
@@ -225,11 +322,18 @@ class RoomsState:
         :containers_state: A ContainersState object.
         :doors_state: A DoorsState object.
         :items_state: A ItemsState object.
+        :lazy: A boolean, True if Room objects should only be instantiated
+        when they're first retrieved, False if they should all be instantiated
+        now.
         :**dict_of_dicts: A structure of internal name keys corresponding to
         dict values which are key-value pairs to initialize an individual
         Creature object with.
         """
         self._rooms_objs = dict()
+        self._room_dicts = dict()
+        self._room_ordinals = dict()
+        self._pristine = dict()
+        self._room_cursor = None
         self._creatures_state = creatures_state
         self._containers_state = containers_state
         self._doors_state = doors_state
@@ -239,14 +343,17 @@ class RoomsState:
         # **dict_of_dicts.
 
         for room_internal_name, room_dict in dict_of_dicts.items():
-            room = Room(
-                creatures_state,
-                containers_state,
-                doors_state,
-                items_state,
-                internal_name=room_internal_name,
-                **room_dict,
-            )
+            # In lazy mode, the section is just set aside and given an
+            # ordinal. The entrance has to be found from the raw value, so
+            # it's parsed the same way IniEntry.__init__ would.
+
+            if lazy:
+                self._room_ordinals[room_internal_name] = len(self._room_ordinals)
+                self._room_dicts[room_internal_name] = room_dict
+                if str(room_dict.get("is_entrance", "")).lower() == "true":
+                    self._room_cursor = room_internal_name
+                continue
+            room = self._materialize(room_internal_name, room_dict)
 
             # The cursor is set to the room identifies by
             # is_entrance=True
@@ -255,15 +362,142 @@ class RoomsState:
                 self._room_cursor = room.internal_name
             self.set(room.internal_name, room)
 
+        # The AutoMap object tracks which rooms have been visited, by
+        # room ordinal. The player starts out in the entrance room.
+
+        self.automap = AutoMap(self._room_ordinals)
+        if self._room_cursor is not None:
+            self.automap.visit(self._room_cursor)
+
+    def _materialize(self, internal_name, room_dict):
+        # Instantiates a Room object from its rooms.ini section.
+        return Room(
+            self._creatures_state,
+            self._containers_state,
+            self._doors_state,
+            self._items_state,
+            internal_name=internal_name,
+            **room_dict,
+        )
+
     def get(self, internal_name):
         """
         This method is used to retrieve a Room object from internal storage with
-        the given internal name.
+        the given internal name. If the room hasn't been instantiated yet, it's
+        instantiated now.
 
         :room_internal_name: A string, the internal name of the Room object.
         :return: A Room object.
         """
-        return self._rooms_objs[internal_name]
+        room = self._rooms_objs.get(internal_name)
+        if room is None:
+            room_dict = self._take_section(internal_name)
+            room = self._materialize(internal_name, room_dict)
+            self._rooms_objs[internal_name] = room
+            self._pristine[internal_name] = room_dict, self._element_snapshots(room)
+            self._place_creature(room)
+        return room
+
+    def _element_snapshots(self, room):
+        # Returns the doors, creature and container of a room that's just
+        # been instantiated, each paired with a snapshot of its state.
+        elements = list(room.doors)
+        if room.creature_here is not None:
+            elements.append(room.creature_here)
+        if room.container_here is not None:
+            elements.append(room.container_here)
+        return tuple((element, element.snapshot()) for element in elements)
+
+    def reset_rooms(self, keep=()):
+        """
+        This method returns every room that was instantiated in lazy mode to
+        the way it was before it was instantiated, except those named in
+        keep: the Room object is discarded and its section set aside again,
+        and its doors, creature and container are restored to the state they
+        were in when it was instantiated. It's used to restore a saved game
+        that didn't include those rooms.
+
+        :keep: A collection of room internal names.
+        :return: None.
+        """
+        # The rooms are reset in the reverse of the order they were
+        # instantiated in, so a door shared by two of them ends up in the
+        # state it was in before either was instantiated.
+
+        for internal_name in reversed(tuple(self._pristine)):
+            if internal_name in keep:
+                continue
+            room_dict, element_snapshots = self._pristine.pop(internal_name)
+            del self._rooms_objs[internal_name]
+            self._return_section(internal_name, room_dict)
+            for element, snapshot in element_snapshots:
+                if isinstance(element, Container):
+                    element.restore(snapshot, self._items_state)
+                else:
+                    element.restore(snapshot)
+
+    def view(self, cursor_internal_name=None):
+        """
+        This method returns a new RoomsState object that shares this one's
+        Room objects, sections and sub-states, but has its own cursor and its
+        own AutoMap, so several players can move through the same rooms
+        independently. The view has the same class as this object.
+
+        :cursor_internal_name: A string, the internal name of the room the
+        view's cursor starts in, or None to start in this object's current
+        room.
+        :return: A RoomsState object.
+        """
+        view = object.__new__(type(self))
+
+        # Every slot, including those added by a subclass, is shared
+        # with the view except the two that are per-player.
+
+        for cls in type(self).__mro__:
+            for attr in getattr(cls, "__slots__", ()):
+                if hasattr(self, attr):
+                    setattr(view, attr, getattr(self, attr))
+        view._room_cursor = (
+            self._room_cursor if cursor_internal_name is None else cursor_internal_name
+        )
+        view.automap = AutoMap(self._room_ordinals)
+        view.automap.visit(view._room_cursor)
+        return view
+
+    def _take_section(self, internal_name):
+        # Returns the rooms.ini section set aside in lazy mode for the
+        # given room, releasing it since the room is being instantiated.
+        return self._room_dicts.pop(internal_name)
+
+    def _return_section(self, internal_name, room_dict):
+        # Sets aside the rooms.ini section of a room that's been reset, to
+        # instantiate it from again.
+        self._room_dicts[internal_name] = room_dict
+
+    def is_materialized(self, internal_name):
+        """
+        This method returns True if the Room object with the given internal
+        name has been instantiated, False otherwise.
+
+        :room_internal_name: A string, the internal name of the Room object.
+        :return: A boolean.
+        """
+        return internal_name in self._rooms_objs
+
+    def find_creature(self, creature):
+        """
+        This method returns the internal name of the room the given creature
+        is in. Only instantiated rooms are searched, since a creature in a
+        room that hasn't been instantiated yet hasn't been instantiated
+        either.
+
+        :creature: A Creature object.
+        :return: A string, or None if the creature isn't in any room.
+        """
+        for internal_name, room in tuple(self._rooms_objs.items()):
+            if room.creature_here is creature:
+                return internal_name
+        return None
 
     def set(self, internal_name, room):
         """
@@ -274,7 +508,86 @@ class RoomsState:
         :room: A Room object.
         :return: None.
         """
+        if internal_name not in self._room_ordinals:
+            self._room_ordinals[internal_name] = len(self._room_ordinals)
+        self._room_dicts.pop(internal_name, None)
         self._rooms_objs[internal_name] = room
+        self._place_creature(room)
+
+    def _place_creature(self, room):
+        # If the creatures are kept in a CreatureTable, the room ordinal
+        # of the creature in a newly stored room is recorded in its row.
+        table = self._creatures_state.table
+        if table is not None and room.creature_here is not None:
+            table.place(
+                room.creature_here.internal_name,
+                self._room_ordinal(room.internal_name),
+            )
+
+    def _room_ordinal(self, internal_name):
+        # Returns the ordinal of the room with the given internal name.
+        return self._room_ordinals[internal_name]
+
+    def move_creature(self, from_internal_name, to_internal_name):
+        """
+        This method moves the creature in one room to another room, which must
+        not have a creature in it.
+
+        :from_internal_name: A string, the internal name of the room the
+        creature is in.
+        :to_internal_name: A string, the internal name of the room to move it
+        to.
+        :return: None.
+        """
+        from_room = self.get(from_internal_name)
+        to_room = self.get(to_internal_name)
+        if from_room.creature_here is None or to_room.creature_here is not None:
+            raise InternalError(
+                f"can't move a creature from {from_internal_name} to "
+                f"{to_internal_name}"
+            )
+        to_room.creature_here, from_room.creature_here = from_room.creature_here, None
+        self._place_creature(to_room)
+
+    def keys(self):
+        """
+        This method returns an iterator of the internal names of the Room
+        objects stored in this object, whether or not they've been
+        instantiated.
+
+        :return: An iterator of strings.
+        """
+        return self._room_ordinals.keys()
+
+    def values(self):
+        """
+        This method returns an iterator of the Room objects stored in this
+        object. In lazy mode, any rooms not yet instantiated are instantiated
+        as they're reached.
+
+        :return: An iterator of Room objects.
+        """
+        return (self.get(internal_name) for internal_name in tuple(self.keys()))
+
+    def size(self):
+        """
+        This method returns the number of Room objects stored in this object,
+        whether or not they've been instantiated.
+
+        :return: An int.
+        """
+        return len(self._room_ordinals)
+
+    def place_cursor(self, internal_name):
+        """
+        This method moves the cursor straight to the room with the given
+        internal name, without passing through a door or recording a visit on
+        the automap. It's used to restore a saved game.
+
+        :internal_name: A string, the internal name of a Room object.
+        :return: None.
+        """
+        self._room_cursor = self.get(internal_name).internal_name
 
     def move(self, north=False, west=False, south=False, east=False):
         """
@@ -341,8 +654,10 @@ class RoomsState:
         # the value for cursor is updated by setting _room_cursor to
         # that Room object's internal_name.
 
+        from_room_internal_name = self.cursor.internal_name
         other_room_internal_name = door.other_room_internal_name(
-            self.cursor.internal_name
+            from_room_internal_name
         )
-        new_room_dest = self._rooms_objs[other_room_internal_name]
+        new_room_dest = self.get(other_room_internal_name)
         self._room_cursor = new_room_dest.internal_name
+        self.automap.visit(self._room_cursor, from_room_internal_name, exit_key.lower())
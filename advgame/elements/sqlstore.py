@@ -0,0 +1,952 @@
+#!/usr/bin/python3
+
+import json
+import sqlite3
+
+from collections import Counter, OrderedDict, defaultdict, deque
+
+from advgame.elements.automap import AutoMap
+from advgame.elements.characters import GameState
+from advgame.elements.containers import (
+    Container,
+    ContainersState,
+    Corpse,
+    Creature,
+    CreaturesState,
+)
+from advgame.elements.doors import Door, DoorsState
+from advgame.elements.rooms import Room, RoomsState
+from advgame.errors import InternalError
+
+
+__all__ = (
+    "SQLiteWorldStore",
+    "SQLiteRoomsState",
+    "SQLiteContainersState",
+    "SQLiteCreaturesState",
+    "SQLiteDoorsState",
+)
+
+
+class SQLiteWorldStore:
+    """
+    This class keeps a dungeon's definitions and the per-session changes
+    made to it in a SQLite database, so a world doesn't have to fit in
+    memory and many sessions can be persisted side by side.
+
+    The .ini sections are stored once, as JSON, by import_world(). Rooms
+    get a table of their own, indexed by internal name and by grid
+    coordinates. Each session's changes are stored as snapshots of the
+    objects that have changed, keyed by session name, kind and internal
+    name.
+
+    The state objects returned by open_session() are drop-in replacements
+    for RoomsState, ContainersState, CreaturesState and DoorsState: they
+    instantiate objects on demand, keep them in an LRU cache, and write the
+    snapshots of changed objects back to the database in batches. The
+    GameState object returned by open_game() is built on them, and also
+    saves the game's progress, the character, the cursor and the automap,
+    so a reopened session resumes the game where it was left.
+    """
+
+    __slots__ = ("connection", "_session_states", "_session_games")
+
+    ROOM = "room"
+    DOOR = "door"
+    CONTAINER = "container"
+    CREATURE = "creature"
+    GAME = "game"
+
+    # The entries of a GameState snapshot that are saved as the GAME kind;
+    # the rest are the rooms, doors, containers and creatures, which the
+    # state objects save themselves.
+
+    _game_entries = ("game", "character", "cursor", "automap")
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS sections (
+            kind TEXT NOT NULL,
+            internal_name TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (kind, internal_name)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS rooms (
+            ordinal INTEGER PRIMARY KEY,
+            internal_name TEXT NOT NULL UNIQUE,
+            x INTEGER,
+            y INTEGER,
+            is_entrance INTEGER NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS rooms_coords ON rooms (x, y);
+        CREATE TABLE IF NOT EXISTS session_state (
+            session TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            internal_name TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (session, kind, internal_name)
+        ) WITHOUT ROWID;
+    """
+
+    _compass_steps = {
+        "north": (0, 1),
+        "east": (1, 0),
+        "south": (0, -1),
+        "west": (-1, 0),
+    }
+
+    def __init__(self, path=":memory:"):
+        """
+        This __init__ method opens (or creates) the SQLite database at the
+        given path and makes sure its tables exist.
+
+        :path: A string, the path to the database file, default ':memory:'.
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(self._schema)
+        self._session_states = list()
+        self._session_games = list()
+
+    def import_world(
+        self,
+        doors_dict_of_dicts,
+        containers_dict_of_dicts,
+        creatures_dict_of_dicts,
+        rooms_dict_of_dicts,
+    ):
+        """
+        This method stores the sections of doors.ini, containers.ini,
+        creatures.ini and rooms.ini in the database, replacing any world that
+        was stored before. Each room is also given grid coordinates by walking
+        outward from the entrance through the rooms' compass doors.
+
+        Items aren't stored; item definitions are small and never change, so
+        sessions use an ordinary ItemsState object.
+
+        :doors_dict_of_dicts: A dict-of-dicts from doors.ini.
+        :containers_dict_of_dicts: A dict-of-dicts from containers.ini.
+        :creatures_dict_of_dicts: A dict-of-dicts from creatures.ini.
+        :rooms_dict_of_dicts: A dict-of-dicts from rooms.ini.
+        :return: None.
+        """
+        coords = self._room_coordinates(rooms_dict_of_dicts)
+        with self.connection:
+            self.connection.execute("DELETE FROM sections")
+            self.connection.execute("DELETE FROM rooms")
+            for kind, dict_of_dicts in (
+                (self.DOOR, doors_dict_of_dicts),
+                (self.CONTAINER, containers_dict_of_dicts),
+                (self.CREATURE, creatures_dict_of_dicts),
+            ):
+                self.connection.executemany(
+                    "INSERT INTO sections VALUES (?, ?, ?)",
+                    (
+                        (kind, internal_name, json.dumps(dict(section)))
+                        for internal_name, section in dict_of_dicts.items()
+                    ),
+                )
+            self.connection.executemany(
+                "INSERT INTO rooms (internal_name, x, y, is_entrance, data) "
+                + "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        internal_name,
+                        *coords.get(internal_name, (None, None)),
+                        str(section.get("is_entrance", "")).lower() == "true",
+                        json.dumps(dict(section)),
+                    )
+                    for internal_name, section in rooms_dict_of_dicts.items()
+                ),
+            )
+
+    def _room_coordinates(self, rooms_dict_of_dicts):
+        # Places the rooms on a grid with a breadth-first walk from the
+        # entrance, one step per compass door. Rooms that can't be
+        # reached from the entrance get no coordinates.
+        entrances = [
+            internal_name
+            for internal_name, section in rooms_dict_of_dicts.items()
+            if str(section.get("is_entrance", "")).lower() == "true"
+        ]
+        if not entrances:
+            return dict()
+        coords = {entrances[0]: (0, 0)}
+        queue = deque(entrances[:1])
+        while queue:
+            internal_name = queue.popleft()
+            x, y = coords[internal_name]
+            section = rooms_dict_of_dicts[internal_name]
+            for compass_dir, (step_x, step_y) in self._compass_steps.items():
+                other_name = section.get(f"{compass_dir}_door")
+                if other_name not in rooms_dict_of_dicts or other_name in coords:
+                    continue
+                coords[other_name] = (x + step_x, y + step_y)
+                queue.append(other_name)
+        return coords
+
+    def open_session(self, session, items_state, cache_size=256, batch_size=64):
+        """
+        This method returns the state objects for the named session, with any
+        changes saved for that session earlier applied to the objects as
+        they're instantiated.
+
+        :session: A string, the session name.
+        :items_state: An ItemsState object.
+        :cache_size: An int, the number of objects of each kind to keep
+        instantiated.
+        :batch_size: An int, the number of changed objects to collect before
+        writing them back.
+        :return: A tuple of a SQLiteRoomsState object, a SQLiteCreaturesState
+        object, a SQLiteContainersState object and a SQLiteDoorsState object,
+        in the order GameState accepts them.
+        """
+        doors_state = SQLiteDoorsState(self, session, cache_size, batch_size)
+        containers_state = SQLiteContainersState(
+            self, session, items_state, cache_size, batch_size
+        )
+        creatures_state = SQLiteCreaturesState(
+            self, session, items_state, cache_size, batch_size
+        )
+        rooms_state = SQLiteRoomsState(
+            self,
+            session,
+            creatures_state,
+            containers_state,
+            doors_state,
+            items_state,
+            cache_size,
+            batch_size,
+        )
+        self._session_states.extend(
+            (rooms_state, creatures_state, containers_state, doors_state)
+        )
+        return rooms_state, creatures_state, containers_state, doors_state
+
+    def open_game(self, session, items_state, cache_size=256, batch_size=64):
+        """
+        This method returns a GameState object for the named session, built
+        on the state objects open_session() returns. If a game was saved for
+        the session earlier, its progress, the character, the room the
+        player was in and the automap are restored as well.
+
+        :session: A string, the session name.
+        :items_state: An ItemsState object.
+        :cache_size: An int, the number of objects of each kind to keep
+        instantiated.
+        :batch_size: An int, the number of changed objects to collect before
+        writing them back.
+        :return: A GameState object.
+        """
+        game_state = GameState(
+            *self.open_session(session, items_state, cache_size, batch_size),
+            items_state,
+        )
+        entries = {
+            entry_name: self.load_state(session, self.GAME, entry_name)
+            for entry_name in self._game_entries
+        }
+        if entries["game"] is not None:
+            game_state.restore(entries)
+        self._session_games.append((session, game_state))
+        return game_state
+
+    def flush(self):
+        """
+        This method writes back every changed object held by the state objects
+        of every open session, and the game of every session opened with
+        open_game().
+
+        :return: None.
+        """
+        for state in self._session_states:
+            state.flush()
+        for session, game_state in self._session_games:
+            self.save_states(session, self.GAME, game_state.snapshot(elements=False))
+
+    def close(self):
+        """
+        This method flushes all open sessions and closes the database.
+
+        :return: None.
+        """
+        self.flush()
+        self._session_states.clear()
+        self._session_games.clear()
+        self.connection.close()
+
+    def section(self, kind, internal_name):
+        """
+        This method returns the stored .ini section of the given kind and
+        internal name, or None if there's no such section.
+
+        :kind: A string, one of 'door', 'container' or 'creature'.
+        :internal_name: A string.
+        :return: A dict, or None.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM sections WHERE kind = ? AND internal_name = ?",
+            (kind, internal_name),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def section_names(self, kind):
+        """
+        This method returns the internal names of all stored sections of the
+        given kind.
+
+        :kind: A string, one of 'room', 'door', 'container' or 'creature'.
+        :return: A list of strings.
+        """
+        if kind == self.ROOM:
+            cursor = self.connection.execute(
+                "SELECT internal_name FROM rooms ORDER BY ordinal"
+            )
+        else:
+            cursor = self.connection.execute(
+                "SELECT internal_name FROM sections WHERE kind = ?", (kind,)
+            )
+        return [internal_name for (internal_name,) in cursor]
+
+    def load_state(self, session, kind, internal_name):
+        """
+        This method returns the snapshot saved for the given object in the
+        given session, or None if none has been saved.
+
+        :session: A string, the session name.
+        :kind: A string, the kind of object.
+        :internal_name: A string.
+        :return: A JSON-compatible value, or None.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM session_state "
+            + "WHERE session = ? AND kind = ? AND internal_name = ?",
+            (session, kind, internal_name),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_states(self, session, kind, snapshots):
+        """
+        This method saves a batch of object snapshots for the given session in
+        a single transaction.
+
+        :session: A string, the session name.
+        :kind: A string, the kind of the objects.
+        :snapshots: A dict of internal name strings to JSON-compatible values.
+        :return: None.
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO session_state VALUES (?, ?, ?, ?)",
+                (
+                    (session, kind, internal_name, json.dumps(snapshot))
+                    for internal_name, snapshot in snapshots.items()
+                ),
+            )
+
+    def delete_session(self, session):
+        """
+        This method deletes every change saved for the given session.
+
+        :session: A string, the session name.
+        :return: None.
+        """
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM session_state WHERE session = ?", (session,)
+            )
+
+
+class _LRUCache:
+    # An LRU mapping of internal names to pairs of an instantiated object
+    # and the JSON text of the snapshot it was last saved with. When the
+    # cache grows past capacity the least recently used entry is passed
+    # to the on_evict callable.
+
+    __slots__ = "_entries", "capacity", "_on_evict"
+
+    def __init__(self, capacity, on_evict):
+        if capacity < 1:
+            raise InternalError("LRU cache capacity must be at least 1")
+        self._entries = OrderedDict()
+        self.capacity = capacity
+        self._on_evict = on_evict
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            evicted_key, evicted_entry = self._entries.popitem(last=False)
+            self._on_evict(evicted_key, evicted_entry)
+
+    def pop(self, key):
+        return self._entries.pop(key, None)
+
+    def replace(self, key, entry):
+        # Replaces an entry without counting it as a use.
+        self._entries[key] = entry
+
+    def items(self):
+        return tuple(self._entries.items())
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class _SQLiteStateMixin:
+    # The caching and write-back logic shared by the four SQLite-backed
+    # state classes. Objects are instantiated by _materialize() and
+    # snapshotted by _snapshot(); the cache entry keeps the JSON text of
+    # the last saved snapshot, so an object is only written back if its
+    # snapshot has changed. Objects can also be pinned, which keeps them
+    # out of the cache entirely: a room pins its creature and container
+    # so they can't be evicted (and later reinstantiated as a different
+    # object) while the room still refers to them.
+
+    __slots__ = ()
+
+    def _init_cache(self, store, session, kind, cache_size, batch_size):
+        self._store = store
+        self._session = session
+        self._kind = kind
+        self._cache = _LRUCache(cache_size, self._write_back)
+        self._pinned = dict()
+        self._pending = dict()
+        self._batch_size = batch_size
+
+    def _fetch(self, internal_name):
+        if internal_name in self._pinned:
+            return self._pinned[internal_name][0]
+        entry = self._cache.get(internal_name)
+        if entry is not None:
+            return entry[0]
+        obj = self._materialize(internal_name)
+
+        # A snapshot waiting in the pending batch is newer than the one in
+        # the database.
+
+        saved = self._pending.get(internal_name)
+        if saved is None:
+            saved = self._store.load_state(self._session, self._kind, internal_name)
+        if saved is not None:
+            self._restore(obj, saved)
+        self._cache.put(internal_name, (obj, json.dumps(self._snapshot(obj))))
+        return obj
+
+    def _store_obj(self, internal_name, obj):
+        # An object stored with set() is always written back, since its
+        # saved snapshot (if any) is for a different object.
+        if internal_name in self._pinned:
+            self._pinned[internal_name] = (obj, None)
+        else:
+            self._cache.put(internal_name, (obj, None))
+
+    def _write_back(self, internal_name, entry):
+        obj, saved_json = entry
+        snapshot = self._snapshot(obj)
+        if json.dumps(snapshot) != saved_json:
+            self._pending[internal_name] = snapshot
+        if len(self._pending) >= self._batch_size:
+            self._flush_pending()
+
+    def _flush_pending(self):
+        if self._pending:
+            self._store.save_states(self._session, self._kind, self._pending)
+            self._pending = dict()
+
+    def pin(self, internal_name):
+        """
+        This method instantiates the named object if need be and keeps it
+        instantiated until unpin() is called.
+
+        :internal_name: A string.
+        :return: The object.
+        """
+        obj = self._fetch(internal_name)
+        if internal_name not in self._pinned:
+            self._pinned[internal_name] = self._cache.pop(internal_name)
+        return obj
+
+    def unpin(self, internal_name):
+        """
+        This method returns a pinned object to the LRU cache.
+
+        :internal_name: A string.
+        :return: None.
+        """
+        entry = self._pinned.pop(internal_name, None)
+        if entry is not None:
+            self._cache.put(internal_name, entry)
+
+    def flush(self):
+        """
+        This method writes back every instantiated object whose state has
+        changed since it was last saved.
+
+        :return: None.
+        """
+        for entries in (self._cache.items(), tuple(self._pinned.items())):
+            for internal_name, (obj, saved_json) in entries:
+                snapshot = self._snapshot(obj)
+                snapshot_json = json.dumps(snapshot)
+                if snapshot_json == saved_json:
+                    continue
+                self._pending[internal_name] = snapshot
+                if internal_name in self._pinned:
+                    self._pinned[internal_name] = (obj, snapshot_json)
+                else:
+                    self._cache.replace(internal_name, (obj, snapshot_json))
+        self._flush_pending()
+
+    def cached_count(self):
+        """
+        This method returns the number of objects currently instantiated.
+
+        :return: An int.
+        """
+        return len(self._cache) + len(self._pinned)
+
+
+class SQLiteDoorsState(_SQLiteStateMixin, DoorsState):
+    """
+    This DoorsState subclass draws its Door objects from a SQLiteWorldStore.
+    It's keyed by pairs of room internal names like DoorsState.
+    """
+
+    def __init__(self, store, session, cache_size=256, batch_size=64):
+        """
+        This __init__ method accepts the store and session to draw on.
+
+        :store: A SQLiteWorldStore object.
+        :session: A string, the session name.
+        :cache_size: An int, the number of Door objects to keep instantiated.
+        :batch_size: An int, the number of changed objects to collect before
+        writing them back.
+        """
+        self._init_cache(store, session, store.DOOR, cache_size, batch_size)
+
+        # The count and the adjacency index cover every stored door; they
+        # only need the doors' internal names.
+
+        self._adjacency = defaultdict(dict)
+        self._size = 0
+        for door_internal_name in store.section_names(self._kind):
+            self._link(*door_internal_name.split("_x_"))
+            self._size += 1
+
+    def _materialize(self, internal_name):
+        section = self._store.section(self._kind, internal_name)
+        if section is None:
+            raise KeyError(internal_name)
+        return Door.subclassing_factory(internal_name=internal_name, **section)
+
+    def _snapshot(self, door):
+        return door.snapshot()
+
+    def _restore(self, door, snapshot):
+        door.restore(snapshot)
+
+    def get(self, room_1_intrn_name, room_2_intrn_name):
+        return self._fetch("_x_".join(self.key(room_1_intrn_name, room_2_intrn_name)))
+
+    def set(self, room_1_intrn_name, room_2_intrn_name, door):
+        if self.contains(room_1_intrn_name, room_2_intrn_name):
+            room_1_intrn_name, room_2_intrn_name = self.key(
+                room_1_intrn_name, room_2_intrn_name
+            )
+        else:
+            self._link(room_1_intrn_name, room_2_intrn_name)
+            self._size += 1
+        self._store_obj(f"{room_1_intrn_name}_x_{room_2_intrn_name}", door)
+
+    def delete(self, room_1_intrn_name, room_2_intrn_name):
+        raise InternalError("doors can't be deleted from a SQLiteDoorsState")
+
+    def _iter_keys(self):
+        for door_internal_name in self._store.section_names(self._kind):
+            yield tuple(door_internal_name.split("_x_"))
+
+
+class SQLiteContainersState(_SQLiteStateMixin, ContainersState):
+    """
+    This ContainersState subclass draws its Container objects from a
+    SQLiteWorldStore.
+    """
+
+    def __init__(self, store, session, items_state, cache_size=256, batch_size=64):
+        """
+        This __init__ method accepts the store and session to draw on, and an
+        ItemsState object to populate containers from.
+
+        :store: A SQLiteWorldStore object.
+        :session: A string, the session name.
+        :items_state: An ItemsState object.
+        :cache_size: An int, the number of Container objects to keep
+        instantiated.
+        :batch_size: An int, the number of changed objects to collect before
+        writing them back.
+        """
+        self._items_state = items_state
+        self._init_cache(store, session, store.CONTAINER, cache_size, batch_size)
+
+    def _materialize(self, internal_name):
+        section = self._store.section(self._kind, internal_name)
+        if section is None:
+            raise KeyError(internal_name)
+        return Container.subclassing_factory(
+            self._items_state, internal_name=internal_name, **section
+        )
+
+    def _snapshot(self, container):
+        return container.snapshot()
+
+    def _restore(self, container, snapshot):
+        container.restore(snapshot, self._items_state)
+
+    def contains(self, internal_name):
+        return (
+            internal_name in self._cache
+            or internal_name in self._pinned
+            or self._store.section(self._kind, internal_name) is not None
+        )
+
+    def get(self, internal_name):
+        return self._fetch(internal_name)
+
+    def set(self, internal_name, container):
+        self._store_obj(internal_name, container)
+
+    def delete(self, internal_name):
+        raise InternalError("containers can't be deleted from a SQLiteContainersState")
+
+    def keys(self):
+        return self._store.section_names(self._kind)
+
+    def values(self):
+        return [self.get(internal_name) for internal_name in self.keys()]
+
+    def items(self):
+        return [
+            (internal_name, self.get(internal_name)) for internal_name in self.keys()
+        ]
+
+    def size(self):
+        return len(self.keys())
+
+
+class SQLiteCreaturesState(_SQLiteStateMixin, CreaturesState):
+    """
+    This CreaturesState subclass draws its Creature objects from a
+    SQLiteWorldStore.
+    """
+
+    def __init__(self, store, session, items_state, cache_size=256, batch_size=64):
+        """
+        This __init__ method accepts the store and session to draw on, and an
+        ItemsState object to populate creatures' inventories from.
+
+        :store: A SQLiteWorldStore object.
+        :session: A string, the session name.
+        :items_state: An ItemsState object.
+        :cache_size: An int, the number of Creature objects to keep
+        instantiated.
+        :batch_size: An int, the number of changed objects to collect before
+        writing them back.
+        """
+        self._items_state = items_state
+        self._init_cache(store, session, store.CREATURE, cache_size, batch_size)
+
+    def _materialize(self, internal_name):
+        section = self._store.section(self._kind, internal_name)
+        if section is None:
+            raise KeyError(internal_name)
+        return Creature(self._items_state, internal_name=internal_name, **section)
+
+    def _snapshot(self, creature):
+        return creature.snapshot()
+
+    def _restore(self, creature, snapshot):
+        creature.restore(snapshot)
+
+    def contains(self, internal_name):
+        return (
+            internal_name in self._cache
+            or internal_name in self._pinned
+            or self._store.section(self._kind, internal_name) is not None
+        )
+
+    def get(self, internal_name):
+        return self._fetch(internal_name)
+
+    def set(self, internal_name, creature):
+        self._store_obj(internal_name, creature)
+
+    def delete(self, internal_name):
+        raise InternalError("creatures can't be deleted from a SQLiteCreaturesState")
+
+    def keys(self):
+        return self._store.section_names(self._kind)
+
+    def values(self):
+        return [self.get(internal_name) for internal_name in self.keys()]
+
+    def items(self):
+        return [
+            (internal_name, self.get(internal_name)) for internal_name in self.keys()
+        ]
+
+    def size(self):
+        return len(self.keys())
+
+
+class _RoomOrdinals:
+    # A read-only mapping of room internal names to the ordinals the
+    # rooms table assigned them, looked up on demand, for the AutoMap.
+
+    __slots__ = ("_connection",)
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __getitem__(self, internal_name):
+        row = self._connection.execute(
+            "SELECT ordinal FROM rooms WHERE internal_name = ?", (internal_name,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(internal_name)
+        return row[0]
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM rooms").fetchone()[0]
+
+
+class SQLiteRoomsState(_SQLiteStateMixin, RoomsState):
+    """
+    This RoomsState subclass draws its Room objects from a SQLiteWorldStore.
+    The cursor starts in the entrance; it's saved and restored with the
+    rest of the game by SQLiteWorldStore.open_game().
+    """
+
+    __slots__ = (
+        "_store",
+        "_session",
+        "_kind",
+        "_cache",
+        "_pinned",
+        "_pending",
+        "_batch_size",
+        "_room_pins",
+        "_door_pins",
+        "_room_door_names",
+    )
+
+    def __init__(
+        self,
+        store,
+        session,
+        creatures_state,
+        containers_state,
+        doors_state,
+        items_state,
+        cache_size=256,
+        batch_size=64,
+    ):
+        """
+        This __init__ method accepts the store and session to draw on, and the
+        state objects to instantiate rooms with.
+
+        :store: A SQLiteWorldStore object.
+        :session: A string, the session name.
+        :creatures_state: A SQLiteCreaturesState object.
+        :containers_state: A SQLiteContainersState object.
+        :doors_state: A SQLiteDoorsState object.
+        :items_state: An ItemsState object.
+        :cache_size: An int, the number of Room objects to keep instantiated.
+        :batch_size: An int, the number of changed objects to collect before
+        writing them back.
+        """
+        self._creatures_state = creatures_state
+        self._containers_state = containers_state
+        self._doors_state = doors_state
+        self._items_state = items_state
+        self._room_pins = dict()
+        self._door_pins = Counter()
+        self._room_door_names = dict()
+        self._init_cache(store, session, store.ROOM, cache_size, batch_size)
+
+        row = store.connection.execute(
+            "SELECT internal_name FROM rooms WHERE is_entrance"
+        ).fetchone()
+        self._room_cursor = row[0] if row else None
+        self.automap = AutoMap(_RoomOrdinals(store.connection))
+        if self._room_cursor is not None:
+            self.automap.visit(self._room_cursor)
+
+            # The room the player is in is pinned, since a command can
+            # look at the room on the other side of a door while it's
+            # still working on this one.
+
+            self.get(self._room_cursor)
+            self.pin(self._room_cursor)
+
+    def _materialize(self, internal_name):
+        row = self._store.connection.execute(
+            "SELECT data FROM rooms WHERE internal_name = ?", (internal_name,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(internal_name)
+        argd = json.loads(row[0])
+
+        # The room's doors are pinned before it's instantiated, since it
+        # holds views that share their state, and a door evicted from the
+        # cache would be reinstantiated with a different state. A door is
+        # shared by two rooms, so it's only unpinned once neither of them
+        # is instantiated.
+
+        door_names = tuple(
+            "_x_".join(
+                self._doors_state.key(internal_name, argd[f"{compass_dir}_door"])
+            )
+            for compass_dir in ("north", "east", "south", "west")
+            if argd.get(f"{compass_dir}_door")
+        )
+        for door_name in door_names:
+            if not self._door_pins[door_name]:
+                self._doors_state.pin(door_name)
+            self._door_pins[door_name] += 1
+        self._room_door_names[internal_name] = door_names
+        return Room(
+            self._creatures_state,
+            self._containers_state,
+            self._doors_state,
+            self._items_state,
+            internal_name=internal_name,
+            **argd,
+        )
+
+    def _snapshot(self, room):
+        return room.snapshot()
+
+    def _restore(self, room, snapshot):
+        room.restore(snapshot)
+
+    def _write_back(self, internal_name, entry):
+        # When a room is evicted, the creature, container and doors it
+        # pinned are released to their own caches.
+        super()._write_back(internal_name, entry)
+        creature_name, container_name = self._room_pins.pop(internal_name, (None,) * 2)
+        if creature_name is not None:
+            self._creatures_state.unpin(creature_name)
+        if container_name is not None:
+            self._containers_state.unpin(container_name)
+        for door_name in self._room_door_names.pop(internal_name, ()):
+            self._door_pins[door_name] -= 1
+            if not self._door_pins[door_name]:
+                del self._door_pins[door_name]
+                self._doors_state.unpin(door_name)
+
+    def get(self, internal_name):
+        """
+        This method is used to retrieve a Room object with the given internal
+        name, instantiating it if it's not in the cache.
+
+        :room_internal_name: A string, the internal name of the Room object.
+        :return: A Room object.
+        """
+        room = self._fetch(internal_name)
+        if internal_name in self._room_pins:
+            return room
+
+        # A newly instantiated room pins its creature and container. A
+        # corpse isn't pinned, since it isn't drawn from containers_state;
+        # it's saved as part of the room.
+
+        creature_name = container_name = None
+        if room.creature_here:
+            creature_name = room.creature_here.internal_name
+            self._creatures_state.pin(creature_name)
+        if room.container_here and not isinstance(room.container_here, Corpse):
+            container_name = room.container_here.internal_name
+            self._containers_state.pin(container_name)
+        self._room_pins[internal_name] = creature_name, container_name
+        return room
+
+    def set(self, internal_name, room):
+        self._store_obj(internal_name, room)
+
+    def reset_rooms(self, keep=()):
+        # Rooms are drawn from the store with the state they were last
+        # written back with, not from their sections, so there's no earlier
+        # state to reset them to.
+        pass
+
+    def place_cursor(self, internal_name):
+        from_room_internal_name = self._room_cursor
+        super().place_cursor(internal_name)
+        self.pin(self._room_cursor)
+        if from_room_internal_name != self._room_cursor:
+            self.unpin(from_room_internal_name)
+
+    def move(self, north=False, west=False, south=False, east=False):
+        from_room_internal_name = self._room_cursor
+        super().move(north=north, west=west, south=south, east=east)
+        self.pin(self._room_cursor)
+        self.unpin(from_room_internal_name)
+
+    def contains(self, internal_name):
+        return (
+            self.is_materialized(internal_name)
+            or self._store.connection.execute(
+                "SELECT 1 FROM rooms WHERE internal_name = ?", (internal_name,)
+            ).fetchone()
+            is not None
+        )
+
+    def is_materialized(self, internal_name):
+        return internal_name in self._cache or internal_name in self._pinned
+
+    def keys(self):
+        return self._store.section_names(self._kind)
+
+    def values(self):
+        return (self.get(internal_name) for internal_name in self.keys())
+
+    def size(self):
+        return self._store.connection.execute("SELECT COUNT(*) FROM rooms").fetchone()[
+            0
+        ]
+
+    def room_at(self, x, y):
+        """
+        This method returns the internal name of the room at the given grid
+        coordinates, or None if there's no room there.
+
+        :x: An int, the east-west coordinate.
+        :y: An int, the north-south coordinate.
+        :return: A string, or None.
+        """
+        row = self._store.connection.execute(
+            "SELECT internal_name FROM rooms WHERE x = ? AND y = ?", (x, y)
+        ).fetchone()
+        return row[0] if row else None
+
+    def coordinates(self, internal_name):
+        """
+        This method returns the grid coordinates of the named room, or None if
+        it couldn't be placed on the grid.
+
+        :internal_name: A string, the internal name of the Room object.
+        :return: A tuple of two ints, or None.
+        """
+        row = self._store.connection.execute(
+            "SELECT x, y FROM rooms WHERE internal_name = ?", (internal_name,)
+        ).fetchone()
+        return None if row is None or row[0] is None else tuple(row)
@@ -0,0 +1,453 @@
+#!/usr/bin/python3
+
+import mmap
+import struct
+import sys
+
+from advgame.elements.automap import AutoMap
+from advgame.elements.characters import ItemsState
+from advgame.elements.doors import Door, DoorsState
+from advgame.elements.items import Item
+from advgame.elements.rooms import RoomsState
+from advgame.errors import InternalError
+
+
+__all__ = (
+    "WorldPack",
+    "write_world_pack",
+    "PackedItemsState",
+    "PackedDoorsState",
+    "PackedRoomsState",
+)
+
+
+# A world pack file is laid out as a header, a string table and three
+# tables of fixed-width records, one each for items, doors and rooms.
+#
+# The header is the magic bytes, the format version, the number of
+# strings, and then for each table its record count, its field count and
+# the file offset its records start at.
+#
+# The string table is an array of count+1 little-endian uint32 offsets
+# followed by the UTF-8 bytes of every distinct string, each stored once.
+# String n spans offsets[n] to offsets[n+1] of the bytes.
+#
+# Each table starts with its field count's worth of uint32 string ids
+# naming its fields, followed by its records. A record is the string id
+# of the entry's internal name and then one string id per field, NO_VALUE
+# if the entry's .ini section lacks that key. Records are sorted by the
+# UTF-8 bytes of their internal names, so a lookup is a binary search
+# straight over the mapped file.
+
+_MAGIC = b"AGWP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI" + "III" * 3)
+_UINT32 = struct.Struct("<I")
+
+NO_VALUE = 0xFFFFFFFF
+
+ITEMS, DOORS, ROOMS = range(3)
+
+
+def write_world_pack(
+    path, items_dict_of_dicts, doors_dict_of_dicts, rooms_dict_of_dicts
+):
+    """
+    This function writes the static parts of a world -- the items.ini,
+    doors.ini and rooms.ini sections -- to a world pack file at the given
+    path.
+
+    :path: A string, the path of the file to write.
+    :items_dict_of_dicts: A dict-of-dicts from items.ini.
+    :doors_dict_of_dicts: A dict-of-dicts from doors.ini.
+    :rooms_dict_of_dicts: A dict-of-dicts from rooms.ini.
+    :return: None.
+    """
+    string_ids = dict()
+
+    def intern_string(value):
+        # Returns the id of the given string in the string table, adding
+        # it if it's new.
+        return string_ids.setdefault(str(value), len(string_ids))
+
+    tables = list()
+    for dict_of_dicts in (
+        items_dict_of_dicts,
+        doors_dict_of_dicts,
+        rooms_dict_of_dicts,
+    ):
+        field_names = sorted(
+            {key for section in dict_of_dicts.values() for key in section}
+        )
+        records = sorted(
+            (internal_name.encode("utf-8"), internal_name, dict(section))
+            for internal_name, section in dict_of_dicts.items()
+        )
+        table = [intern_string(field_name) for field_name in field_names]
+        for _, internal_name, section in records:
+            table.append(intern_string(internal_name))
+            table.extend(
+                intern_string(section[field_name])
+                if field_name in section
+                else NO_VALUE
+                for field_name in field_names
+            )
+        tables.append((len(records), len(field_names), table))
+
+    string_bytes = [string.encode("utf-8") for string in string_ids]
+    string_offsets = [0]
+    for encoded in string_bytes:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+    string_table = struct.pack(f"<{len(string_offsets)}I", *string_offsets) + b"".join(
+        string_bytes
+    )
+
+    # Each table's offset is rounded up to a multiple of 4 so its uint32s
+    # are aligned.
+
+    offset = _HEADER.size + len(string_table)
+    header_fields = list()
+    table_blobs = list()
+    for record_count, field_count, table in tables:
+        padding = -offset % 4
+        offset += padding
+        header_fields.extend((record_count, field_count, offset))
+        blob = b"\0" * padding + struct.pack(f"<{len(table)}I", *table)
+        table_blobs.append(blob)
+        offset += len(blob) - padding
+    with open(path, "wb") as pack_file:
+        pack_file.write(_HEADER.pack(_MAGIC, _VERSION, len(string_ids), *header_fields))
+        pack_file.write(string_table)
+        for blob in table_blobs:
+            pack_file.write(blob)
+
+
+class _PackTable:
+    # A read-only mapping of internal names to .ini sections over one
+    # table of a mapped world pack. A section is decoded into a dict only
+    # when it's looked up; nothing is cached per entry, so the table holds
+    # only its position in the file and its field names, which every
+    # lookup needs and so are decoded once, here.
+
+    __slots__ = (
+        "_pack",
+        "_count",
+        "_field_count",
+        "_records_offset",
+        "field_names",
+        "_field_indexes",
+    )
+
+    def __init__(self, pack, count, field_count, offset):
+        self._pack = pack
+        self._count = count
+        self._field_count = field_count
+        self._records_offset = offset + 4 * field_count
+        self.field_names = tuple(
+            sys.intern(pack.string(field_id))
+            for field_id in struct.unpack_from(f"<{field_count}I", pack.view, offset)
+        )
+        self._field_indexes = {
+            field_name: field_index
+            for field_index, field_name in enumerate(self.field_names)
+        }
+
+    def _record_offset(self, index):
+        return self._records_offset + 4 * (1 + self._field_count) * index
+
+    def index_of(self, internal_name):
+        # Binary-searches the records for the given internal name and
+        # returns its index, comparing encoded names so only the names on
+        # the search path are read.
+        view = self._pack.view
+        target = internal_name.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (name_id,) = _UINT32.unpack_from(view, self._record_offset(middle))
+            start, end = self._pack.string_span(name_id)
+            name_bytes = view[start:end].tobytes()
+            if name_bytes == target:
+                return middle
+            elif name_bytes < target:
+                low = middle + 1
+            else:
+                high = middle
+        raise KeyError(internal_name)
+
+    def name_at(self, index):
+        (name_id,) = _UINT32.unpack_from(self._pack.view, self._record_offset(index))
+        return self._pack.string(name_id)
+
+    def field_index(self, field_name):
+        # Returns the position of the given field in this table's
+        # records, or None if no entry has that field.
+        return self._field_indexes.get(field_name)
+
+    def value_at(self, index, field_index):
+        # Returns a single field of the entry at the given index without
+        # decoding the rest of it, or None if the entry lacks it.
+        (value_id,) = _UINT32.unpack_from(
+            self._pack.view, self._record_offset(index) + 4 * (1 + field_index)
+        )
+        return None if value_id == NO_VALUE else self._pack.string(value_id)
+
+    def __getitem__(self, internal_name):
+        record = struct.unpack_from(
+            f"<{self._field_count}I",
+            self._pack.view,
+            self._record_offset(self.index_of(internal_name)) + 4,
+        )
+        return {
+            field_name: self._pack.string(value_id)
+            for field_name, value_id in zip(self.field_names, record)
+            if value_id != NO_VALUE
+        }
+
+    def __contains__(self, internal_name):
+        try:
+            self.index_of(internal_name)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (self.name_at(index) for index in range(self._count))
+
+    def keys(self):
+        return iter(self)
+
+
+class _PackOrdinals:
+    # A read-only mapping of room internal names to their record index
+    # in the pack, for the AutoMap.
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, internal_name):
+        return self._table.index_of(internal_name)
+
+    def __len__(self):
+        return len(self._table)
+
+
+class WorldPack:
+    """
+    This class opens a world pack file written by write_world_pack() with
+    mmap, so every process that opens the same file shares the same
+    physical pages. Its items, doors and rooms attributes are read-only
+    mappings of internal names to .ini sections; each section is decoded
+    straight from the mapped file when it's looked up.
+    """
+
+    __slots__ = ("_file", "_mmap", "view", "_string_count", "items", "doors", "rooms")
+
+    def __init__(self, path):
+        """
+        This __init__ method opens and maps the world pack file at the given
+        path, and checks its header.
+
+        :path: A string, the path of the world pack file.
+        """
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self._mmap)
+        magic, version, self._string_count, *table_fields = _HEADER.unpack_from(
+            self.view, 0
+        )
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise InternalError(f"{path} is not a version {_VERSION} world pack")
+        self.items, self.doors, self.rooms = (
+            _PackTable(self, *table_fields[index * 3 : index * 3 + 3])
+            for index in (ITEMS, DOORS, ROOMS)
+        )
+
+    def string_span(self, string_id):
+        """
+        This method returns the start and end offsets in the file of the
+        UTF-8 bytes of the given string.
+
+        :string_id: An int.
+        :return: A tuple of two ints.
+        """
+        start, end = struct.unpack_from("<2I", self.view, _HEADER.size + 4 * string_id)
+        bytes_offset = _HEADER.size + 4 * (self._string_count + 1)
+        return bytes_offset + start, bytes_offset + end
+
+    def string(self, string_id):
+        """
+        This method decodes the given string from the string table.
+
+        :string_id: An int.
+        :return: A string.
+        """
+        start, end = self.string_span(string_id)
+        return str(self.view[start:end], "utf-8")
+
+    def close(self):
+        """
+        This method unmaps and closes the world pack file.
+
+        :return: None.
+        """
+        self.view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+class PackedItemsState(ItemsState):
+    """
+    This ItemsState subclass draws its Item objects from a WorldPack,
+    instantiating each one the first time it's retrieved.
+    """
+
+    def __init__(self, world_pack):
+        """
+        This __init__ method accepts the world pack to draw on.
+
+        :world_pack: A WorldPack object.
+        """
+        self._contents = dict()
+        self._pack = world_pack
+
+    def contains(self, item_internal_name):
+        return item_internal_name in self._contents or item_internal_name in (
+            self._pack.items
+        )
+
+    def get(self, item_internal_name):
+        item = self._contents.get(item_internal_name)
+        if item is None:
+            item = Item.subclassing_factory(
+                internal_name=item_internal_name,
+                **self._pack.items[item_internal_name],
+            )
+            self._contents[item_internal_name] = item
+        return item
+
+    def keys(self):
+        return self._pack.items.keys()
+
+    def values(self):
+        return (self.get(item_internal_name) for item_internal_name in self.keys())
+
+    def items(self):
+        return (
+            (item_internal_name, self.get(item_internal_name))
+            for item_internal_name in self.keys()
+        )
+
+    def size(self):
+        return len(self._pack.items)
+
+
+class PackedDoorsState(DoorsState):
+    """
+    This DoorsState subclass draws its Door objects from a WorldPack,
+    instantiating each one the first time it's retrieved.
+    """
+
+    def __init__(self, world_pack):
+        """
+        This __init__ method accepts the world pack to draw on.
+
+        :world_pack: A WorldPack object.
+        """
+        super().__init__()
+        self._pack = world_pack
+
+        # The count and the adjacency index cover every door in the pack,
+        # instantiated or not; they only need the doors' internal names.
+
+        for door_internal_name in self._pack.doors:
+            self._link(*door_internal_name.split("_x_"))
+        self._size = len(self._pack.doors)
+
+    def get(self, room_1_intrn_name, room_2_intrn_name):
+        room_1_intrn_name, room_2_intrn_name = self.key(
+            room_1_intrn_name, room_2_intrn_name
+        )
+        if room_2_intrn_name not in self._contents.get(room_1_intrn_name, ()):
+            door_internal_name = f"{room_1_intrn_name}_x_{room_2_intrn_name}"
+            self._contents[room_1_intrn_name][
+                room_2_intrn_name
+            ] = Door.subclassing_factory(
+                internal_name=door_internal_name, **self._pack.doors[door_internal_name]
+            )
+        return self._contents[room_1_intrn_name][room_2_intrn_name]
+
+    def _iter_keys(self):
+        for door_internal_name in self._pack.doors:
+            yield tuple(door_internal_name.split("_x_"))
+
+
+class PackedRoomsState(RoomsState):
+    """
+    This RoomsState subclass draws its rooms' sections from a WorldPack. It
+    always works in lazy mode: a Room object is instantiated the first time
+    it's retrieved.
+    """
+
+    __slots__ = ("_pack",)
+
+    def __init__(
+        self, world_pack, creatures_state, containers_state, doors_state, items_state
+    ):
+        """
+        This __init__ method accepts the world pack to draw on, and the state
+        objects to instantiate rooms with.
+
+        :world_pack: A WorldPack object.
+        :creatures_state: A CreaturesState object.
+        :containers_state: A ContainersState object.
+        :doors_state: A DoorsState object, typically a PackedDoorsState.
+        :items_state: An ItemsState object, typically a PackedItemsState.
+        """
+        super().__init__(
+            creatures_state, containers_state, doors_state, items_state, lazy=True
+        )
+        self._pack = world_pack
+
+        # The entrance is found by reading just the is_entrance field of
+        # each record.
+
+        rooms_table = world_pack.rooms
+        field_index = rooms_table.field_index("is_entrance")
+        for index in range(len(rooms_table) if field_index is not None else 0):
+            is_entrance = rooms_table.value_at(index, field_index)
+            if is_entrance is not None and is_entrance.lower() == "true":
+                self._room_cursor = rooms_table.name_at(index)
+                break
+        self.automap = AutoMap(_PackOrdinals(world_pack.rooms))
+        if self._room_cursor is not None:
+            self.automap.visit(self._room_cursor)
+
+    def _take_section(self, internal_name):
+        return self._pack.rooms[internal_name]
+
+    def _return_section(self, internal_name, room_dict):
+        # The section is still in the pack, so there's nothing to set
+        # aside.
+        pass
+
+    def _room_ordinal(self, internal_name):
+        # A room's ordinal is its record index in the pack.
+        return self._pack.rooms.index_of(internal_name)
+
+    def set(self, internal_name, room):
+        if internal_name not in self._pack.rooms:
+            raise InternalError(f"room {internal_name} isn't in the world pack")
+        self._rooms_objs[internal_name] = room
+
+    def keys(self):
+        return self._pack.rooms.keys()
+
+    def size(self):
+        return len(self._pack.rooms)
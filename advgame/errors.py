@@ -7,6 +7,7 @@ This module stores the exceptions used by other advgame modules.
 __all__ = (
     "BadCommandError",
     "InternalError",
+    "SaveFileError",
 )
 
 
@@ -36,3 +37,13 @@ class BadCommandError(Exception):
         """
         self.command = command
         self.message = message
+
+
+class SaveFileError(Exception):
+    """
+    This Exception subclass represents a save file that can't be read: it
+    isn't a save file, it was written by an unsupported version, or it
+    fails its checksum.
+    """
+
+    pass
@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+
+"""
+The advgame.events module implements a publish/subscribe bus for the
+actions taken in each room, so the other players in a room can see what
+happens there. Subscriptions are kept per room, so publishing an event only
+costs as much as the number of subscribers in that room. Each subscription
+delivers events through a bounded asyncio queue that drops its oldest event
+when a new one arrives and it's full.
+"""
+
+import asyncio
+import threading
+
+
+__all__ = ("PUBLISHED_COMMANDS", "RoomEvent", "RoomEventBus", "Subscription")
+
+
+# The commands whose results are published to the room they were issued
+# in; they're the ones that change the room in a way other players there
+# would see. The names are those used by CommandProcessor.dispatch().
+
+PUBLISHED_COMMANDS = frozenset(
+    (
+        "attack",
+        "cast_spell",
+        "close",
+        "drop",
+        "leave",
+        "lock",
+        "open",
+        "pick_lock",
+        "pick_up",
+        "put",
+        "take",
+        "unlock",
+    )
+)
+
+
+class RoomEvent:
+    """
+    One published action: who took it, with what command, in which room,
+    and the GameStateMessage objects the command returned.
+    """
+
+    __slots__ = "room_internal_name", "actor_name", "command", "messages"
+
+    def __init__(self, room_internal_name, actor_name, command, messages):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :room_internal_name: A string, the internal name of the room.
+        :actor_name: A string, the name of the character who took the action.
+        :command: A string, the command name.
+        :messages: A tuple of GameStateMessage objects.
+        """
+        self.room_internal_name = room_internal_name
+        self.actor_name = actor_name
+        self.command = command
+        self.messages = messages
+
+    @property
+    def message(self):
+        """
+        This property returns the event's messages, each prefixed with the
+        name of the character who took the action.
+
+        :return: A string.
+        """
+        return "\n".join(
+            f"[{self.actor_name}] {game_state_message.message}"
+            for game_state_message in self.messages
+        )
+
+
+class Subscription:
+    """
+    One subscriber's subscription to the room it's in. Events are read from
+    it with get() in a coroutine, or get_nowait() outside of one.
+    """
+
+    __slots__ = "subscriber", "room_internal_name", "queue", "dropped", "_loop"
+
+    def __init__(self, subscriber, room_internal_name, queue_size):
+        """
+        This __init__ method creates the subscription's queue. If it's called
+        from a coroutine, events published from other threads are handed to
+        that coroutine's event loop.
+
+        :subscriber: A hashable object identifying the subscriber.
+        :room_internal_name: A string, the internal name of the room.
+        :queue_size: An int, the most events the queue holds.
+        """
+        self.subscriber = subscriber
+        self.room_internal_name = room_internal_name
+        self.queue = asyncio.Queue(queue_size)
+        self.dropped = 0
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
+    async def get(self):
+        """
+        This coroutine waits for and returns the next event.
+
+        :return: A RoomEvent object.
+        """
+        return await self.queue.get()
+
+    def get_nowait(self):
+        """
+        This method returns the next event, raising asyncio.QueueEmpty if
+        there isn't one.
+
+        :return: A RoomEvent object.
+        """
+        return self.queue.get_nowait()
+
+    def deliver(self, event):
+        """
+        This method queues an event, dropping the oldest queued event first if
+        the queue is full. asyncio queues aren't thread-safe, so an event
+        published from outside the subscriber's event loop is handed to that
+        loop to queue.
+
+        :event: A RoomEvent object.
+        :return: None.
+        """
+        if self._loop is not None and not self._in_loop():
+            self._loop.call_soon_threadsafe(self._put, event)
+        else:
+            self._put(event)
+
+    def _in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _put(self, event):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class RoomEventBus:
+    """
+    This class keeps each room's subscriptions and delivers the events
+    published to a room to the subscriptions in it. A subscription follows
+    its subscriber from room to room with relocate().
+    """
+
+    __slots__ = "_rooms", "_subscriptions", "_queue_size", "_lock"
+
+    def __init__(self, queue_size=64):
+        """
+        This __init__ method creates an empty bus.
+
+        :queue_size: An int, the default queue size for subscriptions.
+        """
+        self._rooms = dict()
+        self._subscriptions = dict()
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber, room_internal_name, queue_size=None):
+        """
+        This method subscribes a subscriber to the given room, replacing any
+        subscription it already had.
+
+        :subscriber: A hashable object identifying the subscriber.
+        :room_internal_name: A string, the internal name of the room.
+        :queue_size: An int, or None to use the bus's default.
+        :return: A Subscription object.
+        """
+        subscription = Subscription(
+            subscriber, room_internal_name, queue_size or self._queue_size
+        )
+        with self._lock:
+            self._remove(subscriber)
+            self._subscriptions[subscriber] = subscription
+            self._rooms.setdefault(room_internal_name, dict())[
+                subscriber
+            ] = subscription
+        return subscription
+
+    def unsubscribe(self, subscriber):
+        """
+        This method removes a subscriber's subscription, if it has one.
+
+        :subscriber: A hashable object identifying the subscriber.
+        :return: None.
+        """
+        with self._lock:
+            self._remove(subscriber)
+
+    def relocate(self, subscriber, room_internal_name):
+        """
+        This method moves a subscriber's subscription to another room. It does
+        nothing if the subscriber has no subscription.
+
+        :subscriber: A hashable object identifying the subscriber.
+        :room_internal_name: A string, the internal name of the new room.
+        :return: None.
+        """
+        with self._lock:
+            subscription = self._remove(subscriber)
+            if subscription is None:
+                return
+            subscription.room_internal_name = room_internal_name
+            self._subscriptions[subscriber] = subscription
+            self._rooms.setdefault(room_internal_name, dict())[
+                subscriber
+            ] = subscription
+
+    def subscriber_count(self, room_internal_name):
+        """
+        This method returns the number of subscriptions in the given room.
+
+        :room_internal_name: A string, the internal name of the room.
+        :return: An int.
+        """
+        with self._lock:
+            return len(self._rooms.get(room_internal_name, ()))
+
+    def publish(self, event, source=None):
+        """
+        This method delivers an event to every subscription in the event's
+        room except the source's own.
+
+        :event: A RoomEvent object.
+        :source: The subscriber that took the action, or None.
+        :return: An int, the number of subscriptions the event went to.
+        """
+        with self._lock:
+            subscriptions = tuple(
+                self._rooms.get(event.room_internal_name, dict()).values()
+            )
+        delivered = 0
+        for subscription in subscriptions:
+            if subscription.subscriber == source:
+                continue
+            subscription.deliver(event)
+            delivered += 1
+        return delivered
+
+    def _remove(self, subscriber):
+        # Removes and returns a subscriber's subscription, or returns
+        # None; the caller holds the lock. Empty rooms are dropped so the
+        # room dict only grows with occupied rooms.
+        subscription = self._subscriptions.pop(subscriber, None)
+        if subscription is None:
+            return None
+        room = self._rooms[subscription.room_internal_name]
+        del room[subscriber]
+        if not room:
+            del self._rooms[subscription.room_internal_name]
+        return subscription
@@ -0,0 +1,502 @@
+#!/usr/bin/python3
+
+"""
+The advgame.fuzzer module implements a harness that plays random commands
+against a world to find the ones that make CommandProcessor.process()
+raise an exception instead of returning a result. A command that raises,
+whether an InternalError, a KeyError or anything else, is a bug a player
+would otherwise find.
+
+Commands are generated from the syntax in COMMANDS_SYNTAX, filled in with
+the titles of the items, doors, containers and creatures in the world and
+with numbers in digits or words; some are the commands that would make
+progress in the current state, some are mangled, and some are random
+tokens. Each transcript of commands is played on a freshly built world
+with dice seeded from the transcript's seed, so a failing transcript
+replays the same way every time, and is cut down to a shortest reproducer
+before it's reported. Transcripts can be played across a pool of worker
+processes.
+"""
+
+import re
+import traceback
+
+from multiprocessing import Pool
+from random import Random
+
+from advgame.commands import COMMANDS_SYNTAX
+from advgame.process import CommandProcessor
+from advgame.solver import SeededDice, legal_commands
+from advgame.utils import set_dice_roller
+from advgame.world import build_game_state
+
+
+__all__ = (
+    "CommandGenerator",
+    "FuzzFailure",
+    "FuzzReport",
+    "Fuzzer",
+    "minimize_transcript",
+    "play_transcript",
+)
+
+
+_CHARACTER_CLASSES = ("Warrior", "Thief", "Mage", "Priest")
+
+_COMPASS_DIRECTIONS = ("north", "south", "east", "west")
+
+_NUMBER_WORDS = (
+    "one",
+    "two",
+    "three",
+    "seven",
+    "twelve",
+    "fifteen",
+    "twenty-one",
+    "ninety-nine",
+)
+
+# Numbers a player might type that aren't quantities the game accepts.
+
+_BAD_NUMBERS = ("0", "-1", "zero", "one hundred", "twenty", "1.5", "99999999999")
+
+_JUNK_TOKENS = ("", " ", "the", "a", "of", "and", "it", "all", "?", "!", "'", "\t")
+
+_OPTIONAL_WORD_RE = re.compile(r"\[(\w+)\]")
+
+_USING_OR_VIA_RE = re.compile(r"\[USING\xa0or\xa0VIA\]")
+
+_PLACEHOLDER_RE = re.compile(r"<([^>]*)>")
+
+
+class CommandGenerator:
+    """
+    A generator of command strings for a world, drawing on a random.Random
+    object so that the same seed generates the same commands.
+    """
+
+    __slots__ = "_rng", "_syntaxes", "_fillers"
+
+    def __init__(self, game_state, rng):
+        """
+        This __init__ method collects the vocabulary of the world the given
+        GameState object was built from.
+
+        :game_state: A GameState object.
+        :rng: A random.Random object.
+        """
+        self._rng = rng
+        self._syntaxes = [
+            (command.lower(), syntax)
+            for command, syntaxes in COMMANDS_SYNTAX.items()
+            for syntax in syntaxes
+        ]
+        item_titles = sorted({item.title for item in game_state.items_state.values()})
+        container_titles = sorted(
+            {container.title for container in game_state.containers_state.values()}
+        )
+        creature_titles = sorted(
+            {creature.title for creature in game_state.creatures_state.values()}
+        )
+        door_titles = sorted(
+            {
+                door.title
+                for room in game_state.rooms_state.values()
+                for door in room.doors
+            }
+        )
+
+        # Each placeholder in a syntax string is filled from the titles it
+        # names, mixed with a few of the wrong kind, since a player who
+        # tries to open a kobold should be told so rather than crash the
+        # game.
+
+        self._fillers = {
+            "character name": ("Niath", "Lidda", "X", "a" * 64, "Ⅻ"),
+            "Warrior, Thief, Mage or Priest": _CHARACTER_CLASSES
+            + ("Wizard", "warrior", "thief"),
+            "command name": tuple(command for command, _ in self._syntaxes)
+            + ("fly", "look"),
+            "compass direction": _COMPASS_DIRECTIONS + ("up", "northeast"),
+            "number": tuple(str(number) for number in range(1, 6))
+            + _NUMBER_WORDS
+            + _BAD_NUMBERS,
+            "item name": tuple(item_titles),
+            "container name": tuple(container_titles)
+            + tuple(f"{title} corpse" for title in creature_titles),
+            "chest name": tuple(container_titles),
+            "corpse name": tuple(f"{title} corpse" for title in creature_titles),
+            "creature name": tuple(creature_titles),
+            "door name": tuple(door_titles) + ("door", "doorway"),
+        }
+        self._fillers["words"] = tuple(
+            word
+            for filler in self._fillers.values()
+            for title in filler
+            for word in title.split()
+        )
+
+    def _fill(self, placeholder):
+        name = placeholder.replace("\xa0", " ")
+        fillers = self._fillers.get(name)
+        if fillers is None:
+            fillers = self._fillers["item name"]
+        if self._rng.random() < 0.1:
+            fillers = self._fillers["words"]
+        return self._rng.choice(fillers)
+
+    def plausible(self):
+        """
+        This method returns a command built from the syntax of a randomly
+        chosen command.
+
+        :return: A string.
+        """
+        rng = self._rng
+        command, syntax = rng.choice(self._syntaxes)
+        syntax = _USING_OR_VIA_RE.sub(
+            lambda _: rng.choice(("using", "via", "")), syntax
+        )
+        syntax = _OPTIONAL_WORD_RE.sub(lambda match: rng.choice((match[1], "")), syntax)
+        syntax = syntax.replace("(s)", rng.choice(("s", "")))
+        syntax = _PLACEHOLDER_RE.sub(lambda match: self._fill(match[1]), syntax)
+        words = [
+            word.lower() for word in syntax.replace("\xa0", " ").split(" ") if word
+        ]
+        return " ".join([command] + words)
+
+    def mangled(self, command):
+        """
+        This method returns a copy of a command with one of its words dropped,
+        repeated, swapped or replaced, or with its letters recased.
+
+        :command: A string.
+        :return: A string.
+        """
+        rng = self._rng
+        words = command.split(" ")
+        index = rng.randrange(len(words))
+        mangling = rng.randrange(5)
+        if mangling == 0:
+            del words[index]
+        elif mangling == 1:
+            words.insert(index, words[index])
+        elif mangling == 2:
+            other_index = rng.randrange(len(words))
+            words[index], words[other_index] = words[other_index], words[index]
+        elif mangling == 3:
+            words[index] = rng.choice(self._fillers["words"] + _JUNK_TOKENS)
+        else:
+            return "".join(
+                letter.upper() if rng.random() < 0.5 else letter for letter in command
+            )
+        return " ".join(words)
+
+    def junk(self):
+        """
+        This method returns a string of random tokens.
+
+        :return: A string.
+        """
+        rng = self._rng
+        return " ".join(
+            rng.choice(self._fillers["words"] + _JUNK_TOKENS + _BAD_NUMBERS)
+            for _ in range(rng.randrange(4))
+        )
+
+    def command(self, game_state):
+        """
+        This method returns a command to play on the given GameState object:
+        usually a plausible one, sometimes one that would make progress in
+        its current state, and sometimes a mangled command or junk.
+
+        :game_state: A GameState object.
+        :return: A string.
+        """
+        rng = self._rng
+        roll = rng.random()
+        if not game_state.game_has_begun and roll < 0.3:
+            return rng.choice(
+                (
+                    f"set name to {rng.choice(self._fillers['character name'])}",
+                    f"set class to {rng.choice(_CHARACTER_CLASSES)}",
+                    "begin game",
+                )
+            )
+        if game_state.game_has_begun and roll < 0.3:
+            commands = legal_commands(game_state)
+            if commands:
+                return rng.choice(commands)
+        if roll < 0.85:
+            return self.plausible()
+        if roll < 0.95:
+            return self.mangled(self.plausible())
+        return self.junk()
+
+
+class FuzzFailure:
+    """
+    A transcript of commands that makes CommandProcessor.process() raise an
+    exception, as found and as minimized.
+    """
+
+    __slots__ = "seed", "signature", "transcript", "reproducer", "traceback"
+
+    def __init__(self, seed, signature, transcript, reproducer, traceback):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :seed: An int, the seed the transcript's dice are rolled with.
+        :signature: A tuple of the exception's type name and the file, line
+        and function it was raised from.
+        :transcript: A tuple of command strings, ending with the one that
+        raised.
+        :reproducer: A tuple of command strings, a shortest subsequence of
+        the transcript that raises the same exception from the same place.
+        :traceback: A string, the formatted traceback of the reproducer.
+        """
+        self.seed = seed
+        self.signature = signature
+        self.transcript = transcript
+        self.reproducer = reproducer
+        self.traceback = traceback
+
+    def __repr__(self):
+        return (
+            f"<FuzzFailure {self.signature[0]} at {self.signature[1]}:"
+            + f"{self.signature[2]} seed={self.seed} reproducer={self.reproducer!r}>"
+        )
+
+
+class FuzzReport:
+    """
+    The result of a Fuzzer.run() call: the number of transcripts and
+    commands played, and one FuzzFailure object for each distinct place an
+    exception was raised from.
+    """
+
+    __slots__ = "transcripts_played", "commands_played", "failures"
+
+    def __init__(self, transcripts_played, commands_played, failures):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :transcripts_played: An int.
+        :commands_played: An int.
+        :failures: A tuple of FuzzFailure objects.
+        """
+        self.transcripts_played = transcripts_played
+        self.commands_played = commands_played
+        self.failures = failures
+
+    @property
+    def passed(self):
+        """
+        This property returns True if no command raised an exception, False
+        otherwise.
+
+        :return: A boolean.
+        """
+        return not self.failures
+
+
+def _signature(exception):
+    # The innermost frame identifies the bug; the same exception raised
+    # from the same line by different commands is the same failure.
+    frame = traceback.extract_tb(exception.__traceback__)[-1]
+    return (type(exception).__name__, frame.filename, frame.lineno, frame.name)
+
+
+def play_transcript(world_sections, commands, seed):
+    """
+    This function plays a sequence of commands on a freshly built world, with
+    dice seeded from the given seed, until one raises an exception or the
+    game ends.
+
+    :world_sections: A WorldSections object.
+    :commands: An iterable of command strings.
+    :seed: An int.
+    :return: None if no command raised, otherwise a tuple of the number of
+    commands played, including the one that raised, the exception's
+    signature, and its formatted traceback.
+    """
+    previous_dice_roller = set_dice_roller(SeededDice(seed))
+    try:
+        game_state = build_game_state(world_sections)
+        command_processor = CommandProcessor(game_state)
+        for index, command in enumerate(commands):
+            try:
+                command_processor.process(command)
+            except Exception as exception:
+                return (index + 1, _signature(exception), traceback.format_exc())
+        return None
+    finally:
+        set_dice_roller(previous_dice_roller)
+
+
+def minimize_transcript(world_sections, commands, seed, signature):
+    """
+    This function cuts a failing transcript down to a shortest sequence of
+    its commands that still raises an exception with the given signature,
+    using the ddmin delta-debugging algorithm: it tries dropping ever
+    smaller chunks of the sequence and keeps any shorter sequence that still
+    fails. The result is 1-minimal, in that dropping any one more command
+    makes the failure go away.
+
+    :world_sections: A WorldSections object.
+    :commands: A sequence of command strings that fails with signature.
+    :seed: An int, the seed the transcript's dice are rolled with.
+    :signature: A signature tuple, as in FuzzFailure.
+    :return: A tuple of command strings.
+    """
+
+    def fails(candidate):
+        outcome = play_transcript(world_sections, candidate, seed)
+        return outcome is not None and outcome[1] == signature
+
+    commands = list(commands)
+    granularity = 2
+    while len(commands) >= 2:
+        chunk_size = -(-len(commands) // granularity)
+        chunks = [
+            commands[index : index + chunk_size]
+            for index in range(0, len(commands), chunk_size)
+        ]
+        reduced = False
+
+        # A single chunk that fails on its own is the biggest cut; failing
+        # that, each complement is tried.
+
+        for chunk in chunks:
+            if len(chunks) > 2 and fails(chunk):
+                commands, granularity, reduced = chunk, 2, True
+                break
+        else:
+            for index in range(len(chunks)):
+                complement = [
+                    command
+                    for chunk in chunks[:index] + chunks[index + 1 :]
+                    for command in chunk
+                ]
+                if fails(complement):
+                    commands = complement
+                    granularity = max(granularity - 1, 2)
+                    reduced = True
+                    break
+        if not reduced:
+            if granularity >= len(commands):
+                break
+            granularity = min(granularity * 2, len(commands))
+    return tuple(commands)
+
+
+def _fuzz_seeds(world_sections, seeds, transcript_length):
+    # Plays one transcript per seed and returns the number of commands
+    # played and a FuzzFailure object for each new signature, minimized.
+    commands_played = 0
+    failures = dict()
+    for seed in seeds:
+        rng = Random(seed)
+        dice = SeededDice(seed)
+        previous_dice_roller = set_dice_roller(dice)
+        try:
+            game_state = build_game_state(world_sections)
+            generator = CommandGenerator(game_state, rng)
+            command_processor = CommandProcessor(game_state)
+            transcript = list()
+            failure = None
+            for _ in range(transcript_length):
+                if game_state.game_has_ended:
+                    break
+                command = generator.command(game_state)
+                transcript.append(command)
+                commands_played += 1
+                try:
+                    command_processor.process(command)
+                except Exception as exception:
+                    failure = _signature(exception)
+                    break
+        finally:
+            set_dice_roller(previous_dice_roller)
+        if failure is None or failure in failures:
+            continue
+        reproducer = minimize_transcript(world_sections, transcript, seed, failure)
+        _, _, traceback_text = play_transcript(world_sections, reproducer, seed)
+        failures[failure] = FuzzFailure(
+            seed, failure, tuple(transcript), reproducer, traceback_text
+        )
+    return commands_played, failures
+
+
+# Each worker process is given the world once, when the pool starts it.
+
+_worker_world_sections = None
+
+
+def _init_worker(world_sections):
+    global _worker_world_sections
+    _worker_world_sections = world_sections
+
+
+def _fuzz_in_worker(arguments):
+    seeds, transcript_length = arguments
+    return _fuzz_seeds(_worker_world_sections, seeds, transcript_length)
+
+
+class Fuzzer:
+    """
+    A random-command fuzzer for a world. run() plays a number of random
+    transcripts and reports the commands that raised exceptions.
+    """
+
+    __slots__ = "_world_sections", "seed", "processes", "transcript_length"
+
+    def __init__(self, world_sections, seed=0, processes=1, transcript_length=50):
+        """
+        This __init__ method stores its arguments; nothing is played until
+        run() is called.
+
+        :world_sections: A WorldSections object.
+        :seed: An int; transcript n is played with seed + n, so runs with
+        the same seed play the same commands.
+        :processes: An int, the number of worker processes to play
+        transcripts in; 1 plays them in this process.
+        :transcript_length: An int, the greatest number of commands in a
+        transcript.
+        """
+        self._world_sections = world_sections
+        self.seed = seed
+        self.processes = processes
+        self.transcript_length = transcript_length
+
+    def run(self, transcripts=1000):
+        """
+        This method plays the given number of transcripts and returns a
+        FuzzReport object. It finds the same failures however many processes
+        are used.
+
+        :transcripts: An int.
+        :return: A FuzzReport object.
+        """
+        seeds = range(self.seed, self.seed + transcripts)
+        if self.processes > 1:
+            batch_size = -(-transcripts // (self.processes * 4))
+            batches = [
+                (seeds[index : index + batch_size], self.transcript_length)
+                for index in range(0, transcripts, batch_size)
+            ]
+            with Pool(self.processes, _init_worker, (self._world_sections,)) as pool:
+                results = pool.map(_fuzz_in_worker, batches)
+        else:
+            results = [_fuzz_seeds(self._world_sections, seeds, self.transcript_length)]
+
+        # Batches are merged in seed order, so each failure is reported from
+        # the lowest seed that found it.
+
+        commands_played = 0
+        failures = dict()
+        for batch_commands_played, batch_failures in results:
+            commands_played += batch_commands_played
+            for signature, failure in batch_failures.items():
+                failures.setdefault(signature, failure)
+        return FuzzReport(transcripts, commands_played, tuple(failures.values()))
@@ -0,0 +1,671 @@
+#!/usr/bin/python3
+
+"""
+The advgame.host module implements a pre-forking server for many
+concurrent game sessions. The parent process builds a WorldTemplate once,
+freezes the garbage collector's view of the heap, and forks a number of
+worker processes that inherit the world through copy-on-write pages.
+Each session is assigned to a worker by consistent hashing of its name, so
+a session's GameState always lives in the same worker, and the parent
+hands each new connection to that worker by passing its file descriptor.
+
+The protocol is line-based. A client opens a connection and sends
+'SESSION <name>' on the first line; each line after that is a command,
+and the server replies to each with one line of JSON, an object with a
+'messages' list of message strings and a 'game_over' boolean. A host
+started with structured=True replies with a 'results' list of each
+message's structured form in place of 'messages', so clients can render the
+results themselves and the message text is never generated.
+
+A client of a plain host can send 'WIDTH <columns>' on any line to have the
+message strings wrapped to that many columns for the rest of the
+connection; the reply is an object with the 'width' now in effect. A
+command that fails is answered with an object with an 'error' string, and
+the session carries on.
+
+Every socket is non-blocking: the parent reads session lines alongside
+accepting connections, and each worker queues its replies and sends them
+as each connection accepts them, so a slow or stalled client only holds up
+itself. A worker that exits is replaced by a new one that's given the same
+sessions.
+
+A host started with a save_dir keeps a save file there for each session,
+named by a hash of the session name. The SAVE and LOAD commands use it, the
+session's game is saved to it when its connection closes, and a session a
+worker hasn't seen yet is loaded from it, so a player who reconnects picks
+up where they left off.
+"""
+
+import gc
+import json
+import os
+import selectors
+import signal
+import socket
+import threading
+import time
+import traceback
+
+from bisect import bisect
+from hashlib import blake2b
+
+from advgame.errors import InternalError, SaveFileError
+from advgame.output import OutputWriter
+from advgame.process import CommandProcessor
+from advgame.savefile import SaveFile
+from advgame.statemsgs.be_atkd import CharacterDeathGSM
+from advgame.statemsgs.leave import WonTheGameGSM
+from advgame.statemsgs.quit import HaveQuitTheGameGSM
+from advgame.utils import textwrapper
+
+
+__all__ = ("HashRing", "PreforkHost")
+
+
+# The first line of a connection is read by the parent as it arrives,
+# alongside every other connection's; it's limited in length and in the
+# time a client has to send it. Whatever the parent reads past it is
+# passed on to the worker with the connection.
+
+_MAX_SESSION_LINE = 256
+_SESSION_LINE_TIMEOUT = 5.0
+_MAX_HANDOFF = 2 * _MAX_SESSION_LINE
+
+# How long the parent's loop waits for a connection before it checks the
+# session line deadlines and the workers again.
+
+_SELECT_TIMEOUT = 0.5
+
+_GAME_OVER_GSMS = (HaveQuitTheGameGSM, CharacterDeathGSM, WonTheGameGSM)
+
+
+def _send_reply(connection, reply):
+    # Sends a short reply to a connection the parent is about to close;
+    # it's best effort, since the client may already be gone.
+    try:
+        connection.send(reply)
+    except OSError:
+        pass
+
+
+class HashRing:
+    """
+    A consistent hash ring. Each node is placed on the ring at a number of
+    pseudo-random points, and a key belongs to the node at the first point
+    at or after the key's own hash. Adding or removing a node only moves
+    the keys that fall next to that node's points.
+    """
+
+    __slots__ = "_points", "_nodes"
+
+    def __init__(self, nodes, replicas=64):
+        """
+        This __init__ method places each of the given nodes on the ring.
+
+        :nodes: An iterable of hashable, str()-able node identifiers.
+        :replicas: An int, the number of points per node.
+        """
+        ring = sorted(
+            (self._hash(f"{node}#{replica}"), node)
+            for node in nodes
+            for replica in range(replicas)
+        )
+        if not ring:
+            raise InternalError("a HashRing needs at least one node")
+        self._points = [point for point, _ in ring]
+        self._nodes = [node for _, node in ring]
+
+    @staticmethod
+    def _hash(key):
+        # blake2b is used instead of hash() since str hashes are salted
+        # per process and the ring must agree across processes.
+        return int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest())
+
+    def node_for(self, key):
+        """
+        This method returns the node the given key belongs to.
+
+        :key: A string.
+        :return: A node identifier.
+        """
+        index = bisect(self._points, self._hash(key)) % len(self._points)
+        return self._nodes[index]
+
+
+class _SessionWorker:
+    # The loop run by each forked worker. It receives connections from
+    # the parent over its channel, and multiplexes every session's
+    # connection with a selector. Each session's CommandProcessor is
+    # created from the inherited template the first time it's seen.
+    #
+    # The connections are non-blocking. Replies are queued in a buffer per
+    # connection and sent as the connection accepts them; while a reply is
+    # waiting to be sent, the connection isn't read from, so a client that
+    # stops reading only holds up its own session. An error on one
+    # connection drops that connection, not the worker.
+
+    __slots__ = (
+        "_template",
+        "_channel",
+        "_selector",
+        "_processors",
+        "_buffers",
+        "_widths",
+        "_outgoing",
+        "_closing",
+        "_structured",
+        "_save_dir",
+    )
+
+    def __init__(self, world_template, channel, structured, save_dir=None):
+        self._template = world_template
+        self._structured = structured
+        self._save_dir = save_dir
+        self._channel = channel
+        self._selector = selectors.DefaultSelector()
+        self._processors = dict()
+        self._buffers = dict()
+        self._widths = dict()
+        self._outgoing = dict()
+        self._closing = set()
+
+    def run(self):
+        self._selector.register(self._channel, selectors.EVENT_READ, None)
+        while True:
+            for key, events in self._selector.select():
+                if key.data is None:
+                    if not self._accept_handoff():
+                        return
+                    continue
+                connection = key.fileobj
+                if connection.fileno() not in self._buffers:
+                    continue
+                try:
+                    if events & selectors.EVENT_WRITE:
+                        self._send_pending(connection, key.data)
+                    else:
+                        self._serve(connection, key.data)
+                except Exception:
+                    traceback.print_exc()
+                    if connection.fileno() in self._buffers:
+                        self._drop(connection)
+
+    def _accept_handoff(self):
+        # Returns False once the parent has closed the channel. The message
+        # is the session name, a newline, and whatever the client sent
+        # after its session line.
+        message, fds, _, _ = socket.recv_fds(self._channel, _MAX_HANDOFF, 1)
+        if not message:
+            return False
+        if not fds:
+            return True
+        connection = socket.socket(fileno=fds[0])
+        connection.setblocking(False)
+        session, _, data = message.partition(b"\n")
+        session = session.decode("utf-8")
+        self._buffers[connection.fileno()] = b""
+        self._widths[connection.fileno()] = None
+        self._outgoing[connection.fileno()] = bytearray()
+        self._selector.register(connection, selectors.EVENT_READ, session)
+        try:
+            if session not in self._processors:
+                self._processors[session] = self._new_processor(session)
+            if data:
+                self._handle_data(connection, session, data)
+        except Exception:
+            traceback.print_exc()
+            if connection.fileno() in self._buffers:
+                self._drop(connection)
+        return True
+
+    def _new_processor(self, session):
+        # Creates a session's CommandProcessor, loading its saved game if
+        # it has one. A save file that can't be read is left in place and
+        # the session starts a new game; its next save overwrites it.
+        game_state = self._template.new_game_state()
+        if self._save_dir is None:
+            return CommandProcessor(game_state)
+        session_hash = blake2b(session.encode("utf-8"), digest_size=16).hexdigest()
+        save_file = SaveFile(os.path.join(self._save_dir, f"{session_hash}.sav"))
+        if save_file.exists():
+            try:
+                save_file.load(game_state)
+            except SaveFileError:
+                game_state = self._template.new_game_state()
+                save_file = SaveFile(save_file.path)
+        return CommandProcessor(game_state, save_file=save_file)
+
+    def _serve(self, connection, session):
+        try:
+            data = connection.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            # The session's game is saved when its connection closes, so
+            # the player can reconnect to it later.
+            command_processor = self._processors.get(session)
+            if (
+                command_processor is not None
+                and command_processor.save_file is not None
+                and command_processor.game_state.game_has_begun
+            ):
+                # A save that fails, on a full disk say, is reported on
+                # stderr; the connection is closed either way.
+                try:
+                    command_processor.save_file.save(command_processor.game_state)
+                except OSError:
+                    traceback.print_exc()
+            self._drop(connection)
+            return
+        self._handle_data(connection, session, data)
+
+    def _handle_data(self, connection, session, data):
+        # Handles the complete lines received on a connection and queues
+        # the replies to them.
+        buffer = self._buffers[connection.fileno()] + data
+        *lines, self._buffers[connection.fileno()] = buffer.split(b"\n")
+
+        # The JSON replies are lines of their own, so the writer doesn't
+        # wrap them; they're all sent together once every line is handled.
+
+        output_writer = OutputWriter(connection, width=None)
+        for line in lines:
+            command = line.decode("utf-8", "replace").strip()
+            if not command:
+                continue
+            if command.upper().startswith("WIDTH"):
+                output_writer.add(json.dumps(self._set_width(connection, command)))
+                continue
+
+            # A command that raises an exception is reported to the client
+            # and on stderr; the session carries on with the next one.
+
+            try:
+                result = self._processors[session].process(command)
+            except Exception as exception:
+                traceback.print_exc()
+                output_writer.add(
+                    json.dumps(
+                        {
+                            "error": "the command failed with "
+                            + f"{type(exception).__name__}: {exception}"
+                        }
+                    )
+                )
+                continue
+            game_over = isinstance(result[-1], _GAME_OVER_GSMS)
+            if self._structured:
+                reply = {
+                    "results": [
+                        game_state_message.to_dict() for game_state_message in result
+                    ],
+                    "game_over": game_over,
+                }
+            else:
+                width = self._widths[connection.fileno()]
+                reply = {
+                    "messages": [
+                        game_state_message.message
+                        if width is None
+                        else textwrapper(game_state_message.message, width)
+                        for game_state_message in result
+                    ],
+                    "game_over": game_over,
+                }
+            output_writer.add(json.dumps(reply))
+
+            # A finished game is discarded, so reconnecting with the same
+            # session name starts a new one, or resumes its last save. The
+            # connection is closed once the last reply has been sent.
+
+            if game_over:
+                del self._processors[session]
+                self._closing.add(connection.fileno())
+                break
+        self._outgoing[connection.fileno()] += output_writer.getvalue().encode("utf-8")
+        self._send_pending(connection, session)
+
+    def _send_pending(self, connection, session):
+        # Sends as much of the connection's queued replies as it accepts.
+        # The connection is watched for writing while any are left, and for
+        # reading once they're all sent.
+        outgoing = self._outgoing[connection.fileno()]
+        if outgoing:
+            try:
+                del outgoing[: connection.send(outgoing)]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._drop(connection)
+                return
+        if outgoing:
+            events = selectors.EVENT_WRITE
+        elif connection.fileno() in self._closing:
+            self._drop(connection)
+            return
+        else:
+            events = selectors.EVENT_READ
+        if self._selector.get_key(connection).events != events:
+            self._selector.modify(connection, events, session)
+
+    def _set_width(self, connection, command):
+        # Handles a 'WIDTH <columns>' line and returns the reply to it.
+        _, _, columns = command.partition(" ")
+        columns = columns.strip()
+        if not columns.isdigit() or int(columns) < 20:
+            return {"error": "expected WIDTH <columns>, with columns at least 20"}
+        self._widths[connection.fileno()] = int(columns)
+        return {"width": int(columns)}
+
+    def _drop(self, connection):
+        self._selector.unregister(connection)
+        del self._buffers[connection.fileno()]
+        del self._widths[connection.fileno()]
+        del self._outgoing[connection.fileno()]
+        self._closing.discard(connection.fileno())
+        connection.close()
+
+
+class PreforkHost:
+    """
+    This class implements the parent process of the pre-forking server.
+    start() forks the workers and binds the listening socket; serve_forever()
+    accepts connections and hands each to the worker its session hashes to;
+    stop() shuts the workers down.
+    """
+
+    __slots__ = (
+        "_template",
+        "_worker_count",
+        "_bind_address",
+        "_listener",
+        "_channels",
+        "_pids",
+        "_ring",
+        "_running",
+        "_selector",
+        "_pending",
+        "_workers_lock",
+        "_structured",
+        "_save_dir",
+    )
+
+    def __init__(
+        self,
+        world_template,
+        worker_count=None,
+        host="127.0.0.1",
+        port=0,
+        structured=False,
+        save_dir=None,
+    ):
+        """
+        This __init__ method stores its arguments; nothing is forked or bound
+        until start() is called.
+
+        :world_template: A WorldTemplate object.
+        :worker_count: An int, the number of workers; defaults to the number
+        of CPUs.
+        :host: A string, the address to listen on.
+        :port: An int, the port to listen on; 0 picks a free port.
+        :structured: A boolean, True if replies should carry each result's
+        structured form instead of its message text.
+        :save_dir: A string, the directory to keep each session's save file
+        in, or None if games can't be saved.
+        """
+        self._template = world_template
+        self._worker_count = worker_count or os.cpu_count() or 1
+        self._bind_address = (host, port)
+        self._listener = None
+        self._channels = dict()
+        self._pids = dict()
+        self._ring = None
+        self._running = False
+        self._selector = None
+        self._pending = dict()
+        self._workers_lock = threading.Lock()
+        self._structured = structured
+        self._save_dir = save_dir
+
+    @property
+    def address(self):
+        """
+        This property returns the address the host is listening on.
+
+        :return: A tuple of a host string and a port int.
+        """
+        return self._listener.getsockname()
+
+    @property
+    def worker_pids(self):
+        """
+        This property returns the process IDs of the workers, once start()
+        has forked them.
+
+        :return: A tuple of ints.
+        """
+        return tuple(self._pids.values())
+
+    def start(self):
+        """
+        This method binds the listening socket and forks the workers.
+
+        Before forking, the heap is collected and then frozen with
+        gc.freeze(): every object that exists at that point, the world
+        template included, is moved to a permanent generation the collector
+        never scans, so garbage collection in the workers doesn't write to
+        those objects' pages and they stay shared with the parent.
+
+        :return: None.
+        """
+        self._listener = socket.create_server(self._bind_address)
+        self._listener.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+        gc.collect()
+        gc.freeze()
+        for worker_index in range(self._worker_count):
+            self._fork_worker(worker_index)
+        gc.unfreeze()
+        self._ring = HashRing(self._channels)
+        self._running = True
+
+    def _fork_worker(self, worker_index):
+        # Forks the worker at the given index, replacing the one that was
+        # there if there was one. The ring is built from the indexes, so a
+        # replacement worker is given the same sessions. The channels are
+        # SOCK_SEQPACKET so each handoff arrives as a message of its own.
+        parent_end, worker_end = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET
+        )
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(worker_end, parent_end)
+        worker_end.close()
+        if worker_index in self._channels:
+            self._channels[worker_index].close()
+        self._channels[worker_index] = parent_end
+        self._pids[worker_index] = pid
+
+    def _run_worker(self, worker_end, parent_end):
+        # Runs in the forked child. The parent's sockets are closed so
+        # only the parent holds the listener, each channel's parent end and
+        # the connections it hasn't handed off yet; os._exit() skips the
+        # parent's atexit handlers.
+        exit_status = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            self._selector.close()
+            self._listener.close()
+            parent_end.close()
+            for channel in self._channels.values():
+                channel.close()
+            for connection in self._pending:
+                connection.close()
+            _SessionWorker(
+                self._template, worker_end, self._structured, self._save_dir
+            ).run()
+        except BaseException:
+            traceback.print_exc()
+            exit_status = 1
+        finally:
+            os._exit(exit_status)
+
+    def _respawn_workers(self):
+        # Reaps any worker that has exited and forks its replacement. The
+        # sessions that worker held are lost, apart from what was saved,
+        # but new connections to them are served by the replacement.
+        with self._workers_lock:
+            if not self._running:
+                return
+            for worker_index, pid in tuple(self._pids.items()):
+                try:
+                    exited_pid, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    exited_pid = pid
+                if exited_pid:
+                    gc.freeze()
+                    self._fork_worker(worker_index)
+                    gc.unfreeze()
+
+    def worker_for(self, session):
+        """
+        This method returns the index of the worker the given session is
+        assigned to.
+
+        :session: A string, the session name.
+        :return: An int.
+        """
+        return self._ring.node_for(session)
+
+    def handle_connection(self, connection):
+        """
+        This method starts reading the session line from a new connection.
+        The connection is made non-blocking and watched by serve_forever(),
+        which reads the line as it arrives and passes the connection to the
+        session's worker; a connection that hasn't sent a valid session line
+        within the time limit is closed.
+
+        :connection: A socket object.
+        :return: None.
+        """
+        connection.setblocking(False)
+        self._pending[connection] = [b"", time.monotonic() + _SESSION_LINE_TIMEOUT]
+        self._selector.register(connection, selectors.EVENT_READ, connection)
+
+    def _read_session_line(self, connection):
+        # Reads what has arrived of a pending connection's session line,
+        # and hands the connection off once the line is complete. Whatever
+        # was sent after the line goes to the worker along with it.
+        try:
+            data = connection.recv(_MAX_SESSION_LINE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close_pending(connection)
+            return
+        buffer = self._pending[connection][0] + data
+        line, newline, rest = buffer.partition(b"\n")
+        if not newline and len(buffer) < _MAX_SESSION_LINE:
+            self._pending[connection][0] = buffer
+            return
+        keyword, _, session = line.decode("utf-8", "replace").strip().partition(" ")
+        session = session.strip()
+        if (
+            not newline
+            or len(line) >= _MAX_SESSION_LINE
+            or keyword.upper() != "SESSION"
+            or not session
+        ):
+            self._close_pending(connection, b'{"error": "expected SESSION <name>"}\n')
+            return
+        self._selector.unregister(connection)
+        del self._pending[connection]
+        try:
+            self._hand_off(connection, session, rest)
+        finally:
+            connection.close()
+
+    def _hand_off(self, connection, session, data):
+        # Passes the connection to the session's worker. If the worker is
+        # gone, it's replaced and the handoff tried once more; if that
+        # fails too, the failure is reported on stderr and to the client.
+        message = session.encode("utf-8") + b"\n" + data
+        for attempt in range(2):
+            channel = self._channels[self.worker_for(session)]
+            try:
+                socket.send_fds(channel, [message], [connection.fileno()])
+                return
+            except OSError:
+                if attempt:
+                    traceback.print_exc()
+                self._respawn_workers()
+        _send_reply(connection, b'{"error": "the session could not be started"}\n')
+
+    def _close_pending(self, connection, reply=None):
+        self._selector.unregister(connection)
+        del self._pending[connection]
+        if reply is not None:
+            _send_reply(connection, reply)
+        connection.close()
+
+    def serve_forever(self):
+        """
+        This method accepts connections until stop() is called. New
+        connections, their session lines, and the workers' exits are all
+        watched from this one loop, so a slow client only delays itself.
+
+        :return: None.
+        """
+        try:
+            while self._running:
+                for key, _ in self._selector.select(_SELECT_TIMEOUT):
+                    if key.data is not None:
+                        self._read_session_line(key.data)
+                        continue
+                    try:
+                        connection, _ = self._listener.accept()
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        return
+                    self.handle_connection(connection)
+                now = time.monotonic()
+                for connection, (_, deadline) in tuple(self._pending.items()):
+                    if deadline <= now:
+                        self._close_pending(
+                            connection, b'{"error": "expected SESSION <name>"}\n'
+                        )
+                self._respawn_workers()
+        finally:
+            for connection in tuple(self._pending):
+                self._close_pending(connection)
+
+    def stop(self):
+        """
+        This method stops accepting connections, closes the workers'
+        channels so they exit, and waits for them.
+
+        :return: None.
+        """
+        with self._workers_lock:
+            self._running = False
+            if self._listener is not None:
+                try:
+                    self._listener.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                self._listener.close()
+            for channel in self._channels.values():
+                channel.close()
+            for pid in self._pids.values():
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass
+            self._channels.clear()
+            self._pids.clear()
@@ -0,0 +1,964 @@
+#!/usr/bin/python3
+
+"""
+The advgame.loadgen module implements a load generator that simulates many
+players playing at once, to size the hardware a host needs and to catch
+performance regressions before they're deployed. Each simulated player
+sets a name and class, begins the game, and then either plays a script of
+commands or takes a random walk through the dungeon: leaving by doors,
+taking and picking up items, and attacking creatures. The walk is drawn
+from what's in the player's current room, as its game state shows in
+process, or as a host's structured replies describe it. A player whose game
+ends starts a new one.
+
+The players are driven either against CommandProcessors in this process,
+interleaved one command at a time, or against a PreforkHost over
+localhost connections, multiplexed with a selector; each player has one
+command outstanding at a time. The run is divided into windows of time,
+and for each window the generator records the commands played, their
+latency percentiles, the errors seen, and the resident memory of the
+process or processes being measured. The LoadReport it returns can be
+dumped to JSON and compared with a report from another build.
+"""
+
+import json
+import os
+import selectors
+import socket
+import time
+
+from collections import Counter, deque
+from random import Random
+
+from advgame.elements.containers import Chest, Corpse
+from advgame.process import CommandProcessor
+from advgame.solver import SeededDice
+from advgame.statemsgs.be_atkd import CharacterDeathGSM
+from advgame.statemsgs.leave import WonTheGameGSM
+from advgame.statemsgs.quit import HaveQuitTheGameGSM
+from advgame.utils import set_dice_roller
+from advgame.world import WorldTemplate
+
+
+__all__ = (
+    "LoadGenerator",
+    "LoadReport",
+    "LoadWindow",
+    "SimulatedPlayer",
+)
+
+
+_CHARACTER_CLASSES = ("Warrior", "Thief", "Mage", "Priest")
+
+_CHARACTER_NAMES = ("Niath", "Lidda", "Regdar", "Mialee", "Jozan", "Ember")
+
+_GAME_OVER_GSMS = (HaveQuitTheGameGSM, CharacterDeathGSM, WonTheGameGSM)
+
+_PERCENTILES = (50, 90, 99)
+
+
+def _percentiles(latencies):
+    # Nearest-rank percentiles, and the maximum, of a list of latencies in
+    # seconds, as milliseconds.
+    if not latencies:
+        return dict.fromkeys(
+            [f"p{percentile}" for percentile in _PERCENTILES] + ["max"]
+        )
+    latencies = sorted(latencies)
+    summary = {
+        f"p{percentile}": latencies[-(-len(latencies) * percentile // 100) - 1] * 1000
+        for percentile in _PERCENTILES
+    }
+    summary["max"] = latencies[-1] * 1000
+    return summary
+
+
+def _resident_bytes(pids):
+    # The total resident memory of the given processes, read from /proc, or
+    # None where it can't be read.
+    total = 0
+    try:
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        for pid in pids:
+            with open(f"/proc/{pid}/statm") as statm_file:
+                total += int(statm_file.read().split()[1]) * page_size
+    except (OSError, ValueError, IndexError):
+        return None
+    return total
+
+
+def _world_vocabulary(game_state):
+    # The titles a random walk draws its commands from.
+    return {
+        "doors": sorted(
+            {
+                door.title
+                for room in game_state.rooms_state.values()
+                for door in room.doors
+            }
+        ),
+        "items": sorted({item.title for item in game_state.items_state.values()}),
+        "containers": sorted(
+            {container.title for container in game_state.containers_state.values()}
+        ),
+        "creatures": sorted(
+            {creature.title for creature in game_state.creatures_state.values()}
+        ),
+    }
+
+
+def _door_title(compass_dir, door_type):
+    # The title a room gives the door in the given direction.
+    return f"{compass_dir} doorway" if door_type == "doorway" else f"{compass_dir} door"
+
+
+class _RoomView:
+    # What a simulated player knows of its current room: its doors'
+    # titles, the creature and the container in it, the container's
+    # contents if they've been seen, and the items on the floor. Contents
+    # and items are dicts of titles to quantities.
+
+    __slots__ = "doors", "creature", "container", "contents", "items"
+
+    def __init__(self, doors, creature, container, contents, items):
+        self.doors = doors
+        self.creature = creature
+        self.container = container
+        self.contents = contents
+        self.items = items
+
+    @classmethod
+    def from_game_state(cls, game_state):
+        # The contents of a chest are known once it's open, and those of
+        # a corpse always.
+        room = game_state.rooms_state.cursor
+        container = room.container_here
+        contents = None
+        if isinstance(container, Corpse) or (
+            isinstance(container, Chest) and not container.is_closed
+        ):
+            contents = {item.title: item_qty for item_qty, item in container.values()}
+        return cls(
+            [door.title for door in room.doors],
+            None if room.creature_here is None else room.creature_here.title,
+            None if container is None else container.title,
+            contents,
+            {
+                item.title: item_qty
+                for item_qty, item in (
+                    () if room.items_here is None else room.items_here.values()
+                )
+            },
+        )
+
+    @classmethod
+    def from_entered_room(cls, fields):
+        # Built from the structured form of an EnteredRoomGSM.
+        return cls(
+            [
+                _door_title(compass_dir, door_type)
+                for compass_dir, door_type in fields["doors"].items()
+            ],
+            fields["creature_title"],
+            fields["container_title"],
+            None,
+            {item_title: item_qty for item_qty, item_title in fields["items_here"]},
+        )
+
+    def observe(self, fields):
+        # Updates the view from the structured form of a result that
+        # changes the room.
+        message_type = fields["type"]
+        if message_type == "various.FoeDeathGSM":
+            self.creature = None
+            self.container = f"{fields['creature_title']} corpse"
+            self.contents = None
+        elif message_type == "lookat.FoundContainerHereGSM":
+            if fields["contents"] is not None:
+                self.contents = {
+                    item_title: item_qty for item_qty, item_title in fields["contents"]
+                }
+        elif message_type == "pickup.ItemPickedUpGSM":
+            _take_from(self.items, fields["item_title"], fields["pick_up_amount"])
+        elif message_type == "take.ItemOrItemsTakenGSM" and self.contents:
+            _take_from(self.contents, fields["item_title"], fields["amount_taken"])
+
+
+def _take_from(titles, item_title, amount):
+    # Takes an amount of the titled item out of a dict of titles to
+    # quantities.
+    item_qty = titles.get(item_title, 0) - amount
+    if item_qty > 0:
+        titles[item_title] = item_qty
+    else:
+        titles.pop(item_title, None)
+
+
+class SimulatedPlayer:
+    """
+    A simulated player. It hands out the commands the player enters, one at
+    a time: the commands that set up a character and begin the game, then
+    either a script or a random walk. The walk is drawn from what the player
+    has observed of its current room, with observe_game_state() or
+    observe_results(); a player that observes nothing, such as one playing
+    against a host that doesn't send structured replies, draws on the titles
+    in the whole world instead. Either way the choices come from the
+    player's own random.Random object, so the same seed and the same replies
+    enter the same commands.
+    """
+
+    __slots__ = (
+        "name",
+        "character_class",
+        "commands_left",
+        "games_played",
+        "_rng",
+        "_vocabulary",
+        "_script",
+        "_pending",
+        "_room",
+    )
+
+    def __init__(self, name, rng, vocabulary, commands, script=None):
+        """
+        This __init__ method stores its arguments and queues the commands that
+        begin the player's first game.
+
+        :name: A string, the player's session name.
+        :rng: A random.Random object.
+        :vocabulary: A dict of the world's door, item, container and creature
+        titles, as lists.
+        :commands: An int, the number of commands the player enters in all.
+        :script: A sequence of command strings to play after beginning each
+        game, or None to take a random walk.
+        """
+        self.name = name
+        self.commands_left = commands
+        self.games_played = 0
+        self._rng = rng
+        self._vocabulary = vocabulary
+        self._script = None if script is None else tuple(script)
+        self.character_class = rng.choice(_CHARACTER_CLASSES)
+        self._pending = deque()
+        self._room = None
+        self.new_game()
+
+    def new_game(self):
+        """
+        This method queues the commands that set up a character and begin a
+        new game, followed by the script if there is one.
+
+        :return: None.
+        """
+        self.games_played += 1
+        self._room = None
+        self._pending.clear()
+        self._pending.extend(
+            (
+                f"set name to {self._rng.choice(_CHARACTER_NAMES)}",
+                f"set class to {self.character_class}",
+                "begin game",
+            )
+        )
+        if self._script is not None:
+            self._pending.extend(self._script)
+
+    def next_command(self):
+        """
+        This method returns the next command the player enters, or None if
+        the player is done: it has entered all its commands, or come to the
+        end of its script.
+
+        :return: A string or None.
+        """
+        if self.commands_left <= 0:
+            return None
+        if self._pending:
+            command = self._pending.popleft()
+        elif self._script is not None:
+            return None
+        else:
+            command = self._walk()
+        self.commands_left -= 1
+        return command
+
+    def observe_game_state(self, game_state):
+        """
+        This method records the player's current room as its GameState object
+        shows it, for the walk to draw on.
+
+        :game_state: A GameState object.
+        :return: None.
+        """
+        if game_state.game_has_begun:
+            self._room = _RoomView.from_game_state(game_state)
+
+    def observe_results(self, results):
+        """
+        This method updates what the player knows of its current room from
+        the structured form of the results of its last command, as a host
+        started with structured=True replies with them.
+
+        :results: A list of dicts, each as returned by a GameStateMessage
+        object's to_dict() method.
+        :return: None.
+        """
+        for fields in results:
+            if fields["type"] == "various.EnteredRoomGSM":
+                self._room = _RoomView.from_entered_room(fields)
+            elif self._room is not None:
+                self._room.observe(fields)
+
+    def _walk(self):
+        rng = self._rng
+        room = self._room
+        if room is None:
+            return self._walk_world()
+        roll = rng.random()
+        if roll < 0.35 and room.doors:
+            return f"leave via {rng.choice(room.doors)}"
+        elif roll < 0.55 and room.creature:
+            return f"attack {room.creature}"
+        elif roll < 0.7 and room.container and room.contents is None:
+            # A corpse can't be opened; its contents are seen by looking.
+            if room.container.endswith(" corpse"):
+                return f"look at {room.container}"
+            return rng.choice((f"open {room.container}", f"look at {room.container}"))
+        elif roll < 0.7 and room.contents:
+            item_title = rng.choice(sorted(room.contents))
+            return (
+                f"take {room.contents[item_title]} {item_title} "
+                + f"from {room.container}"
+            )
+        elif roll < 0.85 and room.items:
+            item_title = rng.choice(sorted(room.items))
+            return f"pick up {room.items[item_title]} {item_title}"
+        return rng.choice(("inventory", "status"))
+
+    def _walk_world(self):
+        rng = self._rng
+        vocabulary = self._vocabulary
+        roll = rng.random()
+        if roll < 0.35 and vocabulary["doors"]:
+            return f"leave via {rng.choice(vocabulary['doors'])}"
+        elif roll < 0.55 and vocabulary["creatures"]:
+            return f"attack {rng.choice(vocabulary['creatures'])}"
+        elif roll < 0.7 and vocabulary["items"] and vocabulary["containers"]:
+            return (
+                f"take {rng.choice(vocabulary['items'])} "
+                + f"from {rng.choice(vocabulary['containers'])}"
+            )
+        elif roll < 0.85 and vocabulary["items"]:
+            return f"pick up {rng.choice(vocabulary['items'])}"
+        return rng.choice(("inventory", "status"))
+
+
+class LoadWindow:
+    """
+    The measurements of one window of time in a load run.
+    """
+
+    __slots__ = "start", "commands", "errors", "latency", "resident_bytes"
+
+    def __init__(self, start, commands, errors, latency, resident_bytes):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :start: A float, the seconds from the start of the run to the start
+        of the window.
+        :commands: An int, the number of replies received in the window.
+        :errors: An int, the number of errors seen in the window.
+        :latency: A dict of the p50, p90, p99 and max latencies of the
+        window's commands, in milliseconds.
+        :resident_bytes: An int, the resident memory measured at the end of
+        the window, or None if it couldn't be measured.
+        """
+        self.start = start
+        self.commands = commands
+        self.errors = errors
+        self.latency = latency
+        self.resident_bytes = resident_bytes
+
+    def to_dict(self):
+        """
+        This method returns the window as a dict that can be serialized to
+        JSON.
+
+        :return: A dict.
+        """
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+
+class LoadReport:
+    """
+    The result of a LoadGenerator.run() call: the settings it ran with, the
+    totals and latency percentiles of the whole run, and its windows.
+    """
+
+    __slots__ = (
+        "target",
+        "settings",
+        "seconds",
+        "commands",
+        "errors",
+        "games_ended",
+        "latency",
+        "starting_resident_bytes",
+        "windows",
+    )
+
+    def __init__(
+        self,
+        target,
+        settings,
+        seconds,
+        commands,
+        errors,
+        games_ended,
+        latency,
+        starting_resident_bytes,
+        windows,
+    ):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :target: A string, 'in-process' or the 'host:port' address played
+        against.
+        :settings: A dict of the settings the run was made with.
+        :seconds: A float, the wall-clock time the run took.
+        :commands: An int, the number of replies received.
+        :errors: A dict mapping each kind of error to the number seen.
+        :games_ended: An int, the number of games that ended in a win, a
+        death or a quit.
+        :latency: A dict of the p50, p90, p99 and max latencies of every
+        command, in milliseconds.
+        :starting_resident_bytes: An int, the resident memory measured at
+        the start of the run, or None if it couldn't be measured.
+        :windows: A tuple of LoadWindow objects.
+        """
+        self.target = target
+        self.settings = settings
+        self.seconds = seconds
+        self.commands = commands
+        self.errors = errors
+        self.games_ended = games_ended
+        self.latency = latency
+        self.starting_resident_bytes = starting_resident_bytes
+        self.windows = windows
+
+    @property
+    def throughput(self):
+        """
+        This property returns the number of replies received per second.
+
+        :return: A float.
+        """
+        return self.commands / self.seconds if self.seconds else 0.0
+
+    @property
+    def error_rate(self):
+        """
+        This property returns the number of errors per command sent.
+
+        :return: A float.
+        """
+        sent = self.commands + sum(self.errors.values())
+        return sum(self.errors.values()) / sent if sent else 0.0
+
+    @property
+    def memory_growth(self):
+        """
+        This property returns the growth in resident memory from the start of
+        the run to the end of its last window.
+
+        :return: An int, or None if memory couldn't be measured.
+        """
+        if (
+            not self.windows
+            or self.starting_resident_bytes is None
+            or self.windows[-1].resident_bytes is None
+        ):
+            return None
+        return self.windows[-1].resident_bytes - self.starting_resident_bytes
+
+    def to_dict(self):
+        """
+        This method returns the report as a dict that can be serialized to
+        JSON.
+
+        :return: A dict.
+        """
+        report = {
+            attribute: getattr(self, attribute)
+            for attribute in self.__slots__
+            if attribute != "windows"
+        }
+        report["windows"] = [window.to_dict() for window in self.windows]
+        return report
+
+    @classmethod
+    def from_dict(cls, report):
+        """
+        This classmethod builds a report from a dict returned by to_dict().
+
+        :report: A dict.
+        :return: A LoadReport object.
+        """
+        return cls(
+            report["target"],
+            report["settings"],
+            report["seconds"],
+            report["commands"],
+            report["errors"],
+            report["games_ended"],
+            report["latency"],
+            report["starting_resident_bytes"],
+            tuple(LoadWindow(**window) for window in report["windows"]),
+        )
+
+    def dump(self, path):
+        """
+        This method writes the report to a JSON file.
+
+        :path: A string, the path of the file.
+        :return: None.
+        """
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(self.to_dict(), report_file, indent=2)
+            report_file.write("\n")
+
+    @classmethod
+    def load(cls, path):
+        """
+        This classmethod reads a report from a JSON file written by dump().
+
+        :path: A string, the path of the file.
+        :return: A LoadReport object.
+        """
+        with open(path, "r", encoding="utf-8") as report_file:
+            return cls.from_dict(json.load(report_file))
+
+    def summary(self):
+        """
+        This method returns a summary of the run, a line for the totals and a
+        line for the latencies.
+
+        :return: A string.
+        """
+        memory_growth = self.memory_growth
+        return (
+            f"{self.settings['players']} players against {self.target}: "
+            + f"{self.commands} commands in {self.seconds:.2f}s, "
+            + f"{self.throughput:.0f} commands/s; "
+            + f"{sum(self.errors.values())} errors ({self.error_rate:.2%}); "
+            + f"{self.games_ended} games ended.\n"
+            + "Latency "
+            + ", ".join(
+                f"{name} {value:.2f}ms"
+                for name, value in self.latency.items()
+                if value is not None
+            )
+            + (
+                ""
+                if memory_growth is None
+                else f"; memory grew {memory_growth / 2**20:.1f} MiB."
+            )
+        )
+
+    def compare(self, baseline, tolerance=0.1):
+        """
+        This method compares the report with one from another build, run with
+        the same settings, and describes each way this run did worse: lower
+        throughput, higher latency percentiles or memory growth, each by more
+        than the given fraction, or a higher error rate.
+
+        :baseline: A LoadReport object.
+        :tolerance: A float, the fraction a measure may worsen by.
+        :return: A list of strings, empty if nothing regressed.
+        """
+        regressions = list()
+        if self.settings != baseline.settings:
+            regressions.append("the runs were made with different settings")
+        if self.throughput < baseline.throughput * (1 - tolerance):
+            regressions.append(
+                f"throughput fell from {baseline.throughput:.0f} to "
+                + f"{self.throughput:.0f} commands/s"
+            )
+        for name, value in self.latency.items():
+            baseline_value = baseline.latency.get(name)
+            if (
+                value is not None
+                and baseline_value is not None
+                and value > baseline_value * (1 + tolerance)
+            ):
+                regressions.append(
+                    f"{name} latency rose from {baseline_value:.2f} to {value:.2f}ms"
+                )
+        if self.error_rate > baseline.error_rate:
+            regressions.append(
+                f"error rate rose from {baseline.error_rate:.2%} to "
+                + f"{self.error_rate:.2%}"
+            )
+        memory_growth = self.memory_growth
+        baseline_growth = baseline.memory_growth
+        if (
+            memory_growth is not None
+            and baseline_growth is not None
+            and memory_growth > max(baseline_growth, 0) * (1 + tolerance)
+            and memory_growth > 2**20
+        ):
+            regressions.append(
+                f"memory growth rose from {baseline_growth / 2**20:.1f} to "
+                + f"{memory_growth / 2**20:.1f} MiB"
+            )
+        return regressions
+
+
+class _Recorder:
+    # Accumulates latencies and errors for the whole run and for the
+    # current window, and closes each window once its time is up.
+
+    __slots__ = (
+        "_window_seconds",
+        "_pids",
+        "_start_time",
+        "_window_start",
+        "_window_latencies",
+        "_window_errors",
+        "latencies",
+        "errors",
+        "games_ended",
+        "starting_resident_bytes",
+        "windows",
+    )
+
+    def __init__(self, window_seconds, pids):
+        self._window_seconds = window_seconds
+        self._pids = pids
+        self.starting_resident_bytes = self._resident_bytes()
+        self._start_time = self._window_start = time.perf_counter()
+        self._window_latencies = list()
+        self._window_errors = 0
+        self.latencies = list()
+        self.errors = Counter()
+        self.games_ended = 0
+        self.windows = list()
+
+    def reply(self, latency):
+        self.latencies.append(latency)
+        self._window_latencies.append(latency)
+
+    def error(self, kind):
+        self.errors[kind] += 1
+        self._window_errors += 1
+
+    def tick(self):
+        if time.perf_counter() - self._window_start >= self._window_seconds:
+            self._close_window()
+
+    def finish(self):
+        # Returns the run's elapsed time, after closing the last window.
+        self._close_window()
+        return time.perf_counter() - self._start_time
+
+    def _resident_bytes(self):
+        return None if self._pids is None else _resident_bytes(self._pids)
+
+    def _close_window(self):
+        self.windows.append(
+            LoadWindow(
+                self._window_start - self._start_time,
+                len(self._window_latencies),
+                self._window_errors,
+                _percentiles(self._window_latencies),
+                self._resident_bytes(),
+            )
+        )
+        self._window_start = time.perf_counter()
+        self._window_latencies = list()
+        self._window_errors = 0
+
+
+class _Connection:
+    # A simulated player's connection to a host, with the replies read
+    # from it so far and the time its outstanding command was sent.
+
+    __slots__ = "player", "sock", "buffer", "sent_at"
+
+    def __init__(self, player, sock):
+        self.player = player
+        self.sock = sock
+        self.buffer = b""
+        self.sent_at = None
+
+
+class LoadGenerator:
+    """
+    A load generator for the game. run() plays the simulated players to
+    the end of their commands, against CommandProcessors in this process or
+    against a host at an address, and returns a LoadReport.
+    """
+
+    __slots__ = (
+        "world_template",
+        "players",
+        "commands_per_player",
+        "seed",
+        "address",
+        "script",
+        "window",
+        "timeout",
+        "memory_pids",
+    )
+
+    def __init__(
+        self,
+        world_template=None,
+        players=100,
+        commands_per_player=50,
+        seed=0,
+        address=None,
+        script=None,
+        window=1.0,
+        timeout=10.0,
+        memory_pids=None,
+    ):
+        """
+        This __init__ method stores its arguments; nothing is played until
+        run() is called.
+
+        :world_template: A WorldTemplate object, which in-process runs play
+        on, and whose titles a walk draws on when it can't observe the room
+        it's in; defaults to one built from the game's own dungeon.
+        :players: An int, the number of simulated players.
+        :commands_per_player: An int, the number of commands each player
+        enters.
+        :seed: An int, the seed of the players' walks, and of the dice in an
+        in-process run.
+        :address: A (host, port) tuple of a host to play against, or None to
+        play in this process.
+        :script: A sequence of command strings for every player to play after
+        beginning the game, or None to take random walks.
+        :window: A float, the length in seconds of each window.
+        :timeout: A float, the seconds to wait for a reply before counting
+        it as an error.
+        :memory_pids: An iterable of the process IDs whose memory is
+        measured; defaults to this process for an in-process run, and to
+        none for a run against a host.
+        """
+        self.world_template = (
+            WorldTemplate() if world_template is None else world_template
+        )
+        self.players = players
+        self.commands_per_player = commands_per_player
+        self.seed = seed
+        self.address = address
+        self.script = None if script is None else tuple(script)
+        self.window = window
+        self.timeout = timeout
+        if memory_pids is None and address is None:
+            memory_pids = (os.getpid(),)
+        self.memory_pids = None if memory_pids is None else tuple(memory_pids)
+
+    def _players(self):
+        vocabulary = _world_vocabulary(self.world_template.new_game_state())
+        return [
+            SimulatedPlayer(
+                f"load-{self.seed}-{index}",
+                Random(f"{self.seed}:{index}"),
+                vocabulary,
+                self.commands_per_player,
+                self.script,
+            )
+            for index in range(self.players)
+        ]
+
+    def run(self):
+        """
+        This method plays every simulated player's commands and returns a
+        LoadReport object.
+
+        :return: A LoadReport object.
+        """
+        players = self._players()
+        recorder = _Recorder(self.window, self.memory_pids)
+        if self.address is None:
+            target = "in-process"
+            self._run_in_process(players, recorder)
+        else:
+            target = f"{self.address[0]}:{self.address[1]}"
+            self._run_against_host(players, recorder)
+        seconds = recorder.finish()
+        return LoadReport(
+            target,
+            {
+                "players": self.players,
+                "commands_per_player": self.commands_per_player,
+                "seed": self.seed,
+                "script": None if self.script is None else list(self.script),
+            },
+            seconds,
+            len(recorder.latencies),
+            dict(sorted(recorder.errors.items())),
+            recorder.games_ended,
+            _percentiles(recorder.latencies),
+            recorder.starting_resident_bytes,
+            tuple(recorder.windows),
+        )
+
+    def _run_in_process(self, players, recorder):
+        # Every player's game is live at once; they take turns entering a
+        # command. Each reply is rendered and serialized as the host would,
+        # so the latency covers the same work.
+        previous_dice_roller = set_dice_roller(SeededDice(self.seed))
+        try:
+            command_processors = dict()
+            turns = deque(players)
+            while turns:
+                player = turns.popleft()
+                command = player.next_command()
+                if command is None:
+                    continue
+                command_processor = command_processors.get(player.name)
+                if command_processor is None:
+                    command_processor = command_processors[
+                        player.name
+                    ] = CommandProcessor(self.world_template.new_game_state())
+                sent_at = time.perf_counter()
+                try:
+                    result = command_processor.process(command)
+                    game_over = isinstance(result[-1], _GAME_OVER_GSMS)
+                    json.dumps(
+                        {
+                            "messages": [
+                                game_state_message.message
+                                for game_state_message in result
+                            ],
+                            "game_over": game_over,
+                        }
+                    )
+                except Exception as exception:
+                    recorder.error(type(exception).__name__)
+                else:
+                    recorder.reply(time.perf_counter() - sent_at)
+                    if game_over:
+                        recorder.games_ended += 1
+                        del command_processors[player.name]
+                        player.new_game()
+                    else:
+                        player.observe_game_state(command_processor.game_state)
+                turns.append(player)
+                recorder.tick()
+        finally:
+            set_dice_roller(previous_dice_roller)
+
+    def _run_against_host(self, players, recorder):
+        # Each player has its own connection, and every connection is
+        # watched by one selector. A player sends its next command as soon
+        # as the reply to its last one arrives. Every player connects
+        # before any sends its first command, so no reply waits on the
+        # connections still being opened.
+        selector = selectors.DefaultSelector()
+        try:
+            for player in players:
+                self._connect(selector, player, recorder, send=False)
+            for key in list(selector.get_map().values()):
+                self._send(selector, key.data, recorder)
+            while selector.get_map():
+                events = selector.select(min(self.window, self.timeout))
+                for key, _ in events:
+                    self._receive(selector, key.data, recorder)
+                self._expire(selector, recorder)
+                recorder.tick()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+
+    def _connect(self, selector, player, recorder, send=True):
+        # Opens a player's connection and, if send is True, sends its next
+        # command. A player that can't connect is counted as an error and
+        # dropped.
+        try:
+            sock = socket.create_connection(self.address, timeout=self.timeout)
+            sock.sendall(f"SESSION {player.name}\n".encode("utf-8"))
+        except OSError as exception:
+            recorder.error(type(exception).__name__)
+            return
+        connection = _Connection(player, sock)
+        selector.register(sock, selectors.EVENT_READ, connection)
+        if send:
+            self._send(selector, connection, recorder)
+
+    def _send(self, selector, connection, recorder):
+        command = connection.player.next_command()
+        if command is None:
+            self._close(selector, connection)
+            return
+        try:
+            connection.sock.sendall(f"{command}\n".encode("utf-8"))
+        except OSError as exception:
+            recorder.error(type(exception).__name__)
+            self._reconnect(selector, connection, recorder)
+            return
+        connection.sent_at = time.perf_counter()
+
+    def _receive(self, selector, connection, recorder):
+        try:
+            data = connection.sock.recv(65536)
+        except OSError as exception:
+            recorder.error(type(exception).__name__)
+            self._reconnect(selector, connection, recorder)
+            return
+        if not data:
+            recorder.error("connection closed")
+            self._reconnect(selector, connection, recorder)
+            return
+        connection.buffer += data
+        if b"\n" not in connection.buffer:
+            return
+        line, _, connection.buffer = connection.buffer.partition(b"\n")
+        latency = time.perf_counter() - connection.sent_at
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            reply = None
+        if not isinstance(reply, dict) or "error" in reply:
+            recorder.error("bad reply")
+            self._reconnect(selector, connection, recorder)
+            return
+        recorder.reply(latency)
+        if "results" in reply:
+            connection.player.observe_results(reply["results"])
+
+        # The host closes the connection once a game is over; reconnecting
+        # with the same session name starts a new one.
+
+        if reply.get("game_over"):
+            recorder.games_ended += 1
+            connection.player.new_game()
+            self._reconnect(selector, connection, recorder)
+            return
+        self._send(selector, connection, recorder)
+
+    def _expire(self, selector, recorder):
+        # A reply that takes longer than the timeout is counted as an
+        # error, and the player starts over on a new connection.
+        now = time.perf_counter()
+        for key in list(selector.get_map().values()):
+            connection = key.data
+            if (
+                connection.sent_at is not None
+                and now - connection.sent_at > self.timeout
+            ):
+                recorder.error("timeout")
+                self._reconnect(selector, connection, recorder)
+
+    def _reconnect(self, selector, connection, recorder):
+        self._close(selector, connection)
+        if connection.player.commands_left > 0:
+            self._connect(selector, connection.player, recorder)
+
+    def _close(self, selector, connection):
+        selector.unregister(connection.sock)
+        connection.sock.close()
@@ -0,0 +1,658 @@
+#!/usr/bin/python3
+
+"""
+The advgame.memreport module measures how much memory a large item catalog
+takes. It generates a catalog of items of every type, and lists of
+quantities and internal names such as container contents, room items and
+creature inventories give, and builds them twice: once as the game does,
+with each item type's own slot layout and its names interned, and once as
+it did before, when every item carried all fifteen item attributes and a
+__dict__, and every list of items held its own copy of each name. Each
+build is measured with tracemalloc, and the report compares the two.
+
+It also measures the GameStateMessage objects that processing commands
+allocates. Transcripts of commands are recorded once, by playing the
+fuzzer's command generator against fresh worlds, and then played twice
+more with the same dice: once with the message classes' flyweight
+instances shared as the game does, and once with every message allocated
+anew, as before they were. Each message's text is rendered, as a host
+does, and the results are kept, so the report compares the message objects
+allocated and the bytes they retain per command.
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from random import Random
+
+from advgame.elements.basics import IniEntry
+from advgame.elements.characters import ItemsMultiState
+from advgame.elements.items import (
+    Armor,
+    Coin,
+    Item,
+    Key,
+    Oddment,
+    Potion,
+    Shield,
+    Wand,
+    Weapon,
+)
+from advgame.fuzzer import CommandGenerator
+from advgame.process import CommandProcessor
+from advgame.solver import SeededDice
+from advgame.statemsgs.gsm import GameStateMessage
+from advgame.utils import set_dice_roller
+from advgame.world import build_game_state
+
+
+__all__ = (
+    "MemoryReport",
+    "MessageChurnReport",
+    "generate_item_lists",
+    "generate_item_sections",
+    "item_catalog_memory_report",
+    "message_churn_report",
+)
+
+
+# The base items a catalog is generated from, by item type: each is an
+# internal name, a noun for the title, a description, and the type's own
+# attributes as they'd appear in items.ini.
+
+_CATALOG_BASES = {
+    "weapon": (
+        ("Longsword", "longsword", "A sword with a long blade.", "1d8"),
+        ("Dagger", "dagger", "A short double-edged blade.", "1d4"),
+        ("Mace", "mace", "A flanged iron head on a haft.", "1d6"),
+    ),
+    "armor": (
+        ("Scale_Mail", "scale mail", "A coat of overlapping steel scales.", "5"),
+        ("Leather_Armor", "leather armor", "A jerkin of boiled leather.", "2"),
+    ),
+    "shield": (("Buckler", "buckler", "A small round shield.", "1"),),
+    "wand": (("Wand", "wand", "A length of carved ebony.", "2d6"),),
+    "potion": (
+        ("Health_Potion", "health potion", "A small flask of red liquid.", "20"),
+        ("Mana_Potion", "mana potion", "A small flask of blue liquid.", "20"),
+    ),
+    "coin": (("Gold_Coin", "gold coin", "A gold coin.", None),),
+    "key": (("Key", "key", "An iron key.", None),),
+    "oddment": (
+        ("Goblet", "goblet", "A dented pewter goblet.", None),
+        ("Candlestick", "candlestick", "A brass candlestick.", None),
+    ),
+}
+
+_ADJECTIVES = ("old", "fine", "rusty", "plain", "heavy", "battered", "gilded")
+
+_ITEM_CLASSES = {
+    "armor": Armor,
+    "coin": Coin,
+    "key": Key,
+    "oddment": Oddment,
+    "potion": Potion,
+    "shield": Shield,
+    "wand": Wand,
+    "weapon": Weapon,
+}
+
+
+def _letters(index):
+    # Internal names in item lists are letters and underscores, so each
+    # generated item's index is spelled in letters.
+    letters = ""
+    while True:
+        index, remainder = divmod(index, 26)
+        letters = chr(ord("a") + remainder) + letters
+        if not index:
+            return letters
+
+
+def generate_item_sections(item_count, seed=0):
+    """
+    This function generates an item catalog as the sections of an items.ini
+    file would give it: a dict of internal names to dicts of strings. Each
+    title is built separately, as reading them from a file does, so items
+    with the same title have separate but equal title strings.
+
+    :item_count: An int, the number of items.
+    :seed: An int, the seed of the random choice of items.
+    :return: A dict of dicts.
+    """
+    rng = Random(seed)
+    item_types = tuple(_CATALOG_BASES)
+    item_sections = dict()
+    for index in range(item_count):
+        item_type = rng.choice(item_types)
+        internal_name, noun, description, stat = rng.choice(_CATALOG_BASES[item_type])
+        item_section = {
+            "title": f"{rng.choice(_ADJECTIVES)} {noun}",
+            "description": description,
+            "weight": str(rng.randint(1, 10)),
+            "value": str(rng.randint(1, 100)),
+            "item_type": item_type,
+        }
+        if item_type in ("weapon", "wand"):
+            item_section.update(damage=stat, attack_bonus=str(rng.randint(0, 2)))
+        elif item_type in ("armor", "shield"):
+            item_section["armor_bonus"] = stat
+        elif item_type == "potion":
+            item_section[
+                "hit_points_recovered"
+                if internal_name == "Health_Potion"
+                else "mana_points_recovered"
+            ] = stat
+        if item_type in ("weapon", "wand", "armor", "shield"):
+            for character_class in ("warrior", "thief", "priest", "mage"):
+                item_section[f"{character_class}_can_use"] = rng.choice(
+                    ("true", "false")
+                )
+        item_sections[f"{internal_name}_{_letters(index)}"] = item_section
+    return item_sections
+
+
+def generate_item_lists(internal_names, list_count, list_length, seed=0):
+    """
+    This function generates lists of items in the form the contents of a
+    container, the items in a room and the inventory of a creature are
+    given in the .ini files: strings like '[2xGold_Coin_a,1xDagger_b]'.
+
+    :internal_names: A sequence of strings, the internal names to choose
+    from.
+    :list_count: An int, the number of lists.
+    :list_length: An int, the number of items in each list.
+    :seed: An int, the seed of the random choice of items.
+    :return: A list of strings.
+    """
+    rng = Random(seed)
+    return [
+        "["
+        + ",".join(
+            f"{rng.randint(1, 20)}x{internal_name}"
+            for internal_name in rng.sample(internal_names, list_length)
+        )
+        + "]"
+        for _ in range(list_count)
+    ]
+
+
+# The layout every item had before each item type declared its own: the
+# fifteen attributes of all item types, and a subclass per item type
+# without __slots__, so each item had a __dict__ as well.
+
+_FLAT_ITEM_SLOTS = (
+    "internal_name",
+    "title",
+    "description",
+    "weight",
+    "value",
+    "damage",
+    "attack_bonus",
+    "armor_bonus",
+    "item_type",
+    "warrior_can_use",
+    "thief_can_use",
+    "priest_can_use",
+    "mage_can_use",
+    "hit_points_recovered",
+    "mana_points_recovered",
+)
+
+
+class _FlatItem(IniEntry):
+    __slots__ = _FLAT_ITEM_SLOTS
+
+    def __init__(self, **argd):
+        super().__init__(**argd)
+        self._post_init_slots_set_none(self.__slots__)
+
+
+_FLAT_ITEM_CLASSES = {
+    item_type: type(f"Flat{item_class.__name__}", (_FlatItem,), {})
+    for item_type, item_class in _ITEM_CLASSES.items()
+}
+
+
+def _flat_item(**item_dict):
+    return _FLAT_ITEM_CLASSES[item_dict["item_type"]](**item_dict)
+
+
+def _flat_list_value(inventory_value):
+    # The list parsing as it was before its names were interned.
+    inner_capture = IniEntry.inventory_list_value_re.match(inventory_value).group(1)
+    return [
+        (int(item_qty), item_name)
+        for item_qty, item_name in (
+            name_x_qty_str.split("x", maxsplit=1)
+            for name_x_qty_str in inner_capture.split(",")
+        )
+    ]
+
+
+def _traced_bytes(build):
+    # Calls build() and returns what it returned and the number of bytes
+    # still allocated from it once it's returned.
+    gc.collect()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0] - start_bytes
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+class MemoryReport:
+    """
+    The result of item_catalog_memory_report(): the bytes the items and the
+    lists of items took in each layout, and the size of one item of each
+    type.
+    """
+
+    __slots__ = (
+        "item_count",
+        "names_listed",
+        "flat_bytes",
+        "compact_bytes",
+        "instance_sizes",
+    )
+
+    def __init__(
+        self, item_count, names_listed, flat_bytes, compact_bytes, instance_sizes
+    ):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :item_count: An int, the number of items in the catalog.
+        :names_listed: An int, the number of names in all the lists of
+        items.
+        :flat_bytes: A dict of 'items' and 'lists' to the bytes each took in
+        the layout items had before.
+        :compact_bytes: A dict of 'items' and 'lists' to the bytes each took
+        in the current layout.
+        :instance_sizes: A dict of item types to pairs of the size in bytes
+        of one item of that type in the layout before and in the current
+        layout.
+        """
+        self.item_count = item_count
+        self.names_listed = names_listed
+        self.flat_bytes = flat_bytes
+        self.compact_bytes = compact_bytes
+        self.instance_sizes = instance_sizes
+
+    @property
+    def bytes_saved(self):
+        """
+        This property returns the number of bytes the current layout saves.
+
+        :return: An int.
+        """
+        return sum(self.flat_bytes.values()) - sum(self.compact_bytes.values())
+
+    @property
+    def fraction_saved(self):
+        """
+        This property returns the fraction of the memory the layout before
+        took that the current layout saves.
+
+        :return: A float.
+        """
+        return self.bytes_saved / sum(self.flat_bytes.values())
+
+    def to_dict(self):
+        """
+        This method returns the report as a dict that can be dumped as JSON.
+
+        :return: A dict.
+        """
+        return {
+            "item_count": self.item_count,
+            "names_listed": self.names_listed,
+            "flat_bytes": dict(self.flat_bytes),
+            "compact_bytes": dict(self.compact_bytes),
+            "instance_sizes": {
+                item_type: list(sizes)
+                for item_type, sizes in self.instance_sizes.items()
+            },
+        }
+
+    def summary(self):
+        """
+        This method returns a summary of the report as a table.
+
+        :return: A string.
+        """
+        lines = [
+            f"{self.item_count} items, named {self.names_listed} times in "
+            + "lists of items:",
+            f"  {'':<8}{'flat':>14}{'compact':>14}{'saved':>14}",
+        ]
+        for part in ("items", "lists"):
+            flat_bytes = self.flat_bytes[part]
+            compact_bytes = self.compact_bytes[part]
+            lines.append(
+                f"  {part:<8}{flat_bytes:>14,}{compact_bytes:>14,}"
+                + f"{flat_bytes - compact_bytes:>14,}"
+            )
+        lines.append(
+            f"  {'total':<8}{sum(self.flat_bytes.values()):>14,}"
+            + f"{sum(self.compact_bytes.values()):>14,}{self.bytes_saved:>14,}"
+            + f" ({self.fraction_saved:.0%})"
+        )
+        lines.append(
+            "  bytes per item: "
+            + ", ".join(
+                f"{item_type} {flat_size} -> {compact_size}"
+                for item_type, (flat_size, compact_size) in sorted(
+                    self.instance_sizes.items()
+                )
+            )
+        )
+        return "\n".join(lines)
+
+
+def item_catalog_memory_report(
+    item_count=10000, list_count=2000, list_length=10, seed=0
+):
+    """
+    This function generates an item catalog and lists of its items, builds
+    them in the current layout and in the layout items had before, and
+    reports the memory each took. The current layout's items include the
+    entries its names add to the interpreter's table of interned strings,
+    which grows the first time a catalog is built.
+
+    :item_count: An int, the number of items in the catalog.
+    :list_count: An int, the number of lists of items.
+    :list_length: An int, the number of items in each list.
+    :seed: An int, the seed the catalog and lists are generated from.
+    :return: A MemoryReport object.
+    """
+    list_parser = IniEntry()
+    layouts = {
+        "flat": (_flat_item, _flat_list_value),
+        "compact": (Item.subclassing_factory, list_parser._process_list_value),
+    }
+    measured_bytes = dict()
+    examples = dict()
+    for layout, (item_factory, parse_list) in layouts.items():
+        # The sections and lists are generated inside the measured builds
+        # and dropped once they're parsed, so what's measured is what the
+        # game keeps of them.
+
+        def build_items():
+            return {
+                internal_name: item_factory(internal_name=internal_name, **section)
+                for internal_name, section in generate_item_sections(
+                    item_count, seed
+                ).items()
+            }
+
+        items, items_bytes = _traced_bytes(build_items)
+
+        def build_lists():
+            item_lists = list()
+            for list_value in generate_item_lists(
+                tuple(items), list_count, list_length, seed
+            ):
+                items_multi_state = ItemsMultiState()
+                for item_qty, internal_name in parse_list(list_value):
+                    items_multi_state.set(internal_name, item_qty, items[internal_name])
+                item_lists.append(items_multi_state)
+            return item_lists
+
+        _, lists_bytes = _traced_bytes(build_lists)
+        measured_bytes[layout] = {"items": items_bytes, "lists": lists_bytes}
+        examples[layout] = {item.item_type: item for item in items.values()}
+    instance_sizes = {
+        item_type: (
+            sys.getsizeof(examples["flat"][item_type]),
+            sys.getsizeof(compact_item),
+        )
+        for item_type, compact_item in examples["compact"].items()
+    }
+    return MemoryReport(
+        item_count,
+        list_count * list_length,
+        measured_bytes["flat"],
+        measured_bytes["compact"],
+        instance_sizes,
+    )
+
+
+class MessageChurnReport:
+    """
+    The result of message_churn_report(): the GameStateMessage objects
+    allocated by the commands played, and the bytes they retained, with
+    flyweight instances shared and without.
+    """
+
+    __slots__ = (
+        "transcript_count",
+        "commands_played",
+        "messages_returned",
+        "objects_allocated",
+        "retained_bytes",
+    )
+
+    def __init__(
+        self,
+        transcript_count,
+        commands_played,
+        messages_returned,
+        objects_allocated,
+        retained_bytes,
+    ):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :transcript_count: An int, the number of transcripts played.
+        :commands_played: An int, the number of commands in them.
+        :messages_returned: An int, the number of messages the commands
+        returned.
+        :objects_allocated: A dict of 'plain' and 'flyweight' to the number
+        of distinct message objects among those messages.
+        :retained_bytes: A dict of 'plain' and 'flyweight' to the bytes the
+        messages, their rendered text, and any flyweight instances kept by
+        their classes took.
+        """
+        self.transcript_count = transcript_count
+        self.commands_played = commands_played
+        self.messages_returned = messages_returned
+        self.objects_allocated = objects_allocated
+        self.retained_bytes = retained_bytes
+
+    def per_command(self, measure, mode):
+        """
+        This method returns one of the report's measures per command played.
+
+        :measure: A string, 'objects_allocated' or 'retained_bytes'.
+        :mode: A string, 'plain' or 'flyweight'.
+        :return: A float.
+        """
+        return getattr(self, measure)[mode] / self.commands_played
+
+    def to_dict(self):
+        """
+        This method returns the report as a dict that can be dumped as JSON.
+
+        :return: A dict.
+        """
+        return {
+            "transcript_count": self.transcript_count,
+            "commands_played": self.commands_played,
+            "messages_returned": self.messages_returned,
+            "objects_allocated": dict(self.objects_allocated),
+            "retained_bytes": dict(self.retained_bytes),
+        }
+
+    def summary(self):
+        """
+        This method returns a summary of the report as a table.
+
+        :return: A string.
+        """
+        lines = [
+            f"{self.transcript_count} transcripts, {self.commands_played} "
+            + f"commands, {self.messages_returned} messages:",
+            f"  {'per command':<20}{'plain':>12}{'flyweight':>12}{'saved':>8}",
+        ]
+        for measure, label in (
+            ("objects_allocated", "objects allocated"),
+            ("retained_bytes", "bytes retained"),
+        ):
+            plain = self.per_command(measure, "plain")
+            flyweight = self.per_command(measure, "flyweight")
+            saved = 1 - flyweight / plain if plain else 0
+            lines.append(
+                f"  {label:<20}{plain:>12,.2f}{flyweight:>12,.2f}{saved:>8.0%}"
+            )
+        return "\n".join(lines)
+
+
+def _message_classes():
+    # Every GameStateMessage subclass that's been defined.
+    message_classes = list()
+    subclasses = [GameStateMessage]
+    while subclasses:
+        message_class = subclasses.pop()
+        message_classes.append(message_class)
+        subclasses.extend(message_class.__subclasses__())
+    return message_classes
+
+
+def _record_transcripts(world_sections, transcript_count, transcript_length, seed):
+    # Plays the fuzzer's commands against fresh worlds, and returns each
+    # transcript's seed and the commands played. A transcript stops when
+    # its game ends, or before a command that raises.
+    transcripts = list()
+    for transcript_seed in range(seed, seed + transcript_count):
+        previous_dice_roller = set_dice_roller(SeededDice(transcript_seed))
+        try:
+            game_state = build_game_state(world_sections)
+            generator = CommandGenerator(game_state, Random(transcript_seed))
+            command_processor = CommandProcessor(game_state)
+            commands = list()
+            for _ in range(transcript_length):
+                if game_state.game_has_ended:
+                    break
+                command = generator.command(game_state)
+                try:
+                    command_processor.process(command)
+                except Exception:
+                    break
+                commands.append(command)
+        finally:
+            set_dice_roller(previous_dice_roller)
+        transcripts.append((transcript_seed, commands))
+    return transcripts
+
+
+def _play_transcripts(world_sections, transcripts, share_flyweights):
+    # Plays the transcripts, keeping every result, and returns the number
+    # of messages returned, the number of distinct message objects among
+    # them, and the bytes they retained. The worlds are built before
+    # measuring starts, and each message class's flyweight instances are
+    # emptied, or turned off, for the duration.
+    games = list()
+    for transcript_seed, commands in transcripts:
+        dice = SeededDice(transcript_seed)
+        previous_dice_roller = set_dice_roller(dice)
+        try:
+            games.append(
+                (dice, CommandProcessor(build_game_state(world_sections)), commands)
+            )
+        finally:
+            set_dice_roller(previous_dice_roller)
+    message_classes = _message_classes()
+    saved_flyweights = {
+        message_class: message_class._flyweights for message_class in message_classes
+    }
+    results = list()
+    gc.collect()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        for message_class, flyweights in saved_flyweights.items():
+            if flyweights is not None:
+                message_class._flyweights = dict() if share_flyweights else None
+        for dice, command_processor, commands in games:
+            previous_dice_roller = set_dice_roller(dice)
+            try:
+                for command in commands:
+                    result = command_processor.process(command)
+                    for game_state_message in result:
+                        game_state_message.message
+                    results.append(result)
+            finally:
+                set_dice_roller(previous_dice_roller)
+        gc.collect()
+        with_results_bytes = tracemalloc.get_traced_memory()[0]
+
+        # Dropping the results and the flyweight instances leaves only
+        # what the games themselves kept, which is the same either way.
+
+        messages_returned = sum(map(len, results))
+        objects_allocated = len(
+            {
+                id(game_state_message)
+                for result in results
+                for game_state_message in result
+            }
+        )
+        for message_class, flyweights in saved_flyweights.items():
+            message_class._flyweights = flyweights
+        del results[:]
+        gc.collect()
+        without_results_bytes = tracemalloc.get_traced_memory()[0]
+    finally:
+        for message_class, flyweights in saved_flyweights.items():
+            message_class._flyweights = flyweights
+        if not already_tracing:
+            tracemalloc.stop()
+    return (
+        messages_returned,
+        objects_allocated,
+        with_results_bytes - without_results_bytes,
+    )
+
+
+def message_churn_report(
+    world_sections, transcript_count=20, transcript_length=100, seed=0
+):
+    """
+    This function records transcripts of the fuzzer's commands and plays
+    them with flyweight message instances shared and without, and reports
+    the message objects each allocated and the bytes they retained.
+
+    :world_sections: A WorldSections object.
+    :transcript_count: An int, the number of transcripts.
+    :transcript_length: An int, the most commands in a transcript.
+    :seed: An int, the seed of the first transcript; each one after it is
+    seeded with the next int.
+    :return: A MessageChurnReport object.
+    """
+    transcripts = _record_transcripts(
+        world_sections, transcript_count, transcript_length, seed
+    )
+    objects_allocated = dict()
+    retained_bytes = dict()
+    for mode, share_flyweights in (("plain", False), ("flyweight", True)):
+        (
+            messages_returned,
+            objects_allocated[mode],
+            retained_bytes[mode],
+        ) = _play_transcripts(world_sections, transcripts, share_flyweights)
+    return MessageChurnReport(
+        transcript_count,
+        sum(len(commands) for _, commands in transcripts),
+        messages_returned,
+        objects_allocated,
+        retained_bytes,
+    )
@@ -0,0 +1,263 @@
+#!/usr/bin/python3
+
+"""
+The advgame.multiplayer module implements a shared world: a single set of
+rooms, doors, chests and creatures that many players explore at once. Each
+player has their own character and their own GameState, whose RoomsState
+is a view onto the shared rooms with its own cursor.
+
+Commands may be processed concurrently from several threads. Before a
+command runs, the locks for the rooms and doors it could touch are taken,
+so players in different rooms never contend. The locks are always taken in
+one global order, which is what keeps commands that touch two rooms, like
+LEAVE, from deadlocking against each other.
+
+The results of commands that change a room are published to the world's
+RoomEventBus, so a player who subscribes with subscribe() sees what the
+other players in the same room do.
+"""
+
+import threading
+
+from contextlib import contextmanager
+
+from advgame.elements.characters import GameState
+from advgame.errors import InternalError
+from advgame.events import RoomEventBus
+from advgame.process import CommandProcessor
+from advgame.scheduler import CreatureScheduler
+from advgame.world import build_game_state, load_world_sections
+
+
+__all__ = ("SharedWorld",)
+
+
+# These commands can act on one of the doors of the current room, whose
+# state is shared with the room on the far side of it, so they lock every
+# door of the current room and every room beyond them. All other commands
+# only act on the current room.
+
+_DOOR_COMMANDS = frozenset(("close", "leave", "lock", "open", "pick", "unlock"))
+
+
+class _Player:
+    # One player's CommandProcessor, and the lock that keeps that player's
+    # own commands from running concurrently with each other.
+
+    __slots__ = "processor", "lock"
+
+    def __init__(self, processor):
+        self.processor = processor
+        self.lock = threading.Lock()
+
+
+class SharedWorld:
+    """
+    This class holds one world shared by any number of players. join() adds
+    a player and returns their GameState; process() runs one of that player's
+    commands under the locks for the rooms and doors it touches.
+    """
+
+    __slots__ = (
+        "_game_state",
+        "_entrance",
+        "_players",
+        "_locks",
+        "_players_lock",
+        "event_bus",
+    )
+
+    def __init__(self, world_sections=None, lazy=False, queue_size=64):
+        """
+        This __init__ method builds the shared world from the given
+        WorldSections object, or from the game's own dungeon if none is given.
+
+        :world_sections: A WorldSections object, or None.
+        :lazy: A boolean, passed on to RoomsState.
+        :queue_size: An int, the default queue size for event subscriptions.
+        """
+        if world_sections is None:
+            world_sections = load_world_sections()
+        self._game_state = build_game_state(world_sections, lazy=lazy)
+        self._entrance = self._game_state.rooms_state.cursor.internal_name
+        self._players = dict()
+        self._locks = dict()
+        self._players_lock = threading.Lock()
+        self.event_bus = RoomEventBus(queue_size)
+
+    def join(self, player_name):
+        """
+        This method adds a player to the world, starting in the entrance room,
+        and returns the player's GameState. It raises an InternalError if a
+        player by that name has already joined.
+
+        :player_name: A string, the name the player is known by to this object.
+        :return: A GameState object.
+        """
+        shared = self._game_state
+        game_state = GameState(
+            shared.rooms_state.view(self._entrance),
+            shared.creatures_state,
+            shared.containers_state,
+            shared.doors_state,
+            shared.items_state,
+        )
+        with self._players_lock:
+            if player_name in self._players:
+                raise InternalError(f"player {player_name} has already joined")
+            self._players[player_name] = _Player(
+                CommandProcessor(game_state, self.event_bus)
+            )
+        return game_state
+
+    def leave(self, player_name):
+        """
+        This method removes a player from the world. The rooms keep whatever
+        changes the player made to them, and their event subscription is
+        removed.
+
+        :player_name: A string.
+        :return: None.
+        """
+        with self._players_lock:
+            player = self._players.pop(player_name)
+        self.event_bus.unsubscribe(player.processor.game_state)
+
+    def subscribe(self, player_name, queue_size=None):
+        """
+        This method subscribes a player to the events in whichever room they're
+        in; the subscription follows them as they move. The player's own
+        actions aren't delivered to them.
+
+        :player_name: A string.
+        :queue_size: An int, or None to use the world's default.
+        :return: A Subscription object.
+        """
+        player = self._players[player_name]
+        with player.lock:
+            game_state = player.processor.game_state
+            return self.event_bus.subscribe(
+                game_state,
+                game_state.rooms_state.cursor.internal_name,
+                queue_size,
+            )
+
+    def players(self):
+        """
+        This method returns a tuple of the names of the players in the world.
+
+        :return: A tuple of strings.
+        """
+        with self._players_lock:
+            return tuple(self._players)
+
+    def process(self, player_name, natural_language_str):
+        """
+        This method processes a command for the given player and returns its
+        result, as CommandProcessor.process() does. It blocks until the locks
+        for every room and door the command could touch are free.
+
+        :player_name: A string.
+        :natural_language_str: The player's command input as a natural
+        language string.
+        :return: A tuple of GameStateMessage objects.
+        """
+        player = self._players[player_name]
+        with player.lock:
+            # Only this player's own commands move their cursor, and
+            # they're serialized by the player lock, so the lock keys
+            # worked out here stay correct until the command is done.
+
+            keys = self.lock_keys(player.processor.game_state, natural_language_str)
+            with self._holding(keys):
+                return player.processor.process(natural_language_str)
+
+    def lock_keys(self, game_state, natural_language_str):
+        """
+        This method returns the keys of the locks a command needs, in the
+        order they must be acquired. A key is a ('door', internal name) or
+        ('room', internal name) tuple, and keys are always sorted, so any two
+        commands acquire the locks they have in common in the same order and
+        can't deadlock.
+
+        :game_state: A GameState object belonging to a player in this world.
+        :natural_language_str: The player's command input as a natural
+        language string.
+        :return: A list of tuples.
+        """
+        room = game_state.rooms_state.cursor
+        verb, *_ = natural_language_str.lower().split() or ("",)
+        if game_state.game_has_begun and verb in _DOOR_COMMANDS:
+            return self._neighborhood_keys(room)
+        return [("room", room.internal_name)]
+
+    def _neighborhood_keys(self, room):
+        # The sorted lock keys for a room, its doors, and the rooms on the
+        # far side of them.
+        keys = {("room", room.internal_name)}
+        for door in room.doors:
+            keys.add(("door", door.internal_name))
+            other_room_internal_name = door.other_room_internal_name(room.internal_name)
+            if other_room_internal_name != "Exit":
+                keys.add(("room", other_room_internal_name))
+        return sorted(keys)
+
+    @contextmanager
+    def _holding(self, keys):
+        # Acquires the locks for the given keys in the order given, and
+        # releases them in reverse.
+        locks = [self._lock_for(key) for key in keys]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def locked_neighborhood(self, room_internal_name):
+        """
+        This method returns a context manager that holds the locks for a room,
+        its doors, and the rooms on the far side of them, the same locks a
+        LEAVE from that room takes.
+
+        :room_internal_name: A string.
+        :return: A context manager.
+        """
+        room = self._game_state.rooms_state.get(room_internal_name)
+        return self._holding(self._neighborhood_keys(room))
+
+    def is_occupied(self, room_internal_name):
+        """
+        This method returns True if any player is in the given room.
+
+        :room_internal_name: A string.
+        :return: A boolean.
+        """
+        with self._players_lock:
+            players = tuple(self._players.values())
+        return any(
+            player.processor.game_state.rooms_state.cursor.internal_name
+            == room_internal_name
+            for player in players
+        )
+
+    def new_scheduler(self):
+        """
+        This method returns a CreatureScheduler for this world's creatures,
+        which keeps them out of rooms players are in and takes the same locks
+        player commands do.
+
+        :return: A CreatureScheduler object.
+        """
+        return CreatureScheduler(
+            self._game_state.rooms_state, self.is_occupied, self.locked_neighborhood
+        )
+
+    def _lock_for(self, key):
+        # dict.setdefault() is atomic, so two threads asking for the same
+        # new key both get the one lock that was stored.
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks.setdefault(key, threading.Lock())
+        return lock
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+
+"""
+The OutputWriter class, which assembles the response to a command in a
+buffer and delivers it in a single write. It wraps each message to its own
+width, so each terminal or network connection can have its own, and it
+writes to either a text stream like sys.stdout or a socket.
+"""
+
+from advgame.utils import textwrapper
+
+
+__all__ = ("OutputWriter",)
+
+
+class OutputWriter:
+    """
+    A buffered writer for game output. Text added to it is wrapped to its
+    width and held until flush() writes all of it at once.
+    """
+
+    __slots__ = "width", "_stream", "_buffer"
+
+    def __init__(self, stream, width=80):
+        """
+        This __init__ method creates an empty writer.
+
+        :stream: A text stream with write() and flush() methods, or a socket.
+        :width: An int, the number of columns to wrap to, or None to write
+        text unwrapped.
+        """
+        self._stream = stream
+        self.width = width
+        self._buffer = list()
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def add(self, text):
+        """
+        This method wraps a string of text and adds it to the buffer as one
+        block of lines.
+
+        :text: A string.
+        :return: None.
+        """
+        self._buffer.append(
+            text if self.width is None else textwrapper(text, self.width)
+        )
+
+    def add_results(self, results):
+        """
+        This method adds the message of each GameStateMessage object in a
+        tuple returned by CommandProcessor.process() to the buffer.
+
+        :results: A tuple of GameStateMessage objects.
+        :return: None.
+        """
+        for game_state_message in results:
+            self.add(game_state_message.message)
+
+    def getvalue(self):
+        """
+        This method returns the buffered text as it would be written.
+
+        :return: A string.
+        """
+        if not self._buffer:
+            return ""
+        return "\n".join(self._buffer) + "\n"
+
+    def flush(self):
+        """
+        This method writes the buffered text to the stream in a single write
+        and empties the buffer.
+
+        :return: An int, the number of characters written.
+        """
+        output = self.getvalue()
+        self._buffer.clear()
+        if not output:
+            return 0
+
+        # A socket is written to with one sendall() call; a text stream
+        # with one write() call, followed by a flush so a terminal shows
+        # the whole response at once.
+
+        if hasattr(self._stream, "sendall"):
+            self._stream.sendall(output.encode("utf-8"))
+        else:
+            self._stream.write(output)
+            self._stream.flush()
+        return len(output)
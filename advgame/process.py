@@ -10,8 +10,11 @@ from dataclasses import dataclass
 
 from advgame.commands import (
     attack_command,
+    attack_command_iter,
     begin_game_command,
+    begin_game_command_iter,
     cast_spell_command,
+    cast_spell_command_iter,
     close_command,
     drink_command,
     drop_command,
@@ -19,14 +22,17 @@ from advgame.commands import (
     help_command,
     inventory_command,
     leave_command,
+    load_command,
     lock_command,
     look_at_command,
+    map_command,
     open_command,
     pick_lock_command,
     pick_up_command,
     put_command,
     quit_command,
     reroll_command,
+    save_command,
     set_class_command,
     set_name_command,
     status_command,
@@ -40,6 +46,8 @@ from advgame.commands import (
 )
 from advgame.elements import GameState
 from advgame.errors import InternalError
+from advgame.events import PUBLISHED_COMMANDS, RoomEvent
+from advgame.savefile import SaveFile
 from advgame.statemsgs.command import NotRecognizedGSM, NotAllowedNowGSM
 from advgame.statemsgs import GameStateMessage
 
@@ -51,6 +59,7 @@ __all__ = ("CommandProcessor",)
 class Context:
     game_state: GameState
     game_ending_state_msg: GameStateMessage
+    save_file: SaveFile = None
 
 
 # This module consists solely of the CommandProcessor class and its
@@ -73,7 +82,14 @@ class CommandProcessor:
     stringifies to a natural language reply.
     """
 
-    __slots__ = "context", "commands_set", "game_state", "game_ending_state_msg"
+    __slots__ = (
+        "context",
+        "commands_set",
+        "game_state",
+        "game_ending_state_msg",
+        "event_bus",
+        "save_file",
+    )
 
     # All return values from [a-z_]+_command methods in this class are
     # tuples. Every [a-z_]+_command method returns a tuple of one or
@@ -87,8 +103,14 @@ class CommandProcessor:
     # object, each bearing a message in its `message` property. The
     # frontend code will iterate through the tuple printing each message
     # in turn.
+    #
+    # A frontend can instead use process_iter(), which yields the
+    # objects one at a time. The commands whose results come in stages
+    # (ATTACK, CAST SPELL and BEGIN GAME) have generator forms that
+    # yield each object as soon as it's determined, so the player's hit
+    # can be shown before the foe's counterattack is even rolled.
 
-    def __init__(self, game_state):
+    def __init__(self, game_state, event_bus=None, save_file=None):
         """
         Initialize the CommandProcessor before the beginning of the game.
 
@@ -96,6 +118,10 @@ class CommandProcessor:
         RoomsState, CreaturesState, ContainersState, DoorsState, and ItemsState
         objects. Once the character_name and character_class attributes are set
         on this object, a Character object will be added and the game can begin.
+        :event_bus: A RoomEventBus object to publish the results of commands
+        that change a room to, or None.
+        :save_file: A SaveFile object for the SAVE and LOAD commands to use,
+        or None if games can't be saved.
         """
         self.context = dict(game_state=None, game_ending_state_msg=None)
 
@@ -120,9 +146,23 @@ class CommandProcessor:
         # underscores) is the beginning of that name.
         self.commands_set = PREGAME_COMMANDS | INGAME_COMMANDS
 
+        # If an event bus is given, the results of commands that other
+        # players in the room would see are published to it, with this
+        # object's GameState as the source.
+        self.event_bus = event_bus
+
+        # The SAVE and LOAD commands save to and load from this SaveFile
+        # object; without one, they report that saving is unavailable.
+        self.save_file = save_file
+
     @staticmethod
     def pre_process(natural_language_str):
         tokens = natural_language_str.strip().split()
+
+        # A blank command isn't any command; it's passed on as an empty
+        # string, which isn't recognized.
+        if not tokens:
+            return "", tokens
         command = tokens.pop(0).lower()
 
         # This block of conditionals is a set of preprocessing steps
@@ -209,11 +249,26 @@ class CommandProcessor:
         was returned when the game ended is returned again. Otherwise, the
         command is processed and a state message object is returned.
 
+        :natural_language_str: The player's command input as a natural language
+        string.
+        """
+        return tuple(self.process_iter(natural_language_str))
+
+    def process_iter(self, natural_language_str):
+        """
+        Process and dispatch a natural language command string like process()
+        does, but yield the GameStateMessage objects one at a time instead of
+        returning them in a tuple. For ATTACK, CAST SPELL and BEGIN GAME each
+        object is yielded as soon as it's determined. The generator must be
+        run to completion for the command to take full effect; the last
+        object it yields is the one to check for the end of the game.
+
         :natural_language_str: The player's command input as a natural language
         string.
         """
         if self.game_state.game_has_ended:
-            return (self.game_ending_state_msg,)
+            yield self.game_ending_state_msg
+            return
 
         command, tokens = self.pre_process(natural_language_str)
 
@@ -227,40 +282,95 @@ class CommandProcessor:
         # returned. The commands allowed in the current game mode are
         # included.
         if command not in self.commands_set:
-            return (
-                NotRecognizedGSM(
-                    command,
-                    INGAME_COMMANDS
-                    if self.game_state.game_has_begun
-                    else PREGAME_COMMANDS,
-                    self.game_state.game_has_begun,
-                ),
+            yield NotRecognizedGSM(
+                command,
+                INGAME_COMMANDS if self.game_state.game_has_begun else PREGAME_COMMANDS,
+                self.game_state.game_has_begun,
             )
+            return
 
         # If the player used an ingame command during the pregame, or a
         # pregame command during the ingame, a NotAllowedNowGSM error
         # is returned with a list of the currently allowed commands
         # included.
         elif self.game_state.game_has_begun and command not in INGAME_COMMANDS:
-            return (
-                NotAllowedNowGSM(
-                    command, INGAME_COMMANDS, self.game_state.game_has_begun
-                ),
+            yield NotAllowedNowGSM(
+                command, INGAME_COMMANDS, self.game_state.game_has_begun
             )
+            return
         elif not self.game_state.game_has_begun and command not in PREGAME_COMMANDS:
-            return (
-                NotAllowedNowGSM(
-                    command, PREGAME_COMMANDS, self.game_state.game_has_begun
-                ),
+            yield NotAllowedNowGSM(
+                command, PREGAME_COMMANDS, self.game_state.game_has_begun
             )
+            return
 
-        return self.dispatch(command, tokens)
+        if self.event_bus is None or command not in PUBLISHED_COMMANDS:
+            yield from self.dispatch_iter(command, tokens)
+            return
+
+        # The event is published once the command's results are all in.
+        room_internal_name = self.game_state.rooms_state.cursor.internal_name
+        retval = list()
+        for game_state_message in self.dispatch_iter(command, tokens):
+            retval.append(game_state_message)
+            yield game_state_message
+        self.publish(room_internal_name, command, tuple(retval))
+
+    def publish(self, room_internal_name, command, retval):
+        """
+        Publish a command's results to the event bus, as an event in the room
+        the command was issued in. If the command moved the character to
+        another room, this object's subscription follows it there and the
+        event is published to the new room as well.
+
+        :room_internal_name: A string, the internal name of the room the
+        command was issued in.
+        :command: A string, the command name.
+        :retval: The tuple of GameStateMessage objects the command returned.
+        :return: None.
+        """
+        actor_name = self.game_state.character_name
+        self.event_bus.publish(
+            RoomEvent(room_internal_name, actor_name, command, retval),
+            self.game_state,
+        )
+        new_room_internal_name = self.game_state.rooms_state.cursor.internal_name
+        if new_room_internal_name == room_internal_name:
+            return
+        self.event_bus.relocate(self.game_state, new_room_internal_name)
+        self.event_bus.publish(
+            RoomEvent(new_room_internal_name, actor_name, command, retval),
+            self.game_state,
+        )
+
+    def dispatch_iter(self, command, tokens):
+        # The streaming counterpart of dispatch(). The commands with
+        # generator forms are run through them; every other command's
+        # tuple is yielded from. Like dispatch(), the game-ending value
+        # is copied back from the context, even if the caller stops
+        # iterating early.
+        match command:
+            case "attack":
+                command_iter = attack_command_iter
+            case "cast_spell":
+                command_iter = cast_spell_command_iter
+            case "begin_game":
+                yield from begin_game_command_iter(self.game_state, tokens)
+                return
+            case _:
+                yield from self.dispatch(command, tokens)
+                return
+        context = Context(self.game_state, self.game_ending_state_msg, self.save_file)
+        try:
+            yield from command_iter(context, tokens)
+        finally:
+            self.game_ending_state_msg = context.game_ending_state_msg
 
     def dispatch(self, command, tokens):
         # Having completed all the checks, I have a valid command and
         # there is a matching command method. The command method is tail
         # called with the remainder of the tokens as an argument.
-        context = Context(self.game_state, self.game_ending_state_msg)
+        context = Context(self.game_state, self.game_ending_state_msg, self.save_file)
         match command:
             case "attack":
                 retval = attack_command(context, tokens)
@@ -288,10 +398,14 @@ class CommandProcessor:
                 retval = leave_command(context, tokens)
                 self.game_ending_state_msg = context.game_ending_state_msg
                 return retval
+            case "load":
+                return load_command(context, tokens)
             case "lock":
                 return lock_command(self.game_state, tokens)
             case "look_at":
                 return look_at_command(self.game_state, tokens)
+            case "map":
+                return map_command(self.game_state, tokens)
             case "open":
                 return open_command(self.game_state, tokens)
             case "pick_lock":
@@ -306,6 +420,8 @@ class CommandProcessor:
                 return retval
             case "reroll":
                 return reroll_command(self.game_state, tokens)
+            case "save":
+                return save_command(context, tokens)
             case "set_class":
                 return set_class_command(self.game_state, tokens)
             case "set_name":
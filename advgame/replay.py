@@ -0,0 +1,453 @@
+#!/usr/bin/python3
+
+"""
+The advgame.replay module records game sessions as transcripts and replays
+them to check that the game still behaves as it did when they were
+recorded. A transcript is the seed the session's dice were rolled with and
+each command the player entered, with the type and rendered text of every
+message the game returned for it. Replaying one plays its commands through
+a fresh CommandProcessor on a fresh copy of the world, with dice rolled
+from the same seed, and compares the messages returned with the recorded
+ones; the first message that differs is a divergence.
+
+A transcript file is JSON lines: a header line holding the seed, then one
+line for each command. The Replayer replays a set of transcript files,
+sharded across a pool of worker processes, and reports how many commands
+it replayed per second and every divergence it found. Each worker is
+given a WorldTemplate once, copies one world from it, and resets that
+world to the pristine state before each transcript rather than copying
+a new one.
+"""
+
+import json
+import os
+import time
+
+from multiprocessing import Pool
+
+from advgame.process import CommandProcessor
+from advgame.solver import SeededDice
+from advgame.utils import set_dice_roller
+from advgame.world import WorldTemplate
+
+
+__all__ = (
+    "Divergence",
+    "ReplayReport",
+    "Replayer",
+    "Transcript",
+    "TranscriptWriter",
+    "replay_transcript",
+)
+
+
+def _rendered(results):
+    # A command's results as they're recorded: the type tag and rendered
+    # text of each message.
+    return tuple(
+        (type(game_state_message).type_tag, game_state_message.message)
+        for game_state_message in results
+    )
+
+
+class Transcript:
+    """
+    A recorded game session: the seed its dice were rolled with, and a
+    sequence of exchanges, each a command and the (type tag, text) pairs of
+    the messages the game returned for it.
+    """
+
+    __slots__ = "seed", "exchanges", "name"
+
+    def __init__(self, seed, exchanges, name=None):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :seed: An int.
+        :exchanges: A tuple of (command, messages) pairs, where messages is a
+        tuple of (type tag, text) pairs.
+        :name: A string identifying the transcript, such as its path, or
+        None.
+        """
+        self.seed = seed
+        self.exchanges = exchanges
+        self.name = name
+
+    @classmethod
+    def load(cls, path):
+        """
+        This classmethod reads a transcript from a file. It raises a
+        ValueError if the file isn't a transcript.
+
+        :path: A string, the path of the file.
+        :return: A Transcript object.
+        """
+        with open(path, "r", encoding="utf-8") as transcript_file:
+            lines = [line for line in transcript_file if line.strip()]
+        if not lines:
+            raise ValueError(f"{path} is empty")
+        header = json.loads(lines[0])
+        if not isinstance(header, dict) or "seed" not in header:
+            raise ValueError(f"{path} doesn't begin with a transcript header")
+        exchanges = list()
+        for line in lines[1:]:
+            exchange = json.loads(line)
+            exchanges.append(
+                (
+                    exchange["command"],
+                    tuple(
+                        (message["type"], message["text"])
+                        for message in exchange["messages"]
+                    ),
+                )
+            )
+        return cls(header["seed"], tuple(exchanges), path)
+
+    @classmethod
+    def record(cls, world_template, commands, seed=0):
+        """
+        This classmethod plays a sequence of commands on a fresh copy of a
+        world, with dice rolled from the given seed, and returns the
+        transcript of the session.
+
+        :world_template: A WorldTemplate object.
+        :commands: An iterable of command strings.
+        :seed: An int.
+        :return: A Transcript object.
+        """
+        previous_dice_roller = set_dice_roller(SeededDice(seed))
+        try:
+            command_processor = CommandProcessor(world_template.new_game_state())
+            exchanges = tuple(
+                (command, _rendered(command_processor.process(command)))
+                for command in commands
+            )
+        finally:
+            set_dice_roller(previous_dice_roller)
+        return cls(seed, exchanges)
+
+    def dump(self, path):
+        """
+        This method writes the transcript to a file.
+
+        :path: A string, the path of the file.
+        :return: None.
+        """
+        with TranscriptWriter(path, self.seed) as transcript_writer:
+            for command, messages in self.exchanges:
+                transcript_writer.write_exchange(command, messages)
+
+
+class TranscriptWriter:
+    """
+    A writer that records a session to a transcript file as it's played,
+    one line per command, so that a session that ends abruptly is recorded
+    up to its last command. It can be used as a context manager.
+    """
+
+    __slots__ = "path", "seed", "_file"
+
+    def __init__(self, path, seed):
+        """
+        This __init__ method creates the file and writes the header.
+
+        :path: A string, the path of the file.
+        :seed: An int, the seed the session's dice are rolled with.
+        """
+        self.path = path
+        self.seed = seed
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write(json.dumps({"seed": seed}) + "\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, command, results):
+        """
+        This method records a command and the results it returned.
+
+        :command: A string.
+        :results: A sequence of GameStateMessage objects.
+        :return: None.
+        """
+        self.write_exchange(command, _rendered(results))
+
+    def write_exchange(self, command, messages):
+        """
+        This method records a command and the messages it returned, already
+        rendered.
+
+        :command: A string.
+        :messages: A sequence of (type tag, text) pairs.
+        :return: None.
+        """
+        self._file.write(
+            json.dumps(
+                {
+                    "command": command,
+                    "messages": [
+                        {"type": type_tag, "text": text} for type_tag, text in messages
+                    ],
+                }
+            )
+            + "\n"
+        )
+        self._file.flush()
+
+    def close(self):
+        """
+        This method closes the file.
+
+        :return: None.
+        """
+        self._file.close()
+
+
+class Divergence:
+    """
+    The first point at which a replayed transcript differs from its
+    recording: the command, and the messages recorded for it and returned
+    for it on replay. A transcript that can't be read, or a command that
+    raises an exception on replay, is also a divergence, with the error's
+    description in place of the messages returned.
+    """
+
+    __slots__ = "name", "index", "command", "expected", "actual"
+
+    def __init__(self, name, index, command, expected, actual):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :name: A string, the name of the transcript.
+        :index: An int, the index of the exchange that diverged, or None if
+        the transcript couldn't be read.
+        :command: A string, or None.
+        :expected: A tuple of (type tag, text) pairs, as recorded.
+        :actual: A tuple of (type tag, text) pairs, as replayed, or a string
+        describing an exception.
+        """
+        self.name = name
+        self.index = index
+        self.command = command
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self):
+        return f"<Divergence {self.name}:{self.index} command={self.command!r}>"
+
+    def describe(self):
+        """
+        This method returns a description of the divergence for a report:
+        where it happened, and the recorded and replayed messages.
+
+        :return: A string.
+        """
+        lines = [f"{self.name}, command {self.index}: {self.command!r}"]
+        lines.extend(f"  - {type_tag}: {text}" for type_tag, text in self.expected)
+        if isinstance(self.actual, str):
+            lines.append(f"  ! {self.actual}")
+        else:
+            lines.extend(f"  + {type_tag}: {text}" for type_tag, text in self.actual)
+        return "\n".join(lines)
+
+
+def replay_transcript(world_template, transcript, game_state=None):
+    """
+    This function replays a transcript on a fresh copy of a world, with dice
+    rolled from the transcript's seed, and compares what the game returns
+    for each command with what was recorded.
+
+    :world_template: A WorldTemplate object.
+    :transcript: A Transcript object.
+    :game_state: A GameState object from world_template.new_game_state() to
+    reset and replay on, or None to replay on a new copy.
+    :return: None if the replay matches the recording, otherwise a
+    Divergence object for the first command that doesn't.
+    """
+    if game_state is None:
+        game_state = world_template.new_game_state()
+    else:
+        world_template.reset_game_state(game_state)
+    previous_dice_roller = set_dice_roller(SeededDice(transcript.seed))
+    try:
+        command_processor = CommandProcessor(game_state)
+        for index, (command, expected) in enumerate(transcript.exchanges):
+            try:
+                actual = _rendered(command_processor.process(command))
+            except Exception as exception:
+                actual = f"{type(exception).__name__}: {exception}"
+            if actual != expected:
+                return Divergence(transcript.name, index, command, expected, actual)
+        return None
+    finally:
+        set_dice_roller(previous_dice_roller)
+
+
+class ReplayReport:
+    """
+    The result of a Replayer.run() call: how many transcripts and commands
+    were replayed and how long it took, and the divergences found.
+    """
+
+    __slots__ = "transcripts_replayed", "commands_replayed", "seconds", "divergences"
+
+    def __init__(self, transcripts_replayed, commands_replayed, seconds, divergences):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :transcripts_replayed: An int.
+        :commands_replayed: An int.
+        :seconds: A float, the wall-clock time the run took.
+        :divergences: A tuple of Divergence objects, in order of transcript
+        name.
+        """
+        self.transcripts_replayed = transcripts_replayed
+        self.commands_replayed = commands_replayed
+        self.seconds = seconds
+        self.divergences = divergences
+
+    @property
+    def passed(self):
+        """
+        This property returns True if every transcript replayed as recorded,
+        False otherwise.
+
+        :return: A boolean.
+        """
+        return not self.divergences
+
+    @property
+    def commands_per_second(self):
+        """
+        This property returns the number of commands replayed per second.
+
+        :return: A float.
+        """
+        return self.commands_replayed / self.seconds if self.seconds else 0.0
+
+    def summary(self):
+        """
+        This method returns a one-line summary of the run.
+
+        :return: A string.
+        """
+        return (
+            f"Replayed {self.transcripts_replayed} transcripts "
+            + f"({self.commands_replayed} commands) in {self.seconds:.2f}s, "
+            + f"{self.commands_per_second:.0f} commands/s; "
+            + f"{len(self.divergences)} diverged."
+        )
+
+
+def _replay_paths(world_template, paths):
+    # Replays each transcript file and returns the number of commands
+    # replayed and a list of divergences. Every transcript is replayed on
+    # the same GameState object, reset to the pristine world each time.
+    game_state = world_template.new_game_state()
+    commands_replayed = 0
+    divergences = list()
+    for path in paths:
+        try:
+            transcript = Transcript.load(path)
+        except (OSError, ValueError, KeyError, TypeError) as exception:
+            divergences.append(
+                Divergence(
+                    path, None, None, (), f"{type(exception).__name__}: {exception}"
+                )
+            )
+            continue
+        divergence = replay_transcript(world_template, transcript, game_state)
+        if divergence is None:
+            commands_replayed += len(transcript.exchanges)
+        else:
+            commands_replayed += divergence.index + 1
+            divergences.append(divergence)
+    return commands_replayed, divergences
+
+
+# Each worker process is given the world template once, when the pool
+# starts it.
+
+_worker_world_template = None
+
+
+def _init_worker(world_template):
+    global _worker_world_template
+    _worker_world_template = world_template
+
+
+def _replay_in_worker(paths):
+    return _replay_paths(_worker_world_template, paths)
+
+
+class Replayer:
+    """
+    A replayer for transcript files. run() replays them, sharded across a
+    pool of worker processes, and reports the divergences.
+    """
+
+    __slots__ = "world_template", "processes"
+
+    def __init__(self, world_template=None, processes=1):
+        """
+        This __init__ method stores its arguments.
+
+        :world_template: A WorldTemplate object; defaults to one built from
+        the game's own dungeon.
+        :processes: An int, the number of worker processes; 1 replays the
+        transcripts in this process.
+        """
+        self.world_template = (
+            WorldTemplate() if world_template is None else world_template
+        )
+        self.processes = processes
+
+    def run(self, paths):
+        """
+        This method replays the given transcript files and returns a
+        ReplayReport object.
+
+        :paths: An iterable of strings, the paths of the files.
+        :return: A ReplayReport object.
+        """
+        paths = sorted(paths)
+        start_time = time.perf_counter()
+        if self.processes > 1 and len(paths) > 1:
+            shard_size = -(-len(paths) // (self.processes * 4))
+            shards = [
+                paths[index : index + shard_size]
+                for index in range(0, len(paths), shard_size)
+            ]
+            with Pool(self.processes, _init_worker, (self.world_template,)) as pool:
+                results = pool.map(_replay_in_worker, shards)
+        else:
+            results = [_replay_paths(self.world_template, paths)]
+        seconds = time.perf_counter() - start_time
+        commands_replayed = sum(
+            shard_commands_replayed for shard_commands_replayed, _ in results
+        )
+        divergences = tuple(
+            divergence
+            for _, shard_divergences in results
+            for divergence in shard_divergences
+        )
+        return ReplayReport(len(paths), commands_replayed, seconds, divergences)
+
+    def run_directory(self, directory, suffix=".jsonl"):
+        """
+        This method replays every transcript file in a directory and its
+        subdirectories and returns a ReplayReport object.
+
+        :directory: A string, the path of the directory.
+        :suffix: A string; only files whose names end with it are replayed.
+        :return: A ReplayReport object.
+        """
+        return self.run(
+            os.path.join(dirpath, filename)
+            for dirpath, _, filenames in os.walk(directory)
+            for filename in filenames
+            if filename.endswith(suffix)
+        )
@@ -0,0 +1,229 @@
+#!/usr/bin/python3
+
+"""
+The SaveFile class, which persists a game session's state as returned by
+GameState.snapshot() to a compact binary file. The file is a header
+followed by a log of records. The first record holds every entry of the
+snapshot; each later save appends a record holding only the entries that
+changed since the save before it, so saving costs in proportion to what the
+player did rather than to the size of the world. Once the appended records
+outweigh the first one, or there are too many of them, the next save
+rewrites the file as a single record.
+
+The header is the magic number b'AGSAVE' and a format version. Each record
+is a kind byte (full or delta), the length of its payload, and the CRC32
+of its payload, followed by the payload: the record's entries as a JSON
+object, compressed with zlib. In a delta record, an entry whose value is
+null is a tombstone: the entry was removed from the snapshot since the save
+before it, and it's dropped when the records are replayed. A file that's cut
+short or fails a checksum raises a SaveFileError when it's read.
+"""
+
+import json
+import os
+import struct
+import zlib
+
+from advgame.errors import SaveFileError
+
+
+__all__ = ("SaveFile",)
+
+
+MAGIC = b"AGSAVE"
+
+# Version 2 records the character's name and class in the character's own
+# entry. Version 3 records entries removed since the last save as tombstones
+# in delta records.
+
+VERSION = 3
+
+_HEADER = struct.Struct(">6sH")
+
+_RECORD_HEADER = struct.Struct(">BII")
+
+_FULL_RECORD = 0
+_DELTA_RECORD = 1
+
+
+class SaveFile:
+    """
+    A save file for one game session. save() writes a GameState object's
+    state to it and load() reads it back into one.
+    """
+
+    __slots__ = (
+        "path",
+        "max_deltas",
+        "_saved",
+        "_delta_count",
+        "_full_size",
+        "_delta_size",
+    )
+
+    def __init__(self, path, max_deltas=32):
+        """
+        This __init__ method accepts the path of the file; nothing is read or
+        written until save() or load() is called.
+
+        :path: A string, the path of the save file.
+        :max_deltas: An int, the number of delta records after which the
+        next save rewrites the file.
+        """
+        self.path = path
+        self.max_deltas = max_deltas
+
+        # The JSON text of each entry as of the last save or load, used to
+        # find the entries that have changed; None until the file has been
+        # read or written.
+
+        self._saved = None
+        self._delta_count = 0
+        self._full_size = 0
+        self._delta_size = 0
+
+    def exists(self):
+        """
+        This method returns True if the save file exists, False otherwise.
+
+        :return: A boolean.
+        """
+        return os.path.exists(self.path)
+
+    def save(self, game_state):
+        """
+        This method saves the state of the given GameState object. If the file
+        has already been saved to or loaded from, only the entries that have
+        changed are appended; otherwise, or if the file is due to be
+        compacted, it's rewritten in full.
+
+        :game_state: A GameState object.
+        :return: A boolean, True if the file was rewritten in full, False if a
+        delta was appended.
+        """
+        encoded = {
+            key: json.dumps(entry, separators=(",", ":"))
+            for key, entry in game_state.snapshot().items()
+        }
+        if self._saved is None and self.exists():
+            self._read()
+        if (
+            self._saved is None
+            or self._delta_count >= self.max_deltas
+            or self._delta_size > self._full_size
+        ):
+            self._write_full(encoded)
+            return True
+        delta = {
+            key: entry_json
+            for key, entry_json in encoded.items()
+            if self._saved.get(key) != entry_json
+        }
+        removed = self._saved.keys() - encoded.keys()
+        for key in removed:
+            delta[key] = "null"
+        if delta:
+            record = self._record(_DELTA_RECORD, delta)
+            with open(self.path, "ab") as save_file:
+                save_file.write(record)
+            self._delta_count += 1
+            self._delta_size += len(record)
+        self._saved.update(delta)
+        for key in removed:
+            del self._saved[key]
+        return False
+
+    def load(self, game_state):
+        """
+        This method restores the given GameState object from the save file.
+        It raises a FileNotFoundError if there's no save file, and a
+        SaveFileError if it can't be read.
+
+        :game_state: A GameState object.
+        :return: None.
+        """
+        self._read()
+        game_state.restore(
+            {key: json.loads(entry_json) for key, entry_json in self._saved.items()}
+        )
+
+    def _record(self, kind, encoded):
+        # Builds one record from a dict of entry keys and their JSON text.
+        payload = zlib.compress(
+            (
+                "{"
+                + ",".join(
+                    f"{json.dumps(key)}:{entry_json}"
+                    for key, entry_json in encoded.items()
+                )
+                + "}"
+            ).encode("utf-8")
+        )
+        return _RECORD_HEADER.pack(kind, len(payload), zlib.crc32(payload)) + payload
+
+    def _write_full(self, encoded):
+        # The file is written beside the old one and moved over it, so a
+        # crash partway through leaves the old file intact.
+        record = self._record(_FULL_RECORD, encoded)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as save_file:
+            save_file.write(_HEADER.pack(MAGIC, VERSION) + record)
+        os.replace(temp_path, self.path)
+        self._saved = dict(encoded)
+        self._delta_count = 0
+        self._full_size = len(record)
+        self._delta_size = 0
+
+    def _read(self):
+        # Reads the whole file, checks it and merges its records into
+        # self._saved.
+        with open(self.path, "rb") as save_file:
+            data = memoryview(save_file.read())
+        if len(data) < _HEADER.size:
+            raise SaveFileError(f"{self.path} is too short to be a save file")
+        magic, version = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise SaveFileError(f"{self.path} isn't a save file")
+        if version != VERSION:
+            raise SaveFileError(f"{self.path} has unsupported version {version}")
+        saved = dict()
+        delta_count = full_size = delta_size = 0
+        offset = _HEADER.size
+        while offset < len(data):
+            if offset + _RECORD_HEADER.size > len(data):
+                raise SaveFileError(f"{self.path} ends partway through a record")
+            kind, length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+            payload = data[
+                offset + _RECORD_HEADER.size : offset + _RECORD_HEADER.size + length
+            ]
+            if len(payload) != length or zlib.crc32(payload) != checksum:
+                raise SaveFileError(f"{self.path} fails its checksum")
+            record_size = _RECORD_HEADER.size + length
+            offset += record_size
+
+            # Each entry is kept as JSON text so later saves can compare
+            # against it; it's only decoded into objects by load().
+
+            entries = json.loads(zlib.decompress(payload))
+            encoded = {
+                key: json.dumps(entry, separators=(",", ":"))
+                for key, entry in entries.items()
+            }
+            if kind == _FULL_RECORD:
+                saved = encoded
+                delta_count, full_size, delta_size = 0, record_size, 0
+            elif kind == _DELTA_RECORD:
+                saved.update(encoded)
+                for key, entry in entries.items():
+                    if entry is None:
+                        del saved[key]
+                delta_count += 1
+                delta_size += record_size
+            else:
+                raise SaveFileError(f"{self.path} has a record of unknown kind {kind}")
+        if full_size == 0:
+            raise SaveFileError(f"{self.path} has no full record")
+        self._saved = saved
+        self._delta_count = delta_count
+        self._full_size = full_size
+        self._delta_size = delta_size
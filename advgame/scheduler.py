@@ -0,0 +1,379 @@
+#!/usr/bin/python3
+
+"""
+The advgame.scheduler module implements a tick-based scheduler that lets
+creatures act on their own: regenerating hit points, wandering between
+rooms through open doors, or patrolling a fixed route. Actions are kept in a
+heap ordered by the tick they're next due on, so advancing the clock only
+touches the actions that are due, however many creatures the world holds.
+
+The scheduler can be advanced by hand with advance(), or run as an asyncio
+task with run(), which advances it one tick per interval.
+"""
+
+import asyncio
+import random
+
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from heapq import heappop, heappush
+
+from advgame.errors import InternalError
+
+
+__all__ = (
+    "CreatureAction",
+    "CreatureScheduler",
+    "Patrol",
+    "Regenerate",
+    "RegenerateAll",
+    "Wander",
+)
+
+
+class CreatureAction(ABC):
+    """
+    The abstract base class for a recurring creature action. A subclass
+    implements fire(), which performs the action once and returns True if the
+    action should be scheduled again after another period, or False if it's
+    done.
+    """
+
+    __slots__ = "period", "cancelled"
+
+    def __init__(self, period):
+        """
+        This __init__ method sets the action's period.
+
+        :period: An int, the number of ticks between firings.
+        """
+        if period < 1:
+            raise InternalError("a CreatureAction's period must be at least 1 tick")
+        self.period = period
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        This method cancels the action; it's discarded the next time it comes
+        due instead of firing.
+
+        :return: None.
+        """
+        self.cancelled = True
+
+    @abstractmethod
+    def fire(self, scheduler):
+        """
+        This method performs the action once.
+
+        :scheduler: The CreatureScheduler object firing the action.
+        :return: A boolean, True if the action should fire again.
+        """
+        pass
+
+
+class Regenerate(CreatureAction):
+    """
+    A creature regains hit points every period, up to its maximum, until it
+    dies or leaves the world.
+    """
+
+    __slots__ = "creature", "amount", "room_internal_name"
+
+    def __init__(self, creature, amount=1, period=10, room_internal_name=None):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :creature: A Creature object.
+        :amount: An int, the hit points regained each period.
+        :period: An int, the number of ticks between firings.
+        :room_internal_name: A string, the internal name of the room the
+        creature is in, or None to look it up when the action first fires.
+        """
+        super().__init__(period)
+        self.creature = creature
+        self.amount = amount
+        self.room_internal_name = room_internal_name
+
+    def fire(self, scheduler):
+        # The creature's room is locked while its hit points change, like a
+        # roaming action's. If the creature was moved since the room was
+        # last seen, it's looked up again, and the lookup is repeated if it
+        # moves again before the lock is taken.
+
+        while True:
+            room_internal_name = self.room_internal_name
+            if room_internal_name is None or (
+                scheduler.rooms_state.get(room_internal_name).creature_here
+                is not self.creature
+            ):
+                room_internal_name = scheduler.rooms_state.find_creature(self.creature)
+                if room_internal_name is None:
+                    return False
+                self.room_internal_name = room_internal_name
+            with scheduler.locked(room_internal_name):
+                room = scheduler.rooms_state.get(room_internal_name)
+                if room.creature_here is not self.creature:
+                    continue
+                if self.creature.is_dead:
+                    return False
+                self.creature.heal_damage(self.amount)
+                return True
+
+
+class RegenerateAll(CreatureAction):
+    """
+    Every living creature in a CreatureTable regains hit points every period,
+    up to its maximum, in one pass over the table.
+    """
+
+    __slots__ = "table", "amount"
+
+    def __init__(self, table, amount=1, period=10):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :table: A CreatureTable object.
+        :amount: An int, the hit points regained each period.
+        :period: An int, the number of ticks between firings.
+        """
+        super().__init__(period)
+        self.table = table
+        self.amount = amount
+
+    def fire(self, scheduler):
+        self.table.heal_all(self.amount)
+        return True
+
+
+class _RoamingAction(CreatureAction):
+    # The shared logic of Wander and Patrol: both act on whatever creature
+    # is in the room they're tracking, move it through an open door into
+    # an empty, unoccupied room, and stop once there's no creature left
+    # in the room to move (because it was killed).
+
+    __slots__ = ("room_internal_name",)
+
+    def __init__(self, room_internal_name, period):
+        super().__init__(period)
+        self.room_internal_name = room_internal_name
+
+    def fire(self, scheduler):
+        with scheduler.locked(self.room_internal_name):
+            room = scheduler.rooms_state.get(self.room_internal_name)
+            if room.creature_here is None:
+                return False
+            if scheduler.is_occupied(room.internal_name):
+                return True
+            destination = self._choose_destination(scheduler, room)
+            if destination is not None:
+                scheduler.rooms_state.move_creature(
+                    room.internal_name, destination.internal_name
+                )
+                self.room_internal_name = destination.internal_name
+            return True
+
+    def _exits(self, scheduler, room):
+        # Yields each room reachable from the given room through an open
+        # door that a creature could move into now.
+        for door in room.doors:
+            if door.is_closed or door.is_exit:
+                continue
+            other_room = scheduler.rooms_state.get(
+                door.other_room_internal_name(room.internal_name)
+            )
+            if other_room.creature_here is not None or scheduler.is_occupied(
+                other_room.internal_name
+            ):
+                continue
+            yield other_room
+
+    @abstractmethod
+    def _choose_destination(self, scheduler, room):
+        # Returns the room to move the creature into, or None to leave it
+        # where it is this period.
+        pass
+
+
+class Wander(_RoamingAction):
+    """
+    The creature in a room moves to a random neighboring room every period.
+    It only moves through open doors, never into a room that already has a
+    creature or into or out of a room a player is in.
+    """
+
+    __slots__ = ("rng",)
+
+    def __init__(self, room_internal_name, period=5, rng=None):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :room_internal_name: A string, the internal name of the room the
+        creature starts out in.
+        :period: An int, the number of ticks between moves.
+        :rng: A random.Random object, or None to use the random module.
+        """
+        super().__init__(room_internal_name, period)
+        self.rng = rng or random
+
+    def _choose_destination(self, scheduler, room):
+        exits = list(self._exits(scheduler, room))
+        return self.rng.choice(exits) if exits else None
+
+
+class Patrol(_RoamingAction):
+    """
+    The creature in a room walks a fixed route of rooms, one step every
+    period, returning to the start of the route at its end. If the next room
+    on the route can't be entered yet, it waits.
+    """
+
+    __slots__ = "route", "_route_index"
+
+    def __init__(self, route, period=5):
+        """
+        This __init__ method stores its arguments to object attributes. Each
+        room on the route must be adjacent to the one before it, and the last
+        to the first.
+
+        :route: A sequence of room internal names; the creature starts out in
+        the first.
+        :period: An int, the number of ticks between steps.
+        """
+        if len(route) < 2:
+            raise InternalError("a Patrol route must have at least two rooms")
+        super().__init__(route[0], period)
+        self.route = tuple(route)
+        self._route_index = 0
+
+    def _choose_destination(self, scheduler, room):
+        next_index = (self._route_index + 1) % len(self.route)
+        for other_room in self._exits(scheduler, room):
+            if other_room.internal_name == self.route[next_index]:
+                self._route_index = next_index
+                return other_room
+        return None
+
+
+class CreatureScheduler:
+    """
+    This class keeps the recurring creature actions in a heap ordered by the
+    tick each is next due on.
+    """
+
+    __slots__ = "rooms_state", "_heap", "_tick", "_sequence", "_occupied", "_locker"
+
+    def __init__(self, rooms_state, occupied=None, locker=None):
+        """
+        This __init__ method creates a scheduler at tick 0 with no actions.
+
+        :rooms_state: A RoomsState object.
+        :occupied: A callable that accepts a room internal name and returns
+        True if a player is in that room, or None to check the rooms_state
+        object's cursor.
+        :locker: A callable that accepts a room internal name and returns a
+        context manager that locks that room and its neighbors, or None if
+        the rooms aren't shared between threads.
+        """
+        self.rooms_state = rooms_state
+        self._heap = list()
+        self._tick = 0
+        self._sequence = 0
+        self._occupied = occupied
+        self._locker = locker
+
+    @property
+    def tick(self):
+        """
+        This property returns the current tick.
+
+        :return: An int.
+        """
+        return self._tick
+
+    def pending_count(self):
+        """
+        This method returns the number of actions scheduled, including
+        cancelled ones that haven't come due yet.
+
+        :return: An int.
+        """
+        return len(self._heap)
+
+    def schedule(self, action, delay=None):
+        """
+        This method schedules an action to first fire after the given delay.
+
+        :action: A CreatureAction object.
+        :delay: An int, the number of ticks until the action first fires, or
+        None to wait one period.
+        :return: The action, which can be cancelled with its cancel() method.
+        """
+        delay = action.period if delay is None else delay
+        self._push(self._tick + max(delay, 1), action)
+        return action
+
+    def _push(self, due_tick, action):
+        # The sequence number breaks ties between actions due on the same
+        # tick, so they fire in the order scheduled and the actions
+        # themselves are never compared.
+        heappush(self._heap, (due_tick, self._sequence, action))
+        self._sequence += 1
+
+    def advance(self, ticks=1):
+        """
+        This method advances the clock by the given number of ticks, firing
+        every action that comes due in that time in order.
+
+        :ticks: An int.
+        :return: An int, the number of actions fired.
+        """
+        target_tick = self._tick + ticks
+        fired = 0
+        heap = self._heap
+        while heap and heap[0][0] <= target_tick:
+            due_tick, _, action = heappop(heap)
+            if action.cancelled:
+                continue
+            self._tick = due_tick
+            fired += 1
+            if action.fire(self):
+                self._push(due_tick + action.period, action)
+        self._tick = target_tick
+        return fired
+
+    async def run(self, interval=1.0, stop_event=None):
+        """
+        This coroutine advances the scheduler one tick per interval until the
+        stop event is set, or forever if there isn't one.
+
+        :interval: A float, the number of seconds per tick.
+        :stop_event: An asyncio.Event object, or None.
+        :return: None.
+        """
+        while stop_event is None or not stop_event.is_set():
+            await asyncio.sleep(interval)
+            self.advance()
+
+    def is_occupied(self, room_internal_name):
+        """
+        This method returns True if a player is in the given room.
+
+        :room_internal_name: A string.
+        :return: A boolean.
+        """
+        if self._occupied is None:
+            return room_internal_name == self.rooms_state.cursor.internal_name
+        return self._occupied(room_internal_name)
+
+    def locked(self, room_internal_name):
+        """
+        This method returns a context manager that holds the locks for the
+        given room and its neighbors while an action runs.
+
+        :room_internal_name: A string.
+        :return: A context manager.
+        """
+        if self._locker is None:
+            return nullcontext()
+        return self._locker(room_internal_name)
@@ -0,0 +1,422 @@
+#!/usr/bin/python3
+
+"""
+The advgame.solver module implements a search of a world's game tree for
+the shortest sequence of commands that wins the game. It treats a
+CommandProcessor and a GameState as a state machine: from each state it
+tries every command that could make progress, and identifies the states
+that result by a canonical hash of their snapshot, so a state reached by
+two different sequences of commands is only explored once.
+
+The search is breadth-first, so the first winning sequence it finds is as
+short as any, and each level of the tree can be expanded across a pool of
+worker processes. Dice are rolled by a dice object instead of at random,
+either for their average, which makes the game deterministic, or from a
+seed, which makes it reproducible.
+"""
+
+import json
+
+from hashlib import blake2b
+from math import ceil
+from multiprocessing import Pool
+from random import Random
+
+from advgame.elements.containers import Chest, Corpse
+from advgame.elements.items import Key, Potion
+from advgame.errors import InternalError
+from advgame.process import CommandProcessor
+from advgame.statemsgs.leave import WonTheGameGSM
+from advgame.utils import set_dice_roller
+from advgame.world import build_game_state
+
+
+__all__ = (
+    "ExpectedDice",
+    "SeededDice",
+    "Solution",
+    "Solver",
+    "legal_commands",
+    "state_key",
+)
+
+
+# The outcome of a command, as far as the search is concerned: it won the
+# game, it ended the game some other way, or play goes on.
+
+_WON = "won"
+_ENDED = "ended"
+
+
+class ExpectedDice:
+    """
+    A dice roller that rolls each die for its average, rounding up, so that
+    every roll of the same dice has the same result.
+    """
+
+    __slots__ = ()
+
+    def reseed(self, *keys):
+        """
+        This method does nothing; expected rolls don't depend on what's
+        being rolled for.
+
+        :*keys: Any values.
+        :return: None.
+        """
+        pass
+
+    def __call__(self, number_of_dice, sidedness_of_dice, modifier_to_roll):
+        return (number_of_dice * (sidedness_of_dice + 1) + 1) // 2 + modifier_to_roll
+
+
+class SeededDice:
+    """
+    A dice roller that rolls from a seeded random number generator. The
+    solver reseeds it from the state and command before each command, so
+    a command played from a state always rolls the same, in whatever order
+    and in whichever process the states are explored.
+    """
+
+    __slots__ = "seed", "_rng"
+
+    def __init__(self, seed=0):
+        """
+        This __init__ method creates a roller with the given seed.
+
+        :seed: An int.
+        """
+        self.seed = seed
+        self._rng = Random(seed)
+
+    def reseed(self, *keys):
+        """
+        This method reseeds the generator from the roller's seed and the given
+        keys.
+
+        :*keys: Values with a stable repr(), such as strings and bytes.
+        :return: None.
+        """
+        self._rng = Random(repr((self.seed,) + keys))
+
+    def __call__(self, number_of_dice, sidedness_of_dice, modifier_to_roll):
+        return (
+            sum(self._rng.randint(1, sidedness_of_dice) for _ in range(number_of_dice))
+            + modifier_to_roll
+        )
+
+
+def _canonical(value):
+    # Item lists are recorded in the order the items were added, which
+    # doesn't matter to the game, so they're sorted.
+    if isinstance(value, dict):
+        return {key: _canonical(entry) for key, entry in value.items()}
+    elif isinstance(value, list):
+        if all(
+            isinstance(entry, list) and len(entry) == 2 and isinstance(entry[1], str)
+            for entry in value
+        ):
+            return sorted(value, key=lambda entry: entry[1])
+        return [_canonical(entry) for entry in value]
+    return value
+
+
+def _snapshot_key(snapshot):
+    canonical = _canonical(
+        {key: entry for key, entry in snapshot.items() if key != "automap"}
+    )
+    return blake2b(
+        json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode("utf-8"),
+        digest_size=16,
+    ).digest()
+
+
+def state_key(game_state):
+    """
+    This function returns a canonical hash of a GameState object's state. Two
+    states that would play the same from here on have the same key: the
+    automap, which only records where the character has been, and the order
+    items were added to each container are left out.
+
+    :game_state: A GameState object.
+    :return: A bytes object.
+    """
+    return _snapshot_key(game_state.snapshot())
+
+
+def legal_commands(game_state):
+    """
+    This function returns the commands that could make progress toward
+    winning from the given GameState object's state: leaving by or unlocking
+    each door, unlocking, opening and taking keys and potions from the
+    container, attacking the creature, picking up keys and potions, and
+    drinking or casting spells when they'd help. Commands that can't help,
+    like CLOSE, LOCK and DROP, aren't included; neither are changes of
+    equipment.
+
+    :game_state: A GameState object, with the game begun.
+    :return: A list of strings.
+    """
+    character = game_state.character
+    room = game_state.rooms_state.cursor
+    is_thief = character.character_class == "Thief"
+    inventory_titles = {item.title for _, item in character.inventory.values()}
+    commands = list()
+
+    # A door doesn't have to be open to leave by it, only unlocked.
+
+    for door in room.doors:
+        if not door.is_locked:
+            commands.append(f"leave via {door.title}")
+            continue
+        if "door key" in inventory_titles:
+            commands.append(f"unlock {door.title}")
+        if is_thief:
+            commands.append(f"pick lock on {door.title}")
+
+    container = room.container_here
+    if isinstance(container, Chest) and container.is_locked:
+        if "chest key" in inventory_titles:
+            commands.append(f"unlock {container.title}")
+        if is_thief:
+            commands.append(f"pick lock on {container.title}")
+    elif isinstance(container, Chest) and container.is_closed:
+        commands.append(f"open {container.title}")
+    elif isinstance(container, (Chest, Corpse)):
+        for item_qty, item in container.values():
+            if isinstance(item, (Key, Potion)):
+                commands.append(f"take {item_qty} {item.title} from {container.title}")
+
+    if room.creature_here is not None:
+        commands.append(f"attack {room.creature_here.title}")
+        if character.character_class == "Mage":
+            commands.append("cast spell")
+    if room.items_here is not None:
+        for item_qty, item in room.items_here.values():
+            if isinstance(item, (Key, Potion)):
+                commands.append(f"pick up {item_qty} {item.title}")
+
+    if character.hit_points < character.hit_point_total:
+        if "health potion" in inventory_titles:
+            commands.append("drink health potion")
+        if character.character_class == "Priest":
+            commands.append("cast spell")
+    if (
+        "mana potion" in inventory_titles
+        and character.mana_points < character.mana_point_total
+    ):
+        commands.append("drink mana potion")
+    return commands
+
+
+class _Expander:
+    # Expands states into the states one command away. The solver and each
+    # of its worker processes have one. States are passed around as
+    # snapshots, and cloning a state is restoring its snapshot onto the
+    # one GameState object the expander plays every command on, which is
+    # much cheaper than copying a whole GameState.
+
+    __slots__ = "_dice", "_game_state", "root_key", "root_snapshot"
+
+    def __init__(self, world_sections, character_class, dice):
+        self._dice = dice
+        self._dice.reseed("root")
+        self._game_state = build_game_state(world_sections)
+        command_processor = CommandProcessor(self._game_state)
+        for command in (
+            "set name to Solver",
+            f"set class to {character_class}",
+            "begin game",
+        ):
+            command_processor.process(command)
+        if not self._game_state.game_has_begun:
+            raise InternalError(f"invalid character class: {character_class}")
+        self.root_snapshot = self._game_state.snapshot()
+        self.root_key = _snapshot_key(self.root_snapshot)
+
+    def expand_batch(self, batch):
+        # Returns a list of (parent key, command, child key, child
+        # snapshot, outcome) tuples for a list of (key, snapshot) pairs.
+        # Commands that don't change the state are left out.
+        children = list()
+        game_state = self._game_state
+        for parent_key, parent_snapshot in batch:
+            game_state.restore(parent_snapshot)
+            for command in legal_commands(game_state):
+                game_state.restore(parent_snapshot)
+                self._dice.reseed(parent_key, command)
+                results = CommandProcessor(game_state).process(command)
+                child_snapshot = game_state.snapshot()
+                child_key = _snapshot_key(child_snapshot)
+                if child_key == parent_key:
+                    continue
+                if isinstance(results[-1], WonTheGameGSM):
+                    outcome = _WON
+                elif game_state.game_has_ended:
+                    outcome = _ENDED
+                else:
+                    outcome = None
+                children.append(
+                    (parent_key, command, child_key, child_snapshot, outcome)
+                )
+        return children
+
+
+# Each worker process builds its own _Expander when the pool starts it.
+
+_worker_expander = None
+
+
+def _init_worker(world_sections, character_class, dice):
+    global _worker_expander
+    set_dice_roller(dice)
+    _worker_expander = _Expander(world_sections, character_class, dice)
+
+
+def _expand_in_worker(batch):
+    return _worker_expander.expand_batch(batch)
+
+
+class Solution:
+    """
+    The result of a Solver.solve() run: the shortest winning sequence of
+    commands, if one was found, and the number of distinct states explored.
+    """
+
+    __slots__ = "commands", "states_explored"
+
+    def __init__(self, commands, states_explored):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :commands: A tuple of command strings, or None if no win was found.
+        :states_explored: An int.
+        """
+        self.commands = commands
+        self.states_explored = states_explored
+
+    @property
+    def is_winnable(self):
+        """
+        This property returns True if a winning sequence of commands was
+        found, False otherwise.
+
+        :return: A boolean.
+        """
+        return self.commands is not None
+
+    @property
+    def move_count(self):
+        """
+        This property returns the number of commands in the winning sequence,
+        not counting the ones that set up the character, or None if no win was
+        found.
+
+        :return: An int or None.
+        """
+        return None if self.commands is None else len(self.commands)
+
+
+class Solver:
+    """
+    A breadth-first solver for a world. solve() searches for the shortest
+    sequence of commands that takes a character of the given class from the
+    start of the game to the dungeon's exit.
+    """
+
+    __slots__ = (
+        "_world_sections",
+        "character_class",
+        "dice",
+        "processes",
+        "max_depth",
+    )
+
+    def __init__(
+        self,
+        world_sections,
+        character_class="Warrior",
+        dice=None,
+        processes=1,
+        max_depth=200,
+    ):
+        """
+        This __init__ method stores its arguments; nothing is searched until
+        solve() is called.
+
+        :world_sections: A WorldSections object.
+        :character_class: A string, the class of character to play.
+        :dice: An ExpectedDice or SeededDice object; defaults to an
+        ExpectedDice object.
+        :processes: An int, the number of worker processes to expand each
+        level of the tree with; 1 expands it in this process.
+        :max_depth: An int, the greatest number of commands to search to.
+        """
+        self._world_sections = world_sections
+        self.character_class = character_class
+        self.dice = ExpectedDice() if dice is None else dice
+        self.processes = processes
+        self.max_depth = max_depth
+
+    def solve(self):
+        """
+        This method searches the game tree breadth-first and returns a
+        Solution object. The search ends when a winning state is found, when
+        every reachable state has been explored, or at max_depth. It returns
+        the same solution however many processes are used.
+
+        :return: A Solution object.
+        """
+        previous_dice_roller = set_dice_roller(self.dice)
+        pool = None
+        try:
+            expander = _Expander(self._world_sections, self.character_class, self.dice)
+            if self.processes > 1:
+                pool = Pool(
+                    self.processes,
+                    _init_worker,
+                    (self._world_sections, self.character_class, self.dice),
+                )
+
+            # Each state's key maps to the key of the state it was first
+            # reached from and the command that reached it; this is both
+            # the transposition table and the way back to the start.
+
+            parents = {expander.root_key: None}
+            frontier = [(expander.root_key, expander.root_snapshot)]
+            for _ in range(self.max_depth):
+                if not frontier:
+                    break
+                batch_size = ceil(len(frontier) / (self.processes * 4))
+                batches = [
+                    frontier[index : index + batch_size]
+                    for index in range(0, len(frontier), batch_size)
+                ]
+                if pool is None:
+                    expanded = map(expander.expand_batch, batches)
+                else:
+                    expanded = pool.map(_expand_in_worker, batches)
+                frontier = list()
+                for children in expanded:
+                    for parent_key, command, key, snapshot, outcome in children:
+                        if key in parents:
+                            continue
+                        parents[key] = (parent_key, command)
+                        if outcome == _WON:
+                            return Solution(self._path(parents, key), len(parents))
+                        elif outcome is None:
+                            frontier.append((key, snapshot))
+            return Solution(None, len(parents))
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            set_dice_roller(previous_dice_roller)
+
+    @staticmethod
+    def _path(parents, key):
+        commands = list()
+        while parents[key] is not None:
+            key, command = parents[key]
+            commands.append(command)
+        return tuple(reversed(commands))
@@ -44,8 +44,12 @@ from advgame.statemsgs.drop import (
     TryingToDropItemYouDontHaveGSM,
     TryingToDropMoreThanYouHaveGSM,
 )
-from advgame.statemsgs.equip import ClassCantUseItemGSM, NoSuchItemInInventoryGSM
-from advgame.statemsgs.gsm import GameStateMessage
+from advgame.statemsgs.equip import (
+    ClassCantUseItemGSM,
+    ItemNotEquippableGSM,
+    NoSuchItemInInventoryGSM,
+)
+from advgame.statemsgs.gsm import GameStateMessage, message_catalog, results_to_json
 from advgame.statemsgs.help_ import (
     NotRecognizedGSM,
     DisplayCommandsGSM,
@@ -53,6 +57,11 @@ from advgame.statemsgs.help_ import (
 )
 from advgame.statemsgs.inven import DisplayInventoryGSM
 from advgame.statemsgs.leave import DoorIsLockedGSM, LeftRoomGSM, WonTheGameGSM
+from advgame.statemsgs.load import (
+    GameLoadedGSM,
+    NoSavedGameGSM,
+    SavedGameCorruptGSM,
+)
 from advgame.statemsgs.lock import (
     DontPossessCorrectKeyGSM,
     ElementNotLockableGSM,
@@ -67,6 +76,7 @@ from advgame.statemsgs.lookat import (
     FoundItemOrItemsHereGSM,
     FoundNothingGSM,
 )
+from advgame.statemsgs.map_ import DisplayMapGSM
 from advgame.statemsgs.open_ import (
     ElementNotOpenableGSM,
     ElementHasBeenOpenedGSM,
@@ -95,6 +105,7 @@ from advgame.statemsgs.put import (
 )
 from advgame.statemsgs.quit import HaveQuitTheGameGSM
 from advgame.statemsgs.reroll import NameOrClassNotSetGSM
+from advgame.statemsgs.save import GameSavedGSM, SavingUnavailableGSM
 from advgame.statemsgs.setcls import ClassSetGSM, InvalidClassGSM
 from advgame.statemsgs.setname import InvalidPartGSM, NameSetGSM
 from advgame.statemsgs.status import StatusOutputGSM
@@ -146,6 +157,7 @@ __all__ = (
     "DisplayCommandsGSM",
     "DisplayHelpForCommandGSM",
     "DisplayInventoryGSM",
+    "DisplayMapGSM",
     "DisplayRolledStatsGSM",
     "DontPossessCorrectKeyGSM",
     "DoorIsLockedGSM",
@@ -168,12 +180,15 @@ __all__ = (
     "FoundItemOrItemsHereGSM",
     "FoundNothingGSM",
     "GameBeginsGSM",
+    "GameLoadedGSM",
+    "GameSavedGSM",
     "GameStateMessage",
     "HaveQuitTheGameGSM",
     "InsufficientManaGSM",
     "InvalidClassGSM",
     "InvalidPartGSM",
     "ItemEquippedGSM",
+    "ItemNotEquippableGSM",
     "ItemNotEquippedGSM",
     "ItemNotFoundGSM",
     "ItemNotFoundInContainerGSM",
@@ -186,9 +201,12 @@ __all__ = (
     "NameOrClassNotSetGSM",
     "NameSetGSM",
     "NoCreatureToTargetGSM",
+    "NoSavedGameGSM",
     "NotRecognizedGSM",
     "OpponentNotFoundGSM",
     "PutAmountOfItemGSM",
+    "SavedGameCorruptGSM",
+    "SavingUnavailableGSM",
     "StatusOutputGSM",
     "TargetHasBeenUnlockedGSM",
     "TargetNotFoundGSM",
@@ -201,6 +219,8 @@ __all__ = (
     "UnderwentHealingEffectGSM",
     "WonTheGameGSM",
     "YouHaveNoWeaponOrWandEquippedGSM",
+    "message_catalog",
+    "results_to_json",
     "attack",
     "be_atkd",
     "begin",
@@ -213,14 +233,17 @@ __all__ = (
     "help_",
     "inven",
     "leave",
+    "load",
     "lock",
     "lookat",
+    "map_",
     "open_",
     "pickup",
     "pklock",
     "put",
     "quit",
     "reroll",
+    "save",
     "setcls",
     "setname",
     "status",
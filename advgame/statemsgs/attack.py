@@ -21,7 +21,7 @@ class AttackHitGSM(GameStateMessage):
     message includes a clause about the foe turning to attack.
     """
 
-    __slots__ = "creature_title", "damage_done", "creature_slain"
+    __slots__ = "creature_title", "damage_done", "creature_slain", "weapon_type"
 
     @property
     def message(self):
@@ -19,15 +19,14 @@ class AttackedAndHitGSM(GameStateMessage):
 
     __slots__ = "creature_title", "damage_done", "hit_points_left"
 
-    @property
-    def message(self):
-        # This message property informs the player of the effect of a
-        # creature's attack on their hit points.
-        return (
-            f"The {self.creature_title} attacks! Their attack hits. They did "
-            + f"{self.damage_done} damage! You have {self.hit_points_left} hit "
-            + "points left."
+    # This template informs the player of the effect of a
+    # creature's attack on their hit points.
+    templates = {
+        "default": (
+            "The {creature_title} attacks! Their attack hits. They did {damage_done} "
+            "damage! You have {hit_points_left} hit points left."
         )
+    }
 
     def __init__(self, creature_title, damage_done, hit_points_left):
         self.creature_title = creature_title
@@ -43,9 +42,7 @@ class AttackedAndNotHitGSM(GameStateMessage):
 
     __slots__ = ("creature_title",)
 
-    @property
-    def message(self):
-        return f"The {self.creature_title} attacks! Their attack misses."
+    templates = {"default": "The {creature_title} attacks! Their attack misses."}
 
     def __init__(self, creature_title):
         self.creature_title = creature_title
@@ -59,9 +56,9 @@ class CharacterDeathGSM(GameStateMessage):
     exiting the program.
     """
 
-    @property
-    def message(self):
-        return "You have died!"
+    __slots__ = ()
+
+    templates = {"default": "You have died!"}
 
     def __init__(self):
         pass
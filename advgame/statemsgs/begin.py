@@ -15,9 +15,9 @@ class GameBeginsGSM(GameStateMessage):
     The game has begun.
     """
 
-    @property
-    def message(self):
-        return "The game has begun!"
+    __slots__ = ()
+
+    templates = {"default": "The game has begun!"}
 
     def __init__(self):
         pass
@@ -18,7 +18,7 @@ class CastDamagingSpellGSM(GameStateMessage):
     was slain, and adds a 'they turn to attack' sentence if not.
     """
 
-    __slots__ = "creature_title", "damage_dealt"
+    __slots__ = "creature_title", "damage_dealt", "creature_slain"
 
     @property
     def message(self):
@@ -57,9 +57,7 @@ class CastHealingSpellGSM(GameStateMessage):
 
     __slots__ = ()
 
-    @property
-    def message(self):
-        return "You cast a healing spell on yourself."
+    templates = {"default": "You cast a healing spell on yourself."}
 
     def __init__(self):
         pass
@@ -73,13 +71,13 @@ class InsufficientManaGSM(GameStateMessage):
 
     __slots__ = "current_mana_points", "mana_point_total", "spell_mana_cost"
 
-    @property
-    def message(self):
-        return (
-            f"You don't have enough mana points to cast a spell. Casting a "
-            + f"spell costs {self.spell_mana_cost} mana points. Your mana "
-            + f"points are {self.current_mana_points}/{self.mana_point_total}."
+    templates = {
+        "default": (
+            "You don't have enough mana points to cast a spell. Casting a spell costs "
+            "{spell_mana_cost} mana points. Your mana points are "
+            "{current_mana_points}/{mana_point_total}."
         )
+    }
 
     def __init__(self, current_mana_points, mana_point_total, spell_mana_cost):
         self.current_mana_points = current_mana_points
@@ -95,9 +93,11 @@ class NoCreatureToTargetGSM(GameStateMessage):
 
     __slots__ = ()
 
-    @property
-    def message(self):
-        return "You can't cast magic missile here; there is no creature here to target."
+    templates = {
+        "default": (
+            "You can't cast magic missile here; there is no creature here to target."
+        )
+    }
 
     def __init__(self):
         pass
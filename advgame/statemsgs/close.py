@@ -19,18 +19,18 @@ class ElementNotCloseableGSM(GameStateMessage):
 
     __slots__ = "target_title", "target_type"
 
-    @property
-    def message(self):
-        if self.target_type == "armor":
-            return (
-                f"You can't close the {self.target_title}; suits of "
-                + f"{self.target_type} are not closeable."
-            )
-        else:
-            return (
-                f"You can't close the {self.target_title}; "
-                + f"{self.target_type}s are not closeable."
-            )
+    templates = {
+        "armor": (
+            "You can't close the {target_title}; suits of {target_type} are not "
+            "closeable."
+        ),
+        "default": (
+            "You can't close the {target_title}; {target_type}s are not closeable."
+        ),
+    }
+
+    def variant(self):
+        return "armor" if self.target_type == "armor" else "default"
 
     def __init__(self, target_title, target_type):
         self.target_title = target_title
@@ -45,9 +45,7 @@ class ElementHasBeenClosedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"You have closed the {self.target}."
+    templates = {"default": "You have closed the {target}."}
 
     def __init__(self, target):
         self.target = target
@@ -61,9 +59,7 @@ class ElementIsAlreadyClosedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"The {self.target} is already closed."
+    templates = {"default": "The {target} is already closed."}
 
     def __init__(self, target):
         self.target = target
@@ -77,9 +73,7 @@ class ElementToCloseNotHereGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"You found no {self.target_title} here to close."
+    templates = {"default": "You found no {target_title} here to close."}
 
     def __init__(self, target_title):
         self.target_title = target_title
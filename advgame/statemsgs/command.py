@@ -15,6 +15,8 @@ class BadSyntaxGSM(GameStateMessage):
 
     __slots__ = "command", "proper_syntax_options"
 
+    flyweight = True
+
     @property
     def message(self):
         # The proper_syntax_options tuple is drawn from COMMANDS_SYNTAX;
@@ -55,6 +57,8 @@ class ClassRestrictedGSM(GameStateMessage):
         "classes",
     )
 
+    flyweight = True
+
     @property
     def message(self):
         # This message property assembles a list of classes (in
@@ -84,6 +88,8 @@ class NotAllowedNowGSM(GameStateMessage):
 
     __slots__ = "command", "allowed_commands", "game_has_begun"
 
+    flyweight = True
+
     @property
     def message(self):
         # This message property responds to a user using a pregame
@@ -121,6 +127,8 @@ class NotRecognizedGSM(GameStateMessage):
 
     __slots__ = "command", "allowed_commands", "game_has_begun"
 
+    flyweight = True
+
     @property
     def message(self):
         # This message property responds to a user entering a command
@@ -66,9 +66,7 @@ class DrankManaPotionWhenNotASpellcasterGSM(GameStateMessage):
 
     __slots__ = ()
 
-    @property
-    def message(self):
-        return "You feel a little strange, but otherwise nothing happens."
+    templates = {"default": "You feel a little strange, but otherwise nothing happens."}
 
     def __init__(self):
         pass
@@ -82,9 +80,7 @@ class ItemNotDrinkableGSM(GameStateMessage):
 
     __slots__ = ("item_title",)
 
-    @property
-    def message(self):
-        return f"A {self.item_title} is not drinkable."
+    templates = {"default": "A {item_title} is not drinkable."}
 
     def __init__(self, item_title):
         self.item_title = item_title
@@ -98,9 +94,7 @@ class ItemNotInInventoryGSM(GameStateMessage):
 
     __slots__ = ("item_title",)
 
-    @property
-    def message(self):
-        return f"You don't have a {self.item_title} in your inventory."
+    templates = {"default": "You don't have a {item_title} in your inventory."}
 
     def __init__(self, item_title):
         self.item_title = item_title
@@ -115,12 +109,12 @@ class TriedToDrinkMoreThanPossessedGSM(GameStateMessage):
 
     __slots__ = "item_title", "attempted_qty", "possessed_qty"
 
-    @property
-    def message(self):
-        return (
-            f"You can't drink {self.attempted_qty} {self.item_title}s. You "
-            + f"only have {self.possessed_qty} of them."
+    templates = {
+        "default": (
+            "You can't drink {attempted_qty} {item_title}s. You only have "
+            "{possessed_qty} of them."
         )
+    }
 
     def __init__(self, item_title, attempted_qty, possessed_qty):
         self.item_title = item_title
@@ -135,9 +129,9 @@ class AmountToDrinkUnclearGSM(GameStateMessage):
     target.
     """
 
-    @property
-    def message(self):
-        return "Amount to drink unclear. How many do you mean?"
+    __slots__ = ()
+
+    templates = {"default": "Amount to drink unclear. How many do you mean?"}
 
     def __init__(self):
         pass
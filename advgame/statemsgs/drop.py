@@ -99,9 +99,9 @@ class AmountToDropUnclearGSM(GameStateMessage):
     target.
     """
 
-    @property
-    def message(self):
-        return "Amount to drop unclear. How many do you mean?"
+    __slots__ = ()
+
+    templates = {"default": "Amount to drop unclear. How many do you mean?"}
 
     def __init__(self):
         pass
@@ -7,6 +7,7 @@ from advgame.utils import usage_verb
 
 __all__ = (
     "ClassCantUseItemGSM",
+    "ItemNotEquippableGSM",
     "NoSuchItemInInventoryGSM",
 )
 
@@ -40,6 +41,23 @@ class ClassCantUseItemGSM(GameStateMessage):
         self.item_type = item_type
 
 
+class ItemNotEquippableGSM(GameStateMessage):
+    """
+    Returned by equip_command() when the player tries to equip an item that
+    isn't armor, a shield, a wand or a weapon, like a potion or a key.
+    """
+
+    __slots__ = "item_title", "item_type"
+
+    templates = {
+        "default": "You can't equip the {item_title}; {item_type}s are not equippable."
+    }
+
+    def __init__(self, item_title, item_type):
+        self.item_title = item_title
+        self.item_type = item_type
+
+
 class NoSuchItemInInventoryGSM(GameStateMessage):
     """
     Returned by equip_command() when the player tries to equip an item that
@@ -48,9 +66,7 @@ class NoSuchItemInInventoryGSM(GameStateMessage):
 
     __slots__ = ("item_title",)
 
-    @property
-    def message(self):
-        return f"You don't have a {self.item_title} in your inventory."
+    templates = {"default": "You don't have a {item_title} in your inventory."}
 
     def __init__(self, item_title):
         self.item_title = item_title
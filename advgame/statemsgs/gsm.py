@@ -10,18 +10,209 @@ command. A GameStateMessage subclass has an __init__ method that assigns
 keyword arguments to object attributes and a message property which
 contains the logic for rendering the semantic value of the message
 object in natural language.
+
+Every GameStateMessage can also be rendered as a structured value instead:
+to_dict() returns its type tag and its fields as plain JSON-compatible
+values, and to_json() serializes that, without the message property ever
+being evaluated.
+
+A subclass can declare its message text as templates instead of writing a
+message property: a templates dict of variant names to str.format()
+templates over its fields, and a variant() method that picks one if there's
+more than one. Every declared template is collected in a catalog of the
+player-visible strings, returned by message_catalog(). Whichever way it's
+written, a subclass's message is rendered once per object and memoized.
+
+Every message class declares __slots__, so instances have no __dict__.
+Messages that take no arguments, and classes that set flyweight = True,
+are flyweights: constructing one with the same hashable arguments again
+returns the same instance, message text already rendered, instead of
+allocating a new one. Flyweight instances are shared and must be treated
+as immutable.
 """
 
-from abc import ABC, abstractmethod
+import json
+import sys
+
+from abc import ABC, ABCMeta, abstractmethod
+from inspect import signature
+from string import Formatter
+
+from advgame.errors import InternalError
+
+
+__all__ = ("GameStateMessage", "message_catalog", "results_to_json")
+
+
+# The JSON encoder is configured once, for the most compact output.
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _plain(value):
+    # Converts a field value to a JSON-compatible value. Sets are
+    # converted to sorted lists so the output is deterministic. Anything
+    # else, such as a game element object, has to be flattened by the
+    # subclass's own fields() method.
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, (list, tuple)):
+        return [_plain(element) for element in value]
+    elif isinstance(value, (set, frozenset)):
+        return sorted(_plain(element) for element in value)
+    elif isinstance(value, dict):
+        return {str(key): _plain(element) for key, element in value.items()}
+    raise InternalError(
+        f"a {type(value).__name__} value can't be converted to a plain value"
+    )
+
+
+# The templates declared by every GameStateMessage subclass, by type tag.
+
+_message_catalog = dict()
+
+
+def message_catalog():
+    """
+    This function returns the message templates declared by GameStateMessage
+    subclasses, as a dict of type tags to dicts of variant names to
+    templates.
+
+    :return: A dict.
+    """
+    return {
+        type_tag: dict(templates) for type_tag, templates in _message_catalog.items()
+    }
+
+
+class _FieldMap:
+    # The mapping a template is formatted with by default; it looks up
+    # each template field as an attribute of the message object.
+
+    __slots__ = ("_game_state_message",)
+
+    def __init__(self, game_state_message):
+        self._game_state_message = game_state_message
+
+    def __getitem__(self, name):
+        return getattr(self._game_state_message, name)
+
+
+def _memoized(render):
+    # Wraps a message property's getter so the text is rendered on first
+    # access and then kept in the object.
+    def message(self):
+        try:
+            return self._rendered
+        except AttributeError:
+            rendered = self._rendered = render(self)
+            return rendered
+
+    message.__doc__ = render.__doc__
+    message._memoized = True
+    return message
+
+
+# A flyweight class keeps at most this many instances, so a class whose
+# arguments turn out to be high-cardinality (arbitrary player input, say)
+# can't grow without bound; past the limit, new arguments get new
+# instances as usual.
+
+_FLYWEIGHT_LIMIT = 256
 
 
-class GameStateMessage(ABC):
+class _FlyweightMeta(ABCMeta):
+    # The metaclass of GameStateMessage. Calling a flyweight class looks
+    # its arguments up among the instances it's already made. The key
+    # includes the arguments' types, so 1 and True don't collide.
+    def __call__(cls, *argl, **argd):
+        flyweights = cls._flyweights
+        if flyweights is None or argd:
+            return super().__call__(*argl, **argd)
+        key = (argl, tuple(map(type, argl)))
+        try:
+            return flyweights[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # An unhashable argument; this one can't be shared.
+            return super().__call__(*argl)
+        instance = super().__call__(*argl)
+        if len(flyweights) < _FLYWEIGHT_LIMIT:
+            flyweights[key] = instance
+        return instance
+
+
+class GameStateMessage(ABC, metaclass=_FlyweightMeta):
     """
     This class is the abstract base class for all the game state message
     classes in this module. It defines an abstract property message and an
     abstract method __init__.
     """
 
+    # The only slot every message has is the memoized message text.
+
+    __slots__ = ("_rendered",)
+
+    # These are set for each subclass by __init_subclass__(). The type tag
+    # includes the module name since some modules define classes by the
+    # same name (there's a NotRecognizedGSM in both command and help_).
+    # The field names are the subclass's __slots__ in declaration order.
+
+    type_tag = None
+    _field_names = ()
+
+    # A subclass that declares templates gets a message property that
+    # renders them. The templates are compiled once when the class is
+    # created: checked for syntax, interned, and bound to format_map().
+
+    templates = None
+    _formatters = None
+
+    # A subclass is a flyweight if it sets flyweight = True, or if its
+    # __init__ takes no arguments. Its instances are kept in _flyweights.
+
+    flyweight = None
+    _flyweights = None
+
+    def __init_subclass__(cls, **argd):
+        super().__init_subclass__(**argd)
+        module_name = cls.__module__.rpartition(".")[2].rstrip("_")
+        cls.type_tag = f"{module_name}.{cls.__name__}"
+        field_names = list()
+        for ancestor in reversed(cls.__mro__):
+            slots = vars(ancestor).get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            field_names.extend(
+                name
+                for name in slots
+                if not name.startswith("_") and name not in field_names
+            )
+        cls._field_names = tuple(field_names)
+
+        flyweight = vars(cls).get("flyweight")
+        if flyweight is None:
+            flyweight = len(signature(cls.__init__).parameters) == 1
+        cls._flyweights = dict() if flyweight else None
+
+        templates = vars(cls).get("templates")
+        if templates is not None:
+            formatters = dict()
+            for variant, template in templates.items():
+                list(Formatter().parse(template))
+                formatters[variant] = sys.intern(template).format_map
+            cls._formatters = formatters
+            _message_catalog[cls.type_tag] = templates
+            if "message" not in vars(cls):
+                cls.message = property(GameStateMessage._render_templates)
+
+        message = vars(cls).get("message")
+        if isinstance(message, property) and not getattr(
+            message.fget, "_memoized", False
+        ):
+            cls.message = property(_memoized(message.fget))
+
     @property
     @abstractmethod
     def message(self):
@@ -40,3 +231,72 @@ class GameStateMessage(ABC):
         arguments to object attributes, and performs no other task.
         """
         pass
+
+    def variant(self):
+        """
+        This method returns the name of the template to render the message
+        with. Subclasses with more than one template override it.
+
+        :return: A string.
+        """
+        return "default"
+
+    def template_fields(self):
+        """
+        This method returns the mapping the message template is formatted
+        with. By default each field is looked up as an attribute; subclasses
+        that need computed fields override it.
+
+        :return: A mapping.
+        """
+        return _FieldMap(self)
+
+    def _render_templates(self):
+        return self._formatters[self.variant()](self.template_fields())
+
+    def fields(self):
+        """
+        This method returns the object's fields as a dict of plain,
+        JSON-compatible values: its slots, in order, followed by any other
+        public attributes it was given. A subclass whose fields hold game
+        element objects overrides this to flatten them.
+
+        :return: A dict.
+        """
+        fields = {name: _plain(getattr(self, name, None)) for name in self._field_names}
+        for name, value in getattr(self, "__dict__", {}).items():
+            if not name.startswith("_") and name not in fields:
+                fields[name] = _plain(value)
+        return fields
+
+    def to_dict(self):
+        """
+        This method returns the object's structured form: a dict with its type
+        tag under 'type' and its fields.
+
+        :return: A dict.
+        """
+        return {"type": self.type_tag, **self.fields()}
+
+    def to_json(self):
+        """
+        This method returns the object's structured form serialized as compact
+        JSON.
+
+        :return: A string.
+        """
+        return _json_encoder.encode(self.to_dict())
+
+
+def results_to_json(results):
+    """
+    This function serializes a tuple of GameStateMessage objects, as returned
+    by CommandProcessor.process(), to a compact JSON array of their structured
+    forms, encoded as UTF-8.
+
+    :results: An iterable of GameStateMessage objects.
+    :return: A bytes object.
+    """
+    return _json_encoder.encode(
+        [game_state_message.to_dict() for game_state_message in results]
+    ).encode("utf-8")
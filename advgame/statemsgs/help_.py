@@ -22,6 +22,8 @@ class NotRecognizedGSM(GameStateMessage):
         "commands_available",
     )
 
+    flyweight = True
+
     @property
     def message(self):
         return_lines = [
@@ -49,6 +51,8 @@ class DisplayCommandsGSM(GameStateMessage):
 
     __slots__ = "commands_available", "game_started"
 
+    flyweight = True
+
     @property
     def message(self):
         if self.game_started:
@@ -85,6 +89,8 @@ class DisplayHelpForCommandGSM(GameStateMessage):
         "instructions",
     )
 
+    flyweight = True
+
     @property
     def message(self):
         # Like BadSyntaxGSM, this message property accepts syntax
@@ -16,8 +16,9 @@ class DisplayInventoryGSM(GameStateMessage):
 
     __slots__ = ("inventory_contents",)
 
-    @property
-    def message(self):
+    templates = {"default": "You have {items} in your inventory."}
+
+    def template_fields(self):
         display_strs_list = list()
         for item_qty, item in self.inventory_contents:
             indir_artcl_or_qty = (
@@ -31,11 +32,16 @@ class DisplayInventoryGSM(GameStateMessage):
             )
             pluralizer = "s" if item_qty > 1 else ""
             display_strs_list.append(f"{indir_artcl_or_qty} {item.title}{pluralizer}")
-        return (
-            "You have "
-            + join_strs_w_comma_conj(display_strs_list, "and")
-            + " in your inventory."
-        )
+        return {"items": join_strs_w_comma_conj(display_strs_list, "and")}
 
     def __init__(self, inventory_contents_list):
         self.inventory_contents = inventory_contents_list
+
+    def fields(self):
+        # The Item objects are flattened to their titles and types.
+        return {
+            "inventory_contents": [
+                [item_qty, item.title, item.item_type]
+                for item_qty, item in self.inventory_contents
+            ]
+        }
@@ -14,12 +14,12 @@ class DoorIsLockedGSM(GameStateMessage):
 
     __slots__ = "compass_dir", "portal_type"
 
-    @property
-    def message(self):
-        return (
-            f"You can't leave the room via the {self.compass_dir} "
-            + f"{self.portal_type}. The {self.portal_type} is locked."
+    templates = {
+        "default": (
+            "You can't leave the room via the {compass_dir} {portal_type}. The "
+            "{portal_type} is locked."
         )
+    }
 
     def __init__(self, compass_dir, portal_type):
         self.compass_dir = compass_dir
@@ -34,9 +34,7 @@ class LeftRoomGSM(GameStateMessage):
 
     __slots__ = "compass_dir", "portal_type"
 
-    @property
-    def message(self):
-        return f"You leave the room via the {self.compass_dir} {self.portal_type}."
+    templates = {"default": "You leave the room via the {compass_dir} {portal_type}."}
 
     def __init__(self, compass_dir, portal_type):
         self.compass_dir = compass_dir
@@ -53,9 +51,7 @@ class WonTheGameGSM(GameStateMessage):
 
     __slots__ = ()
 
-    @property
-    def message(self):
-        return "You found the exit to the dungeon. You have won the game!"
+    templates = {"default": "You found the exit to the dungeon. You have won the game!"}
 
     def __init__(self):
         pass
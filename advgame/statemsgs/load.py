@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+
+from advgame.statemsgs.gsm import GameStateMessage
+
+
+__all__ = ("GameLoadedGSM", "NoSavedGameGSM", "SavedGameCorruptGSM")
+
+
+class GameLoadedGSM(GameStateMessage):
+    """
+    Returned by load_command() when a saved game has been loaded. It's
+    followed by an EnteredRoomGSM object describing the room the character
+    is in.
+    """
+
+    __slots__ = ("character_name",)
+
+    templates = {
+        "default": "Welcome back, {character_name}. Your game has been loaded."
+    }
+
+    def __init__(self, character_name):
+        self.character_name = character_name
+
+
+class NoSavedGameGSM(GameStateMessage):
+    """
+    Returned by load_command() when there's no saved game to load.
+    """
+
+    __slots__ = ()
+
+    templates = {"default": "There's no saved game to load."}
+
+    def __init__(self):
+        pass
+
+
+class SavedGameCorruptGSM(GameStateMessage):
+    """
+    Returned by load_command() when the save file can't be read because it's
+    truncated, fails its checksum or isn't a save file. The game in progress
+    is left as it was.
+    """
+
+    __slots__ = ()
+
+    templates = {
+        "default": "Your saved game couldn't be loaded; the save file is damaged."
+    }
+
+    def __init__(self):
+        pass
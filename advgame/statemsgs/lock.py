@@ -24,12 +24,9 @@ class DontPossessCorrectKeyGSM(GameStateMessage):
         "key_needed",
     )
 
-    @property
-    def message(self):
-        return (
-            f"To lock the {self.object_to_lock_title} "
-            + f"you need a {self.key_needed}."
-        )
+    templates = {
+        "default": "To lock the {object_to_lock_title} you need a {key_needed}."
+    }
 
     def __init__(self, object_to_lock_title, key_needed):
         self.object_to_lock_title = object_to_lock_title
@@ -39,22 +36,21 @@ class DontPossessCorrectKeyGSM(GameStateMessage):
 class ElementNotLockableGSM(GameStateMessage):
     __slots__ = "target_title", "target_type"
 
-    @property
-    def message(self):
-        # This message property returns a string that informs the
-        # player that they tried to lock something that can't be locked
-        # (a corpse, creature, doorway or item). It omits the direct
-        # article is the item is armor.
-        if self.target_type == "armor":
-            return (
-                f"You can't lock the {self.target_title}; suits of "
-                + f"{self.target_type} are not lockable."
-            )
-        else:
-            return (
-                f"You can't lock the {self.target_title}; {self.target_type}s "
-                + "are not lockable."
-            )
+    templates = {
+        # These templates inform the player that they tried to lock
+        # something that can't be locked (a corpse, creature, doorway or
+        # item). Armor gets its own template.
+        "armor": (
+            "You can't lock the {target_title}; suits of {target_type} are not "
+            "lockable."
+        ),
+        "default": (
+            "You can't lock the {target_title}; {target_type}s are not lockable."
+        ),
+    }
+
+    def variant(self):
+        return "armor" if self.target_type == "armor" else "default"
 
     def __init__(self, target_title, target_type):
         self.target_title = target_title
@@ -69,9 +65,7 @@ class ElementHasBeenLockedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"You have locked the {self.target}."
+    templates = {"default": "You have locked the {target}."}
 
     def __init__(self, target):
         self.target = target
@@ -85,9 +79,7 @@ class ElementIsAlreadyLockedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"The {self.target} is already locked."
+    templates = {"default": "The {target} is already locked."}
 
     def __init__(self, target):
         self.target = target
@@ -101,9 +93,7 @@ class ElementToLockNotHereGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"You found no {self.target_title} here to lock."
+    templates = {"default": "You found no {target_title} here to lock."}
 
     def __init__(self, target_title):
         self.target_title = target_title
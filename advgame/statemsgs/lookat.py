@@ -29,44 +29,60 @@ class FoundContainerHereGSM(GameStateMessage):
         "is_closed",
     )
 
-    @property
-    def message(self):
-        # This message property handles looking at a chest or corpse. If
-        # it's a chest, the property handles all possible combinations
-        # of is_locked in (True, False, None) and is_closed in (True,
-        # False, None). If the chest isn't locked or closed, it lists
-        # the chest's contents. If it's a corpse, contents are listed.
-        # Since contents listing appears at several points in the
-        # conditional, it's handled by a private property, _contents
-        # (see below).
-        if self.container_type == "chest":
-            if self.is_locked is True and self.is_closed is True:
-                return f"{self.container_description} It is closed and locked."
-            elif self.is_locked is False and self.is_closed is True:
-                return f"{self.container_description} It is closed but unlocked."
-            elif self.is_locked is False and self.is_closed is False:
-                return (
-                    f"{self.container_description} It is unlocked and open. "
-                    + f"{self._contents}"
-                )
-            elif self.is_locked is True and self.is_closed is False:
-                raise InternalError(
-                    "FoundContainerHereGSM.message accessed to describe a "
-                    + "chest with the impossible combination of is_locked = "
-                    + "True and is_closed = False."
-                )
-            elif self.is_locked is None and self.is_closed is True:
-                return f"{self.container_description} It is closed."
-            elif self.is_locked is None and self.is_closed is False:
-                return f"{self.container_description} It is open. {self._contents}"
-            elif self.is_locked is True and self.is_closed is None:
-                return f"{self.container_description} It is locked."
-            elif self.is_locked is False and self.is_closed is None:
-                return f"{self.container_description} It is unlocked."
-            else:  # None and None
-                return self.container_description
-        elif self.container_type == "corpse":
-            return f"{self.container_description} {self._contents}"
+    # These templates handle looking at a chest or corpse. For a chest,
+    # there's one for each valid combination of is_locked in (True,
+    # False, None) and is_closed in (True, False, None). If the chest
+    # isn't locked or closed, its contents are listed; if it's a corpse,
+    # contents are listed. Since contents listing appears in several
+    # templates, it's handled by a private property, _contents (see
+    # below).
+
+    templates = {
+        "closed_and_locked": "{container_description} It is closed and locked.",
+        "closed_but_unlocked": "{container_description} It is closed but unlocked.",
+        "unlocked_and_open": (
+            "{container_description} It is unlocked and open. {contents}"
+        ),
+        "closed": "{container_description} It is closed.",
+        "open": "{container_description} It is open. {contents}",
+        "locked": "{container_description} It is locked.",
+        "unlocked": "{container_description} It is unlocked.",
+        "undescribed": "{container_description}",
+        "corpse": "{container_description} {contents}",
+    }
+
+    _chest_variants = {
+        (True, True): "closed_and_locked",
+        (False, True): "closed_but_unlocked",
+        (False, False): "unlocked_and_open",
+        (None, True): "closed",
+        (None, False): "open",
+        (True, None): "locked",
+        (False, None): "unlocked",
+        (None, None): "undescribed",
+    }
+
+    def variant(self):
+        if self.container_type == "corpse":
+            return "corpse"
+        elif self.is_locked is True and self.is_closed is False:
+            raise InternalError(
+                "FoundContainerHereGSM.message accessed to describe a "
+                + "chest with the impossible combination of is_locked = "
+                + "True and is_closed = False."
+            )
+        return self._chest_variants[self.is_locked, self.is_closed]
+
+    def template_fields(self):
+        # The contents sentence is only assembled if the template will
+        # use it.
+        contents = None
+        if self.container_type == "corpse" or self.is_closed is False:
+            contents = self._contents
+        return {
+            "container_description": self.container_description,
+            "contents": contents,
+        }
 
     # This property assembles a sentence listing off the items the
     # container has. It's implemented separately because several
@@ -117,6 +133,26 @@ class FoundContainerHereGSM(GameStateMessage):
                 + "and is_open = False, invalid combination of parameters."
             )
 
+    def fields(self):
+        # The Container object is flattened to its contents, which are
+        # only included when the message property would convey them: for
+        # a corpse, or for a chest that isn't closed.
+        contents = None
+        if self.container_type == "corpse" or self.is_closed is False:
+            contents = [
+                [qty, item.title]
+                for qty, item in sorted(
+                    self.container.values(), key=lambda arg: arg[1].title
+                )
+            ]
+        return {
+            "container_description": self.container_description,
+            "container_type": self.container_type,
+            "is_locked": self.is_locked,
+            "is_closed": self.is_closed,
+            "contents": contents,
+        }
+
 
 class FoundCreatureHereGSM(GameStateMessage):
     """
@@ -163,6 +199,17 @@ class FoundDoorOrDoorwayGSM(GameStateMessage):
         self.compass_dir = compass_dir
         self.door = door
 
+    def fields(self):
+        # The Door object is flattened to the parts of it the message
+        # property conveys.
+        return {
+            "compass_dir": self.compass_dir,
+            "description": self.door.description,
+            "door_type": self.door.door_type,
+            "is_closed": bool(self.door.is_closed),
+            "is_locked": bool(self.door.is_locked),
+        }
+
 
 class FoundItemOrItemsHereGSM(GameStateMessage):
     """
@@ -172,7 +219,7 @@ class FoundItemOrItemsHereGSM(GameStateMessage):
     item's description attribute and specifies how many are present.
     """
 
-    __slots__ = "item_description", "item_qty"
+    __slots__ = "item_description", "item_qty", "container_title", "container_type"
 
     @property
     def message(self):
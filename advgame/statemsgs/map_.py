@@ -0,0 +1,22 @@
+#!/usr/bin/python3
+
+from advgame.statemsgs.gsm import GameStateMessage
+
+
+__all__ = ("DisplayMapGSM",)
+
+
+class DisplayMapGSM(GameStateMessage):
+    """
+    Returned by map_command(). It conveys an ASCII map of the dungeon rooms
+    the player has visited, centered on the room they're in, followed by a
+    legend explaining the door glyphs.
+    """
+
+    __slots__ = "map_text", "legend"
+
+    templates = {"default": "{map_text}\n{legend}"}
+
+    def __init__(self, map_text, legend):
+        self.map_text = map_text
+        self.legend = legend
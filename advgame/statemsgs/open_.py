@@ -20,21 +20,21 @@ class ElementNotOpenableGSM(GameStateMessage):
 
     __slots__ = "target_title", "target_type"
 
-    @property
-    def message(self):
-        # This message conveys that a corpse, creature, door or item
+    templates = {
+        # These templates convey that a corpse, creature, door or item
         # isn't openable, handling armor separately so 'suits of [armor
         # title]' can be used.
-        if self.target_type == "armor":
-            return (
-                f"You can't open the {self.target_title}; suits of "
-                + f"{self.target_type} are not openable."
-            )
-        else:
-            return (
-                f"You can't open the {self.target_title}; {self.target_type}s "
-                + "are not openable."
-            )
+        "armor": (
+            "You can't open the {target_title}; suits of {target_type} are not "
+            "openable."
+        ),
+        "default": (
+            "You can't open the {target_title}; {target_type}s are not openable."
+        ),
+    }
+
+    def variant(self):
+        return "armor" if self.target_type == "armor" else "default"
 
     def __init__(self, target_title, target_type):
         self.target_title = target_title
@@ -49,9 +49,7 @@ class ElementHasBeenOpenedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"You have opened the {self.target}."
+    templates = {"default": "You have opened the {target}."}
 
     def __init__(self, target):
         self.target = target
@@ -65,9 +63,7 @@ class ElementIsAlreadyOpenGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"The {self.target} is already open."
+    templates = {"default": "The {target} is already open."}
 
     def __init__(self, target):
         self.target = target
@@ -81,9 +77,7 @@ class ElementIsLockedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"The {self.target} is locked."
+    templates = {"default": "The {target} is locked."}
 
     def __init__(self, target):
         self.target = target
@@ -97,9 +91,7 @@ class ElementToOpenNotHereGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"You found no {self.target_title} here to open."
+    templates = {"default": "You found no {target_title} here to open."}
 
     def __init__(self, target_title):
         self.target_title = target_title
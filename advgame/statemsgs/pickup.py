@@ -24,12 +24,11 @@ class CantPickUpChestCorpseCreatureOrDoorGSM(GameStateMessage):
 
     __slots__ = "element_type", "element_title"
 
-    @property
-    def message(self):
-        return (
-            f"You can't pick up the {self.element_title}: can't pick up "
-            + f"{self.element_type}s!"
+    templates = {
+        "default": (
+            "You can't pick up the {element_title}: can't pick up {element_type}s!"
         )
+    }
 
     def __init__(self, element_type, element_title):
         self.element_type = element_type
@@ -126,9 +125,9 @@ class AmountToPickUpUnclearGSM(GameStateMessage):
     specify.
     """
 
-    @property
-    def message(self):
-        return "Amount to pick up unclear. How many do you mean?"
+    __slots__ = ()
+
+    templates = {"default": "Amount to pick up unclear. How many do you mean?"}
 
     def __init__(self):
         pass
@@ -143,12 +142,12 @@ class TryingToPickUpMoreThanIsPresentGSM(GameStateMessage):
 
     __slots__ = "item_title", "amount_attempted", "amount_present"
 
-    @property
-    def message(self):
-        return (
-            f"You can't pick up {self.amount_attempted} {self.item_title}s. "
-            + f"Only {self.amount_present} is here."
+    templates = {
+        "default": (
+            "You can't pick up {amount_attempted} {item_title}s. Only {amount_present} "
+            "is here."
         )
+    }
 
     def __init__(self, item_title, amount_attempted, amount_present):
         self.item_title = item_title
@@ -19,21 +19,22 @@ class ElementNotLockpickableGSM(GameStateMessage):
 
     __slots__ = "target_title", "target_type"
 
-    @property
-    def message(self):
-        # This message conveys that a corpse, creature, door or item
+    templates = {
+        # These templates convey that a corpse, creature, door or item
         # isn't unlockable, handling armor separately so 'suits of
         # [armor title]' can be used.
-        if self.target_type == "armor":
-            return (
-                f"You can't pick a lock on the {self.target_title}; suits of "
-                + f"{self.target_type} are not unlockable."
-            )
-        else:
-            return (
-                f"You can't pick a lock on the {self.target_title}; "
-                + f"{self.target_type}s are not unlockable."
-            )
+        "armor": (
+            "You can't pick a lock on the {target_title}; suits of {target_type} are "
+            "not unlockable."
+        ),
+        "default": (
+            "You can't pick a lock on the {target_title}; {target_type}s are not "
+            "unlockable."
+        ),
+    }
+
+    def variant(self):
+        return "armor" if self.target_type == "armor" else "default"
 
     def __init__(self, target_title, target_type):
         self.target_title = target_title
@@ -48,9 +49,7 @@ class TargetHasBeenUnlockedGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"You have unlocked the {self.target_title}."
+    templates = {"default": "You have unlocked the {target_title}."}
 
     def __init__(self, target_title):
         self.target_title = target_title
@@ -64,9 +63,7 @@ class TargetNotFoundGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"This room has no {self.target_title}."
+    templates = {"default": "This room has no {target_title}."}
 
     def __init__(self, target_title):
         self.target_title = target_title
@@ -80,9 +77,7 @@ class TargetNotLockedGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"The {self.target_title} is not locked."
+    templates = {"default": "The {target_title} is not locked."}
 
     def __init__(self, target_title):
         self.target_title = target_title
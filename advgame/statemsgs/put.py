@@ -86,9 +86,9 @@ class AmountToPutUnclearGSM(GameStateMessage):
     in the chest or on the corpse.
     """
 
-    @property
-    def message(self):
-        return "Amount to put unclear. How many do you mean?"
+    __slots__ = ()
+
+    templates = {"default": "Amount to put unclear. How many do you mean?"}
 
     def __init__(self):
         pass
@@ -15,9 +15,7 @@ class HaveQuitTheGameGSM(GameStateMessage):
 
     __slots__ = ()
 
-    @property
-    def message(self):
-        return "You have quit the game."
+    templates = {"default": "You have quit the game."}
 
     def __init__(self):
         pass
@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+
+from advgame.statemsgs.gsm import GameStateMessage
+
+
+__all__ = ("GameSavedGSM", "SavingUnavailableGSM")
+
+
+class GameSavedGSM(GameStateMessage):
+    """
+    Returned by save_command() when the game has been saved.
+    """
+
+    __slots__ = ()
+
+    templates = {"default": "Your game has been saved."}
+
+    def __init__(self):
+        pass
+
+
+class SavingUnavailableGSM(GameStateMessage):
+    """
+    Returned by save_command() or load_command() when the CommandProcessor
+    object wasn't given a save file, so games can't be saved or loaded.
+    """
+
+    __slots__ = ()
+
+    templates = {"default": "Saving and loading games isn't available."}
+
+    def __init__(self):
+        pass
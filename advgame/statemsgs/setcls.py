@@ -14,9 +14,7 @@ class ClassSetGSM(GameStateMessage):
 
     __slots__ = ("class_str",)
 
-    @property
-    def message(self):
-        return f"Your class, {self.class_str}, has been set."
+    templates = {"default": "Your class, {class_str}, has been set."}
 
     def __init__(self, class_str):
         self.class_str = class_str
@@ -30,12 +28,12 @@ class InvalidClassGSM(GameStateMessage):
 
     __slots__ = ("bad_class",)
 
-    @property
-    def message(self):
-        return (
-            f"'{self.bad_class}' is not a valid class choice. Please choose "
-            + "Warrior, Thief, Mage, or Priest."
+    templates = {
+        "default": (
+            "'{bad_class}' is not a valid class choice. Please choose Warrior, Thief, "
+            "Mage, or Priest."
         )
+    }
 
     def __init__(self, bad_class):
         self.bad_class = bad_class
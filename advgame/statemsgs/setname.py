@@ -15,12 +15,12 @@ class InvalidPartGSM(GameStateMessage):
 
     __slots__ = ("name_part",)
 
-    @property
-    def message(self):
-        return (
-            f"The name {self.name_part} is invalid; must be a capital letter "
-            + "followed by lowercase letters."
+    templates = {
+        "default": (
+            "The name {name_part} is invalid; must be a capital letter followed by "
+            "lowercase letters."
         )
+    }
 
     def __init__(self, name_part):
         self.name_part = name_part
@@ -33,9 +33,7 @@ class NameSetGSM(GameStateMessage):
 
     __slots__ = ("name",)
 
-    @property
-    def message(self):
-        return f"Your name, '{self.name}', has been set."
+    templates = {"default": "Your name, '{name}', has been set."}
 
     def __init__(self, name):
         self.name = name
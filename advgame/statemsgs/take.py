@@ -86,9 +86,9 @@ class AmountToTakeUnclearGSM(GameStateMessage):
     to take.
     """
 
-    @property
-    def message(self):
-        return "Amount to take unclear. How many do you want?"
+    __slots__ = ()
+
+    templates = {"default": "Amount to take unclear. How many do you want?"}
 
     def __init__(self):
         pass
@@ -105,6 +105,7 @@ class TryingToTakeMoreThanIsPresentGSM(GameStateMessage):
         "container_title",
         "container_type",
         "item_title",
+        "item_type",
         "amount_attempted",
         "amount_present",
     )
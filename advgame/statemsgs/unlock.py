@@ -24,12 +24,9 @@ class DontPossessCorrectKeyGSM(GameStateMessage):
         "key_needed",
     )
 
-    @property
-    def message(self):
-        return (
-            f"To unlock the {self.object_to_unlock_title} you need a "
-            + f"{self.key_needed}."
-        )
+    templates = {
+        "default": "To unlock the {object_to_unlock_title} you need a {key_needed}."
+    }
 
     def __init__(self, object_to_unlock_title, key_needed):
         self.object_to_unlock_title = object_to_unlock_title
@@ -44,22 +41,18 @@ class ElementNotUnlockableGSM(GameStateMessage):
 
     __slots__ = "target_title", "target_type"
 
-    @property
-    def message(self):
-        singular_item = (
-            f"the suit of {self.target_title}"
-            if self.target_type == "armor"
-            else f"the {self.target_title}"
-        )
-        item_pluralized = (
-            f"suits of {self.target_type}"
-            if self.target_type == "armor"
-            else f"{self.target_type}s"
-        )
-        return (
-            f"You can't unlock {singular_item}; {item_pluralized} are not "
-            + "unlockable."
-        )
+    templates = {
+        "armor": (
+            "You can't unlock the suit of {target_title}; suits of {target_type} are "
+            "not unlockable."
+        ),
+        "default": (
+            "You can't unlock the {target_title}; {target_type}s are not unlockable."
+        ),
+    }
+
+    def variant(self):
+        return "armor" if self.target_type == "armor" else "default"
 
     def __init__(self, target_title, target_type):
         self.target_title = target_title
@@ -74,9 +67,7 @@ class ElementHasBeenUnlockedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"You have unlocked the {self.target}."
+    templates = {"default": "You have unlocked the {target}."}
 
     def __init__(self, target):
         self.target = target
@@ -90,9 +81,7 @@ class ElementIsAlreadyUnlockedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"The {self.target} is already unlocked."
+    templates = {"default": "The {target} is already unlocked."}
 
     def __init__(self, target):
         self.target = target
@@ -106,9 +95,7 @@ class ElementToUnlockNotHereGSM(GameStateMessage):
 
     __slots__ = ("target_title",)
 
-    @property
-    def message(self):
-        return f"You found no {self.target_title} here to unlock."
+    templates = {"default": "You found no {target_title} here to unlock."}
 
     def __init__(self, target_title):
         self.target_title = target_title
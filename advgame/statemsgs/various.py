@@ -29,15 +29,18 @@ class AmbiguousDoorSpecifierGSM(GameStateMessage):
 
     __slots__ = "compass_dirs", "door_or_doorway", "door_type"
 
-    @property
-    def message(self):
-        # This message property assembles a pair of sentences that
-        # describe every door in the room that matches the user's
-        # ambiguous command and asks them which one they mean.
-        door_type = self.door_type.replace("_", " ") if self.door_type else None
-        message_str = (
+    templates = {
+        "default": (
             "More than one door in this room matches your command. Do you mean "
+            "{doors}?"
         )
+    }
+
+    def template_fields(self):
+        # The doors field lists every door in the room that matches the
+        # user's ambiguous command, so the message can ask them which one
+        # they mean.
+        door_type = self.door_type.replace("_", " ") if self.door_type else None
         if door_type is not None:
             door_str_list = [
                 f"the {compass_dir} {door_type}" for compass_dir in self.compass_dirs
@@ -47,8 +50,7 @@ class AmbiguousDoorSpecifierGSM(GameStateMessage):
                 f"the {compass_dir} {self.door_or_doorway}"
                 for compass_dir in self.compass_dirs
             ]
-        message_str += join_strs_w_comma_conj(door_str_list, "or") + "?"
-        return message_str
+        return {"doors": join_strs_w_comma_conj(door_str_list, "or")}
 
     def __init__(self, compass_dirs, door_or_doorway, door_type):
         self.compass_dirs = compass_dirs
@@ -64,9 +66,7 @@ class ContainerIsClosedGSM(GameStateMessage):
 
     __slots__ = ("target",)
 
-    @property
-    def message(self):
-        return f"The {self.target} is closed."
+    templates = {"default": "The {target} is closed."}
 
     def __init__(self, target):
         self.target = target
@@ -109,18 +109,14 @@ class DisplayRolledStatsGSM(GameStateMessage):
         "charisma",
     )
 
-    @property
-    def message(self):
-        return (
-            f"Your ability scores are "
-            f"Strength\u00A0{self.strength}, "
-            f"Dexterity\u00A0{self.dexterity}, "
-            f"Constitution\u00A0{self.constitution}, "
-            f"Intelligence\u00A0{self.intelligence}, "
-            f"Wisdom\u00A0{self.wisdom}, "
-            f"Charisma\u00A0{self.charisma}.\n\n"
-            f"Would you like to reroll or begin the game?"
+    templates = {
+        "default": (
+            "Your ability scores are Strength\u00A0{strength}, "
+            "Dexterity\u00A0{dexterity}, Constitution\u00A0{constitution}, "
+            "Intelligence\u00A0{intelligence}, Wisdom\u00A0{wisdom}, "
+            "Charisma\u00A0{charisma}.\n\nWould you like to reroll or begin the game?"
         )
+    }
 
     def __init__(
         self, strength, dexterity, constitution, intelligence, wisdom, charisma
@@ -258,16 +254,38 @@ class EnteredRoomGSM(GameStateMessage):
     def __init__(self, room):
         self.room = room
 
+    def fields(self):
+        # The Room object is flattened to the parts of it the message
+        # property conveys.
+        room = self.room
+        return {
+            "room_title": room.title,
+            "description": room.description,
+            "container_title": (
+                room.container_here.title if room.container_here else None
+            ),
+            "creature_title": room.creature_here.title if room.creature_here else None,
+            "items_here": (
+                [[item_qty, item.title] for item_qty, item in room.items_here.values()]
+                if room.items_here is not None
+                else []
+            ),
+            "doors": {
+                compass_dir: getattr(room, f"{compass_dir}_door").door_type
+                for compass_dir in ("north", "east", "south", "west")
+                if getattr(room, f"{compass_dir}_door", None) is not None
+            },
+        }
+
 
 class FoeDeathGSM(GameStateMessage):
     __slots__ = ("creature_title",)
 
-    @property
-    def message(self):
-        return (
-            f"The {self.creature_title} is slain. You see a "
-            + f"{self.creature_title} corpse here."
+    templates = {
+        "default": (
+            "The {creature_title} is slain. You see a {creature_title} corpse here."
         )
+    }
 
     def __init__(self, creature_title):
         self.creature_title = creature_title
@@ -285,7 +303,8 @@ class ItemEquippedGSM(GameStateMessage):
         "item_type",
         "attack_bonus",
         "damage",
-        "armor_class" "change_text",
+        "armor_class",
+        "attacking_with",
     )
 
     @property
@@ -353,11 +372,12 @@ class ItemUnequippedGSM(GameStateMessage):
     __slots__ = (
         "item_title",
         "item_type",
-        "changed_value_1",
-        "value_type_1",
-        "changed_value_2",
-        "value_type_2",
-        "change_text",
+        "attack_bonus",
+        "damage",
+        "armor_class",
+        "attacking_with",
+        "now_attacking_with",
+        "now_cant_attack",
     )
 
     @property
@@ -8,16 +8,20 @@ in the codebase.
 
 import re
 
+from functools import lru_cache
 from math import nan as NaN
 from random import randint
 from textwrap import wrap
 
+from advgame.errors import InternalError
+
 
 __all__ = (
     "LEXICAL_NUMBER_1_THRU_99_RE",
     "join_strs_w_comma_conj",
     "lexical_number_to_digits",
     "roll_dice",
+    "set_dice_roller",
     "textwrapper",
     "usage_verb",
 )
@@ -193,24 +197,49 @@ def usage_verb(item_type, gerund=True):
 
 _dice_expression_re = re.compile(r"([1-9]+)d([1-9][0-9]*)([-+][1-9][0-9]*)?")
 
+# Every roll in the game goes through roll_dice(), so replacing the
+# function that makes the roll changes how dice behave everywhere at once.
+# The game solver uses this to play with average or reproducible rolls.
+
+_dice_roller = None
+
+
+def set_dice_roller(dice_roller):
+    """
+    This function sets the function roll_dice() uses to make its rolls, in
+    place of rolling with randint().
+
+    :dice_roller: A callable that accepts the number of dice, their
+    sidedness and the modifier, all ints, and returns an int; or None to roll
+    with randint() again.
+    :return: The previous dice roller, or None.
+    """
+    global _dice_roller
+    previous_dice_roller = _dice_roller
+    _dice_roller = dice_roller
+    return previous_dice_roller
+
 
 def roll_dice(dice_expr):
     """
     This function accepts a standard Dungeons & Dragons dice expression
     (such as 1d20+5, 1d8+2, or 3d10-3), uses randint() to simulate a dice
     roll or rolls with the given modifier, and returns the computed random
-    value>
+    value. If a dice roller has been set with set_dice_roller(), it makes
+    the roll instead.
 
     :dice_expr: A dice expression of the form #d#[±#]. return: A random
     number value, as an int.
     """
     match = _dice_expression_re.match(dice_expr)
     if not match:
-        raise excpt.InternalError("invalid dice expression: " + dice_expr)
+        raise InternalError("invalid dice expression: " + dice_expr)
     number_of_dice, sidedness_of_dice, modifier_to_roll = match.groups()
     number_of_dice = int(number_of_dice)
     sidedness_of_dice = int(sidedness_of_dice)
     modifier_to_roll = int(modifier_to_roll) if modifier_to_roll is not None else 0
+    if _dice_roller is not None:
+        return _dice_roller(number_of_dice, sidedness_of_dice, modifier_to_roll)
     return (
         sum(randint(1, sidedness_of_dice) for _ in range(0, number_of_dice))
         + modifier_to_roll
@@ -223,26 +252,36 @@ def roll_dice(dice_expr):
 # a multi-paragraph string, the paragraphs are run together and a single
 # wrapped paragraph is returned. This function extends it to handle
 # multiple paragraphs.
+#
+# Many paragraphs are wrapped again and again verbatim (room
+# descriptions, help text, item descriptions), so each wrapped paragraph
+# is kept in a bounded LRU cache keyed by the paragraph and the width.
+
+_WRAP_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=_WRAP_CACHE_SIZE)
+def _wrap_paragraph(paragraph, width):
+    # wrap returns a list of lines, so I reassemble the paragraph with
+    # '\n'.join()
+    return "\n".join(wrap(paragraph, width=width))
 
 
 def textwrapper(paragraphs, width=80):
     """
     This function accepts a multiline string comprising paragraphs of
-    unwrapped text, separately wraps each one to 80 columns, and returns the
-    wrapped paragraphs as a string.
-
-    :paragraphs: A multi-line string of text. return: The text input wrapped
-    to 80 columns paragraph-by-paragraph.
+    unwrapped text, separately wraps each one to the given width (80 columns
+    by default), and returns the wrapped paragraphs as a string. Wrapped
+    paragraphs are cached, so wrapping the same paragraph to the same width
+    again is a lookup.
+
+    :paragraphs: A multi-line string of text.
+    :width: An int, the number of columns to wrap to.
+    :return: The text input wrapped paragraph-by-paragraph.
     """
-    # The text is broken into separate paragraph strings and applies
-    # wrap to each one.
-    wrapped_lines = map(lambda para: wrap(para, width=width), paragraphs.split("\n"))
-
-    # wrap returns a list of lines, so I reassemble the paragraphs with
-    # '\n'.join()
-    wrapped_paragraphs = ["\n".join(paragraph) for paragraph in wrapped_lines]
-
-    # The full multi-paragraph text is reassembled with a second use of
+    # The text is broken into separate paragraph strings, each one is
+    # wrapped, and the full multi-paragraph text is reassembled with
     # '\n'.join() and returned.
-    wrapped = "\n".join(wrapped_paragraphs)
-    return wrapped
+    return "\n".join(
+        _wrap_paragraph(paragraph, width) for paragraph in paragraphs.split("\n")
+    )
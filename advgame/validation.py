@@ -0,0 +1,393 @@
+#!/usr/bin/python3
+
+"""
+The advgame.validation module implements a load-time check of the
+dungeon's structure. validate_world() is run once over the RoomsState,
+DoorsState, ContainersState and CreaturesState objects after they've
+been instantiated, and returns a WorldValidationReport that lists every
+structural problem it found: doors that don't match up between the two
+rooms they join, rooms that can't be reached from the entrance, keys
+that can't be reached, and exits that are locked behind their own key.
+"""
+
+from dataclasses import dataclass
+
+from advgame.elements.containers import Chest, Corpse
+from advgame.elements.items import Key
+from advgame.errors import InternalError
+
+
+__all__ = (
+    "WorldProblem",
+    "WorldValidationReport",
+    "validate_world",
+)
+
+
+# The severities a WorldProblem can have. An error means the world can't
+# be played to completion (or is malformed); a warning means the world is
+# playable but some of its content can never be encountered.
+
+ERROR = "error"
+WARNING = "warning"
+
+
+# Keys in this game are generic: any door key unlocks any door and any
+# chest key unlocks any chest (see unlock_command()). So a key dependency
+# is modeled by key kind, identified by the Key object's title.
+
+DOOR_KEY = "door key"
+CHEST_KEY = "chest key"
+
+_COMPASS_OPPOSITES = {
+    "north": "south",
+    "east": "west",
+    "south": "north",
+    "west": "east",
+}
+
+
+@dataclass(frozen=True)
+class WorldProblem:
+    """
+    A single problem found by validate_world(). The code is a short
+    machine-readable identifier, the subject is the internal name of the
+    room, door, container or creature the problem concerns, and the message
+    is a human-readable explanation.
+    """
+
+    __slots__ = "severity", "code", "subject", "message"
+
+    severity: str
+    code: str
+    subject: str
+    message: str
+
+
+class WorldValidationReport:
+    """
+    The structured result of a validate_world() run. It stores every
+    WorldProblem found, the set of internal names of rooms reachable from
+    the entrance, the key kinds that can be obtained, and whether the exit
+    can be reached.
+    """
+
+    __slots__ = "problems", "reachable_rooms", "reachable_key_kinds", "exit_reachable"
+
+    def __init__(self, problems, reachable_rooms, reachable_key_kinds, exit_reachable):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :problems: A tuple of WorldProblem objects.
+        :reachable_rooms: A frozenset of room internal names.
+        :reachable_key_kinds: A frozenset of key titles.
+        :exit_reachable: A boolean.
+        """
+        self.problems = problems
+        self.reachable_rooms = reachable_rooms
+        self.reachable_key_kinds = reachable_key_kinds
+        self.exit_reachable = exit_reachable
+
+    @property
+    def errors(self):
+        """
+        This property returns the problems that have error severity.
+
+        :return: A tuple of WorldProblem objects.
+        """
+        return tuple(problem for problem in self.problems if problem.severity == ERROR)
+
+    @property
+    def warnings(self):
+        """
+        This property returns the problems that have warning severity.
+
+        :return: A tuple of WorldProblem objects.
+        """
+        return tuple(
+            problem for problem in self.problems if problem.severity == WARNING
+        )
+
+    @property
+    def is_valid(self):
+        """
+        This property returns True if no errors were found, False otherwise.
+        Warnings don't make a world invalid.
+
+        :return: A boolean.
+        """
+        return not self.errors
+
+    def raise_for_errors(self):
+        """
+        This method raises an InternalError describing every error found, if
+        there were any.
+
+        :return: None.
+        """
+        if self.is_valid:
+            return
+        raise InternalError(
+            "world failed validation: "
+            + "; ".join(f"[{error.code}] {error.message}" for error in self.errors)
+        )
+
+
+class _DisjointSet:
+    # A union-find structure over hashable keys, using path halving and
+    # union by size, so a sequence of n operations runs in effectively
+    # linear time.
+
+    __slots__ = "_parents", "_sizes"
+
+    def __init__(self, keys):
+        self._parents = {key: key for key in keys}
+        self._sizes = dict.fromkeys(self._parents, 1)
+
+    def find(self, key):
+        parents = self._parents
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    def union(self, key_1, key_2):
+        root_1 = self.find(key_1)
+        root_2 = self.find(key_2)
+        if root_1 == root_2:
+            return
+        if self._sizes[root_1] < self._sizes[root_2]:
+            root_1, root_2 = root_2, root_1
+        self._parents[root_2] = root_1
+        self._sizes[root_1] += self._sizes[root_2]
+
+
+def _key_kinds_in(items_multi_state):
+    # Returns the set of key titles present in an ItemsMultiState
+    # object (a room's items_here, a container or a creature's
+    # inventory).
+    if not items_multi_state:
+        return set()
+    return {
+        item.title for _, item in items_multi_state.values() if isinstance(item, Key)
+    }
+
+
+def validate_world(rooms_state, doors_state, containers_state, creatures_state):
+    """
+    This function validates the structure of the dungeon and returns a
+    WorldValidationReport. It checks that:
+
+    * there is exactly one entrance room;
+
+    * every door a room refers to leads to a room that exists, and that
+    room has the matching door on the opposite wall;
+
+    * every door in doors_state is used by some room, and every container and
+    creature is placed in some room;
+
+    * the exit can be reached from the entrance, treating a locked door as
+    passable only once a door key can be obtained, and a locked chest's
+    contents as available only once a chest key can be obtained.
+
+    Rooms are grouped into connected components with a union-find
+    structure, so the run time is effectively linear in the number of
+    rooms and doors.
+
+    :rooms_state: A RoomsState object.
+    :doors_state: A DoorsState object.
+    :containers_state: A ContainersState object.
+    :creatures_state: A CreaturesState object.
+    :return: A WorldValidationReport object.
+    """
+    problems = list()
+    rooms = {room.internal_name: room for room in rooms_state.values()}
+
+    # Step 1: exactly one room must be marked as the entrance.
+
+    entrances = [name for name, room in rooms.items() if room.is_entrance]
+    if len(entrances) != 1:
+        problems.append(
+            WorldProblem(
+                ERROR,
+                "entrance-count",
+                ",".join(entrances),
+                f"expected exactly one entrance room, found {len(entrances)}",
+            )
+        )
+
+    # Step 2: every door must match up on both sides. The union-find
+    # structure is populated in the same pass: unlocked doors join their
+    # two rooms right away, locked doors are set aside as gated edges.
+
+    disjoint_set = _DisjointSet(rooms)
+    gated_edges = list()
+    exit_doors = list()
+    used_door_names = set()
+    free_key_kinds = dict()
+    chest_key_kinds = dict()
+    placed_containers = set()
+    placed_creatures = set()
+
+    for room_name, room in rooms.items():
+        for compass_dir, opposite_dir in _COMPASS_OPPOSITES.items():
+            door = getattr(room, f"{compass_dir}_door", None)
+            if not door:
+                continue
+            used_door_names.add(door.internal_name)
+            other_room_name = door.other_room_internal_name(room_name)
+            if door.is_exit or other_room_name == "Exit":
+                exit_doors.append((room_name, door))
+                continue
+            if other_room_name not in rooms:
+                problems.append(
+                    WorldProblem(
+                        ERROR,
+                        "dangling-door",
+                        door.internal_name,
+                        f"the {compass_dir} door of {room_name} leads to "
+                        + f"{other_room_name}, which doesn't exist",
+                    )
+                )
+                continue
+            other_door = getattr(rooms[other_room_name], f"{opposite_dir}_door", None)
+            if not other_door or other_door.internal_name != door.internal_name:
+                problems.append(
+                    WorldProblem(
+                        ERROR,
+                        "unmatched-door",
+                        door.internal_name,
+                        f"the {compass_dir} door of {room_name} leads to "
+                        + f"{other_room_name}, but {other_room_name} has no "
+                        + f"matching {opposite_dir} door",
+                    )
+                )
+                continue
+
+            # Each door is seen from both sides; it's only recorded from
+            # the room that sorts first.
+            if room_name > other_room_name:
+                continue
+            if door.is_locked:
+                gated_edges.append((room_name, other_room_name))
+            else:
+                disjoint_set.union(room_name, other_room_name)
+
+        # The keys available in each room are tabulated: those on the
+        # floor, on a creature (which can be killed for them) or in a
+        # corpse or unlocked chest are free; those in a locked chest
+        # require a chest key.
+
+        free_key_kinds[room_name] = _key_kinds_in(room.items_here)
+        chest_key_kinds[room_name] = set()
+        if room.creature_here:
+            placed_creatures.add(room.creature_here.internal_name)
+            free_key_kinds[room_name] |= _key_kinds_in(room.creature_here.inventory)
+        if room.container_here:
+            container = room.container_here
+            if isinstance(container, Corpse):
+                placed_creatures.add(container.internal_name)
+            else:
+                placed_containers.add(container.internal_name)
+            if isinstance(container, Chest) and container.is_locked:
+                chest_key_kinds[room_name] = _key_kinds_in(container)
+            else:
+                free_key_kinds[room_name] |= _key_kinds_in(container)
+
+    # Step 3: every door, container and creature that was defined should
+    # be in use somewhere.
+
+    for door in doors_state.values():
+        if door.internal_name not in used_door_names:
+            problems.append(
+                WorldProblem(
+                    WARNING,
+                    "unused-door",
+                    door.internal_name,
+                    f"door {door.internal_name} isn't used by any room",
+                )
+            )
+    for container_name in containers_state.keys():
+        if container_name not in placed_containers:
+            problems.append(
+                WorldProblem(
+                    WARNING,
+                    "unplaced-container",
+                    container_name,
+                    f"container {container_name} isn't placed in any room",
+                )
+            )
+    for creature_name in creatures_state.keys():
+        if creature_name not in placed_creatures:
+            problems.append(
+                WorldProblem(
+                    WARNING,
+                    "unplaced-creature",
+                    creature_name,
+                    f"creature {creature_name} isn't placed in any room",
+                )
+            )
+
+    # Step 4: the reachable region is grown to a fixed point. Each pass
+    # collects the key kinds obtainable in the component containing the
+    # entrance; once a door key is obtainable every gated edge is joined.
+    # There are only two key kinds, so this loop runs at most three times.
+
+    key_kinds = set()
+    reachable_rooms = frozenset()
+    if len(entrances) == 1:
+        entrance = entrances[0]
+        while True:
+            entrance_root = disjoint_set.find(entrance)
+            reachable_rooms = frozenset(
+                room_name
+                for room_name in rooms
+                if disjoint_set.find(room_name) == entrance_root
+            )
+            found_key_kinds = set()
+            for room_name in reachable_rooms:
+                found_key_kinds |= free_key_kinds[room_name]
+                if CHEST_KEY in key_kinds:
+                    found_key_kinds |= chest_key_kinds[room_name]
+            if found_key_kinds <= key_kinds:
+                break
+            key_kinds |= found_key_kinds
+            if DOOR_KEY in key_kinds:
+                for room_name, other_room_name in gated_edges:
+                    disjoint_set.union(room_name, other_room_name)
+
+    # Step 5: the exit must be reachable, and content that can never be
+    # reached is reported.
+
+    exit_reachable = any(
+        room_name in reachable_rooms and (not door.is_locked or DOOR_KEY in key_kinds)
+        for room_name, door in exit_doors
+    )
+    if not exit_doors:
+        problems.append(
+            WorldProblem(ERROR, "no-exit", "Exit", "no room has a door to the exit")
+        )
+    elif not exit_reachable:
+        if any(room_name in reachable_rooms for room_name, _ in exit_doors):
+            message = (
+                "the exit door is locked and no door key can be reached "
+                + "without passing through it"
+            )
+        else:
+            message = "no room with a door to the exit can be reached"
+        problems.append(WorldProblem(ERROR, "exit-unreachable", "Exit", message))
+    if len(entrances) == 1:
+        for room_name in rooms:
+            if room_name not in reachable_rooms:
+                problems.append(
+                    WorldProblem(
+                        WARNING,
+                        "unreachable-room",
+                        room_name,
+                        f"room {room_name} can't be reached from the entrance",
+                    )
+                )
+
+    return WorldValidationReport(
+        tuple(problems), reachable_rooms, frozenset(key_kinds), exit_reachable
+    )
@@ -0,0 +1,387 @@
+#!/usr/bin/python3
+
+"""
+The advgame.world module gathers the steps that turn the five .ini texts
+into a playable GameState: parsing the texts, then instantiating the state
+objects in dependency order from ItemsState through RoomsState. A
+WorldTemplate does that once and then hands out independent copies of the
+pristine world, so a process serving many sessions only parses and
+validates the world a single time. A WorldFactory also builds the world
+once, but hands out copies that share nothing, and resets any of them to
+the pristine world in place, undoing whatever was done to it.
+"""
+
+from copy import deepcopy
+
+from iniconfig import IniConfig
+
+from advgame.data import ini_file_texts
+from advgame.elements.characters import GameState, ItemsState
+from advgame.elements.containers import ContainersState, CreaturesState
+from advgame.elements.doors import DoorsState
+from advgame.elements.rooms import RoomsState
+from advgame.errors import InternalError
+from advgame.validation import validate_world
+
+
+__all__ = (
+    "WorldFactory",
+    "WorldSections",
+    "WorldTemplate",
+    "build_game_state",
+    "load_world_sections",
+)
+
+
+class WorldSections:
+    """
+    The parsed contents of the five .ini files, each stored as a
+    dict-of-dicts of internal names to section key-value pairs.
+    """
+
+    __slots__ = "items", "doors", "containers", "creatures", "rooms"
+
+    def __init__(self, items, doors, containers, creatures, rooms):
+        """
+        This __init__ method stores its arguments to object attributes.
+
+        :items: A dict-of-dicts from items.ini.
+        :doors: A dict-of-dicts from doors.ini.
+        :containers: A dict-of-dicts from containers.ini.
+        :creatures: A dict-of-dicts from creatures.ini.
+        :rooms: A dict-of-dicts from rooms.ini.
+        """
+        self.items = items
+        self.doors = doors
+        self.containers = containers
+        self.creatures = creatures
+        self.rooms = rooms
+
+    @classmethod
+    def from_ini_configs(cls, items, doors, containers, creatures, rooms):
+        """
+        This factory method builds a WorldSections object from five IniConfig
+        objects.
+
+        :items: An IniConfig object parsed from items.ini.
+        :doors: An IniConfig object parsed from doors.ini.
+        :containers: An IniConfig object parsed from containers.ini.
+        :creatures: An IniConfig object parsed from creatures.ini.
+        :rooms: An IniConfig object parsed from rooms.ini.
+        :return: A WorldSections object.
+        """
+        return cls(
+            *(
+                {name: dict(section) for name, section in ini_config.sections.items()}
+                for ini_config in (items, doors, containers, creatures, rooms)
+            )
+        )
+
+
+def load_world_sections(ini_texts=ini_file_texts):
+    """
+    This function parses the five .ini texts held by an IniFileTexts object
+    (by default, the game's own dungeon) and returns them as a WorldSections
+    object.
+
+    :ini_texts: An IniFileTexts object.
+    :return: A WorldSections object.
+    """
+    ini_consts = (
+        ini_texts.ITEMS_INI,
+        ini_texts.DOORS_INI,
+        ini_texts.CONTAINERS_INI,
+        ini_texts.CREATURES_INI,
+        ini_texts.ROOMS_INI,
+    )
+
+    # IniConfig reads from a file, so each text is written to a tempfile
+    # which is removed once it's been parsed.
+
+    ini_configs = list()
+    for ini_const in ini_consts:
+        ini_configs.append(IniConfig(ini_texts.get_ini_tmpfile_name(ini_const)))
+        ini_texts.remove_tempfile(ini_const)
+    return WorldSections.from_ini_configs(*ini_configs)
+
+
+def build_game_state(world_sections, lazy=False, tabular=False):
+    """
+    This function instantiates the state objects from a WorldSections object
+    and returns them summarized by a GameState object. Some state objects
+    require other ones as arguments to initialize properly, so this proceeds
+    in order from simple to complex.
+
+    :world_sections: A WorldSections object.
+    :lazy: A boolean, passed on to RoomsState.
+    :tabular: A boolean, passed on to CreaturesState.
+    :return: A GameState object.
+    """
+    items_state = ItemsState(**world_sections.items)
+    doors_state = DoorsState(**world_sections.doors)
+    containers_state = ContainersState(items_state, **world_sections.containers)
+    creatures_state = CreaturesState(
+        items_state, tabular=tabular, **world_sections.creatures
+    )
+    rooms_state = RoomsState(
+        creatures_state,
+        containers_state,
+        doors_state,
+        items_state,
+        lazy=lazy,
+        **world_sections.rooms,
+    )
+    return GameState(
+        rooms_state, creatures_state, containers_state, doors_state, items_state
+    )
+
+
+def _build_pristine_world(world_sections, validate):
+    # Builds the world from a WorldSections object, or the game's own
+    # dungeon if it's None, and validates it unless validate is False.
+    if world_sections is None:
+        world_sections = load_world_sections()
+    game_state = build_game_state(world_sections)
+    if validate:
+        validate_world(
+            game_state.rooms_state,
+            game_state.doors_state,
+            game_state.containers_state,
+            game_state.creatures_state,
+        ).raise_for_errors()
+    return game_state
+
+
+class WorldTemplate:
+    """
+    This class builds and validates a world once, and then returns a fresh
+    copy of the pristine world for every new session with new_game_state().
+    Item objects never change during play, so every copy shares the
+    template's ItemsState and Item objects; everything else is copied.
+    """
+
+    __slots__ = "_game_state", "_snapshot"
+
+    def __init__(self, world_sections=None, validate=True):
+        """
+        This __init__ method builds the pristine world from the given
+        WorldSections object, or from the game's own dungeon if none is
+        given. Unless validate is False, it raises an InternalError if the
+        world fails validation.
+
+        :world_sections: A WorldSections object, or None.
+        :validate: A boolean, default True.
+        """
+        self._game_state = _build_pristine_world(world_sections, validate)
+        self._snapshot = self._game_state.snapshot()
+
+    def new_game_state(self):
+        """
+        This method returns a new GameState object holding a copy of the
+        pristine world.
+
+        :return: A GameState object.
+        """
+        items_state = self._game_state.items_state
+        shared = {id(item): item for item in items_state.values()}
+        shared[id(items_state)] = items_state
+        return deepcopy(self._game_state, shared)
+
+    def reset_game_state(self, game_state):
+        """
+        This method restores a GameState object returned by new_game_state()
+        to the pristine world, so it can be played from the start again. This
+        is several times cheaper than copying a new one.
+
+        :game_state: A GameState object returned by new_game_state().
+        :return: None.
+        """
+        game_state.restore(self._snapshot)
+
+
+# The slot names of each class, across its MRO, as found by _slot_names().
+
+_class_slot_names = dict()
+
+
+def _slot_names(cls):
+    slot_names = _class_slot_names.get(cls)
+    if slot_names is None:
+        slot_names = list()
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            slot_names.extend(
+                name for name in slots if name not in ("__dict__", "__weakref__")
+            )
+        slot_names = _class_slot_names[cls] = tuple(slot_names)
+    return slot_names
+
+
+class _PristineImage:
+    # A record of every mutable object reachable from a GameState object
+    # while its world is pristine: the contents of each dict, list, set
+    # and bytearray, and the attributes of each object of a class from
+    # this package. restore() writes them all back in place, so any
+    # change to those objects is undone, and anything attached to them
+    # since is dropped. Strings, numbers and tuples can't change, so only
+    # the objects inside tuples are recorded.
+
+    __slots__ = "game_state", "_containers", "_objects"
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+        self._containers = list()
+        self._objects = list()
+        seen = set()
+        unvisited = [game_state]
+        while unvisited:
+            value = unvisited.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, dict):
+                self._containers.append((value, dict(value)))
+                unvisited.extend(value.keys())
+                unvisited.extend(value.values())
+            elif isinstance(value, (list, set, bytearray)):
+                self._containers.append((value, value.copy()))
+                unvisited.extend(value)
+            elif isinstance(value, (tuple, frozenset)):
+                unvisited.extend(value)
+            elif type(value).__module__.startswith("advgame."):
+                slot_names = _slot_names(type(value))
+                slot_values = tuple(
+                    (name, getattr(value, name))
+                    for name in slot_names
+                    if hasattr(value, name)
+                )
+                unset_slot_names = tuple(
+                    name for name in slot_names if not hasattr(value, name)
+                )
+                attributes = dict(vars(value)) if hasattr(value, "__dict__") else None
+                self._objects.append((value, slot_values, unset_slot_names, attributes))
+                unvisited.extend(slot_value for _, slot_value in slot_values)
+                if attributes is not None:
+                    unvisited.extend(attributes.values())
+
+    def restore(self):
+        for container, contents in self._containers:
+            if isinstance(container, (list, bytearray)):
+                container[:] = contents
+            else:
+                container.clear()
+                container.update(contents)
+
+        # object.__setattr__() is used so no class's own __setattr__ can
+        # get in the way of putting the recorded values back.
+
+        for value, slot_values, unset_slot_names, attributes in self._objects:
+            for name, slot_value in slot_values:
+                object.__setattr__(value, name, slot_value)
+            for name in unset_slot_names:
+                if hasattr(value, name):
+                    object.__delattr__(value, name)
+            if attributes is not None:
+                value.__dict__.clear()
+                value.__dict__.update(attributes)
+
+
+# The WorldFactory returned by WorldFactory.default(), built the first
+# time it's called in a process.
+
+_default_world_factory = None
+
+
+class WorldFactory:
+    """
+    This class builds and validates a world once, and then hands out
+    GameState objects holding copies of the pristine world with
+    game_state(). Unlike a WorldTemplate's copies, these share nothing, not
+    even Item objects, so any part of one can be changed without affecting
+    the others; and reset() returns one to the pristine world in place,
+    undoing any change made to the objects in it, not only the ones a game
+    makes. This is several times cheaper than building or copying a new
+    world, which makes it suited to test suites and bots that play many
+    games.
+
+    The factory keeps each GameState object it has handed out, so that it
+    can reset it. One that's no longer needed should be passed to
+    release(), which resets it and hands it out again from the next
+    game_state() call.
+    """
+
+    __slots__ = "_game_state", "_images", "_released"
+
+    def __init__(self, world_sections=None, validate=True):
+        """
+        This __init__ method builds the pristine world from the given
+        WorldSections object, or from the game's own dungeon if none is
+        given. Unless validate is False, it raises an InternalError if the
+        world fails validation.
+
+        :world_sections: A WorldSections object, or None.
+        :validate: A boolean, default True.
+        """
+        self._game_state = _build_pristine_world(world_sections, validate)
+        self._images = dict()
+        self._released = list()
+
+    @classmethod
+    def default(cls):
+        """
+        This classmethod returns a WorldFactory for the game's own dungeon,
+        built the first time it's called in a process and shared after that.
+
+        :return: A WorldFactory object.
+        """
+        global _default_world_factory
+        if _default_world_factory is None:
+            _default_world_factory = cls()
+        return _default_world_factory
+
+    def game_state(self):
+        """
+        This method returns a GameState object holding a copy of the pristine
+        world, either a released one or a new copy.
+
+        :return: A GameState object.
+        """
+        if self._released:
+            return self._released.pop()
+        game_state = deepcopy(self._game_state)
+        self._images[id(game_state)] = _PristineImage(game_state)
+        return game_state
+
+    def _image(self, game_state):
+        image = self._images.get(id(game_state))
+        if image is None or image.game_state is not game_state:
+            raise InternalError("the GameState wasn't handed out by this WorldFactory")
+        return image
+
+    def reset(self, game_state):
+        """
+        This method returns a GameState object handed out by game_state() to
+        the pristine world, in place. It raises an InternalError if the
+        GameState object came from somewhere else.
+
+        :game_state: A GameState object.
+        :return: None.
+        """
+        self._image(game_state).restore()
+
+    def release(self, game_state):
+        """
+        This method resets a GameState object handed out by game_state() and
+        keeps it to hand out again. It raises an InternalError if the
+        GameState object came from somewhere else or was already released.
+
+        :game_state: A GameState object.
+        :return: None.
+        """
+        image = self._image(game_state)
+        if any(released is game_state for released in self._released):
+            raise InternalError("the GameState was already released")
+        image.restore()
+        self._released.append(game_state)
@@ -2,6 +2,8 @@
 
 from iniconfig import IniConfig
 
+from advgame import WorldFactory, WorldSections
+
 
 __all__ = (
     "containers_ini_config",
@@ -9,6 +11,7 @@ __all__ = (
     "doors_ini_config",
     "creatures_ini_config",
     "rooms_ini_config",
+    "world_factory",
 )
 
 
@@ -17,3 +20,19 @@ items_ini_config = IniConfig("./testing_data/items.ini")
 doors_ini_config = IniConfig("./testing_data/doors.ini")
 creatures_ini_config = IniConfig("./testing_data/creatures.ini")
 rooms_ini_config = IniConfig("./testing_data/rooms.ini")
+
+# The testing dungeon is built once per process. Each test takes a copy of
+# it from world_factory.game_state() and releases it when it's done, which
+# resets it to the pristine dungeon for the next test. Its exit can't be
+# reached, so validation is skipped.
+
+world_factory = WorldFactory(
+    WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    ),
+    validate=False,
+)
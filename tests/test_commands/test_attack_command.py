@@ -1,18 +1,10 @@
 #!/usr/bin/python3
 
 from unittest import TestCase
+from unittest.mock import patch
 from operator import itemgetter
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    Corpse,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor, Corpse
 from advgame.statemsgs.attack import (
     AttackHitGSM,
     AttackMissedGSM,
@@ -27,13 +19,7 @@ from advgame.statemsgs.be_atkd import (
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.various import FoeDeathGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = (
@@ -48,28 +34,9 @@ class Test_Attack_1(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.game_state.character_name = "Niath"
         self.game_state.character_class = "Warrior"
@@ -130,6 +97,30 @@ class Test_Attack_1(TestCase):
             result[0].message, "This room doesn't have a sorcerer; nobody is here."
         )
 
+    def test_attack_process_iter(self):
+        # The player's attack is yielded before the kobold's
+        # counterattack is rolled. The player's attack roll is fixed to
+        # miss, so the kobold is always left alive to counterattack.
+        with patch("advgame.commands.attack.roll_dice", return_value=0), patch(
+            "advgame.commands.be_atkd.roll_dice", return_value=1
+        ) as counterattack_roll_dice:
+            results = self.command_processor.process_iter("attack kobold")
+            self.assertIsInstance(next(results), AttackMissedGSM)
+            counterattack_roll_dice.assert_not_called()
+            self.assertIsInstance(next(results), AttackedAndNotHitGSM)
+            counterattack_roll_dice.assert_called()
+            self.assertEqual(list(results), [])
+
+        # The counterattack can end the game, and the game-ending value
+        # is kept just as it is by process().
+        self.game_state.character.take_damage(self.game_state.character.hit_points - 1)
+        with patch("advgame.commands.attack.roll_dice", return_value=0), patch(
+            "advgame.commands.be_atkd.roll_dice", return_value=100
+        ):
+            results = tuple(self.command_processor.process_iter("attack kobold"))
+        self.assertIsInstance(results[-1], CharacterDeathGSM)
+        self.assertIs(self.command_processor.process("look at kobold")[0], results[-1])
+
     def test_attack_vs_be_attacked_by_vs_character_death_2(self):
         results = tuple()
         while not len(results) or not isinstance(results[-1], FoeDeathGSM):
@@ -217,28 +208,9 @@ class Test_Attack_2(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.game_state.character_name = "Mialee"
         self.game_state.character_class = "Mage"
@@ -2,15 +2,7 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.drink import (
     AmountToDrinkUnclearGSM,
@@ -22,13 +14,7 @@ from advgame.statemsgs.drink import (
 )
 from advgame.statemsgs.various import UnderwentHealingEffectGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Drink",)
@@ -40,28 +26,8 @@ class Test_Drink(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
         self.command_processor = CommandProcessor(self.game_state)
 
     def test_drink1(self):
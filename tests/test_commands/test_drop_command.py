@@ -2,15 +2,7 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.drop import (
     AmountToDropUnclearGSM,
@@ -20,13 +12,7 @@ from advgame.statemsgs.drop import (
 )
 from advgame.statemsgs.various import ItemUnequippedGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Drop",)
@@ -38,28 +24,9 @@ class Test_Drop(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
 
     def test_drop_1(self):
@@ -378,3 +345,14 @@ class Test_Drop(TestCase):
             "You dropped a longsword. You see a longsword here. You have 2 "
             + "longswords left.",
         )
+
+    def test_drop_16(self):
+        self.command_processor.game_state.character_name = "Niath"
+        self.command_processor.game_state.character_class = "Warrior"
+        self.game_state.game_has_begun = True
+        gold_coin = self.items_state.get("Gold_Coin")
+        self.command_processor.game_state.character.pick_up_item(gold_coin, qty=30)
+        for command in ("drop", "drop 0 gold coins"):
+            result = self.command_processor.process(command)
+            self.assertIsInstance(result[0], BadSyntaxGSM)
+            self.assertEqual(result[0].command, "DROP")
@@ -2,26 +2,16 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
-from advgame.statemsgs.equip import ClassCantUseItemGSM, NoSuchItemInInventoryGSM
+from advgame.statemsgs.equip import (
+    ClassCantUseItemGSM,
+    ItemNotEquippableGSM,
+    NoSuchItemInInventoryGSM,
+)
 from advgame.statemsgs.various import ItemEquippedGSM, ItemUnequippedGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = (
@@ -36,28 +26,9 @@ class Test_Equip_1(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.longsword = self.command_processor.game_state.items_state.get("Longsword")
         self.scale_mail = self.command_processor.game_state.items_state.get(
@@ -179,6 +150,18 @@ class Test_Equip_1(TestCase):
             + r"[\d+-]+ and your wand damage is now [\dd+-]+.$",
         )
 
+    def test_equip_8(self):
+        mana_potion = self.items_state.get("Mana_Potion")
+        self.command_processor.game_state.character.pick_up_item(mana_potion)
+        result = self.command_processor.process("equip mana potion")
+        self.assertIsInstance(result[0], ItemNotEquippableGSM)
+        self.assertEqual(result[0].item_title, "mana potion")
+        self.assertEqual(result[0].item_type, "potion")
+        self.assertEqual(
+            result[0].message,
+            "You can't equip the mana potion; potions are not equippable.",
+        )
+
 
 class Test_Equip_2(TestCase):
     def __init__(self, *argl, **argd):
@@ -186,28 +169,9 @@ class Test_Equip_2(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.buckler = self.command_processor.game_state.items_state.get("Buckler")
         self.longsword = self.command_processor.game_state.items_state.get("Longsword")
@@ -2,28 +2,14 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.help_ import (
     DisplayCommandsGSM,
     DisplayHelpForCommandGSM,
     NotRecognizedGSM,
 )
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = (
@@ -38,28 +24,8 @@ class Test_Help_1(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
         self.command_processor = CommandProcessor(self.game_state)
         self.command_processor.process("set name to Niath")
         self.command_processor.process("set class to Warrior")
@@ -80,13 +46,16 @@ class Test_Help_1(TestCase):
                 "HELP",
                 "INVENTORY",
                 "LEAVE",
+                "LOAD",
                 "LOCK",
                 "LOOK AT",
+                "MAP",
                 "OPEN",
                 "PICK LOCK",
                 "PICK UP",
                 "PUT",
                 "QUIT",
+                "SAVE",
                 "STATUS",
                 "TAKE",
                 "UNEQUIP",
@@ -97,8 +66,8 @@ class Test_Help_1(TestCase):
             result[0].message,
             """The list of commands available during the game is:
 
-ATTACK, CAST SPELL, CLOSE, DRINK, DROP, EQUIP, HELP, INVENTORY, LEAVE, LOCK, LOOK AT, OPEN, PICK LOCK, \
-PICK UP, PUT, QUIT, STATUS, TAKE, UNEQUIP, and UNLOCK
+ATTACK, CAST SPELL, CLOSE, DRINK, DROP, EQUIP, HELP, INVENTORY, LEAVE, LOAD, LOCK, LOOK AT, MAP, OPEN, \
+PICK LOCK, PICK UP, PUT, QUIT, SAVE, STATUS, TAKE, UNEQUIP, and UNLOCK
 
 Which one do you want help with?
 """,
@@ -120,14 +89,17 @@ Which one do you want help with?
                 "HELP",
                 "INVENTORY",
                 "LEAVE",
+                "LOAD",
                 "LOCK",
                 "LOOK AT",
+                "MAP",
                 "OPEN",
                 "PICK LOCK",
                 "PICK UP",
                 "PUT",
                 "QUIT",
                 "REROLL",
+                "SAVE",
                 "SET CLASS",
                 "SET NAME",
                 "STATUS",
@@ -141,8 +113,8 @@ Which one do you want help with?
             """The command 'JUGGLE' is not recognized. The full list of commands is:
 
 ATTACK, BEGIN GAME, CAST SPELL, CLOSE, DRINK, DROP, EQUIP, HELP, INVENTORY, \
-LEAVE, LOCK, LOOK AT, OPEN, PICK LOCK, PICK UP, PUT, QUIT, REROLL, SET CLASS, \
-SET NAME, STATUS, TAKE, UNEQUIP, and UNLOCK
+LEAVE, LOAD, LOCK, LOOK AT, MAP, OPEN, PICK LOCK, PICK UP, PUT, QUIT, REROLL, SAVE, \
+SET CLASS, SET NAME, STATUS, TAKE, UNEQUIP, and UNLOCK
 
 Which one do you want help with?
 """,
@@ -236,28 +208,8 @@ class Test_Help_2(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
         self.command_processor = CommandProcessor(self.game_state)
 
     def test_help_1(self):
@@ -265,13 +217,13 @@ class Test_Help_2(TestCase):
         self.assertIsInstance(result[0], DisplayCommandsGSM)
         self.assertEqual(
             result[0].commands_available,
-            ("BEGIN GAME", "HELP", "QUIT", "REROLL", "SET CLASS", "SET NAME"),
+            ("BEGIN GAME", "HELP", "LOAD", "QUIT", "REROLL", "SET CLASS", "SET NAME"),
         )
         self.assertEqual(
             result[0].message,
             """The list of commands available before game start is:
 
-BEGIN GAME, HELP, QUIT, REROLL, SET CLASS, and SET NAME
+BEGIN GAME, HELP, LOAD, QUIT, REROLL, SET CLASS, and SET NAME
 
 Which one do you want help with?
 """,
@@ -293,14 +245,17 @@ Which one do you want help with?
                 "HELP",
                 "INVENTORY",
                 "LEAVE",
+                "LOAD",
                 "LOCK",
                 "LOOK AT",
+                "MAP",
                 "OPEN",
                 "PICK LOCK",
                 "PICK UP",
                 "PUT",
                 "QUIT",
                 "REROLL",
+                "SAVE",
                 "SET CLASS",
                 "SET NAME",
                 "STATUS",
@@ -314,8 +269,8 @@ Which one do you want help with?
             """The command 'JUGGLE' is not recognized. The full list of commands is:
 
 ATTACK, BEGIN GAME, CAST SPELL, CLOSE, DRINK, DROP, EQUIP, HELP, INVENTORY, \
-LEAVE, LOCK, LOOK AT, OPEN, PICK LOCK, PICK UP, PUT, QUIT, REROLL, SET CLASS, \
-SET NAME, STATUS, TAKE, UNEQUIP, and UNLOCK
+LEAVE, LOAD, LOCK, LOOK AT, MAP, OPEN, PICK LOCK, PICK UP, PUT, QUIT, REROLL, SAVE, \
+SET CLASS, SET NAME, STATUS, TAKE, UNEQUIP, and UNLOCK
 
 Which one do you want help with?
 """,
@@ -3,31 +3,11 @@
 from unittest import TestCase
 from operator import itemgetter
 
-from advgame import (
-    Armor,
-    Coin,
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    Potion,
-    RoomsState,
-    Shield,
-    Wand,
-    Weapon,
-)
+from advgame import Armor, Coin, CommandProcessor, Potion, Shield, Wand, Weapon
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.inven import DisplayInventoryGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Inventory",)
@@ -39,32 +19,20 @@ class Test_Inventory(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        containers_ini_config.sections["Wooden_Chest_1"]["contents"] = (
-            "[20xGold_Coin,1xWarhammer,1xMana_Potion,"
-            + "1xHealth_Potion,1xSteel_Shield,1xScale_Mail,1xMagic_Wand]"
-        )
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+
+        # The chest holds more than the testing dungeon puts in it.
+
+        items_state = self.game_state.items_state
+        chest = self.game_state.containers_state.get("Wooden_Chest_1")
+        for item_internal_name in (
+            "Health_Potion",
+            "Steel_Shield",
+            "Scale_Mail",
+            "Magic_Wand",
+        ):
+            chest.set(item_internal_name, 1, items_state.get(item_internal_name))
         self.command_processor = CommandProcessor(self.game_state)
         self.command_processor.game_state.character_name = "Niath"
         self.command_processor.game_state.character_class = "Warrior"
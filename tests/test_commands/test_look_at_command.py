@@ -2,17 +2,7 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    Door,
-    DoorsState,
-    GameState,
-    InternalError,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor, Door, InternalError
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.lookat import (
     FoundContainerHereGSM,
@@ -27,13 +17,7 @@ from advgame.statemsgs.various import (
     DoorNotPresentGSM,
 )
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = (
@@ -48,28 +32,21 @@ class Test_Look_At_1(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
+
+        # The chest holds more than the testing dungeon puts in it.
+
+        items_state = self.game_state.items_state
+        chest = self.game_state.containers_state.get("Wooden_Chest_1")
+        for item_internal_name in (
+            "Health_Potion",
+            "Steel_Shield",
+            "Scale_Mail",
+            "Magic_Wand",
+        ):
+            chest.set(item_internal_name, 1, items_state.get(item_internal_name))
         self.command_processor = CommandProcessor(self.game_state)
         self.game_state.character_name = "Niath"
         self.game_state.character_class = "Warrior"
@@ -340,32 +317,21 @@ class Test_Look_At_2(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        containers_ini_config.sections["Wooden_Chest_1"]["contents"] = (
-            "[20xGold_Coin,1xWarhammer,1xMana_Potion,"
-            + "1xHealth_Potion,1xSteel_Shield,1xScale_Mail,1xMagic_Wand]"
-        )
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
+
+        # The chest holds more than the testing dungeon puts in it.
+
+        items_state = self.game_state.items_state
+        chest = self.game_state.containers_state.get("Wooden_Chest_1")
+        for item_internal_name in (
+            "Health_Potion",
+            "Steel_Shield",
+            "Scale_Mail",
+            "Magic_Wand",
+        ):
+            chest.set(item_internal_name, 1, items_state.get(item_internal_name))
         self.command_processor = CommandProcessor(self.game_state)
         self.command_processor.game_state.character_name = "Lidda"
         self.command_processor.game_state.character_class = "Thief"
@@ -668,3 +634,23 @@ class Test_Look_At_2(TestCase):
             + "blue liquid with a discernable magic aura. It restores 20 mana "
             + "points. There is 1 on the floor.",
         )
+
+    def test_look_at_21(self):
+        self.game_state.rooms_state.cursor.items_here = None
+        result = self.command_processor.process("look at mana potion")
+        self.assertIsInstance(result[0], FoundNothingGSM)
+        self.assertEqual(result[0].item_title, "mana potion")
+        self.assertEqual(result[0].item_location, "floor")
+
+    def test_look_at_22(self):
+        small_leather_armor = self.items_state.get("Small_Leather_Armor")
+        self.game_state.character.pick_up_item(small_leather_armor)
+        result = self.command_processor.process(
+            "look at small leather armor in inventory"
+        )
+        self.assertIsInstance(result[0], FoundItemOrItemsHereGSM)
+        self.assertEqual(
+            result[0].item_description,
+            "A suit of leather armor designed for a humanoid of 4 feet in height. "
+            + "Its armor bonus is +2. No one can use this.",
+        )
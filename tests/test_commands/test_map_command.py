@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from advgame import AutoMap, CommandProcessor
+from advgame.statemsgs.command import BadSyntaxGSM
+from advgame.statemsgs.map_ import DisplayMapGSM
+
+from ..context import world_factory
+
+
+__all__ = ("Test_Map",)
+
+
+class Test_Map(TestCase):
+    def __init__(self, *argl, **argd):
+        super().__init__(*argl, **argd)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.rooms_state = self.game_state.rooms_state
+        self.command_processor = CommandProcessor(self.game_state)
+        self.command_processor.game_state.character_name = "Niath"
+        self.command_processor.game_state.character_class = "Warrior"
+        self.command_processor.game_state.game_has_begun = True
+
+    def test_map_1(self):
+        result = self.command_processor.process("map west")
+        self.assertIsInstance(result[0], BadSyntaxGSM)
+        self.assertEqual(result[0].message, "MAP command: bad syntax. Should be 'MAP'.")
+
+    def test_map_2(self):
+        result = self.command_processor.process("map")
+        self.assertIsInstance(result[0], DisplayMapGSM)
+        self.assertEqual(
+            result[0].map_text,
+            "+-i-+\n|\u00A0@\u00A0I\n+---+",
+        )
+        self.assertEqual(result[0].legend, self.rooms_state.automap.LEGEND)
+        self.assertEqual(
+            result[0].message, result[0].map_text + "\n" + result[0].legend
+        )
+
+    def test_map_3(self):
+        self.command_processor.process("open north door")
+        self.command_processor.process("leave via north door")
+        self.command_processor.process("leave via east doorway")
+        automap = self.rooms_state.automap
+        self.assertEqual(automap.visited_count(), 3)
+        self.assertTrue(automap.is_visited("Room_2,2"))
+        self.assertFalse(automap.is_visited("Room_2,1"))
+        result = self.command_processor.process("map")
+        self.assertIsInstance(result[0], DisplayMapGSM)
+        self.assertEqual(
+            result[0].map_text,
+            "+---++-I-+\n"
+            + "|\u00A0\u00A0\u00A0\u00A0\u00A0\u00A0@\u00A0|\n"
+            + "+-/-++-I-+\n"
+            + "+-/-+\n"
+            + "|\u00A0\u00A0\u00A0I\n"
+            + "+---+",
+        )
+
+    def test_map_4(self):
+        # A tile is redrawn when the state of one of its room's doors
+        # changes.
+        self.assertEqual(
+            self.command_processor.process("map")[0].map_text,
+            "+-i-+\n|\u00A0@\u00A0I\n+---+",
+        )
+        self.rooms_state.cursor.east_door.is_locked = False
+        self.assertEqual(
+            self.command_processor.process("map")[0].map_text,
+            "+-i-+\n|\u00A0@\u00A0i\n+---+",
+        )
+
+    def test_map_5(self):
+        # After a move, only the tiles of the rooms entered and left are
+        # redrawn; the rest of the map is reused.
+        automap = self.rooms_state.automap
+        self.command_processor.process("open north door")
+        self.command_processor.process("leave via north door")
+        self.command_processor.process("map")
+        with patch.object(
+            AutoMap, "_door_glyph", autospec=True, side_effect=AutoMap._door_glyph
+        ) as door_glyph:
+            self.command_processor.process("leave via east doorway")
+            result = self.command_processor.process("map")
+            self.assertEqual(door_glyph.call_count, 2 * 4)
+            door_glyph.reset_mock()
+            self.assertEqual(
+                self.command_processor.process("map")[0].map_text, result[0].map_text
+            )
+            self.assertEqual(door_glyph.call_count, 0)
+        self.assertIn("D = locked door", automap.LEGEND)
+        self.assertIn("doorway", automap.LEGEND)
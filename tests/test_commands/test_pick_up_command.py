@@ -2,15 +2,7 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.pickup import (
     AmountToPickUpUnclearGSM,
@@ -20,13 +12,7 @@ from advgame.statemsgs.pickup import (
     TryingToPickUpMoreThanIsPresentGSM,
 )
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Pick_Up",)
@@ -38,28 +24,9 @@ class Test_Pick_Up(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.command_processor.game_state.character_name = "Niath"
         self.command_processor.game_state.character_class = "Warrior"
@@ -229,3 +196,10 @@ class Test_Pick_Up(TestCase):
             result[0].message,
             "You can't pick up the kobold corpse: can't pick up corpses!",
         )
+
+    def test_pick_up_15(self):
+        for command in ("pick up", "pick up 0 mana potion"):
+            result = self.command_processor.process(command)
+            self.assertIsInstance(result[0], BadSyntaxGSM)
+            self.assertEqual(result[0].command, "PICK UP")
+        self.assertEqual(self.game_state.character.list_items(), [])
@@ -2,24 +2,10 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import NotAllowedNowGSM, NotRecognizedGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Processor_Process",)
@@ -31,45 +17,42 @@ class Test_Processor_Process(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
         self.command_processor = CommandProcessor(self.game_state)
 
+    def test_process_iter(self):
+        for command in ("juggle", "attack kobold", "set name to Niath", "help"):
+            results = self.command_processor.process_iter(command)
+            self.assertNotIsInstance(results, tuple)
+            self.assertEqual(
+                tuple(type(result) for result in results),
+                tuple(
+                    type(result) for result in self.command_processor.process(command)
+                ),
+            )
+
     def test_command_not_recognized_in_pregame(self):
         result = self.command_processor.process("juggle")
         self.assertIsInstance(result[0], NotRecognizedGSM)
         self.assertEqual(result[0].command, "juggle")
         self.assertEqual(
             result[0].allowed_commands,
-            {"begin_game", "set_name", "help", "quit", "set_class", "reroll"},
+            {"begin_game", "set_name", "help", "load", "quit", "set_class", "reroll"},
         )
         self.assertEqual(
             result[0].message,
             "Command 'juggle' not recognized. Commands allowed before game "
-            + "start are BEGIN GAME, HELP, QUIT, REROLL, SET CLASS, and SET "
-            + "NAME.",
+            + "start are BEGIN GAME, HELP, LOAD, QUIT, REROLL, SET CLASS, and "
+            + "SET NAME.",
         )
 
+    def test_blank_command_not_recognized(self):
+        for command in ("", "   "):
+            result = self.command_processor.process(command)
+            self.assertIsInstance(result[0], NotRecognizedGSM)
+            self.assertEqual(result[0].command, "")
+
     def test_command_not_recognized_during_game(self):
         self.command_processor.game_state.character_name = "Niath"
         self.command_processor.game_state.character_class = "Warrior"
@@ -90,13 +73,16 @@ class Test_Processor_Process(TestCase):
                 "inventory",
                 "leave",
                 "look_at",
+                "load",
                 "lock",
+                "map",
                 "open",
                 "help",
                 "pick_lock",
                 "pick_up",
                 "put",
                 "quit",
+                "save",
                 "status",
                 "take",
                 "unequip",
@@ -107,8 +93,8 @@ class Test_Processor_Process(TestCase):
             result[0].message,
             "Command 'juggle' not recognized. Commands allowed during the "
             + "game are ATTACK, CAST SPELL, CLOSE, DRINK, DROP, EQUIP, HELP, "
-            + "INVENTORY, LEAVE, LOCK, LOOK AT, OPEN, PICK LOCK, PICK UP, "
-            + "PUT, QUIT, STATUS, TAKE, UNEQUIP, and UNLOCK.",
+            + "INVENTORY, LEAVE, LOAD, LOCK, LOOK AT, MAP, OPEN, PICK LOCK, "
+            + "PICK UP, PUT, QUIT, SAVE, STATUS, TAKE, UNEQUIP, and UNLOCK.",
         )
 
     def test_command_not_allowed_in_pregame(self):
@@ -117,12 +103,12 @@ class Test_Processor_Process(TestCase):
         self.assertEqual(result[0].command, "attack")
         self.assertEqual(
             result[0].allowed_commands,
-            {"begin_game", "help", "reroll", "set_name", "quit", "set_class"},
+            {"begin_game", "help", "load", "reroll", "set_name", "quit", "set_class"},
         )
         self.assertEqual(
             result[0].message,
             "Command 'attack' not allowed before game start. Commands allowed "
-            + "before game start are BEGIN GAME, HELP, QUIT, REROLL, SET "
+            + "before game start are BEGIN GAME, HELP, LOAD, QUIT, REROLL, SET "
             + "CLASS, and SET NAME.",
         )
 
@@ -147,13 +133,16 @@ class Test_Processor_Process(TestCase):
                 "inventory",
                 "leave",
                 "look_at",
+                "load",
                 "lock",
+                "map",
                 "open",
                 "pick_lock",
                 "pick_up",
                 "quit",
                 "put",
                 "quit",
+                "save",
                 "status",
                 "take",
                 "unequip",
@@ -164,6 +153,6 @@ class Test_Processor_Process(TestCase):
             result[0].message,
             "Command 'reroll' not allowed during the game. Commands allowed "
             + "during the game are ATTACK, CAST SPELL, CLOSE, DRINK, DROP, "
-            + "EQUIP, HELP, INVENTORY, LEAVE, LOCK, LOOK AT, OPEN, PICK LOCK, "
-            + "PICK UP, PUT, QUIT, STATUS, TAKE, UNEQUIP, and UNLOCK.",
+            + "EQUIP, HELP, INVENTORY, LEAVE, LOAD, LOCK, LOOK AT, MAP, OPEN, "
+            + "PICK LOCK, PICK UP, PUT, QUIT, SAVE, STATUS, TAKE, UNEQUIP, and UNLOCK.",
         )
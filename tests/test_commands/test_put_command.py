@@ -2,27 +2,13 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.put import PutAmountOfItemGSM
 from advgame.statemsgs.take import ItemNotFoundInContainerGSM
 from advgame.statemsgs.various import ContainerIsClosedGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Put",)
@@ -34,28 +20,9 @@ class Test_Put(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.game_state.character_name = "Niath"
         self.game_state.character_class = "Warrior"
@@ -228,3 +195,15 @@ class Test_Put(TestCase):
             "You put 15 gold coins in the wooden chest. You have no more gold "
             + "coins.",
         )
+
+    def test_put_9(self):
+        self.game_state.rooms_state.cursor.container_here.is_locked = None
+        self.game_state.rooms_state.cursor.container_here.is_closed = False
+        self.command_processor.process("take 20 gold coins from the wooden chest")
+        for command in (
+            "put 5 in the wooden chest",
+            "put 0 gold coins in the wooden chest",
+        ):
+            result = self.command_processor.process(command)
+            self.assertIsInstance(result[0], BadSyntaxGSM)
+            self.assertEqual(result[0].command, "PUT")
@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+
+import os
+import tempfile
+
+from unittest import TestCase
+
+from advgame import (
+    CommandProcessor,
+    SaveFile,
+    WorldSections,
+    build_game_state,
+)
+from advgame.statemsgs.command import BadSyntaxGSM
+from advgame.statemsgs.load import (
+    GameLoadedGSM,
+    NoSavedGameGSM,
+    SavedGameCorruptGSM,
+)
+from advgame.statemsgs.save import GameSavedGSM, SavingUnavailableGSM
+from advgame.statemsgs.various import EnteredRoomGSM
+
+from ..context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Save_And_Load",)
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_Save_And_Load(TestCase):
+    def __init__(self, *argl, **argd):
+        super().__init__(*argl, **argd)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.save_dir = tempfile.TemporaryDirectory()
+        self.save_path = os.path.join(self.save_dir.name, "advgame.sav")
+        self.command_processor = CommandProcessor(
+            build_game_state(_world_sections()), save_file=SaveFile(self.save_path)
+        )
+        for command in ("set name to Niath", "set class to Warrior", "begin game"):
+            self.command_processor.process(command)
+
+    def tearDown(self):
+        self.save_dir.cleanup()
+
+    def test_save_and_load_1(self):
+        result = self.command_processor.process("save game")
+        self.assertIsInstance(result[0], BadSyntaxGSM)
+        self.assertEqual(
+            result[0].message, "SAVE command: bad syntax. Should be 'SAVE'."
+        )
+
+        result = self.command_processor.process("load")
+        self.assertIsInstance(result[0], NoSavedGameGSM)
+        self.assertEqual(result[0].message, "There's no saved game to load.")
+
+    def test_save_and_load_2(self):
+        result = self.command_processor.process("save")
+        self.assertIsInstance(result[0], GameSavedGSM)
+        self.assertEqual(result[0].message, "Your game has been saved.")
+
+        # Loading undoes what was done since the save.
+
+        self.command_processor.process("open north door")
+        self.command_processor.process("leave via north door")
+        result = self.command_processor.process("load")
+        self.assertIsInstance(result[0], GameLoadedGSM)
+        self.assertEqual(
+            result[0].message, "Welcome back, Niath. Your game has been loaded."
+        )
+        self.assertIsInstance(result[1], EnteredRoomGSM)
+        game_state = self.command_processor.game_state
+        self.assertEqual(game_state.rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertTrue(game_state.rooms_state.cursor.north_door.is_closed)
+
+    def test_save_and_load_3(self):
+        self.command_processor.process("open north door")
+        self.command_processor.process("save")
+
+        # A saved game can be loaded before the game begins.
+
+        command_processor = CommandProcessor(
+            build_game_state(_world_sections()), save_file=SaveFile(self.save_path)
+        )
+        result = command_processor.process("save")
+        self.assertIn("not allowed before game start", result[0].message)
+        result = command_processor.process("load")
+        self.assertIsInstance(result[0], GameLoadedGSM)
+        self.assertTrue(command_processor.game_state.game_has_begun)
+        self.assertEqual(command_processor.game_state.character_class, "Warrior")
+        self.assertFalse(
+            command_processor.game_state.rooms_state.cursor.north_door.is_closed
+        )
+        result = command_processor.process("leave via north door")
+        self.assertEqual(result[0].message, "You leave the room via the north door.")
+
+    def test_save_and_load_4(self):
+        self.command_processor.process("save")
+        with open(self.save_path, "r+b") as save_file:
+            save_file.seek(-1, os.SEEK_END)
+            save_file.write(b"\x00")
+        result = self.command_processor.process("load")
+        self.assertIsInstance(result[0], SavedGameCorruptGSM)
+
+    def test_save_and_load_5(self):
+        command_processor = CommandProcessor(self.command_processor.game_state)
+        for command in ("save", "load"):
+            result = command_processor.process(command)
+            self.assertIsInstance(result[0], SavingUnavailableGSM)
+            self.assertEqual(
+                result[0].message, "Saving and loading games isn't available."
+            )
+
+    def test_save_and_load_6(self):
+        command_processor = CommandProcessor(
+            build_game_state(_world_sections(), lazy=True),
+            save_file=SaveFile(self.save_path),
+        )
+        for command in ("set name to Niath", "set class to Warrior", "begin game"):
+            command_processor.process(command)
+        command_processor.process("save")
+        rooms_state = command_processor.game_state.rooms_state
+        self.assertFalse(rooms_state.is_materialized("Room_1,2"))
+
+        # Loading undoes what was done in rooms that weren't instantiated
+        # when the game was saved.
+
+        for command in ("open north door", "leave via north door", "drop buckler"):
+            command_processor.process(command)
+        self.assertIsNotNone(rooms_state.get("Room_1,2").items_here)
+        result = command_processor.process("load")
+        self.assertIsInstance(result[0], GameLoadedGSM)
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertTrue(rooms_state.cursor.north_door.is_closed)
+        self.assertFalse(rooms_state.is_materialized("Room_1,2"))
+        self.assertIsNone(rooms_state.get("Room_1,2").items_here)
+        self.assertTrue(rooms_state.get("Room_1,2").south_door.is_closed)
@@ -1,16 +1,9 @@
 #!/usr/bin/python3
 
+from copy import copy
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.put import (
     AmountToPutUnclearGSM,
@@ -25,13 +18,7 @@ from advgame.statemsgs.take import (
 )
 from advgame.statemsgs.various import ContainerIsClosedGSM, ContainerNotFoundGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = ("Test_Take",)
@@ -43,28 +30,9 @@ class Test_Take(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
+        self.items_state = self.game_state.items_state
         self.command_processor = CommandProcessor(self.game_state)
         self.game_state.character_name = "Niath"
         self.game_state.character_class = "Warrior"
@@ -663,3 +631,32 @@ class Test_Take(TestCase):
         self.assertIsInstance(result[0], ContainerIsClosedGSM)
         self.assertEqual(result[0].target, "wooden chest")
         self.assertEqual(result[0].message, "The wooden chest is closed.")
+
+    def test_take_31(self):
+        chest = self.game_state.rooms_state.cursor.container_here
+        chest.is_locked = chest.is_closed = False
+
+        # Two different items with the same title; the first is taken.
+
+        longsword = self.items_state.get("Longsword")
+        other_longsword = copy(longsword)
+        other_longsword.internal_name = "Longsword_2"
+        chest.set("Longsword", 1, longsword)
+        chest.set("Longsword_2", 1, other_longsword)
+        result = self.command_processor.process("take longsword from wooden chest")
+        self.assertIsInstance(result[0], ItemOrItemsTakenGSM)
+        self.assertEqual(result[0].item_title, "longsword")
+        self.assertEqual(
+            [item.title for _, item in chest.values()].count("longsword"), 1
+        )
+
+    def test_take_32(self):
+        self.game_state.rooms_state.cursor.container_here.is_locked = None
+        self.game_state.rooms_state.cursor.container_here.is_closed = False
+        for command in (
+            "take 0 gold coins from wooden chest",
+            "take 5 from wooden chest",
+        ):
+            result = self.command_processor.process(command)
+            self.assertIsInstance(result[0], BadSyntaxGSM)
+            self.assertEqual(result[0].command, "TAKE")
@@ -2,26 +2,12 @@
 
 from unittest import TestCase
 
-from advgame import (
-    CommandProcessor,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
-    GameState,
-    ItemsState,
-    RoomsState,
-)
+from advgame import CommandProcessor
 from advgame.statemsgs.command import BadSyntaxGSM
 from advgame.statemsgs.unequip import ItemNotEquippedGSM
 from advgame.statemsgs.various import ItemUnequippedGSM
 
-from ..context import (
-    containers_ini_config,
-    items_ini_config,
-    doors_ini_config,
-    creatures_ini_config,
-    rooms_ini_config,
-)
+from ..context import world_factory
 
 
 __all__ = (
@@ -36,28 +22,8 @@ class Test_Unequip_1(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
         self.command_processor = CommandProcessor(self.game_state)
         self.buckler = self.command_processor.game_state.items_state.get("Buckler")
         self.longsword = self.command_processor.game_state.items_state.get("Longsword")
@@ -156,6 +122,14 @@ class Test_Unequip_1(TestCase):
             + r"armor class is now \d+.$",
         )
 
+    def test_unequip_9(self):
+        mana_potion = self.command_processor.game_state.items_state.get("Mana_Potion")
+        self.command_processor.game_state.character.pick_up_item(mana_potion)
+        result = self.command_processor.process("unequip mana potion")
+        self.assertIsInstance(result[0], ItemNotEquippedGSM)
+        self.assertEqual(result[0].item_specified_title, "mana potion")
+        self.assertEqual(result[0].message, "You don't have a mana potion equipped.")
+
 
 class Test_Unequip_2(TestCase):
     def __init__(self, *argl, **argd):
@@ -163,28 +137,8 @@ class Test_Unequip_2(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
         self.command_processor = CommandProcessor(self.game_state)
         self.staff = self.command_processor.game_state.items_state.get("Staff")
         self.magic_wand = self.command_processor.game_state.items_state.get(
@@ -5,24 +5,16 @@ from operator import itemgetter
 
 from advgame import (
     AbilityScores,
-    ContainersState,
-    CreaturesState,
-    DoorsState,
+    Coin,
     Equipment,
-    GameState,
     InternalError,
+    Item,
     ItemsState,
-    RoomsState,
+    Potion,
     Weapon,
 )
 
-from ..context import (
-    containers_ini_config,
-    creatures_ini_config,
-    doors_ini_config,
-    items_ini_config,
-    rooms_ini_config,
-)
+from ..context import items_ini_config, world_factory
 
 
 __all__ = (
@@ -170,28 +162,8 @@ class Test_GameState(TestCase):
         self.maxDiff = None
 
     def setUp(self):
-        self.items_state = ItemsState(**items_ini_config.sections)
-        self.doors_state = DoorsState(**doors_ini_config.sections)
-        self.containers_state = ContainersState(
-            self.items_state, **containers_ini_config.sections
-        )
-        self.creatures_state = CreaturesState(
-            self.items_state, **creatures_ini_config.sections
-        )
-        self.rooms_state = RoomsState(
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-            **rooms_ini_config.sections,
-        )
-        self.game_state = GameState(
-            self.rooms_state,
-            self.creatures_state,
-            self.containers_state,
-            self.doors_state,
-            self.items_state,
-        )
+        self.game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, self.game_state)
 
     def test_game_state(self):
         self.assertFalse(self.game_state.game_has_begun)
@@ -228,6 +200,57 @@ class Test_Item_and_ItemsState(TestCase):
         self.assertEqual(self.items_state.get("Longsword").attack_bonus, 0)
         self.assertEqual(self.items_state.get("Longsword").warrior_can_use, True)
 
+    def test_item_layouts(self):
+        # Each item type has only the attributes it uses, and no __dict__.
+
+        for item in self.items_state.values():
+            self.assertFalse(hasattr(item, "__dict__"), item.internal_name)
+        gold_coin = self.items_state.get("Gold_Coin")
+        self.assertIsInstance(gold_coin, Coin)
+        self.assertFalse(hasattr(gold_coin, "damage"))
+        self.assertFalse(hasattr(gold_coin, "warrior_can_use"))
+        mana_potion = self.items_state.get("Mana_Potion")
+        self.assertEqual(mana_potion.mana_points_recovered, 20)
+        self.assertIsNone(mana_potion.hit_points_recovered)
+        self.assertFalse(hasattr(mana_potion, "armor_bonus"))
+
+        # Keys an item type doesn't use are ignored.
+
+        potion = Item.subclassing_factory(
+            internal_name="Potion", item_type="potion", warrior_can_use="true"
+        )
+        self.assertIsInstance(potion, Potion)
+        self.assertFalse(hasattr(potion, "warrior_can_use"))
+        self.assertIsNone(potion.title)
+        self.assertEqual(potion, Potion(internal_name="Potion", item_type="potion"))
+        self.assertNotEqual(potion, Potion(internal_name="Potion", title="potion"))
+
+    def test_names_interned(self):
+        game_state = world_factory.game_state()
+        self.addCleanup(world_factory.release, game_state)
+        items_state = game_state.items_state
+        for item_internal_name, item in items_state.items():
+            self.assertIs(item_internal_name, item.internal_name)
+        item_lists = list(game_state.containers_state.values())
+        item_lists.extend(
+            room.items_here
+            for room in game_state.rooms_state._rooms_objs.values()
+            if room.items_here is not None
+        )
+        self.assertTrue(any(item_list.size() for item_list in item_lists))
+        for item_list in item_lists:
+            for item_internal_name, (_, item) in item_list.items():
+                self.assertIs(item_internal_name, item.internal_name)
+                self.assertIs(item, items_state.get(item_internal_name))
+        self.assertIs(
+            items_state.get("Longsword").title,
+            Item.subclassing_factory(
+                internal_name="Longsword",
+                title="".join("longsword"),
+                item_type="weapon",
+            ).title,
+        )
+
     def test_usable_by(self):
         self.assertTrue(self.items_state.get("Longsword").usable_by("Warrior"))
         self.assertFalse(self.items_state.get("Longsword").usable_by("Thief"))
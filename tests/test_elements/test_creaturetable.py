@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+
+import sys
+
+from copy import deepcopy
+from unittest import TestCase
+
+from advgame import (
+    CreatureScheduler,
+    CreatureTable,
+    InternalError,
+    RegenerateAll,
+    TabledCreature,
+    WorldSections,
+    build_game_state,
+)
+
+from ..context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Creature_Table",)
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_Creature_Table(TestCase):
+    def setUp(self):
+        self.game_state = build_game_state(_world_sections(), tabular=True)
+        self.table = self.game_state.creatures_state.table
+        self.kobold = self.game_state.creatures_state.get("Kobold_Trysk")
+        self.row = self.table.ordinal("Kobold_Trysk")
+
+    def test_creature_table_rows(self):
+        self.assertIsInstance(self.table, CreatureTable)
+        self.assertIsInstance(self.kobold, TabledCreature)
+        self.assertEqual(len(self.table), self.game_state.creatures_state.size())
+        self.assertEqual(self.table.hit_points[self.row], self.kobold.hit_points)
+        self.assertEqual(
+            self.table.hit_point_total[self.row], self.kobold.hit_point_total
+        )
+        self.assertEqual(self.table.armor_class[self.row], self.kobold.armor_class)
+        self.assertEqual(self.table.attack_bonus[self.row], self.kobold.attack_bonus)
+
+        # The creature's hit points are its table row's.
+
+        self.kobold.take_damage(3)
+        self.assertEqual(
+            self.table.hit_points[self.row], self.kobold.hit_point_total - 3
+        )
+        self.table.hit_points[self.row] = 1
+        self.assertEqual(self.kobold.hit_points, 1)
+
+        # Without tabular mode there's no table.
+
+        self.assertIsNone(build_game_state(_world_sections()).creatures_state.table)
+
+    def test_creature_table_equipment_changes(self):
+        # The armor class and attack bonus columns follow the creature's
+        # equipment.
+
+        armor_class = self.kobold.armor_class
+        armor = self.kobold.armor
+        self.kobold.unequip_armor()
+        self.assertLess(self.table.armor_class[self.row], armor_class)
+        self.assertEqual(self.kobold.armor_class, self.table.armor_class[self.row])
+        self.kobold.equip_armor(armor)
+        self.assertEqual(self.table.armor_class[self.row], armor_class)
+
+        weapon = self.kobold.weapon
+        self.kobold.unequip_weapon()
+        self.assertEqual(self.table.attack_bonus[self.row], 0)
+        with self.assertRaises(InternalError):
+            self.kobold.attack_bonus
+        self.kobold.equip_weapon(weapon)
+        self.assertEqual(self.kobold.attack_bonus, self.table.attack_bonus[self.row])
+
+    def test_creature_table_bulk_operations(self):
+        total = self.kobold.hit_point_total
+        self.kobold.take_damage(5)
+        scheduler = CreatureScheduler(self.game_state.rooms_state)
+        scheduler.schedule(RegenerateAll(self.table, amount=2, period=1))
+        scheduler.advance()
+        self.assertEqual(self.kobold.hit_points, total - 3)
+        scheduler.advance(5)
+        self.assertEqual(self.kobold.hit_points, total)
+
+        self.table.scale_hit_points(2)
+        self.assertEqual(self.kobold.hit_point_total, total * 2)
+        self.assertEqual(self.kobold.hit_points, total * 2)
+
+        self.kobold.take_damage(self.kobold.hit_points)
+        self.assertNotIn(self.row, self.table.living_rows())
+        self.table.heal_all(5)
+        self.assertTrue(self.kobold.is_dead)
+
+    def test_creature_table_room_index(self):
+        rooms_state = self.game_state.rooms_state
+        self.assertEqual(self.table.rows_in_room(0), [self.row])
+        rooms_state.move_creature("Room_1,1", "Room_1,2")
+        self.assertIs(rooms_state.get("Room_1,2").creature_here, self.kobold)
+        self.assertEqual(self.table.rows_in_room(0), [])
+        self.assertEqual(self.table.rows_in_room(1), [self.row])
+
+    def test_creature_table_copy_and_snapshot(self):
+        snapshot = self.kobold.snapshot()
+        self.kobold.take_damage(4)
+        self.kobold.restore(snapshot)
+        self.assertEqual(self.kobold.hit_points, self.kobold.hit_point_total)
+        self.assertEqual(self.kobold.convert_to_corpse().internal_name, "Kobold_Trysk")
+
+        # A copy of the world has its own table.
+
+        game_state_copy = deepcopy(self.game_state)
+        kobold_copy = game_state_copy.creatures_state.get("Kobold_Trysk")
+        self.assertIsNot(game_state_copy.creatures_state.table, self.table)
+        kobold_copy.take_damage(2)
+        self.assertEqual(self.kobold.hit_points, self.kobold.hit_point_total)
+        self.assertEqual(
+            game_state_copy.creatures_state.table.hit_points[self.row],
+            kobold_copy.hit_points,
+        )
+
+    def test_creature_table_creature_size(self):
+        creature = build_game_state(_world_sections()).creatures_state.get(
+            "Kobold_Trysk"
+        )
+
+        # A tabled creature doesn't have the attributes a creature stores
+        # its hit points and mana points in, only its table and row, so it
+        # takes less memory than a creature.
+
+        slot_names = {
+            slot_name
+            for cls in type(self.kobold).__mro__
+            for slot_name in cls.__dict__.get("__slots__", ())
+        }
+        self.assertFalse(
+            slot_names
+            & {
+                "_hit_point_maximum",
+                "_current_hit_points",
+                "_mana_point_maximum",
+                "_current_mana_points",
+            }
+        )
+        self.assertLess(sys.getsizeof(self.kobold), sys.getsizeof(creature))
+
+        # Its mana points are its table row's too.
+
+        self.assertEqual(self.table.mana_points[self.row], self.kobold.mana_points)
+        self.assertEqual(
+            self.table.mana_point_total[self.row], self.kobold.mana_point_total
+        )
+        self.assertEqual(self.kobold.mana_points, creature.mana_points)
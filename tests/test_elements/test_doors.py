@@ -3,9 +3,25 @@
 from operator import itemgetter
 from unittest import TestCase
 
-from advgame import Door, DoorsState, Doorway, IronDoor, WoodenDoor
+from advgame import (
+    Door,
+    DoorState,
+    DoorsState,
+    Doorway,
+    IronDoor,
+    RoomsState,
+    WoodenDoor,
+    WorldSections,
+    build_game_state,
+)
 
-from ..context import doors_ini_config
+from ..context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
 
 
 __all__ = ("Test_Door_and_DoorsState",)
@@ -113,3 +129,78 @@ class Test_Door_and_DoorsState(TestCase):
         self.assertIsInstance(door, IronDoor)
         door_copy = door.copy()
         self.assertIsInstance(door_copy, IronDoor)
+        door_copy.is_locked = True
+        self.assertFalse(door.is_locked)
+
+    def test_doors_state_adjacency(self):
+        door = self.doors_state.get("Room_1,1", "Room_1,2")
+        self.assertIs(self.doors_state.get("Room_1,2", "Room_1,1"), door)
+        self.assertTrue(self.doors_state.contains("Exit", "Room_2,2"))
+        self.assertEqual(self.doors_state.key("Exit", "Room_2,2"), ("Room_2,2", "Exit"))
+        with self.assertRaises(KeyError):
+            self.doors_state.get("Room_1,1", "Room_2,2")
+        self.assertEqual(
+            dict(self.doors_state.neighbors("Room_1,1")),
+            {
+                "Room_1,2": door,
+                "Room_2,1": self.doors_state.get("Room_1,1", "Room_2,1"),
+            },
+        )
+        self.assertEqual(self.doors_state.degree("Room_2,2"), 3)
+        self.assertEqual(self.doors_state.degree("Room_3,3"), 0)
+
+        # The views are live, and the count and index follow set() and
+        # delete().
+
+        keys = self.doors_state.keys()
+        values = self.doors_state.values()
+        self.doors_state.delete("Room_2,2", "Exit")
+        self.assertEqual(len(keys), 4)
+        self.assertNotIn(("Room_2,2", "Exit"), keys)
+        self.assertEqual(self.doors_state.degree("Room_2,2"), 2)
+        self.assertFalse(self.doors_state.contains("Exit", "Room_2,2"))
+        self.doors_state.set("Room_1,2", "Room_1,1", door.copy())
+        self.assertEqual(self.doors_state.size(), 4)
+        self.assertIsNot(self.doors_state.get("Room_1,1", "Room_1,2"), door)
+        self.assertIn(self.doors_state.get("Room_1,1", "Room_1,2"), values)
+
+    def test_door_views(self):
+        door = self.doors_state.get("Room_1,1", "Room_1,2")
+        north_door = door.view("north door")
+        south_door = door.view("south door")
+        self.assertIsInstance(north_door, IronDoor)
+        self.assertEqual(north_door.title, "north door")
+        self.assertEqual(door.title, "iron door")
+        self.assertEqual(north_door.description, door.description)
+
+        # All views of a door share one DoorState object.
+
+        north_door.is_closed = False
+        self.assertFalse(south_door.is_closed)
+        self.assertFalse(door.is_closed)
+        south_door.restore({"is_locked": True, "is_closed": True})
+        self.assertEqual(north_door.snapshot(), {"is_locked": True, "is_closed": True})
+        self.assertEqual(door._state, DoorState(True, True))
+
+    def test_room_doors_share_state(self):
+        game_state = build_game_state(
+            WorldSections.from_ini_configs(
+                items_ini_config,
+                doors_ini_config,
+                containers_ini_config,
+                creatures_ini_config,
+                rooms_ini_config,
+            )
+        )
+        rooms_state = game_state.rooms_state
+        self.assertIsInstance(rooms_state, RoomsState)
+        north_door = rooms_state.get("Room_1,1").north_door
+        south_door = rooms_state.get("Room_1,2").south_door
+        self.assertEqual(
+            (north_door.title, south_door.title), ("north door", "south door")
+        )
+        self.assertIs(north_door._state, south_door._state)
+        self.assertIs(
+            north_door._state,
+            game_state.doors_state.get("Room_1,1", "Room_1,2")._state,
+        )
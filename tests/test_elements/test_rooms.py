@@ -153,3 +153,39 @@ class Test_RoomsState_Obj(TestCase):
         doors_tuple = self.rooms_state.cursor.doors
         self.assertEqual(doors_tuple[0].internal_name, "Room_1,1_x_Room_1,2")
         self.assertEqual(doors_tuple[1].internal_name, "Room_1,1_x_Room_2,1")
+
+    def test_room_door_index(self):
+        room = self.rooms_state.get("Room_2,2")
+        self.assertEqual(list(room.find_doors("door")), ["north", "south"])
+        self.assertEqual(list(room.find_doors("iron_door")), ["north", "south"])
+        self.assertEqual(list(room.find_doors("south", "iron_door")), ["south"])
+        self.assertIs(room.find_doors("west", "doorway")["west"], room.west_door)
+        self.assertEqual(room.find_doors("west", "iron_door"), {})
+        self.assertEqual(room.find_doors("east"), {})
+
+    def test_rooms_state_lazy(self):
+        rooms_state = RoomsState(
+            self.creatures_state,
+            self.containers_state,
+            self.doors_state,
+            self.items_state,
+            lazy=True,
+            **rooms_ini_config.sections,
+        )
+        self.assertEqual(rooms_state.size(), 4)
+        self.assertEqual(
+            set(rooms_state.keys()),
+            {"Room_1,1", "Room_1,2", "Room_2,1", "Room_2,2"},
+        )
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertTrue(rooms_state.is_materialized("Room_1,1"))
+        self.assertFalse(rooms_state.is_materialized("Room_1,2"))
+        self.assertFalse(rooms_state.is_materialized("Room_2,2"))
+        rooms_state.move(north=True)
+        self.assertTrue(rooms_state.is_materialized("Room_1,2"))
+        self.assertEqual(rooms_state.cursor.title, "northwest dungeon room")
+        self.assertEqual(rooms_state.cursor.south_door.title, "south door")
+        self.assertFalse(rooms_state.is_materialized("Room_2,2"))
+        self.assertEqual(rooms_state.get("Room_2,1"), self.rooms_state.get("Room_2,1"))
+        self.assertEqual(len(tuple(rooms_state.values())), 4)
+        self.assertTrue(rooms_state.is_materialized("Room_2,2"))
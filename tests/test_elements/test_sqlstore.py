@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+
+import os
+import tempfile
+
+from unittest import TestCase
+
+from advgame import (
+    CommandProcessor,
+    Corpse,
+    ItemsState,
+    SQLiteWorldStore,
+)
+
+from ..context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_SQLite_World_Store",)
+
+
+class Test_SQLite_World_Store(TestCase):
+    def __init__(self, *argl, **argd):
+        super().__init__(*argl, **argd)
+        self.maxDiff = None
+
+    def setUp(self):
+        file_descriptor, self.db_path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(file_descriptor)
+        self.store = SQLiteWorldStore(self.db_path)
+        self.store.import_world(
+            doors_ini_config.sections,
+            containers_ini_config.sections,
+            creatures_ini_config.sections,
+            rooms_ini_config.sections,
+        )
+        self.items_state = ItemsState(**items_ini_config.sections)
+
+    def tearDown(self):
+        self.store.connection.close()
+        os.remove(self.db_path)
+
+    def _open(self, store, session, cache_size=256, batch_size=64):
+        game_state = store.open_game(session, self.items_state, cache_size, batch_size)
+        if not game_state.game_has_begun:
+            game_state.character_name = "Niath"
+            game_state.character_class = "Warrior"
+            game_state.game_has_begun = True
+        return CommandProcessor(game_state)
+
+    def test_sqlstore_lookups(self):
+        command_processor = self._open(self.store, "alpha")
+        rooms_state = command_processor.game_state.rooms_state
+        self.assertEqual(rooms_state.size(), 4)
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertEqual(rooms_state.cursor.north_door.title, "north door")
+        self.assertEqual(rooms_state.room_at(1, 1), "Room_2,2")
+        self.assertEqual(rooms_state.coordinates("Room_2,1"), (1, 0))
+        self.assertIsNone(rooms_state.room_at(5, 5))
+        self.assertTrue(
+            command_processor.game_state.creatures_state.contains("Kobold_Trysk")
+        )
+        self.assertTrue(
+            command_processor.game_state.doors_state.contains("Room_1,1", "Room_1,2")
+        )
+        self.assertFalse(rooms_state.is_materialized("Room_1,2"))
+        doors_state = command_processor.game_state.doors_state
+        self.assertEqual(doors_state.size(), 5)
+        self.assertEqual(len(list(doors_state.values())), 5)
+        self.assertEqual(doors_state.degree("Room_2,2"), 3)
+        self.assertIs(
+            doors_state.get("Room_1,2", "Room_1,1"),
+            doors_state.get("Room_1,1", "Room_1,2"),
+        )
+
+    def test_sqlstore_lru_eviction(self):
+        command_processor = self._open(self.store, "alpha", cache_size=1)
+        rooms_state = command_processor.game_state.rooms_state
+        command_processor.process("open north door")
+        command_processor.process("leave via north door")
+        command_processor.process("leave via east doorway")
+
+        # The room the player is in is pinned, and the cache holds the one
+        # they left most recently; the entrance was evicted, and its open
+        # door is restored from the pending write-back batch.
+
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_2,2")
+        self.assertTrue(rooms_state.is_materialized("Room_1,2"))
+        self.assertFalse(rooms_state.is_materialized("Room_1,1"))
+        self.assertEqual(rooms_state.cached_count(), 2)
+        self.assertFalse(rooms_state.get("Room_1,1").north_door.is_closed)
+
+    def test_sqlstore_shared_doors(self):
+        command_processor = self._open(self.store, "alpha", cache_size=1)
+        rooms_state = command_processor.game_state.rooms_state
+        command_processor.process("open north door")
+        command_processor.process("leave via north door")
+        self.assertFalse(rooms_state.cursor.south_door.is_closed)
+        command_processor.process("close south door")
+        command_processor.process("leave via east doorway")
+
+        # Both rooms' doors still share their state after the rooms and
+        # doors caches have turned over.
+
+        entrance = rooms_state.get("Room_1,1")
+        self.assertIs(
+            entrance.north_door._state, rooms_state.get("Room_1,2").south_door._state
+        )
+        self.assertTrue(entrance.north_door.is_closed)
+
+    def test_sqlstore_session_persistence(self):
+        command_processor = self._open(self.store, "alpha")
+        kobold = command_processor.game_state.rooms_state.cursor.creature_here
+        kobold.take_damage(kobold.hit_points)
+        corpse = kobold.convert_to_corpse()
+        command_processor.game_state.rooms_state.cursor.container_here = corpse
+        command_processor.game_state.rooms_state.cursor.creature_here = None
+        command_processor.process("pick up mana potion")
+        command_processor.process("open north door")
+        command_processor.process("leave via north door")
+        character = command_processor.game_state.character
+        character.take_damage(5)
+        hit_points = character.hit_points
+        self.store.close()
+
+        # The changes are read back by a new connection to the same file;
+        # another session sees the pristine world.
+
+        self.store = SQLiteWorldStore(self.db_path)
+        command_processor = self._open(self.store, "alpha")
+        rooms_state = command_processor.game_state.rooms_state
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,2")
+
+        # The game is resumed with it: the character, the game's progress
+        # and the automap.
+
+        game_state = command_processor.game_state
+        self.assertTrue(game_state.game_has_begun)
+        self.assertEqual(game_state.character_name, "Niath")
+        self.assertEqual(game_state.character.hit_points, hit_points)
+        self.assertTrue(game_state.character.inventory.contains("Mana_Potion"))
+        self.assertEqual(rooms_state.automap.visited_count(), 2)
+        self.assertTrue(rooms_state.automap.is_visited("Room_1,1"))
+        entrance = rooms_state.get("Room_1,1")
+        self.assertIsNone(entrance.creature_here)
+        self.assertIsInstance(entrance.container_here, Corpse)
+        self.assertFalse(entrance.items_here.contains("Mana_Potion"))
+        self.assertFalse(entrance.north_door.is_closed)
+        other_processor = self._open(self.store, "beta")
+        other_entrance = other_processor.game_state.rooms_state.cursor
+        self.assertEqual(other_entrance.internal_name, "Room_1,1")
+        self.assertIsNotNone(other_entrance.creature_here)
+        self.assertTrue(other_entrance.items_here.contains("Mana_Potion"))
+
+        # The state objects alone resume the world's changes, but not the
+        # game, so they start in the entrance.
+
+        rooms_state, *_ = self.store.open_session("alpha", self.items_state)
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertIsInstance(rooms_state.cursor.container_here, Corpse)
@@ -0,0 +1,183 @@
+#!/usr/bin/python3
+
+import os
+import tempfile
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from advgame import (
+    CommandProcessor,
+    ContainersState,
+    CreaturesState,
+    DoorsState,
+    GameState,
+    InternalError,
+    ItemsState,
+    PackedDoorsState,
+    PackedItemsState,
+    PackedRoomsState,
+    RoomsState,
+    WorldPack,
+    write_world_pack,
+)
+
+from ..context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_World_Pack",)
+
+
+class Test_World_Pack(TestCase):
+    def __init__(self, *argl, **argd):
+        super().__init__(*argl, **argd)
+        self.maxDiff = None
+
+    def setUp(self):
+        file_descriptor, self.pack_path = tempfile.mkstemp(suffix=".pack")
+        os.close(file_descriptor)
+        write_world_pack(
+            self.pack_path,
+            items_ini_config.sections,
+            doors_ini_config.sections,
+            rooms_ini_config.sections,
+        )
+        self.world_pack = WorldPack(self.pack_path)
+
+    def tearDown(self):
+        self.world_pack.close()
+        os.remove(self.pack_path)
+
+    def test_world_pack_tables(self):
+        self.assertEqual(
+            list(self.world_pack.rooms),
+            ["Room_1,1", "Room_1,2", "Room_2,1", "Room_2,2"],
+        )
+        self.assertEqual(len(self.world_pack.items), len(items_ini_config.sections))
+        for door_internal_name, section in doors_ini_config.sections.items():
+            self.assertEqual(self.world_pack.doors[door_internal_name], dict(section))
+        self.assertIn("Longsword", self.world_pack.items)
+        self.assertNotIn("Juggling_Ball", self.world_pack.items)
+        with self.assertRaises(KeyError):
+            self.world_pack.rooms["Room_9,9"]
+
+    def test_world_pack_field_names(self):
+        # The field names are decoded when the pack is opened; a lookup
+        # decodes only the entry's name and values.
+
+        longsword = items_ini_config.sections["Longsword"]
+        self.assertEqual(set(longsword) - set(self.world_pack.items.field_names), set())
+        with patch.object(
+            WorldPack, "string", autospec=True, side_effect=WorldPack.string
+        ) as string:
+            self.assertEqual(self.world_pack.items["Longsword"], dict(longsword))
+            self.assertEqual(string.call_count, len(longsword))
+            string.reset_mock()
+            self.assertIsNone(self.world_pack.items.field_index("no_such_field"))
+            self.assertEqual(
+                self.world_pack.items.field_names[
+                    self.world_pack.items.field_index("title")
+                ],
+                "title",
+            )
+            self.assertEqual(string.call_count, 0)
+
+    def test_world_pack_bad_file(self):
+        with open(self.pack_path, "wb") as pack_file:
+            pack_file.write(b"\0" * 64)
+        with self.assertRaises(InternalError):
+            WorldPack(self.pack_path)
+
+    def test_world_pack_states(self):
+        items_state = PackedItemsState(self.world_pack)
+        doors_state = PackedDoorsState(self.world_pack)
+        containers_state = ContainersState(
+            items_state, **containers_ini_config.sections
+        )
+        creatures_state = CreaturesState(items_state, **creatures_ini_config.sections)
+        rooms_state = PackedRoomsState(
+            self.world_pack, creatures_state, containers_state, doors_state, items_state
+        )
+
+        # Only the entries that have been touched are instantiated.
+
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertEqual(rooms_state.size(), 4)
+        self.assertFalse(rooms_state.is_materialized("Room_2,2"))
+        self.assertLess(len(items_state._contents), items_state.size())
+
+        # The packed states instantiate the same objects the ordinary
+        # ones do.
+
+        ref_items_state = ItemsState(**items_ini_config.sections)
+        ref_doors_state = DoorsState(**doors_ini_config.sections)
+        ref_rooms_state = RoomsState(
+            CreaturesState(ref_items_state, **creatures_ini_config.sections),
+            ContainersState(ref_items_state, **containers_ini_config.sections),
+            ref_doors_state,
+            ref_items_state,
+            **rooms_ini_config.sections,
+        )
+        self.assertEqual(items_state.get("Longsword"), ref_items_state.get("Longsword"))
+        self.assertEqual(
+            doors_state.get("Room_1,1", "Room_1,2"),
+            ref_doors_state.get("Room_1,1", "Room_1,2"),
+        )
+        self.assertEqual(list(doors_state.keys()), list(ref_doors_state.keys()))
+        self.assertEqual(doors_state.size(), ref_doors_state.size())
+        self.assertEqual(
+            dict(doors_state.neighbors("Room_2,2")),
+            dict(ref_doors_state.neighbors("Room_2,2")),
+        )
+        self.assertEqual(
+            rooms_state.get("Room_2,2").title, ref_rooms_state.get("Room_2,2").title
+        )
+
+        game_state = GameState(
+            rooms_state, creatures_state, containers_state, doors_state, items_state
+        )
+        game_state.character_name = "Niath"
+        game_state.character_class = "Warrior"
+        game_state.game_has_begun = True
+        command_processor = CommandProcessor(game_state)
+        command_processor.process("open north door")
+        command_processor.process("leave via north door")
+        self.assertEqual(rooms_state.cursor.internal_name, "Room_1,2")
+        self.assertTrue(rooms_state.automap.is_visited("Room_1,2"))
+
+    def test_world_pack_tabular_creatures(self):
+        items_state = PackedItemsState(self.world_pack)
+        creatures_state = CreaturesState(
+            items_state, tabular=True, **creatures_ini_config.sections
+        )
+        rooms_state = PackedRoomsState(
+            self.world_pack,
+            creatures_state,
+            ContainersState(items_state, **containers_ini_config.sections),
+            PackedDoorsState(self.world_pack),
+            items_state,
+        )
+
+        # A creature's room is recorded in the table by the room's record
+        # index in the pack.
+
+        kobold = rooms_state.cursor.creature_here
+        room_index = self.world_pack.rooms.index_of("Room_1,1")
+        self.assertEqual(
+            creatures_state.table.rows_in_room(room_index),
+            [creatures_state.table.ordinal(kobold.internal_name)],
+        )
+        rooms_state.move_creature("Room_1,1", "Room_2,1")
+        self.assertEqual(creatures_state.table.rows_in_room(room_index), [])
+        self.assertEqual(
+            creatures_state.table.rows_in_room(
+                self.world_pack.rooms.index_of("Room_2,1")
+            ),
+            [creatures_state.table.ordinal(kobold.internal_name)],
+        )
@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+
+import asyncio
+import threading
+
+from unittest import TestCase
+
+from advgame import RoomEvent, RoomEventBus, SharedWorld, WorldSections
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Room_Event_Bus", "Test_Shared_World_Events")
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_Room_Event_Bus(TestCase):
+    def setUp(self):
+        self.event_bus = RoomEventBus(queue_size=2)
+
+    def test_room_event_bus_fan_out(self):
+        subscription_1 = self.event_bus.subscribe("Niath", "Room_1,1")
+        subscription_2 = self.event_bus.subscribe("Lidda", "Room_1,1")
+        subscription_3 = self.event_bus.subscribe("Mialee", "Room_1,2")
+        event = RoomEvent("Room_1,1", "Niath", "open", ())
+        self.assertEqual(self.event_bus.publish(event, "Niath"), 1)
+        self.assertIs(subscription_2.get_nowait(), event)
+        self.assertTrue(subscription_1.queue.empty())
+        self.assertTrue(subscription_3.queue.empty())
+
+        self.event_bus.relocate("Lidda", "Room_1,2")
+        self.assertEqual(self.event_bus.subscriber_count("Room_1,1"), 1)
+        self.assertEqual(self.event_bus.subscriber_count("Room_1,2"), 2)
+        self.event_bus.unsubscribe("Niath")
+        self.assertEqual(self.event_bus.subscriber_count("Room_1,1"), 0)
+        self.assertEqual(self.event_bus.publish(event), 0)
+
+    def test_room_event_bus_drops_oldest(self):
+        subscription = self.event_bus.subscribe("Lidda", "Room_1,1")
+        events = [RoomEvent("Room_1,1", "Niath", "take", ()) for _ in range(3)]
+        for event in events:
+            self.event_bus.publish(event, "Niath")
+        self.assertEqual(subscription.dropped, 1)
+        self.assertIs(subscription.get_nowait(), events[1])
+        self.assertIs(subscription.get_nowait(), events[2])
+
+    def test_room_event_bus_threadsafe_delivery(self):
+        # An event published from another thread reaches a coroutine
+        # waiting on the subscription.
+
+        async def receive():
+            subscription = self.event_bus.subscribe("Lidda", "Room_1,1")
+            event = RoomEvent("Room_1,1", "Niath", "attack", ())
+            thread = threading.Thread(
+                target=self.event_bus.publish, args=(event, "Niath")
+            )
+            thread.start()
+            received = await asyncio.wait_for(subscription.get(), 5)
+            thread.join()
+            return event, received
+
+        event, received = asyncio.run(receive())
+        self.assertIs(received, event)
+
+
+class Test_Shared_World_Events(TestCase):
+    def setUp(self):
+        self.world = SharedWorld(_world_sections())
+        for player_name in ("Niath", "Lidda"):
+            self.world.join(player_name)
+            self.world.process(player_name, f"set name to {player_name}")
+            self.world.process(player_name, "set class to Warrior")
+            self.world.process(player_name, "begin game")
+
+    def test_shared_world_events(self):
+        niath_subscription = self.world.subscribe("Niath")
+        lidda_subscription = self.world.subscribe("Lidda")
+        self.world.process("Niath", "inventory")
+        self.assertTrue(lidda_subscription.queue.empty())
+
+        self.world.process("Niath", "open north door")
+        event = lidda_subscription.get_nowait()
+        self.assertEqual(event.command, "open")
+        self.assertEqual(event.room_internal_name, "Room_1,1")
+        self.assertEqual(event.message, "[Niath] You have opened the north door.")
+        self.assertTrue(niath_subscription.queue.empty())
+
+        # Leaving is seen in the room left; after that, actions in the
+        # new room aren't delivered to the player left behind.
+
+        self.world.process("Niath", "leave using north door")
+        self.assertEqual(lidda_subscription.get_nowait().command, "leave")
+        self.assertEqual(niath_subscription.room_internal_name, "Room_1,2")
+        self.world.process("Niath", "close south door")
+        self.assertTrue(lidda_subscription.queue.empty())
+        self.world.leave("Niath")
+        self.assertEqual(self.world.event_bus.subscriber_count("Room_1,2"), 0)
@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+
+from random import Random
+from unittest import TestCase
+from unittest.mock import patch
+
+from advgame import (
+    COMMANDS_SYNTAX,
+    CommandGenerator,
+    Fuzzer,
+    WorldSections,
+    build_game_state,
+    inventory_command,
+    minimize_transcript,
+    play_transcript,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = (
+    "Test_Command_Generator",
+    "Test_Fuzzer",
+    "Test_Minimize_Transcript",
+)
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+# A stand-in for inventory_command() with a bug in it: it raises a KeyError
+# once the character is carrying a mana potion.
+
+
+def _buggy_inventory_command(game_state, tokens):
+    if any(
+        item.title == "mana potion" for _, item in game_state.character.list_items()
+    ):
+        raise KeyError("Mana_Potion")
+    return inventory_command(game_state, tokens)
+
+
+_FAILING_TRANSCRIPT = (
+    "set name to Niath",
+    "status",
+    "set class to Warrior",
+    "help",
+    "begin game",
+    "look at kobold",
+    "inventory",
+    "pick up mana potion",
+    "map",
+    "inventory",
+)
+
+
+class Test_Command_Generator(TestCase):
+    def setUp(self):
+        self.game_state = build_game_state(_world_sections())
+
+    def test_same_seed_same_commands(self):
+        commands = list()
+        for _ in range(2):
+            generator = CommandGenerator(self.game_state, Random(7))
+            commands.append([generator.command(self.game_state) for _ in range(200)])
+        self.assertEqual(commands[0], commands[1])
+
+    def test_plausible_commands(self):
+        generator = CommandGenerator(self.game_state, Random(1))
+        verbs = {command.lower() for command in COMMANDS_SYNTAX}
+        for _ in range(200):
+            command = generator.plausible()
+            self.assertTrue(
+                any(
+                    command == verb or command.startswith(f"{verb} ") for verb in verbs
+                ),
+                command,
+            )
+
+
+class Test_Minimize_Transcript(TestCase):
+    def setUp(self):
+        self.world_sections = _world_sections()
+
+    def test_play_transcript(self):
+        self.assertIsNone(play_transcript(self.world_sections, _FAILING_TRANSCRIPT, 0))
+        with patch("advgame.process.inventory_command", _buggy_inventory_command):
+            commands_played, signature, traceback_text = play_transcript(
+                self.world_sections, _FAILING_TRANSCRIPT, 0
+            )
+        self.assertEqual(commands_played, len(_FAILING_TRANSCRIPT))
+        self.assertEqual(signature[0], "KeyError")
+        self.assertEqual(signature[3], "_buggy_inventory_command")
+        self.assertIn("KeyError: 'Mana_Potion'", traceback_text)
+
+    def test_minimize_transcript(self):
+        with patch("advgame.process.inventory_command", _buggy_inventory_command):
+            _, signature, _ = play_transcript(
+                self.world_sections, _FAILING_TRANSCRIPT, 0
+            )
+            reproducer = minimize_transcript(
+                self.world_sections, _FAILING_TRANSCRIPT, 0, signature
+            )
+        self.assertEqual(
+            reproducer,
+            (
+                "set name to Niath",
+                "set class to Warrior",
+                "begin game",
+                "pick up mana potion",
+                "inventory",
+            ),
+        )
+
+
+class Test_Fuzzer(TestCase):
+    def setUp(self):
+        self.world_sections = _world_sections()
+
+    def test_fuzzer_passes(self):
+        report = Fuzzer(self.world_sections, seed=0).run(100)
+        self.assertTrue(report.passed, report.failures)
+        self.assertEqual(report.transcripts_played, 100)
+        self.assertGreater(report.commands_played, 1000)
+
+    def test_fuzzer_finds_and_minimizes_failure(self):
+        with patch("advgame.process.inventory_command", _buggy_inventory_command):
+            report = Fuzzer(self.world_sections, seed=0).run(100)
+        self.assertFalse(report.passed)
+        (failure,) = report.failures
+        self.assertEqual(failure.signature[0], "KeyError")
+        self.assertLessEqual(len(failure.reproducer), len(failure.transcript))
+        self.assertEqual(failure.reproducer[-1].split()[0].lower(), "inventory")
+
+        # The reproducer fails on its own, from a fresh world.
+
+        with patch("advgame.process.inventory_command", _buggy_inventory_command):
+            outcome = play_transcript(
+                self.world_sections, failure.reproducer, failure.seed
+            )
+        self.assertEqual(outcome[1], failure.signature)
+
+    def test_parallel_matches_serial(self):
+        serial_report = Fuzzer(self.world_sections, seed=100).run(40)
+        parallel_report = Fuzzer(self.world_sections, seed=100, processes=2).run(40)
+        self.assertEqual(serial_report.commands_played, parallel_report.commands_played)
+        self.assertEqual(
+            [failure.signature for failure in serial_report.failures],
+            [failure.signature for failure in parallel_report.failures],
+        )
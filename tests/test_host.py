@@ -0,0 +1,447 @@
+#!/usr/bin/python3
+
+import json
+import os
+import signal
+import socket
+import struct
+import tempfile
+import threading
+import time
+
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from advgame import (
+    CommandProcessor,
+    HashRing,
+    InternalError,
+    PreforkHost,
+    WorldFactory,
+    WorldSections,
+    WorldTemplate,
+    build_game_state,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = (
+    "Test_World_Template",
+    "Test_World_Factory",
+    "Test_Hash_Ring",
+    "Test_Prefork_Host",
+)
+
+
+def _buggy_inventory_command(game_state, tokens):
+    raise ValueError("an inventory bug")
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_World_Template(TestCase):
+    def test_build_game_state(self):
+        game_state = build_game_state(_world_sections())
+        self.assertEqual(game_state.rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertEqual(game_state.rooms_state.size(), 4)
+
+    def test_new_game_state_is_independent(self):
+        # The testing dungeon's exit can't be reached, so validation is
+        # skipped.
+        world_template = WorldTemplate(_world_sections(), validate=False)
+        game_state_1 = world_template.new_game_state()
+        game_state_2 = world_template.new_game_state()
+        self.assertIs(game_state_1.items_state, game_state_2.items_state)
+        self.assertIsNot(game_state_1.rooms_state, game_state_2.rooms_state)
+        game_state_1.rooms_state.cursor.north_door.is_closed = False
+        game_state_1.rooms_state.move(north=True)
+        self.assertEqual(game_state_1.rooms_state.cursor.internal_name, "Room_1,2")
+        self.assertEqual(game_state_2.rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertTrue(game_state_2.rooms_state.cursor.north_door.is_closed)
+        self.assertIs(
+            game_state_1.rooms_state.cursor.items_here,
+            game_state_1.rooms_state.get("Room_1,2").items_here,
+        )
+
+    def test_reset_game_state(self):
+        world_template = WorldTemplate(_world_sections(), validate=False)
+        game_state = world_template.new_game_state()
+        command_processor = CommandProcessor(game_state)
+        for command in (
+            "set name to Niath",
+            "set class to Warrior",
+            "begin game",
+            "pick up mana potion",
+            "leave via north door",
+        ):
+            command_processor.process(command)
+        self.assertEqual(game_state.rooms_state.cursor.internal_name, "Room_1,2")
+        world_template.reset_game_state(game_state)
+        self.assertFalse(game_state.game_has_begun)
+        self.assertIsNone(game_state.character)
+        self.assertEqual(game_state.rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertEqual(
+            game_state.snapshot(), world_template.new_game_state().snapshot()
+        )
+
+
+class Test_World_Factory(TestCase):
+    def setUp(self):
+        self.world_factory = WorldFactory(_world_sections(), validate=False)
+
+    def test_game_states_share_nothing(self):
+        game_state_1 = self.world_factory.game_state()
+        game_state_2 = self.world_factory.game_state()
+        self.assertIsNot(game_state_1.items_state, game_state_2.items_state)
+        game_state_1.items_state.get("Mana_Potion").mana_points_recovered = 11
+        self.assertNotEqual(
+            game_state_2.items_state.get("Mana_Potion").mana_points_recovered, 11
+        )
+
+    def test_reset(self):
+        game_state = self.world_factory.game_state()
+        pristine_snapshot = game_state.snapshot()
+        mana_potion = game_state.items_state.get("Mana_Potion")
+        mana_points_recovered = mana_potion.mana_points_recovered
+        command_processor = CommandProcessor(game_state)
+        for command in (
+            "set name to Niath",
+            "set class to Warrior",
+            "begin game",
+            "pick up mana potion",
+            "open north door",
+            "leave via north door",
+        ):
+            command_processor.process(command)
+
+        # Changes no game could make are undone as well.
+
+        mana_potion.mana_points_recovered = 11
+        game_state.items_state.delete("Longsword")
+        chest = game_state.containers_state.get("Wooden_Chest_1")
+        chest.set("Magic_Wand", 1, game_state.items_state.get("Magic_Wand"))
+
+        self.world_factory.reset(game_state)
+        self.assertEqual(game_state.snapshot(), pristine_snapshot)
+        self.assertIsNone(game_state.character)
+        self.assertEqual(game_state.rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertEqual(game_state.rooms_state.automap.visited_count(), 1)
+        self.assertIs(game_state.items_state.get("Mana_Potion"), mana_potion)
+        self.assertEqual(mana_potion.mana_points_recovered, mana_points_recovered)
+        self.assertTrue(game_state.items_state.contains("Longsword"))
+        self.assertFalse(chest.contains("Magic_Wand"))
+
+    def test_release(self):
+        game_state = self.world_factory.game_state()
+        game_state.character_name = "Niath"
+        self.world_factory.release(game_state)
+        with self.assertRaises(InternalError):
+            self.world_factory.release(game_state)
+        self.assertIs(self.world_factory.game_state(), game_state)
+        self.assertIsNone(game_state.character_name)
+        with self.assertRaises(InternalError):
+            self.world_factory.reset(build_game_state(_world_sections()))
+
+    def test_default(self):
+        self.assertIs(WorldFactory.default(), WorldFactory.default())
+
+
+class Test_Hash_Ring(TestCase):
+    def test_hash_ring_stable(self):
+        hash_ring = HashRing(range(4))
+        sessions = [f"session-{index}" for index in range(400)]
+        assignments = {session: hash_ring.node_for(session) for session in sessions}
+        self.assertEqual(set(assignments.values()), {0, 1, 2, 3})
+        self.assertEqual(
+            assignments, {session: hash_ring.node_for(session) for session in sessions}
+        )
+
+        # Adding a node only moves sessions onto the new node.
+
+        bigger_ring = HashRing(range(5))
+        for session, node in assignments.items():
+            self.assertIn(bigger_ring.node_for(session), (node, 4))
+
+
+@skipUnless(hasattr(os, "fork"), "requires os.fork()")
+class Test_Prefork_Host(TestCase):
+    def setUp(self):
+        self.host = PreforkHost(
+            WorldTemplate(_world_sections(), validate=False), worker_count=2
+        )
+        self.host.start()
+        self.thread = threading.Thread(target=self.host.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.host.stop()
+        self.thread.join(5)
+
+    def _connect(self, session):
+        connection = socket.create_connection(self.host.address, timeout=5)
+        connection.sendall(f"SESSION {session}\n".encode("utf-8"))
+        return connection, connection.makefile("rb")
+
+    def _command(self, connection, reader, command):
+        connection.sendall(command.encode("utf-8") + b"\n")
+        return json.loads(reader.readline())
+
+    def test_prefork_host_sessions(self):
+        connection, reader = self._connect("alpha")
+        reply = self._command(connection, reader, "set name to Niath")
+        self.assertEqual(reply["messages"], ["Your name, 'Niath', has been set."])
+        self.assertFalse(reply["game_over"])
+        connection.close()
+
+        # The same session picks up where it left off on a new
+        # connection; a different session has its own game.
+
+        connection, reader = self._connect("alpha")
+        reply = self._command(connection, reader, "set class to Warrior")
+        self.assertEqual(len(reply["messages"]), 2)
+        reply = self._command(connection, reader, "quit")
+        self.assertTrue(reply["game_over"])
+        self.assertEqual(reader.readline(), b"")
+        connection.close()
+
+        connection, reader = self._connect("beta")
+        reply = self._command(connection, reader, "begin game")
+        self.assertTrue(
+            reply["messages"][0].startswith(
+                "You need to set your character name and class before you "
+                + "begin the game."
+            )
+        )
+        connection.close()
+
+    def test_prefork_host_width(self):
+        connection, reader = self._connect("delta")
+        self.assertIn("error", self._command(connection, reader, "WIDTH wide"))
+        self.assertEqual(self._command(connection, reader, "WIDTH 30"), {"width": 30})
+        reply = self._command(connection, reader, "help")
+        self.assertIn("\n", reply["messages"][0])
+        self.assertTrue(
+            all(len(line) <= 30 for line in reply["messages"][0].split("\n"))
+        )
+
+        # Several commands sent at once are all answered.
+
+        connection.sendall(b"set name to Niath\nset class to Warrior\n")
+        self.assertEqual(
+            json.loads(reader.readline())["messages"],
+            ["Your name, 'Niath', has been\nset."],
+        )
+        self.assertEqual(len(json.loads(reader.readline())["messages"]), 2)
+        connection.close()
+
+    def test_prefork_host_bad_session_line(self):
+        connection = socket.create_connection(self.host.address, timeout=5)
+        connection.sendall(b"HELLO\n")
+        reply = json.loads(connection.makefile("rb").readline())
+        self.assertIn("error", reply)
+        connection.close()
+
+    def test_prefork_host_structured(self):
+        host = PreforkHost(
+            WorldTemplate(_world_sections(), validate=False),
+            worker_count=1,
+            structured=True,
+        )
+        host.start()
+        thread = threading.Thread(target=host.serve_forever, daemon=True)
+        thread.start()
+        try:
+            connection = socket.create_connection(host.address, timeout=5)
+            connection.sendall(b"SESSION gamma\nset name to Niath\n")
+            reply = json.loads(connection.makefile("rb").readline())
+            self.assertEqual(
+                reply["results"], [{"type": "setname.NameSetGSM", "name": "Niath"}]
+            )
+            self.assertNotIn("messages", reply)
+            connection.close()
+        finally:
+            host.stop()
+            thread.join(5)
+
+    def test_prefork_host_save_dir(self):
+        with tempfile.TemporaryDirectory() as save_dir:
+            host = PreforkHost(
+                WorldTemplate(_world_sections(), validate=False),
+                worker_count=1,
+                save_dir=save_dir,
+            )
+            host.start()
+            thread = threading.Thread(target=host.serve_forever, daemon=True)
+            thread.start()
+            try:
+                connection = socket.create_connection(host.address, timeout=5)
+                connection.sendall(b"SESSION epsilon\n")
+                reader = connection.makefile("rb")
+                for command in (
+                    "set name to Niath",
+                    "set class to Warrior",
+                    "begin game",
+                    "open north door",
+                ):
+                    self._command(connection, reader, command)
+                reader.close()
+                connection.close()
+
+                # The game is saved once the worker sees the connection
+                # close.
+
+                deadline = time.monotonic() + 5
+                while not os.listdir(save_dir) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertEqual(len(os.listdir(save_dir)), 1)
+            finally:
+                host.stop()
+                thread.join(5)
+
+            # A new host loads the session's game when it reconnects.
+
+            host = PreforkHost(
+                WorldTemplate(_world_sections(), validate=False),
+                worker_count=1,
+                save_dir=save_dir,
+            )
+            host.start()
+            thread = threading.Thread(target=host.serve_forever, daemon=True)
+            thread.start()
+            try:
+                connection = socket.create_connection(host.address, timeout=5)
+                connection.sendall(b"SESSION epsilon\n")
+                reader = connection.makefile("rb")
+                reply = self._command(connection, reader, "leave via north door")
+                self.assertTrue(reply["messages"][0].startswith("You leave the room"))
+                connection.close()
+            finally:
+                host.stop()
+                thread.join(5)
+
+    def test_prefork_host_slow_session_line(self):
+        # A client that hasn't finished its session line doesn't hold up
+        # anyone else's.
+
+        slow_connection = socket.create_connection(self.host.address, timeout=5)
+        slow_connection.sendall(b"SESS")
+        started = time.monotonic()
+        connection, reader = self._connect("eta")
+        reply = self._command(connection, reader, "set name to Niath")
+        self.assertEqual(reply["messages"], ["Your name, 'Niath', has been set."])
+        self.assertLess(time.monotonic() - started, 2)
+        connection.close()
+
+        # It's served once it finishes the line.
+
+        slow_connection.sendall(b"ION theta\nset name to Lidda\n")
+        reply = json.loads(slow_connection.makefile("rb").readline())
+        self.assertEqual(reply["messages"], ["Your name, 'Lidda', has been set."])
+        slow_connection.close()
+
+    def test_prefork_host_connection_reset(self):
+        # A client that resets its connection with replies still unsent,
+        # and one that stops reading them, only lose their own connections.
+
+        worker_pids = self.host.worker_pids
+        for session in ("iota", "kappa"):
+            connection, reader = self._connect(session)
+            connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            connection.sendall(b"help\n" * 2000)
+            connection.close()
+        stalled_connection, _ = self._connect("lambda")
+        stalled_connection.sendall(b"help\n" * 2000)
+        for session in ("iota", "kappa", "lambda", "mu"):
+            connection, reader = self._connect(session)
+            reply = self._command(connection, reader, "set name to Niath")
+            self.assertEqual(reply["messages"], ["Your name, 'Niath', has been set."])
+            connection.close()
+        stalled_connection.close()
+        self.assertEqual(self.host.worker_pids, worker_pids)
+
+    def test_prefork_host_handoff_fails(self):
+        # A connection that can't be handed to a worker is told so.
+
+        with patch("advgame.host.socket.send_fds", side_effect=OSError("no worker")):
+            connection = socket.create_connection(self.host.address, timeout=5)
+            connection.sendall(b"SESSION omicron\n")
+            reply = json.loads(connection.makefile("rb").readline())
+        self.assertEqual(reply, {"error": "the session could not be started"})
+        connection.close()
+
+        # Once the workers can be reached again, sessions are served.
+
+        connection, reader = self._connect("omicron")
+        reply = self._command(connection, reader, "set name to Niath")
+        self.assertEqual(reply["messages"], ["Your name, 'Niath', has been set."])
+        connection.close()
+
+    def test_prefork_host_respawns_workers(self):
+        connection, reader = self._connect("nu")
+        self._command(connection, reader, "set name to Niath")
+        connection.close()
+        worker_index = self.host.worker_for("nu")
+        dead_pid = self.host.worker_pids[worker_index]
+        os.kill(dead_pid, signal.SIGKILL)
+
+        # The worker's replacement serves the session, as a new game, and
+        # takes its place on the ring.
+
+        deadline = time.monotonic() + 5
+        while (
+            self.host.worker_pids[worker_index] == dead_pid
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        connection, reader = self._connect("nu")
+        reply = self._command(connection, reader, "begin game")
+        self.assertTrue(
+            reply["messages"][0].startswith(
+                "You need to set your character name and class before you "
+                + "begin the game."
+            )
+        )
+        connection.close()
+        self.assertNotEqual(self.host.worker_pids[worker_index], dead_pid)
+        self.assertEqual(self.host.worker_for("nu"), worker_index)
+
+    def test_prefork_host_command_error(self):
+        # The workers are forked with a command that raises, which is
+        # reported to the client without ending its session.
+
+        self.host.stop()
+        self.thread.join(5)
+        with patch("advgame.process.inventory_command", _buggy_inventory_command):
+            self.host = PreforkHost(
+                WorldTemplate(_world_sections(), validate=False), worker_count=1
+            )
+            self.host.start()
+        self.thread = threading.Thread(target=self.host.serve_forever, daemon=True)
+        self.thread.start()
+        connection, reader = self._connect("xi")
+        for command in ("set name to Niath", "set class to Warrior", "begin game"):
+            self._command(connection, reader, command)
+        self.assertEqual(
+            self._command(connection, reader, "inventory"),
+            {"error": "the command failed with ValueError: an inventory bug"},
+        )
+        reply = self._command(connection, reader, "status")
+        self.assertFalse(reply["game_over"])
+        connection.close()
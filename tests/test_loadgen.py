@@ -0,0 +1,277 @@
+#!/usr/bin/python3
+
+import os
+import tempfile
+import threading
+
+from random import Random
+from unittest import TestCase, skipUnless
+
+from advgame import (
+    CommandProcessor,
+    LoadGenerator,
+    LoadReport,
+    PreforkHost,
+    SeededDice,
+    SimulatedPlayer,
+    WorldSections,
+    WorldTemplate,
+    set_dice_roller,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = (
+    "Test_Load_Generator",
+    "Test_Load_Generator_Against_Host",
+    "Test_Load_Report",
+    "Test_Simulated_Player",
+)
+
+
+def _world_template():
+    return WorldTemplate(
+        WorldSections.from_ini_configs(
+            items_ini_config,
+            doors_ini_config,
+            containers_ini_config,
+            creatures_ini_config,
+            rooms_ini_config,
+        ),
+        validate=False,
+    )
+
+
+_VOCABULARY = {
+    "doors": ["north door", "east door"],
+    "items": ["mana potion", "longsword"],
+    "containers": ["wooden chest"],
+    "creatures": ["kobold"],
+}
+
+# The replies to a command that names something that isn't there.
+
+_NOT_FOUND_TYPES = {
+    "attack.OpponentNotFoundGSM",
+    "lookat.FoundNothingGSM",
+    "open.ElementToOpenNotHereGSM",
+    "pickup.ItemNotFoundGSM",
+    "take.ItemNotFoundInContainerGSM",
+    "various.ContainerNotFoundGSM",
+    "various.DoorNotPresentGSM",
+}
+
+# Each game played from this script ends after five commands.
+
+_QUIT_SCRIPT = ("status", "quit")
+
+
+class Test_Simulated_Player(TestCase):
+    def test_random_walk(self):
+        commands = list()
+        for _ in range(2):
+            player = SimulatedPlayer("load-0-0", Random(5), _VOCABULARY, 40)
+            commands.append(list(iter(player.next_command, None)))
+        self.assertEqual(commands[0], commands[1])
+        self.assertEqual(len(commands[0]), 40)
+        self.assertTrue(commands[0][0].startswith("set name to "))
+        self.assertEqual(commands[0][1], f"set class to {player.character_class}")
+        self.assertEqual(commands[0][2], "begin game")
+        self.assertTrue(
+            any(command.startswith("leave via ") for command in commands[0])
+        )
+        self.assertTrue(any(command.startswith("attack ") for command in commands[0]))
+
+    def _play(self, structured):
+        # Plays a player's walk against a game with seeded dice, letting it
+        # observe its game state or the structured form of its results, and
+        # returns its commands and the types of the results they got.
+        world_template = _world_template()
+        player = SimulatedPlayer("load-0-0", Random(5), _VOCABULARY, 300)
+        command_processor = CommandProcessor(world_template.new_game_state())
+        commands = list()
+        result_types = list()
+        previous_dice_roller = set_dice_roller(SeededDice(5))
+        try:
+            for command in iter(player.next_command, None):
+                commands.append(command)
+                result = command_processor.process(command)
+                results = [
+                    game_state_message.to_dict() for game_state_message in result
+                ]
+                result_types.extend(fields["type"] for fields in results)
+                if command_processor.game_state.game_has_ended:
+                    player.new_game()
+                    command_processor = CommandProcessor(
+                        world_template.new_game_state()
+                    )
+                elif structured:
+                    player.observe_results(results)
+                else:
+                    player.observe_game_state(command_processor.game_state)
+        finally:
+            set_dice_roller(previous_dice_roller)
+        return commands, result_types
+
+    def test_room_walk(self):
+        # A player that observes its room only names what's in it.
+
+        commands, result_types = self._play(structured=False)
+        self.assertEqual(self._play(structured=False)[0], commands)
+        self.assertFalse(_NOT_FOUND_TYPES.intersection(result_types))
+        self.assertIn("leave.LeftRoomGSM", result_types)
+        self.assertIn("various.FoeDeathGSM", result_types)
+        self.assertTrue(any(command.startswith("take ") for command in commands))
+
+        # The structured results tell it the same.
+
+        commands, result_types = self._play(structured=True)
+        self.assertFalse(_NOT_FOUND_TYPES.intersection(result_types))
+        self.assertIn("leave.LeftRoomGSM", result_types)
+
+    def test_script(self):
+        player = SimulatedPlayer(
+            "load-0-0", Random(5), _VOCABULARY, 40, script=_QUIT_SCRIPT
+        )
+        commands = list(iter(player.next_command, None))
+        self.assertEqual(len(commands), 5)
+        self.assertEqual(
+            commands[1:],
+            [f"set class to {player.character_class}", "begin game", "status", "quit"],
+        )
+
+        # A new game begins the script again.
+
+        player.new_game()
+        self.assertEqual(player.games_played, 2)
+        self.assertEqual(len(list(iter(player.next_command, None))), 5)
+        self.assertEqual(player.commands_left, 30)
+
+
+class Test_Load_Report(TestCase):
+    def setUp(self):
+        self.report = LoadGenerator(
+            _world_template(), players=5, commands_per_player=10, window=0.01
+        ).run()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_dump_and_load(self):
+        path = os.path.join(self.temp_dir.name, "report.json")
+        self.report.dump(path)
+        loaded = LoadReport.load(path)
+        self.assertEqual(loaded.to_dict(), self.report.to_dict())
+        self.assertEqual(loaded.throughput, self.report.throughput)
+
+    def test_compare(self):
+        self.assertEqual(self.report.compare(self.report), [])
+        report = self.report.to_dict()
+        report["seconds"] *= 2
+        report["latency"] = {
+            name: value * 2 for name, value in report["latency"].items()
+        }
+        report["errors"] = {"timeout": 1}
+        regressions = LoadReport.from_dict(report).compare(self.report)
+        self.assertEqual(len(regressions), 6)
+        self.assertTrue(regressions[0].startswith("throughput fell"))
+        self.assertTrue(regressions[1].startswith("p50 latency rose"))
+        self.assertTrue(regressions[-1].startswith("error rate rose"))
+
+        report["settings"] = dict(report["settings"], players=6)
+        self.assertIn(
+            "the runs were made with different settings",
+            LoadReport.from_dict(report).compare(self.report),
+        )
+
+
+class Test_Load_Generator(TestCase):
+    def setUp(self):
+        self.world_template = _world_template()
+
+    def test_in_process(self):
+        report = LoadGenerator(
+            self.world_template, players=20, commands_per_player=15
+        ).run()
+        self.assertEqual(report.target, "in-process")
+        self.assertEqual(report.commands, 20 * 15)
+        self.assertEqual(report.errors, {})
+        self.assertEqual(report.error_rate, 0.0)
+        self.assertEqual(sum(window.commands for window in report.windows), 300)
+        self.assertLessEqual(report.latency["p50"], report.latency["p99"])
+        self.assertLessEqual(report.latency["p99"], report.latency["max"])
+        self.assertGreater(report.throughput, 0)
+        self.assertIn("20 players against in-process: 300 commands", report.summary())
+
+    def test_games_end_and_begin_again(self):
+        report = LoadGenerator(
+            self.world_template, players=4, commands_per_player=10, script=_QUIT_SCRIPT
+        ).run()
+        self.assertEqual(report.commands, 4 * 10)
+        self.assertEqual(report.games_ended, 4 * 2)
+
+
+@skipUnless(hasattr(os, "fork"), "requires os.fork()")
+class Test_Load_Generator_Against_Host(TestCase):
+    def setUp(self):
+        self.world_template = _world_template()
+        self.host = PreforkHost(self.world_template, worker_count=2)
+        self.host.start()
+        self.thread = threading.Thread(target=self.host.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.host.stop()
+        self.thread.join(5)
+
+    def test_against_host(self):
+        report = LoadGenerator(
+            self.world_template,
+            players=20,
+            commands_per_player=15,
+            address=self.host.address,
+            memory_pids=self.host.worker_pids,
+        ).run()
+        self.assertEqual(report.target, "{}:{}".format(*self.host.address))
+        self.assertEqual(report.commands, 20 * 15)
+        self.assertEqual(report.errors, {})
+        self.assertIsNotNone(report.windows[-1].resident_bytes)
+
+    def test_against_structured_host(self):
+        host = PreforkHost(self.world_template, worker_count=1, structured=True)
+        host.start()
+        thread = threading.Thread(target=host.serve_forever, daemon=True)
+        thread.start()
+        try:
+            report = LoadGenerator(
+                self.world_template,
+                players=5,
+                commands_per_player=20,
+                address=host.address,
+            ).run()
+        finally:
+            host.stop()
+            thread.join(5)
+        self.assertEqual(report.commands, 5 * 20)
+        self.assertEqual(report.errors, {})
+
+    def test_games_end_and_reconnect(self):
+        report = LoadGenerator(
+            self.world_template,
+            players=4,
+            commands_per_player=10,
+            address=self.host.address,
+            script=_QUIT_SCRIPT,
+        ).run()
+        self.assertEqual(report.commands, 4 * 10)
+        self.assertEqual(report.games_ended, 4 * 2)
+        self.assertEqual(report.errors, {})
+        self.assertIsNone(report.memory_growth)
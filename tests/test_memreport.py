@@ -0,0 +1,144 @@
+#!/usr/bin/python3
+
+import json
+
+from unittest import TestCase
+
+from advgame import (
+    BadSyntaxGSM,
+    IniEntry,
+    ItemsState,
+    MemoryReport,
+    MessageChurnReport,
+    WorldSections,
+    generate_item_lists,
+    generate_item_sections,
+    item_catalog_memory_report,
+    message_churn_report,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = (
+    "Test_Generate_Catalog",
+    "Test_Item_Catalog_Memory_Report",
+    "Test_Message_Churn_Report",
+)
+
+
+class Test_Generate_Catalog(TestCase):
+    def test_generate_item_sections(self):
+        item_sections = generate_item_sections(500, seed=3)
+        self.assertEqual(item_sections, generate_item_sections(500, seed=3))
+        self.assertEqual(len(item_sections), 500)
+        items_state = ItemsState(**item_sections)
+        self.assertEqual(
+            {item.item_type for item in items_state.values()},
+            {"armor", "coin", "key", "oddment", "potion", "shield", "wand", "weapon"},
+        )
+
+    def test_generate_item_lists(self):
+        internal_names = tuple(generate_item_sections(100))
+        item_lists = generate_item_lists(internal_names, 20, 5, seed=3)
+        self.assertEqual(len(item_lists), 20)
+        for list_value in item_lists:
+            qty_name_pairs = IniEntry()._process_list_value(list_value)
+            self.assertEqual(len(qty_name_pairs), 5)
+            for _, internal_name in qty_name_pairs:
+                self.assertIn(internal_name, internal_names)
+
+
+class Test_Item_Catalog_Memory_Report(TestCase):
+    def setUp(self):
+        self.report = item_catalog_memory_report(2000, list_count=400)
+
+    def test_savings(self):
+        self.assertIsInstance(self.report, MemoryReport)
+        self.assertEqual(self.report.names_listed, 400 * 10)
+        self.assertLess(
+            self.report.compact_bytes["lists"], self.report.flat_bytes["lists"]
+        )
+        self.assertGreater(self.report.bytes_saved, 0)
+        self.assertGreater(self.report.fraction_saved, 0)
+
+        # An item of each type is smaller in its own layout, and most of all
+        # a coin, key or oddment, which has no attributes of its own.
+
+        for flat_size, compact_size in self.report.instance_sizes.values():
+            self.assertLess(compact_size, flat_size)
+        self.assertEqual(
+            self.report.instance_sizes["coin"][1],
+            min(
+                compact_size for _, compact_size in self.report.instance_sizes.values()
+            ),
+        )
+
+    def test_summary(self):
+        summary = self.report.summary()
+        self.assertTrue(summary.startswith("2000 items, named 4000 times"))
+        self.assertIn("  total", summary)
+        self.assertIn(
+            "coin {} -> {}".format(*self.report.instance_sizes["coin"]), summary
+        )
+        self.assertEqual(
+            json.loads(json.dumps(self.report.to_dict()))["item_count"], 2000
+        )
+
+
+class Test_Message_Churn_Report(TestCase):
+    def setUp(self):
+        self.world_sections = WorldSections.from_ini_configs(
+            items_ini_config,
+            doors_ini_config,
+            containers_ini_config,
+            creatures_ini_config,
+            rooms_ini_config,
+        )
+        self.report = message_churn_report(
+            self.world_sections, transcript_count=5, transcript_length=40
+        )
+
+    def test_flyweights_save(self):
+        self.assertIsInstance(self.report, MessageChurnReport)
+        self.assertGreater(self.report.commands_played, 0)
+
+        # Without flyweights every message is an object of its own.
+
+        self.assertEqual(
+            self.report.objects_allocated["plain"], self.report.messages_returned
+        )
+        self.assertLess(
+            self.report.objects_allocated["flyweight"],
+            self.report.objects_allocated["plain"],
+        )
+        self.assertLess(
+            self.report.retained_bytes["flyweight"],
+            self.report.retained_bytes["plain"],
+        )
+
+    def test_reproducible(self):
+        report = message_churn_report(
+            self.world_sections, transcript_count=5, transcript_length=40
+        )
+        self.assertEqual(report.commands_played, self.report.commands_played)
+        self.assertEqual(report.objects_allocated, self.report.objects_allocated)
+
+        # The flyweight instances the game had are restored afterward.
+
+        self.assertIs(BadSyntaxGSM("SAVE", ()), BadSyntaxGSM("SAVE", ()))
+
+    def test_summary(self):
+        summary = self.report.summary()
+        self.assertTrue(summary.startswith("5 transcripts, "))
+        self.assertIn("objects allocated", summary)
+        self.assertIn("bytes retained", summary)
+        self.assertEqual(
+            json.loads(json.dumps(self.report.to_dict()))["transcript_count"], 5
+        )
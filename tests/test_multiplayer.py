@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+
+import threading
+
+from unittest import TestCase
+
+from advgame import InternalError, SharedWorld, WorldSections
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Shared_World",)
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_Shared_World(TestCase):
+    def setUp(self):
+        self.world = SharedWorld(_world_sections())
+
+    def _join_and_begin(self, player_name):
+        game_state = self.world.join(player_name)
+        self.world.process(player_name, f"set name to {player_name}")
+        self.world.process(player_name, "set class to Warrior")
+        self.world.process(player_name, "begin game")
+        self.assertTrue(game_state.game_has_begun)
+        return game_state
+
+    def test_shared_world_join(self):
+        game_state_1 = self._join_and_begin("Niath")
+        game_state_2 = self._join_and_begin("Lidda")
+        self.assertEqual(self.world.players(), ("Niath", "Lidda"))
+        self.assertIsNot(game_state_1.character, game_state_2.character)
+        self.assertIsNot(game_state_1.rooms_state, game_state_2.rooms_state)
+        self.assertIs(game_state_1.rooms_state.cursor, game_state_2.rooms_state.cursor)
+        with self.assertRaises(InternalError):
+            self.world.join("Niath")
+        self.world.leave("Lidda")
+        self.assertEqual(self.world.players(), ("Niath",))
+
+    def test_shared_world_separate_cursors(self):
+        game_state_1 = self._join_and_begin("Niath")
+        game_state_2 = self._join_and_begin("Lidda")
+        self.world.process("Niath", "open north door")
+        self.world.process("Niath", "leave using north door")
+        self.assertEqual(game_state_1.rooms_state.cursor.internal_name, "Room_1,2")
+        self.assertEqual(game_state_2.rooms_state.cursor.internal_name, "Room_1,1")
+        self.assertTrue(game_state_1.rooms_state.automap.is_visited("Room_1,2"))
+        self.assertFalse(game_state_2.rooms_state.automap.is_visited("Room_1,2"))
+
+        # The door the first player opened is open for the second player
+        # too, from both sides.
+
+        self.assertFalse(game_state_2.rooms_state.cursor.north_door.is_closed)
+        self.assertFalse(game_state_1.rooms_state.cursor.south_door.is_closed)
+        self.world.process("Lidda", "close north door")
+        self.assertTrue(game_state_1.rooms_state.cursor.south_door.is_closed)
+
+    def test_shared_world_lock_keys(self):
+        game_state = self._join_and_begin("Niath")
+        self.assertEqual(
+            self.world.lock_keys(game_state, "inventory"), [("room", "Room_1,1")]
+        )
+        self.assertEqual(
+            self.world.lock_keys(game_state, "leave using north door"),
+            [
+                ("door", "Room_1,1_x_Room_1,2"),
+                ("door", "Room_1,1_x_Room_2,1"),
+                ("room", "Room_1,1"),
+                ("room", "Room_1,2"),
+                ("room", "Room_2,1"),
+            ],
+        )
+
+    def test_shared_world_concurrent_doors(self):
+        # Two players on opposite sides of the same door open and close it
+        # over and over from separate threads; the door ends up in the same
+        # state on both sides, and neither thread deadlocks.
+
+        game_state_1 = self._join_and_begin("Niath")
+        self._join_and_begin("Lidda")
+        self.world.process("Lidda", "open north door")
+        self.world.process("Lidda", "leave using north door")
+        barrier = threading.Barrier(2)
+
+        def play(player_name, door_name):
+            barrier.wait()
+            for _ in range(200):
+                self.world.process(player_name, f"open {door_name}")
+                self.world.process(player_name, f"close {door_name}")
+                self.world.process(player_name, "inventory")
+
+        threads = [
+            threading.Thread(target=play, args=("Niath", "north door")),
+            threading.Thread(target=play, args=("Lidda", "south door")),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+            self.assertFalse(thread.is_alive())
+        near_door = game_state_1.rooms_state.get("Room_1,1").north_door
+        far_door = game_state_1.rooms_state.get("Room_1,2").south_door
+        self.assertTrue(near_door.is_closed)
+        self.assertEqual(near_door.is_closed, far_door.is_closed)
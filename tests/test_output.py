@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+
+import io
+import socket
+
+from unittest import TestCase
+
+from advgame import (
+    CommandProcessor,
+    OutputWriter,
+    WorldSections,
+    build_game_state,
+    textwrapper,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Output_Writer",)
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class Test_Output_Writer(TestCase):
+    def setUp(self):
+        game_state = build_game_state(
+            WorldSections.from_ini_configs(
+                items_ini_config,
+                doors_ini_config,
+                containers_ini_config,
+                creatures_ini_config,
+                rooms_ini_config,
+            )
+        )
+        self.command_processor = CommandProcessor(game_state)
+
+    def test_output_writer_single_write(self):
+        stream = _CountingStream()
+        output_writer = OutputWriter(stream)
+        self.command_processor.process("set name to Niath")
+        result = self.command_processor.process("set class to Warrior")
+        output_writer.add_results(result)
+        self.assertEqual(len(output_writer), 2)
+        self.assertEqual(stream.writes, 0)
+        self.assertEqual(output_writer.flush(), len(stream.getvalue()))
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(
+            stream.getvalue(),
+            "\n".join(
+                textwrapper(game_state_message.message) for game_state_message in result
+            )
+            + "\n",
+        )
+
+        # An empty buffer writes nothing.
+
+        self.assertEqual(output_writer.flush(), 0)
+        self.assertEqual(stream.writes, 1)
+
+    def test_output_writer_width(self):
+        stream = io.StringIO()
+        output_writer = OutputWriter(stream, width=30)
+        output_writer.add_results(self.command_processor.process("help"))
+        output_writer.flush()
+        lines = stream.getvalue().split("\n")
+        self.assertGreater(len(lines), 3)
+        self.assertTrue(all(len(line) <= 30 for line in lines))
+
+        output_writer.width = None
+        output_writer.add("a " * 50)
+        self.assertEqual(output_writer.getvalue(), "a " * 50 + "\n")
+
+    def test_output_writer_socket(self):
+        sender, receiver = socket.socketpair()
+        try:
+            output_writer = OutputWriter(sender, width=40)
+            output_writer.add("First message.")
+            output_writer.add("Second message.")
+            output_writer.flush()
+            self.assertEqual(receiver.recv(4096), b"First message.\nSecond message.\n")
+        finally:
+            sender.close()
+            receiver.close()
@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from advgame import (
+    Divergence,
+    Replayer,
+    Transcript,
+    TranscriptWriter,
+    WorldSections,
+    WorldTemplate,
+    replay_transcript,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = (
+    "Test_Replayer",
+    "Test_Replay_Transcript",
+    "Test_Transcript",
+)
+
+
+def _world_template():
+    return WorldTemplate(
+        WorldSections.from_ini_configs(
+            items_ini_config,
+            doors_ini_config,
+            containers_ini_config,
+            creatures_ini_config,
+            rooms_ini_config,
+        ),
+        validate=False,
+    )
+
+
+_COMMANDS = (
+    "set name to Niath",
+    "set class to Warrior",
+    "begin game",
+    "attack kobold",
+    "attack kobold",
+    "inventory",
+    "status",
+)
+
+
+def _raise_key_error(game_state, tokens):
+    raise KeyError("Mana_Potion")
+
+
+class Test_Transcript(TestCase):
+    def setUp(self):
+        self.world_template = _world_template()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_record(self):
+        transcript = Transcript.record(self.world_template, _COMMANDS, seed=3)
+        self.assertEqual(transcript.seed, 3)
+        self.assertEqual(
+            [command for command, _ in transcript.exchanges], list(_COMMANDS)
+        )
+        command, messages = transcript.exchanges[0]
+        self.assertEqual(
+            messages, (("setname.NameSetGSM", "Your name, 'Niath', has been set."),)
+        )
+
+        # The same seed rolls the same dice, so records the same session.
+
+        self.assertEqual(
+            Transcript.record(self.world_template, _COMMANDS, seed=3).exchanges,
+            transcript.exchanges,
+        )
+
+    def test_dump_and_load(self):
+        path = os.path.join(self.temp_dir.name, "session.jsonl")
+        transcript = Transcript.record(self.world_template, _COMMANDS, seed=3)
+        transcript.dump(path)
+        loaded = Transcript.load(path)
+        self.assertEqual(loaded.seed, 3)
+        self.assertEqual(loaded.exchanges, transcript.exchanges)
+        self.assertEqual(loaded.name, path)
+
+        with open(path, "w") as transcript_file:
+            transcript_file.write(json.dumps({"command": "status"}) + "\n")
+        with self.assertRaises(ValueError):
+            Transcript.load(path)
+
+    def test_writer_writes_as_it_goes(self):
+        path = os.path.join(self.temp_dir.name, "session.jsonl")
+        transcript = Transcript.record(self.world_template, _COMMANDS[:2], seed=3)
+        transcript_writer = TranscriptWriter(path, 3)
+        transcript_writer.write_exchange(*transcript.exchanges[0])
+        self.assertEqual(Transcript.load(path).exchanges, transcript.exchanges[:1])
+        transcript_writer.close()
+
+
+class Test_Replay_Transcript(TestCase):
+    def setUp(self):
+        self.world_template = _world_template()
+        self.transcript = Transcript.record(self.world_template, _COMMANDS, seed=3)
+
+    def test_replay_matches(self):
+        self.assertIsNone(replay_transcript(self.world_template, self.transcript))
+
+    def test_replay_diverges(self):
+        exchanges = list(self.transcript.exchanges)
+        command, messages = exchanges[5]
+        exchanges[5] = (command, (("inven.DisplayInventoryGSM", "Nothing."),))
+        divergence = replay_transcript(
+            self.world_template, Transcript(3, tuple(exchanges), "altered")
+        )
+        self.assertIsInstance(divergence, Divergence)
+        self.assertEqual(divergence.name, "altered")
+        self.assertEqual(divergence.index, 5)
+        self.assertEqual(divergence.command, "inventory")
+        self.assertEqual(divergence.actual, messages)
+        self.assertIn("  - inven.DisplayInventoryGSM: Nothing.", divergence.describe())
+
+        # A different seed rolls different dice, so the fight goes
+        # differently.
+
+        self.assertIsNotNone(
+            replay_transcript(
+                self.world_template, Transcript(4, self.transcript.exchanges)
+            )
+        )
+
+    def test_replay_exception(self):
+        with patch("advgame.process.inventory_command", _raise_key_error):
+            divergence = replay_transcript(self.world_template, self.transcript)
+        self.assertEqual(divergence.index, 5)
+        self.assertEqual(divergence.actual, "KeyError: 'Mana_Potion'")
+
+
+class Test_Replayer(TestCase):
+    def setUp(self):
+        self.world_template = _world_template()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for seed in range(6):
+            Transcript.record(self.world_template, _COMMANDS, seed=seed).dump(
+                os.path.join(self.temp_dir.name, f"session_{seed}.jsonl")
+            )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_replayer_passes(self):
+        report = Replayer(self.world_template).run_directory(self.temp_dir.name)
+        self.assertTrue(report.passed)
+        self.assertEqual(report.transcripts_replayed, 6)
+        self.assertEqual(report.commands_replayed, 6 * len(_COMMANDS))
+        self.assertGreater(report.commands_per_second, 0)
+        self.assertTrue(report.summary().startswith("Replayed 6 transcripts"))
+
+    def test_replayer_reports_divergences(self):
+        path = os.path.join(self.temp_dir.name, "session_2.jsonl")
+        with open(path) as transcript_file:
+            lines = transcript_file.readlines()
+        lines[1] = lines[1].replace("Niath", "Naith", 1)
+        with open(path, "w") as transcript_file:
+            transcript_file.writelines(lines)
+        with open(os.path.join(self.temp_dir.name, "broken.jsonl"), "w") as broken:
+            broken.write("not json\n")
+
+        serial_report = Replayer(self.world_template).run_directory(self.temp_dir.name)
+        parallel_report = Replayer(self.world_template, processes=2).run_directory(
+            self.temp_dir.name
+        )
+        for report in (serial_report, parallel_report):
+            self.assertFalse(report.passed)
+            self.assertEqual(report.transcripts_replayed, 7)
+            broken_divergence, altered_divergence = report.divergences
+            self.assertTrue(broken_divergence.name.endswith("broken.jsonl"))
+            self.assertIsNone(broken_divergence.index)
+            self.assertEqual(altered_divergence.name, path)
+            self.assertEqual(altered_divergence.index, 0)
+        self.assertEqual(
+            serial_report.commands_replayed, parallel_report.commands_replayed
+        )
@@ -0,0 +1,194 @@
+#!/usr/bin/python3
+
+import os
+import tempfile
+
+from unittest import TestCase, mock
+
+from advgame import (
+    CommandProcessor,
+    GameState,
+    SaveFile,
+    SaveFileError,
+    WorldSections,
+    build_game_state,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Save_File",)
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_Save_File(TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.TemporaryDirectory()
+        self.save_path = os.path.join(self.save_dir.name, "test.sav")
+        self.game_state = build_game_state(_world_sections())
+        self.command_processor = CommandProcessor(self.game_state)
+        for command in ("set name to Niath", "set class to Warrior", "begin game"):
+            self.command_processor.process(command)
+
+    def tearDown(self):
+        self.save_dir.cleanup()
+
+    def _loaded_game_state(self):
+        game_state = build_game_state(_world_sections())
+        SaveFile(self.save_path).load(game_state)
+        return game_state
+
+    def test_save_and_load(self):
+        save_file = SaveFile(self.save_path)
+        self.assertFalse(save_file.exists())
+        self.assertTrue(save_file.save(self.game_state))
+        self.assertTrue(save_file.exists())
+
+        game_state = self._loaded_game_state()
+        self.assertEqual(game_state.snapshot(), self.game_state.snapshot())
+        self.assertTrue(game_state.game_has_begun)
+        self.assertEqual(game_state.character_name, "Niath")
+        self.assertEqual(
+            game_state.character.hit_points, self.game_state.character.hit_points
+        )
+        self.assertEqual(
+            game_state.character.weapon.internal_name,
+            self.game_state.character.weapon.internal_name,
+        )
+
+    def test_incremental_saves(self):
+        save_file = SaveFile(self.save_path)
+        save_file.save(self.game_state)
+        full_size = os.path.getsize(self.save_path)
+
+        # A later save only appends the entries that changed.
+
+        self.command_processor.process("open north door")
+        self.assertFalse(save_file.save(self.game_state))
+        self.assertLess(os.path.getsize(self.save_path) - full_size, full_size)
+
+        # Saving with nothing changed appends nothing.
+
+        size = os.path.getsize(self.save_path)
+        self.assertFalse(save_file.save(self.game_state))
+        self.assertEqual(os.path.getsize(self.save_path), size)
+
+        self.command_processor.process("leave via north door")
+        save_file.save(self.game_state)
+        game_state = self._loaded_game_state()
+        self.assertEqual(game_state.snapshot(), self.game_state.snapshot())
+        self.assertEqual(game_state.rooms_state.cursor.internal_name, "Room_1,2")
+        self.assertFalse(game_state.rooms_state.get("Room_1,1").north_door.is_closed)
+
+        # A new SaveFile object picks up the existing file and appends
+        # to it too.
+
+        self.command_processor.process("close south door")
+        size = os.path.getsize(self.save_path)
+        self.assertFalse(SaveFile(self.save_path).save(self.game_state))
+        self.assertGreater(os.path.getsize(self.save_path), size)
+        self.assertEqual(
+            self._loaded_game_state().snapshot(), self.game_state.snapshot()
+        )
+
+    def test_removed_entries(self):
+        save_file = SaveFile(self.save_path)
+        save_file.save(self.game_state)
+        room = self.game_state.rooms_state.cursor
+        creature_key = f"creature:{room.creature_here.internal_name}"
+        self.assertIn(creature_key, self.game_state.snapshot())
+
+        # The creature is killed, the way the attack command does it, so its
+        # entry drops out of the snapshot; the delta records that it's gone.
+
+        room.creature_here = None
+        self.assertNotIn(creature_key, self.game_state.snapshot())
+        self.assertFalse(save_file.save(self.game_state))
+        game_state = build_game_state(_world_sections())
+        with mock.patch.object(GameState, "restore") as restore:
+            SaveFile(self.save_path).load(game_state)
+        self.assertEqual(restore.call_args.args[0], self.game_state.snapshot())
+
+        game_state = self._loaded_game_state()
+        self.assertIsNone(game_state.rooms_state.cursor.creature_here)
+        self.assertEqual(game_state.snapshot(), self.game_state.snapshot())
+
+    def test_compaction(self):
+        save_file = SaveFile(self.save_path, max_deltas=2)
+        self.assertTrue(save_file.save(self.game_state))
+        self.command_processor.process("open north door")
+        self.assertFalse(save_file.save(self.game_state))
+        self.command_processor.process("close north door")
+        self.assertFalse(save_file.save(self.game_state))
+
+        # The third save rewrites the file as a single record.
+
+        self.command_processor.process("open north door")
+        self.assertTrue(save_file.save(self.game_state))
+        self.assertEqual(
+            self._loaded_game_state().snapshot(), self.game_state.snapshot()
+        )
+
+    def test_damaged_files(self):
+        SaveFile(self.save_path).save(self.game_state)
+        with open(self.save_path, "rb") as save_file:
+            data = save_file.read()
+
+        for damaged_data in (
+            b"NOTSAVE" + data[7:],
+            data[:6] + b"\xff\xff" + data[8:],
+            data[:-1] + bytes([data[-1] ^ 0xFF]),
+            data[:-5],
+            data[:4],
+        ):
+            with open(self.save_path, "wb") as save_file:
+                save_file.write(damaged_data)
+            game_state = build_game_state(_world_sections())
+            snapshot = game_state.snapshot()
+            with self.assertRaises(SaveFileError):
+                SaveFile(self.save_path).load(game_state)
+
+            # The file is checked before anything is restored.
+
+            self.assertEqual(game_state.snapshot(), snapshot)
+
+    def test_class_set_after_instantiation(self):
+        # The character is instantiated as soon as a name and class are
+        # both set; setting the class again changes the game's record of it
+        # but not the character, which is what's restored.
+
+        game_state = build_game_state(_world_sections())
+        command_processor = CommandProcessor(game_state)
+        for command in (
+            "set name to Lidda",
+            "set class to Warrior",
+            "set class to Thief",
+            "begin game",
+        ):
+            command_processor.process(command)
+        self.assertEqual(game_state.character.character_class, "Warrior")
+        SaveFile(self.save_path).save(game_state)
+
+        loaded_game_state = self._loaded_game_state()
+        self.assertEqual(loaded_game_state.character.character_name, "Lidda")
+        self.assertEqual(loaded_game_state.character.character_class, "Warrior")
+        self.assertEqual(
+            loaded_game_state.character.hit_point_total,
+            game_state.character.hit_point_total,
+        )
+        self.assertEqual(loaded_game_state.snapshot(), game_state.snapshot())
@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+
+import asyncio
+import random
+
+from contextlib import contextmanager
+from unittest import TestCase
+
+from advgame import (
+    CreatureAction,
+    CreatureScheduler,
+    Patrol,
+    Regenerate,
+    SharedWorld,
+    Wander,
+    WorldSections,
+    build_game_state,
+)
+from advgame.scheduler import _RoamingAction
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Creature_Scheduler",)
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class _Counter(CreatureAction):
+    __slots__ = ("count",)
+
+    def __init__(self, period):
+        super().__init__(period)
+        self.count = 0
+
+    def fire(self, scheduler):
+        self.count += 1
+        return True
+
+
+class Test_Creature_Scheduler(TestCase):
+    def setUp(self):
+        self.game_state = build_game_state(_world_sections())
+        self.rooms_state = self.game_state.rooms_state
+        self.scheduler = CreatureScheduler(
+            self.rooms_state, occupied=lambda room_internal_name: False
+        )
+
+    def _open_north_door(self):
+        self.rooms_state.get("Room_1,1").north_door.is_closed = False
+        self.rooms_state.get("Room_1,2").south_door.is_closed = False
+
+    def test_scheduler_only_fires_due_actions(self):
+        counters = [_Counter(1000) for _ in range(10000)]
+        for index, counter in enumerate(counters):
+            self.scheduler.schedule(counter, delay=index % 1000 + 1)
+        self.assertEqual(self.scheduler.advance(), 10)
+        self.assertEqual(self.scheduler.tick, 1)
+        self.assertEqual(self.scheduler.advance(999), 9990)
+        self.assertEqual(self.scheduler.pending_count(), 10000)
+        self.assertTrue(all(counter.count == 1 for counter in counters))
+
+        counters[0].cancel()
+        self.assertEqual(self.scheduler.advance(), 9)
+        self.assertEqual(self.scheduler.pending_count(), 9999)
+
+    def test_scheduler_regenerate(self):
+        kobold = self.rooms_state.get("Room_1,1").creature_here
+        kobold.take_damage(5)
+        hit_points = kobold.hit_points
+        self.scheduler.schedule(Regenerate(kobold, amount=2, period=3))
+        self.scheduler.advance(2)
+        self.assertEqual(kobold.hit_points, hit_points)
+        self.scheduler.advance(1)
+        self.assertEqual(kobold.hit_points, hit_points + 2)
+        self.scheduler.advance(30)
+        self.assertEqual(kobold.hit_points, kobold.hit_point_total)
+
+        # A dead creature stops regenerating.
+
+        kobold.take_damage(kobold.hit_points)
+        self.scheduler.advance(3)
+        self.assertEqual(kobold.hit_points, 0)
+        self.assertEqual(self.scheduler.pending_count(), 0)
+
+    def test_scheduler_regenerate_locks_room(self):
+        locked = list()
+
+        @contextmanager
+        def locker(room_internal_name):
+            locked.append(room_internal_name)
+            yield
+
+        scheduler = CreatureScheduler(
+            self.rooms_state, occupied=lambda room_internal_name: False, locker=locker
+        )
+        kobold = self.rooms_state.get("Room_1,1").creature_here
+        kobold.take_damage(5)
+        regenerate = scheduler.schedule(Regenerate(kobold, period=1))
+        scheduler.advance(1)
+        self.assertEqual(locked, ["Room_1,1"])
+
+        # The creature is followed into the room it's moved to.
+
+        self.rooms_state.move_creature("Room_1,1", "Room_1,2")
+        scheduler.advance(1)
+        self.assertEqual(locked, ["Room_1,1", "Room_1,2"])
+        self.assertEqual(regenerate.room_internal_name, "Room_1,2")
+
+        # A creature that's no longer in any room stops regenerating.
+
+        self.rooms_state.get("Room_1,2").creature_here = None
+        scheduler.advance(1)
+        self.assertEqual(scheduler.pending_count(), 0)
+
+    def test_scheduler_action_hooks_are_abstract(self):
+        class _NoFire(CreatureAction):
+            __slots__ = ()
+
+        class _NoDestination(_RoamingAction):
+            __slots__ = ()
+
+        with self.assertRaises(TypeError):
+            _NoFire(1)
+        with self.assertRaises(TypeError):
+            _NoDestination("Room_1,1", 1)
+
+    def test_scheduler_wander(self):
+        kobold = self.rooms_state.get("Room_1,1").creature_here
+        wander = self.scheduler.schedule(
+            Wander("Room_1,1", period=2, rng=random.Random(0))
+        )
+
+        # Both of the room's doors are closed, so the creature stays put.
+
+        self.scheduler.advance(2)
+        self.assertIs(self.rooms_state.get("Room_1,1").creature_here, kobold)
+
+        self._open_north_door()
+        self.scheduler.advance(2)
+        self.assertIsNone(self.rooms_state.get("Room_1,1").creature_here)
+        self.assertIs(self.rooms_state.get("Room_1,2").creature_here, kobold)
+        self.assertEqual(wander.room_internal_name, "Room_1,2")
+
+        # Once the creature is gone from its room, the action ends.
+
+        self.rooms_state.get("Room_1,2").creature_here = None
+        self.scheduler.advance(2)
+        self.assertEqual(self.scheduler.pending_count(), 0)
+
+    def test_scheduler_patrol_avoids_player(self):
+        # By default a creature won't move out of the player's room.
+
+        scheduler = CreatureScheduler(self.rooms_state)
+        kobold = self.rooms_state.get("Room_1,1").creature_here
+        self._open_north_door()
+        scheduler.schedule(Patrol(("Room_1,1", "Room_1,2"), period=1))
+        scheduler.advance(3)
+        self.assertIs(self.rooms_state.get("Room_1,1").creature_here, kobold)
+
+        # Nor into it.
+
+        self.rooms_state.move(north=True)
+        scheduler.advance(1)
+        self.assertIs(self.rooms_state.get("Room_1,1").creature_here, kobold)
+
+        # Once the player is elsewhere, it walks its route.
+
+        self.rooms_state.move(east=True)
+        scheduler.advance(1)
+        self.assertIs(self.rooms_state.get("Room_1,2").creature_here, kobold)
+        scheduler.advance(1)
+        self.assertIs(self.rooms_state.get("Room_1,1").creature_here, kobold)
+
+    def test_scheduler_run(self):
+        counter = self.scheduler.schedule(_Counter(1))
+
+        async def run():
+            stop_event = asyncio.Event()
+            task = asyncio.create_task(self.scheduler.run(0.001, stop_event))
+            while counter.count < 3:
+                await asyncio.sleep(0.001)
+            stop_event.set()
+            await asyncio.wait_for(task, 5)
+
+        asyncio.run(run())
+        self.assertGreaterEqual(self.scheduler.tick, 3)
+
+    def test_shared_world_scheduler(self):
+        world = SharedWorld(_world_sections())
+        world.join("Niath")
+        scheduler = world.new_scheduler()
+        self.assertTrue(scheduler.is_occupied("Room_1,1"))
+        self.assertFalse(scheduler.is_occupied("Room_1,2"))
+        with scheduler.locked("Room_1,1"):
+            pass
@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+
+from unittest import TestCase
+
+from advgame import (
+    CommandProcessor,
+    ExpectedDice,
+    SeededDice,
+    Solver,
+    WonTheGameGSM,
+    WorldSections,
+    build_game_state,
+    legal_commands,
+    load_world_sections,
+    state_key,
+)
+from advgame.utils import roll_dice, set_dice_roller
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Dice", "Test_State_Key", "Test_Solver")
+
+
+def _world_sections():
+    return WorldSections.from_ini_configs(
+        items_ini_config,
+        doors_ini_config,
+        containers_ini_config,
+        creatures_ini_config,
+        rooms_ini_config,
+    )
+
+
+class Test_Dice(TestCase):
+    def test_expected_dice(self):
+        expected_dice = ExpectedDice()
+        self.assertEqual(expected_dice(1, 20, 5), 16)
+        self.assertEqual(expected_dice(2, 6, 0), 7)
+        self.assertEqual(expected_dice(1, 8, -2), 3)
+
+    def test_seeded_dice(self):
+        seeded_dice = SeededDice(7)
+        previous_dice_roller = set_dice_roller(seeded_dice)
+        try:
+            seeded_dice.reseed("state", "attack kobold")
+            rolls = [roll_dice("1d20") for _ in range(10)]
+            seeded_dice.reseed("state", "attack kobold")
+            self.assertEqual([roll_dice("1d20") for _ in range(10)], rolls)
+            self.assertTrue(all(1 <= roll <= 20 for roll in rolls))
+        finally:
+            set_dice_roller(previous_dice_roller)
+
+
+class Test_State_Key(TestCase):
+    def setUp(self):
+        self.game_states = list()
+        for _ in range(2):
+            game_state = build_game_state(_world_sections())
+            command_processor = CommandProcessor(game_state)
+            for command in ("set name to Niath", "set class to Warrior", "begin game"):
+                command_processor.process(command)
+            self.game_states.append(game_state)
+
+    def test_state_key(self):
+        game_state_1, game_state_2 = self.game_states
+
+        # The character's ability scores were rolled separately, so
+        # they're made to match.
+
+        game_state_2.character.restore(
+            game_state_1.character.snapshot(), game_state_2.items_state
+        )
+        self.assertEqual(state_key(game_state_1), state_key(game_state_2))
+
+        # The order items are picked up in doesn't matter.
+
+        command_processor_1 = CommandProcessor(game_state_1)
+        command_processor_1.process("pick up mana potion")
+        command_processor_1.process("pick up 2 health potions")
+        command_processor_2 = CommandProcessor(game_state_2)
+        command_processor_2.process("pick up 2 health potions")
+        self.assertNotEqual(state_key(game_state_1), state_key(game_state_2))
+        command_processor_2.process("pick up mana potion")
+        self.assertEqual(state_key(game_state_1), state_key(game_state_2))
+
+        # Nor does where the character has been, only where they are.
+
+        for command in ("leave via north door", "leave via south door"):
+            command_processor_1.process(command)
+        self.assertEqual(state_key(game_state_1), state_key(game_state_2))
+
+    def test_legal_commands(self):
+        # The east door is locked, and the Warrior has no key for it.
+
+        game_state = self.game_states[0]
+        self.assertEqual(
+            legal_commands(game_state),
+            [
+                "leave via north door",
+                "attack kobold",
+                "pick up 1 mana potion",
+                "pick up 2 health potion",
+            ],
+        )
+        game_state.character.character_class = "Thief"
+        self.assertIn("pick lock on east door", legal_commands(game_state))
+        self.assertIn("pick lock on wooden chest", legal_commands(game_state))
+
+
+class Test_Solver(TestCase):
+    def test_solve_shipped_world(self):
+        solution = Solver(load_world_sections(), "Warrior").solve()
+        self.assertTrue(solution.is_winnable)
+        self.assertEqual(solution.move_count, 11)
+
+        # Playing the solution through process() wins the game.
+
+        previous_dice_roller = set_dice_roller(ExpectedDice())
+        try:
+            command_processor = CommandProcessor(
+                build_game_state(load_world_sections())
+            )
+            for command in ("set name to Niath", "set class to Warrior", "begin game"):
+                command_processor.process(command)
+            for command in solution.commands:
+                result = command_processor.process(command)
+        finally:
+            set_dice_roller(previous_dice_roller)
+        self.assertIsInstance(result[-1], WonTheGameGSM)
+
+    def test_solve_unwinnable_world(self):
+        # The testing dungeon's exit can't be reached without picking a
+        # lock, so a Warrior's search explores every state and finds no
+        # win, while a Thief can win.
+
+        solution = Solver(_world_sections(), "Warrior").solve()
+        self.assertFalse(solution.is_winnable)
+        self.assertIsNone(solution.move_count)
+        self.assertGreater(solution.states_explored, 1)
+        self.assertTrue(Solver(_world_sections(), "Thief").solve().is_winnable)
+
+    def test_solve_in_parallel(self):
+        solutions = [
+            Solver(
+                _world_sections(), "Thief", SeededDice(3), processes=processes
+            ).solve()
+            for processes in (1, 2)
+        ]
+        self.assertTrue(solutions[0].is_winnable)
+        self.assertEqual(solutions[0].commands, solutions[1].commands)
+        self.assertEqual(solutions[0].states_explored, solutions[1].states_explored)
@@ -0,0 +1,275 @@
+#!/usr/bin/python3
+
+import json
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from advgame import (
+    COMMANDS_SYNTAX,
+    AmbiguousDoorSpecifierGSM,
+    BadSyntaxGSM,
+    CharacterDeathGSM,
+    CommandProcessor,
+    DisplayInventoryGSM,
+    ElementHasBeenOpenedGSM,
+    EnteredRoomGSM,
+    FoundContainerHereGSM,
+    GameStateMessage,
+    HaveQuitTheGameGSM,
+    NotAllowedNowGSM,
+    WorldSections,
+    build_game_state,
+    message_catalog,
+    results_to_json,
+)
+from advgame.statemsgs.lock import ElementNotLockableGSM
+from advgame.statemsgs.command import NotRecognizedGSM as CommandNotRecognizedGSM
+from advgame.statemsgs.help_ import NotRecognizedGSM as HelpNotRecognizedGSM
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = (
+    "Test_Flyweight_Messages",
+    "Test_Message_Templates",
+    "Test_Structured_Messages",
+)
+
+
+def _all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+def _unrendered(self):
+    raise AssertionError("the message property was evaluated")
+
+
+class Test_Structured_Messages(TestCase):
+    def setUp(self):
+        self.game_state = build_game_state(
+            WorldSections.from_ini_configs(
+                items_ini_config,
+                doors_ini_config,
+                containers_ini_config,
+                creatures_ini_config,
+                rooms_ini_config,
+            )
+        )
+        self.command_processor = CommandProcessor(self.game_state)
+
+    def test_type_tags_unique(self):
+        type_tags = [
+            subclass.type_tag for subclass in _all_subclasses(GameStateMessage)
+        ]
+        self.assertEqual(len(type_tags), len(set(type_tags)))
+        self.assertEqual(CommandNotRecognizedGSM.type_tag, "command.NotRecognizedGSM")
+        self.assertEqual(HelpNotRecognizedGSM.type_tag, "help.NotRecognizedGSM")
+
+    def test_to_dict(self):
+        game_state_message = ElementHasBeenOpenedGSM("north door")
+        self.assertEqual(
+            game_state_message.to_dict(),
+            {"type": "open.ElementHasBeenOpenedGSM", "target": "north door"},
+        )
+        self.assertEqual(
+            json.loads(game_state_message.to_json()), game_state_message.to_dict()
+        )
+
+    def test_element_fields_flattened(self):
+        room = self.game_state.rooms_state.cursor
+        self.assertEqual(
+            EnteredRoomGSM(room).fields(),
+            {
+                "room_title": "southwest dungeon room",
+                "description": "Entrance room.",
+                "container_title": "wooden chest",
+                "creature_title": "kobold",
+                "items_here": [[1, "mana potion"], [2, "health potion"]],
+                "doors": {"north": "iron_door", "east": "iron_door"},
+            },
+        )
+        chest = room.container_here
+        self.assertIsNone(FoundContainerHereGSM(chest).fields()["contents"])
+        chest.is_locked = chest.is_closed = False
+        self.assertEqual(
+            FoundContainerHereGSM(chest).fields()["contents"],
+            [
+                [qty, item.title]
+                for qty, item in sorted(chest.values(), key=lambda pair: pair[1].title)
+            ],
+        )
+
+    def test_results_serialize_without_rendering(self):
+        commands = (
+            "set name to Niath",
+            "set class to Warrior",
+            "begin game",
+            "look at kobold",
+            "look at north door",
+            "look at wooden chest",
+            "inventory",
+            "status",
+            "help",
+            "map",
+            "open north door",
+            "leave using north door",
+            "fly",
+        )
+        for command in commands:
+            results = self.command_processor.process(command)
+            for game_state_message in results:
+                with patch.object(
+                    type(game_state_message), "message", property(_unrendered)
+                ):
+                    structured = json.loads(game_state_message.to_json())
+                self.assertEqual(structured["type"], type(game_state_message).type_tag)
+            self.assertEqual(
+                json.loads(results_to_json(results)),
+                [game_state_message.to_dict() for game_state_message in results],
+            )
+
+
+class Test_Message_Templates(TestCase):
+    def setUp(self):
+        self.game_state = build_game_state(
+            WorldSections.from_ini_configs(
+                items_ini_config,
+                doors_ini_config,
+                containers_ini_config,
+                creatures_ini_config,
+                rooms_ini_config,
+            )
+        )
+
+    def test_message_catalog(self):
+        catalog = message_catalog()
+        self.assertEqual(
+            catalog["open.ElementHasBeenOpenedGSM"],
+            {"default": "You have opened the {target}."},
+        )
+        self.assertEqual(
+            set(catalog["lock.ElementNotLockableGSM"]), {"armor", "default"}
+        )
+        self.assertIn("corpse", catalog["lookat.FoundContainerHereGSM"])
+        for templates in catalog.values():
+            for template in templates.values():
+                self.assertIsInstance(template, str)
+
+        # A malformed template is caught when its class is created.
+
+        with self.assertRaises(ValueError):
+            type(
+                "BadTemplateGSM",
+                (GameStateMessage,),
+                {"templates": {"default": "The {target is here."}},
+            )
+
+    def test_message_variants(self):
+        self.assertEqual(
+            ElementNotLockableGSM("studded leather", "armor").message,
+            "You can't lock the studded leather; suits of armor are not lockable.",
+        )
+        self.assertEqual(
+            ElementNotLockableGSM("mana potion", "potion").message,
+            "You can't lock the mana potion; potions are not lockable.",
+        )
+        self.assertEqual(
+            AmbiguousDoorSpecifierGSM(("north", "east"), "door", "iron_door").message,
+            "More than one door in this room matches your command. Do you mean the "
+            + "north iron door or the east iron door?",
+        )
+        chest = self.game_state.rooms_state.cursor.container_here
+        self.assertEqual(
+            FoundContainerHereGSM(chest).variant(),
+            "closed_and_locked",
+        )
+        chest.is_locked = chest.is_closed = False
+        self.assertTrue(
+            FoundContainerHereGSM(chest).message.startswith(
+                f"{chest.description} It is unlocked and open. It contains "
+            )
+        )
+
+    def test_message_memoized(self):
+        mana_potion = self.game_state.items_state.get("Mana_Potion")
+        inventory = [(2, mana_potion)]
+        game_state_message = DisplayInventoryGSM(inventory)
+        self.assertEqual(
+            game_state_message.message, "You have 2 mana potions in your inventory."
+        )
+
+        # The message is rendered once; later accesses don't reread the
+        # object's fields, and it's not included among them.
+
+        inventory.clear()
+        self.assertEqual(
+            game_state_message.message, "You have 2 mana potions in your inventory."
+        )
+        self.assertNotIn("_rendered", game_state_message.fields())
+
+        # Hand-written message properties are memoized too.
+
+        game_state_message = EnteredRoomGSM(self.game_state.rooms_state.cursor)
+        self.assertIs(game_state_message.message, game_state_message.message)
+
+
+class Test_Flyweight_Messages(TestCase):
+    def setUp(self):
+        self.command_processor = CommandProcessor(
+            build_game_state(
+                WorldSections.from_ini_configs(
+                    items_ini_config,
+                    doors_ini_config,
+                    containers_ini_config,
+                    creatures_ini_config,
+                    rooms_ini_config,
+                )
+            )
+        )
+
+    def test_messages_have_no_dict(self):
+        for subclass in _all_subclasses(GameStateMessage):
+            if subclass.__module__.startswith("advgame."):
+                self.assertEqual(subclass.__dictoffset__, 0, subclass.type_tag)
+        self.assertNotIn("_rendered", CharacterDeathGSM._field_names)
+
+    def test_flyweight_messages(self):
+        self.assertIs(CharacterDeathGSM(), CharacterDeathGSM())
+        bad_syntax = BadSyntaxGSM("MAP", COMMANDS_SYNTAX["MAP"])
+        self.assertIs(BadSyntaxGSM("MAP", COMMANDS_SYNTAX["MAP"]), bad_syntax)
+        self.assertIsNot(BadSyntaxGSM("QUIT", COMMANDS_SYNTAX["QUIT"]), bad_syntax)
+
+        # Arguments of different types don't share an instance, and
+        # unhashable arguments get a new instance each time.
+
+        self.assertIsNot(
+            NotAllowedNowGSM("attack", (), True), NotAllowedNowGSM("attack", (), 1)
+        )
+        self.assertIsNot(
+            NotAllowedNowGSM("attack", [], False), NotAllowedNowGSM("attack", [], False)
+        )
+
+        # Non-flyweight classes are unaffected.
+
+        self.assertIsNot(
+            ElementHasBeenOpenedGSM("north door"), ElementHasBeenOpenedGSM("north door")
+        )
+
+    def test_flyweight_results_share_rendered_text(self):
+        first_result = self.command_processor.process("attack kobold")
+        second_result = self.command_processor.process("attack kobold")
+        self.assertIsInstance(first_result[0], NotAllowedNowGSM)
+        self.assertIs(first_result[0], second_result[0])
+        self.assertIs(first_result[0].message, second_result[0].message)
+
+        (game_state_message,) = self.command_processor.process("quit")
+        self.assertIs(game_state_message, HaveQuitTheGameGSM())
@@ -3,11 +3,15 @@
 from unittest import TestCase
 from math import nan as NaN
 
+from advgame.errors import InternalError
 from advgame.utils import (
     join_strs_w_comma_conj,
     lexical_number_to_digits,
+    roll_dice,
+    set_dice_roller,
     textwrapper,
 )
+from advgame.utils import _wrap_paragraph
 
 
 LOREM_IPSUM_UNWRAPPED = """Lorem ipsum dolor sit amet, consectetur adipiscing \
@@ -77,6 +81,22 @@ class TestTextwrapper(TestCase):
         wrapped_text = textwrapper(LOREM_IPSUM_UNWRAPPED)
         self.assertEqual(wrapped_text, LOREM_IPSUM_WRAPPED)
 
+    def test_textwrapper_cache(self):
+        textwrapper(LOREM_IPSUM_UNWRAPPED)
+        hits = _wrap_paragraph.cache_info().hits
+        self.assertEqual(textwrapper(LOREM_IPSUM_UNWRAPPED), LOREM_IPSUM_WRAPPED)
+        self.assertGreater(_wrap_paragraph.cache_info().hits, hits)
+
+        # The width is part of the key.
+
+        self.assertTrue(
+            all(
+                len(line) <= 40
+                for line in textwrapper(LOREM_IPSUM_UNWRAPPED, width=40).split("\n")
+            )
+        )
+        self.assertEqual(textwrapper(LOREM_IPSUM_UNWRAPPED), LOREM_IPSUM_WRAPPED)
+
 
 class TestLexicalNumberToDigits1(TestCase):
     def __init__(self, *argl, **argd):
@@ -134,3 +154,25 @@ class TestLexicalNumberToDigits2(TestCase):
     def test_join_strs_w_comma_conj_8(self):
         joined_str = join_strs_w_comma_conj(("foo", "bar", "baz"), "or")
         self.assertEqual(joined_str, "foo, bar, or baz")
+
+
+class TestRollDice(TestCase):
+    def test_roll_dice(self):
+        for _ in range(100):
+            self.assertTrue(1 <= roll_dice("3d6-2") <= 16)
+        with self.assertRaises(InternalError):
+            roll_dice("d20")
+
+    def test_set_dice_roller(self):
+        rolls = list()
+
+        def dice_roller(number_of_dice, sidedness_of_dice, modifier_to_roll):
+            rolls.append((number_of_dice, sidedness_of_dice, modifier_to_roll))
+            return 7
+
+        self.assertIsNone(set_dice_roller(dice_roller))
+        try:
+            self.assertEqual(roll_dice("2d10+3"), 7)
+            self.assertEqual(rolls, [(2, 10, 3)])
+        finally:
+            self.assertIs(set_dice_roller(None), dice_roller)
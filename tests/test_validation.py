@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+
+from unittest import TestCase
+
+from advgame import (
+    ContainersState,
+    CreaturesState,
+    DoorsState,
+    InternalError,
+    ItemsState,
+    RoomsState,
+    validate_world,
+)
+
+from .context import (
+    containers_ini_config,
+    creatures_ini_config,
+    doors_ini_config,
+    items_ini_config,
+    rooms_ini_config,
+)
+
+
+__all__ = ("Test_Validate_World",)
+
+
+class Test_Validate_World(TestCase):
+    def __init__(self, *argl, **argd):
+        super().__init__(*argl, **argd)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.doors_dicts = {
+            name: dict(section) for name, section in doors_ini_config.sections.items()
+        }
+        self.rooms_dicts = {
+            name: dict(section) for name, section in rooms_ini_config.sections.items()
+        }
+
+    def _validate(self):
+        items_state = ItemsState(**items_ini_config.sections)
+        doors_state = DoorsState(**self.doors_dicts)
+        containers_state = ContainersState(
+            items_state, **containers_ini_config.sections
+        )
+        creatures_state = CreaturesState(items_state, **creatures_ini_config.sections)
+        rooms_state = RoomsState(
+            creatures_state,
+            containers_state,
+            doors_state,
+            items_state,
+            **self.rooms_dicts,
+        )
+        return validate_world(
+            rooms_state, doors_state, containers_state, creatures_state
+        )
+
+    def test_validate_world_locked_exit(self):
+        # The testing dungeon has no door key in it, so the locked exit
+        # door can't be passed.
+        report = self._validate()
+        self.assertFalse(report.is_valid)
+        self.assertFalse(report.exit_reachable)
+        self.assertEqual(
+            report.reachable_rooms, frozenset(("Room_1,1", "Room_1,2", "Room_2,2"))
+        )
+        self.assertEqual([error.code for error in report.errors], ["exit-unreachable"])
+        self.assertEqual(
+            sorted((warning.code, warning.subject) for warning in report.warnings),
+            [
+                ("unplaced-creature", "Sorcerer_Ardren"),
+                ("unreachable-room", "Room_2,1"),
+            ],
+        )
+        with self.assertRaises(InternalError):
+            report.raise_for_errors()
+
+    def test_validate_world_door_key_reachable(self):
+        # With a door key on the floor of the entrance room, every
+        # locked door can be passed.
+        self.rooms_dicts["Room_1,1"]["items_here"] = "[1xDoor_Key]"
+        report = self._validate()
+        self.assertTrue(report.is_valid)
+        self.assertTrue(report.exit_reachable)
+        self.assertIn("door key", report.reachable_key_kinds)
+        self.assertEqual(len(report.reachable_rooms), 4)
+        report.raise_for_errors()
+
+    def test_validate_world_key_behind_locked_chest(self):
+        # A door key in a locked chest needs a chest key first; a key
+        # behind the exit it unlocks doesn't help.
+        self.rooms_dicts["Room_1,2"]["items_here"] = "[1xChest_Key]"
+        report = self._validate()
+        self.assertIn("chest key", report.reachable_key_kinds)
+        self.assertNotIn("door key", report.reachable_key_kinds)
+        self.doors_dicts["Room_2,2_x_Exit"]["is_locked"] = "false"
+        report = self._validate()
+        self.assertTrue(report.exit_reachable)
+
+    def test_validate_world_unmatched_door(self):
+        del self.rooms_dicts["Room_2,1"]["west_door"]
+        report = self._validate()
+        self.assertIn(
+            ("unmatched-door", "Room_1,1_x_Room_2,1"),
+            [(error.code, error.subject) for error in report.errors],
+        )
+
+    def test_validate_world_unused_door(self):
+        self.doors_dicts["Room_1,2_x_Room_3,3"] = dict(
+            self.doors_dicts["Room_1,2_x_Room_2,2"]
+        )
+        report = self._validate()
+        self.assertIn(
+            ("unused-door", "Room_1,2_x_Room_3,3"),
+            [(warning.code, warning.subject) for warning in report.warnings],
+        )
+
+    def test_validate_world_entrance_count(self):
+        self.rooms_dicts["Room_1,2"]["is_entrance"] = "true"
+        report = self._validate()
+        self.assertIn("entrance-count", [error.code for error in report.errors])